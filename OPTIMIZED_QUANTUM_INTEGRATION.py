@@ -16,6 +16,8 @@ from typing import Dict, List, Any, Optional
 from enum import Enum
 from collections import defaultdict
 
+from bounded_history import BoundedHistory
+
 class OptimizedQuantumEntity:
     """Optimized quantum entity with essential capabilities"""
     def __init__(self, entity_id: str):
@@ -72,7 +74,7 @@ class OptimizedQuantumEngine:
         self.quantum_entities = {}
 
         # Evolution tracking
-        self.evolution_history = []
+        self.evolution_history = BoundedHistory(name="OptimizedQuantumEngine.evolution_history")
         self.evolution_count = 0
 
     def create_ultimate_quantum_entity(self, entity_type: str = "Ultimate") -> OptimizedQuantumEntity:
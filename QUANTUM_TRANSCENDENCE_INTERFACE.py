@@ -16,6 +16,8 @@ from typing import Dict, List, Any, Optional
 from enum import Enum
 from collections import defaultdict
 
+from bounded_history import BoundedHistory
+
 # Import our advanced modules
 try:
     from quantum_consciousness_transcendence import QuantumConsciousnessTranscendenceEngine, TranscendenceLevel, TranscendentQuantumEntity
@@ -90,7 +92,7 @@ class QuantumTranscendenceEngine:
         self.cosmic_entities = {}
 
         # Evolution tracking
-        self.evolution_history = []
+        self.evolution_history = BoundedHistory(name="QuantumTranscendenceEngine.evolution_history")
         self.evolution_count = 0
 
     def create_quantum_transcendence_entity(self, entity_type: str = "Quantum") -> QuantumTranscendenceEntity:
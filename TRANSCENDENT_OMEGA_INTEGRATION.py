@@ -19,6 +19,8 @@ from typing import Dict, List, Any, Optional
 from enum import Enum
 from collections import defaultdict
 
+from bounded_history import BoundedHistory
+
 # Import all advanced modules
 try:
     from temporal_manipulation import TemporalManipulationEngine, TemporalState, TemporalMode
@@ -98,7 +100,7 @@ class TranscendentOmegaEngine:
         self.matrix_syntheses = {}
         
         # Evolution tracking
-        self.evolution_history = []
+        self.evolution_history = BoundedHistory(name="TranscendentOmegaEngine.evolution_history")
         self.synthesis_history = []
         
         # Initialize quantum computing engine
@@ -462,7 +464,7 @@ class TranscendentOmegaEngine:
             'cosmic_entities': len(self.cosmic_entities),
             'matrix_entities': len(self.matrix_entities),
             'total_entities': len(self.transcendent_omega_entities) + len(self.infinite_entities) + len(self.divine_entities) + len(self.cosmic_entities) + len(self.matrix_entities),
-            'evolution_history_length': len(self.evolution_history),
+            'evolution_history_length': self.evolution_history.total,
             'synthesis_history_length': len(self.synthesis_history),
             'system_timestamp': time.time()
         }
@@ -16,6 +16,8 @@ from typing import Dict, List, Any, Optional
 from enum import Enum
 from collections import defaultdict
 
+from bounded_history import BoundedHistory
+
 # Import our advanced modules
 try:
     from quantum_consciousness_neural_network import QuantumConsciousnessNeuralEngine, ConsciousnessLevel, ConsciousnessEntity
@@ -105,7 +107,7 @@ class UltimateQuantumConsciousnessEngine:
         self.universe_entities = {}
 
         # Evolution tracking
-        self.evolution_history = []
+        self.evolution_history = BoundedHistory(name="UltimateQuantumConsciousnessEngine.evolution_history")
         self.evolution_count = 0
 
     def create_ultimate_quantum_entity(self, entity_type: str = "Ultimate") -> UltimateQuantumConsciousnessEntity:
@@ -14,12 +14,14 @@ import threading
 import time
 import random
 import math
-import numpy as np
 from dataclasses import dataclass
 from typing import Dict, List, Any, Optional
 from enum import Enum
 from collections import defaultdict
 
+from bounded_history import BoundedHistory
+from field_accumulator import FieldAccumulator, field_property
+
 # Import all advanced modules
 try:
     from temporal_manipulation import TemporalManipulationEngine, TemporalState, TemporalMode
@@ -62,9 +64,36 @@ class UltimateQuantumEntity:
         self.transcendence_factor = 0.0
         self.creation_timestamp = time.time()
 
+def _ultimate_intensity(entity) -> float:
+    """The ultimate field combines all essences"""
+    return (getattr(entity, 'divine_essence', 0.0) + getattr(entity, 'matrix_essence', 0.0) +
+            getattr(entity, 'quantum_essence', 0.0) + getattr(entity, 'transcendence_factor', 0.0)) / 1e15
+
+# Point fields: intensity each entity deposits at its dimensional coordinates
+ULTIMATE_POINT_FIELDS = {
+    'cosmic': lambda entity: getattr(entity, 'consciousness_level', 1e15) / 1e15,
+    'consciousness': lambda entity: getattr(entity, 'consciousness_level', 1e15) / 1e15,
+    'divine': lambda entity: getattr(entity, 'divine_essence', 0.0) / 1e15,
+    'matrix': lambda entity: getattr(entity, 'matrix_essence', 0.0) / 1e15,
+    'transcendent': lambda entity: getattr(entity, 'transcendence_factor', 0.0),
+    'quantum_consciousness': lambda entity: getattr(entity, 'quantum_essence', 0.0) / 1e15,
+    'ultimate': _ultimate_intensity
+}
+
 class UltimateQuantumEngine:
     """Ultimate quantum engine that integrates all advanced systems"""
 
+    quantum_field = field_property('quantum')
+    neural_field = field_property('neural')
+    cosmic_field = field_property('cosmic')
+    temporal_field = field_property('temporal')
+    consciousness_field = field_property('consciousness')
+    divine_field = field_property('divine')
+    matrix_field = field_property('matrix')
+    transcendent_field = field_property('transcendent')
+    quantum_consciousness_field = field_property('quantum_consciousness')
+    ultimate_field = field_property('ultimate')
+
     def __init__(self):
         # Initialize all advanced engines
         self.temporal_engine = TemporalManipulationEngine()
@@ -80,16 +109,7 @@ class UltimateQuantumEngine:
 
         # Core systems
         self.entities = {}
-        self.quantum_field = np.zeros((1000, 1000, 1000))
-        self.neural_field = np.zeros((1000, 1000, 1000))
-        self.cosmic_field = np.zeros((1000, 1000, 1000))
-        self.temporal_field = np.zeros((1000, 1000, 1000))
-        self.consciousness_field = np.zeros((1000, 1000, 1000))
-        self.divine_field = np.zeros((1000, 1000, 1000))
-        self.matrix_field = np.zeros((1000, 1000, 1000))
-        self.transcendent_field = np.zeros((1000, 1000, 1000))
-        self.quantum_consciousness_field = np.zeros((1000, 1000, 1000))
-        self.ultimate_field = np.zeros((1000, 1000, 1000))
+        self.fields = FieldAccumulator(ULTIMATE_POINT_FIELDS)
 
         # Advanced entities
         self.ultimate_quantum_entities = {}
@@ -107,7 +127,7 @@ class UltimateQuantumEngine:
         self.quantum_syntheses = {}
 
         # Evolution tracking
-        self.evolution_history = []
+        self.evolution_history = BoundedHistory(name="UltimateQuantumEngine.evolution_history")
         self.synthesis_history = []
 
         # Initialize quantum computing engine
@@ -365,154 +385,13 @@ class UltimateQuantumEngine:
 
     def _update_all_fields(self):
         """Update all quantum, neural, cosmic, temporal, consciousness, divine, matrix, transcendent, quantum consciousness, and ultimate fields"""
-        # Reset fields
-        self.quantum_field.fill(0)
-        self.neural_field.fill(0)
-        self.cosmic_field.fill(0)
-        self.temporal_field.fill(0)
-        self.consciousness_field.fill(0)
-        self.divine_field.fill(0)
-        self.matrix_field.fill(0)
-        self.transcendent_field.fill(0)
-        self.quantum_consciousness_field.fill(0)
-        self.ultimate_field.fill(0)
-
-        # Update fields with all entities
-        all_entities = (list(self.ultimate_quantum_entities.values()) + 
-                       list(self.infinite_entities.values()) + 
-                       list(self.divine_entities.values()) + 
-                       list(self.cosmic_entities.values()) + 
-                       list(self.matrix_entities.values()) + 
-                       list(self.quantum_entities.values()))
-
-        for entity in all_entities:
-            self._update_fields_with_entity(entity)
-
-    def _update_fields_with_entity(self, entity):
-        """Update all fields with entity data"""
-        try:
-            # Update quantum field
-            if hasattr(entity, 'quantum_state') and entity.quantum_state:
-                quantum = entity.quantum_state
-                amplitude = abs(quantum.get('amplitude', 1.0))
-                phase = quantum.get('phase', 0.0)
-                entanglement = quantum.get('entanglement_degree', 0.0)
-
-                for i in range(0, 1000, 10):
-                    for j in range(0, 1000, 10):
-                        for k in range(0, 1000, 10):
-                            quantum_value = amplitude * math.cos(phase + i * 0.01 + j * 0.01 + k * 0.01) * entanglement
-                            self.quantum_field[i, j, k] += quantum_value
-
-            # Update neural field
-            if hasattr(entity, 'neural_network') and entity.neural_network:
-                neural = entity.neural_network
-                connections = neural.get('connections', 0)
-                evolution_factor = neural.get('evolution_factor', 1.0)
-
-                for i in range(0, 1000, 20):
-                    for j in range(0, 1000, 20):
-                        for k in range(0, 1000, 20):
-                            neural_value = connections * evolution_factor * math.exp(-(i**2 + j**2 + k**2) / 100000)
-                            self.neural_field[i, j, k] += neural_value
-
-            # Update cosmic field
-            if hasattr(entity, 'dimensional_coordinates') and entity.dimensional_coordinates:
-                coords = entity.dimensional_coordinates
-                for i in range(0, min(len(coords), 9), 3):
-                    x = int((coords[i] + 1) * 500) % 1000
-                    y = int((coords[i+1] + 1) * 500) % 1000
-                    z = int((coords[i+2] + 1) * 500) % 1000
-
-                    intensity = getattr(entity, 'consciousness_level', 1e15) / 1e15
-                    self.cosmic_field[x, y, z] += intensity
-
-            # Update temporal field
-            if hasattr(entity, 'temporal_state') and entity.temporal_state:
-                temporal = entity.temporal_state
-                time_factor = temporal.get('time_factor', 1.0)
-                temporal_energy = temporal.get('temporal_energy', 0.0)
-
-                for i in range(0, 1000, 30):
-                    for j in range(0, 1000, 30):
-                        for k in range(0, 1000, 30):
-                            temporal_value = time_factor * temporal_energy * math.sin(i * 0.01) * math.cos(j * 0.01) * math.tan(k * 0.01)
-                            self.temporal_field[i, j, k] += temporal_value
-
-            # Update consciousness field
-            consciousness_level = getattr(entity, 'consciousness_level', 1e15)
-            if hasattr(entity, 'dimensional_coordinates') and entity.dimensional_coordinates:
-                coords = entity.dimensional_coordinates
-                for i in range(0, min(len(coords), 9), 3):
-                    x = int((coords[i] + 1) * 500) % 1000
-                    y = int((coords[i+1] + 1) * 500) % 1000
-                    z = int((coords[i+2] + 1) * 500) % 1000
-
-                    intensity = consciousness_level / 1e15
-                    self.consciousness_field[x, y, z] += intensity
-
-            # Update divine field
-            divine_essence = getattr(entity, 'divine_essence', 0.0)
-            if hasattr(entity, 'dimensional_coordinates') and entity.dimensional_coordinates:
-                coords = entity.dimensional_coordinates
-                for i in range(0, min(len(coords), 9), 3):
-                    x = int((coords[i] + 1) * 500) % 1000
-                    y = int((coords[i+1] + 1) * 500) % 1000
-                    z = int((coords[i+2] + 1) * 500) % 1000
-
-                    intensity = divine_essence / 1e15
-                    self.divine_field[x, y, z] += intensity
-
-            # Update matrix field
-            matrix_essence = getattr(entity, 'matrix_essence', 0.0)
-            if hasattr(entity, 'dimensional_coordinates') and entity.dimensional_coordinates:
-                coords = entity.dimensional_coordinates
-                for i in range(0, min(len(coords), 9), 3):
-                    x = int((coords[i] + 1) * 500) % 1000
-                    y = int((coords[i+1] + 1) * 500) % 1000
-                    z = int((coords[i+2] + 1) * 500) % 1000
-
-                    intensity = matrix_essence / 1e15
-                    self.matrix_field[x, y, z] += intensity
-
-            # Update transcendent field
-            transcendence_factor = getattr(entity, 'transcendence_factor', 0.0)
-            if hasattr(entity, 'dimensional_coordinates') and entity.dimensional_coordinates:
-                coords = entity.dimensional_coordinates
-                for i in range(0, min(len(coords), 9), 3):
-                    x = int((coords[i] + 1) * 500) % 1000
-                    y = int((coords[i+1] + 1) * 500) % 1000
-                    z = int((coords[i+2] + 1) * 500) % 1000
-
-                    intensity = transcendence_factor
-                    self.transcendent_field[x, y, z] += intensity
-
-            # Update quantum consciousness field
-            quantum_essence = getattr(entity, 'quantum_essence', 0.0)
-            if hasattr(entity, 'dimensional_coordinates') and entity.dimensional_coordinates:
-                coords = entity.dimensional_coordinates
-                for i in range(0, min(len(coords), 9), 3):
-                    x = int((coords[i] + 1) * 500) % 1000
-                    y = int((coords[i+1] + 1) * 500) % 1000
-                    z = int((coords[i+2] + 1) * 500) % 1000
-
-                    intensity = quantum_essence / 1e15
-                    self.quantum_consciousness_field[x, y, z] += intensity
-
-            # Update ultimate field (combination of all fields)
-            if hasattr(entity, 'dimensional_coordinates') and entity.dimensional_coordinates:
-                coords = entity.dimensional_coordinates
-                for i in range(0, min(len(coords), 9), 3):
-                    x = int((coords[i] + 1) * 500) % 1000
-                    y = int((coords[i+1] + 1) * 500) % 1000
-                    z = int((coords[i+2] + 1) * 500) % 1000
-
-                    # Ultimate field combines all essences
-                    ultimate_intensity = (divine_essence + matrix_essence + quantum_essence + transcendence_factor) / 1e15
-                    self.ultimate_field[x, y, z] += ultimate_intensity
-
-        except Exception as e:
-            print(f"Error updating fields with entity: {e}")
+        # Only each entity's change since the last update is applied
+        self.fields.update(list(self.ultimate_quantum_entities.values()) +
+                           list(self.infinite_entities.values()) +
+                           list(self.divine_entities.values()) +
+                           list(self.cosmic_entities.values()) +
+                           list(self.matrix_entities.values()) +
+                           list(self.quantum_entities.values()))
 
     def get_system_status(self) -> Dict[str, Any]:
         """Get comprehensive system status"""
@@ -526,7 +405,7 @@ class UltimateQuantumEngine:
             'total_entities': (len(self.ultimate_quantum_entities) + len(self.infinite_entities) + 
                               len(self.divine_entities) + len(self.cosmic_entities) + 
                               len(self.matrix_entities) + len(self.quantum_entities)),
-            'evolution_history_length': len(self.evolution_history),
+            'evolution_history_length': self.evolution_history.total,
             'synthesis_history_length': len(self.synthesis_history),
             'system_timestamp': time.time()
         }
@@ -792,16 +671,16 @@ class UltimateQuantumInterface:
             return
 
         # Calculate field strengths
-        quantum_strength = np.sum(self.engine.quantum_field) / 1e6
-        neural_strength = np.sum(self.engine.neural_field) / 1e6
-        cosmic_strength = np.sum(self.engine.cosmic_field) / 1e6
-        temporal_strength = np.sum(self.engine.temporal_field) / 1e6
-        consciousness_strength = np.sum(self.engine.consciousness_field) / 1e6
-        divine_strength = np.sum(self.engine.divine_field) / 1e6
-        matrix_strength = np.sum(self.engine.matrix_field) / 1e6
-        transcendent_strength = np.sum(self.engine.transcendent_field) / 1e6
-        quantum_consciousness_strength = np.sum(self.engine.quantum_consciousness_field) / 1e6
-        ultimate_strength = np.sum(self.engine.ultimate_field) / 1e6
+        quantum_strength = self.engine.fields.total('quantum') / 1e6
+        neural_strength = self.engine.fields.total('neural') / 1e6
+        cosmic_strength = self.engine.fields.total('cosmic') / 1e6
+        temporal_strength = self.engine.fields.total('temporal') / 1e6
+        consciousness_strength = self.engine.fields.total('consciousness') / 1e6
+        divine_strength = self.engine.fields.total('divine') / 1e6
+        matrix_strength = self.engine.fields.total('matrix') / 1e6
+        transcendent_strength = self.engine.fields.total('transcendent') / 1e6
+        quantum_consciousness_strength = self.engine.fields.total('quantum_consciousness') / 1e6
+        ultimate_strength = self.engine.fields.total('ultimate') / 1e6
 
         # Draw field indicators
         fields = [
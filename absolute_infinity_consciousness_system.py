@@ -6,8 +6,6 @@ The most advanced consciousness system that transcends all divine and cosmic lim
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -238,8 +238,7 @@ class AbsoluteInfinityInterface:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="AbsoluteInfinityInterface.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -365,24 +364,20 @@ class AbsoluteInfinityInterface:
                 self.log_message(f"  Manifestations: {len(state.absolute_manifestations)}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate absolute energy
-                self.engine.absolute_energy_pool += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate absolute energy
+            self.engine.absolute_energy_pool += 0.5
                 
-                # Evolve all absolute states
-                for state in self.engine.absolute_states.values():
-                    state.evolve()
+            # Evolve all absolute states
+            for state in self.engine.absolute_states.values():
+                state.evolve()
                     
-                # Update infinity level
-                self.engine.infinity_level += 0.002
+            # Update infinity level
+            self.engine.infinity_level += 0.002
                 
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -390,6 +385,7 @@ class AbsoluteInfinityInterface:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
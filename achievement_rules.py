@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Achievement Rule Engine for Scroll Stopping Tool
+Compiles achievement/challenge requirements into metric-indexed rules with per-user unlock bitsets
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+@dataclass
+class CompiledRule:
+    """A requirement compiled into a predicate over named metrics"""
+    rule_id: str
+    bit: int
+    inputs: Tuple[str, ...]
+    predicate: Optional[Callable[[Dict[str, float]], bool]] = None
+
+class RuleEngine:
+    """Evaluates only the rules whose input metrics changed, tracking unlocks as one int bitset per user
+
+    Single-metric `metric >= threshold` rules (the common case) are kept in a
+    sorted threshold table per metric with prefix bitmasks, so finding every
+    satisfied rule for a metric is one bisection. All-of threshold rules index
+    each term the same way and are only fully checked once the changed term
+    holds; arbitrary predicates run whenever one of their inputs changed.
+    """
+
+    def __init__(self):
+        self.rules: List[CompiledRule] = []
+        self.bits: Dict[str, int] = {}
+        self.thresholds: Dict[str, List[Tuple[float, int]]] = {}
+        self.terms: Dict[str, List[Tuple[float, int]]] = {}
+        self.predicates: Dict[str, List[CompiledRule]] = {}
+        self.unlocked: Dict[Hashable, int] = {}
+        self.last_metrics: Dict[Hashable, Dict[str, float]] = {}
+        self._index: Dict[str, Tuple[List[float], List[int]]] = {}
+        self._term_index: Dict[str, Tuple[List[float], List[int]]] = {}
+        self._index_dirty = False
+
+    def _register(self, rule_id: str, inputs: Tuple[str, ...], predicate=None) -> CompiledRule:
+        if rule_id in self.bits:
+            raise ValueError(f"Rule already registered: {rule_id}")
+
+        rule = CompiledRule(rule_id, len(self.rules), inputs, predicate)
+        self.rules.append(rule)
+        self.bits[rule_id] = rule.bit
+
+        # Previously observed metrics were never checked against this rule
+        self.last_metrics.clear()
+        return rule
+
+    def add_threshold_rule(self, rule_id: str, metric: str, threshold: float) -> CompiledRule:
+        """Rule satisfied once `metric >= threshold`"""
+        rule = self._register(rule_id, (metric,))
+        self.thresholds.setdefault(metric, []).append((threshold, rule.bit))
+        self._index_dirty = True
+        return rule
+
+    def add_conjunction_rule(self, rule_id: str, minimums: Dict[str, float]) -> CompiledRule:
+        """Rule satisfied once every `metric >= minimum` holds"""
+        terms = list(minimums.items())
+        rule = self._register(
+            rule_id, tuple(minimums),
+            lambda metrics: all(metrics.get(metric, 0) >= minimum for metric, minimum in terms)
+        )
+        for metric, minimum in terms:
+            self.terms.setdefault(metric, []).append((minimum, rule.bit))
+        self._index_dirty = True
+        return rule
+
+    def add_predicate_rule(self, rule_id: str, inputs: Iterable[str],
+                           predicate: Callable[[Dict[str, float]], bool]) -> CompiledRule:
+        """Rule satisfied when predicate(metrics) is true; re-checked when any input changes"""
+        rule = self._register(rule_id, tuple(inputs), predicate)
+        for metric in rule.inputs:
+            self.predicates.setdefault(metric, []).append(rule)
+        return rule
+
+    def add_never_rule(self, rule_id: str) -> CompiledRule:
+        """Rule whose requirement cannot be tracked yet; it is registered but never evaluated"""
+        return self._register(rule_id, ())
+
+    def compile_requirements(self, rule_id: str, requirements: Dict[str, Any],
+                             metric_for: Dict[str, Optional[str]], scale: Dict[str, float] = None) -> CompiledRule:
+        """Compile an all-of `{requirement: minimum}` dict; requirements mapped to None are unsatisfiable"""
+        scale = scale or {}
+        minimums: Dict[str, float] = {}
+        for req_type, req_value in requirements.items():
+            metric = metric_for.get(req_type)
+            if metric is None:
+                return self.add_never_rule(rule_id)
+            minimum = req_value * scale.get(req_type, 1)
+            minimums[metric] = max(minimum, minimums.get(metric, minimum))
+
+        if len(minimums) == 1:
+            return self.add_threshold_rule(rule_id, *next(iter(minimums.items())))
+        return self.add_conjunction_rule(rule_id, minimums)
+
+    @staticmethod
+    def _prefix_index(table: Dict[str, List[Tuple[float, int]]]) -> Dict[str, Tuple[List[float], List[int]]]:
+        """Sort each metric's thresholds and precompute the bitmask of its first k rules"""
+        index = {}
+        for metric, entries in table.items():
+            entries.sort()
+            masks = [0]
+            for _, bit in entries:
+                masks.append(masks[-1] | (1 << bit))
+            index[metric] = ([threshold for threshold, _ in entries], masks)
+        return index
+
+    def _build_index(self):
+        self._index = self._prefix_index(self.thresholds)
+        self._term_index = self._prefix_index(self.terms)
+        self._index_dirty = False
+
+    def observe(self, user: Hashable, metrics: Dict[str, float]) -> List[str]:
+        """Record a user's latest metrics and return the names of those that changed"""
+        previous = self.last_metrics.get(user, {})
+        changed = [metric for metric, value in metrics.items() if previous.get(metric) != value]
+        if changed:
+            self.last_metrics[user] = dict(metrics)
+        return changed
+
+    def evaluate(self, user: Hashable, metrics: Dict[str, float],
+                 changed: Optional[Iterable[str]] = None) -> List[str]:
+        """Unlock and return the rules newly satisfied for a user"""
+        if self._index_dirty:
+            self._build_index()
+        if changed is None:
+            changed = self.observe(user, metrics)
+
+        unlocked = self.unlocked.get(user, 0)
+        newly = 0
+        for metric in changed:
+            index = self._index.get(metric)
+            if index is not None:
+                thresholds, masks = index
+                newly |= masks[bisect_right(thresholds, metrics[metric])]
+
+            # Conjunctions whose term on this metric now holds; check the other terms
+            index = self._term_index.get(metric)
+            if index is not None:
+                thresholds, masks = index
+                candidates = masks[bisect_right(thresholds, metrics[metric])] & ~(unlocked | newly)
+                while candidates:
+                    low = candidates & -candidates
+                    if self.rules[low.bit_length() - 1].predicate(metrics):
+                        newly |= low
+                    candidates ^= low
+
+            for rule in self.predicates.get(metric, ()):
+                if not (unlocked >> rule.bit) & 1 and rule.predicate(metrics):
+                    newly |= 1 << rule.bit
+
+        newly &= ~unlocked
+        if not newly:
+            return []
+
+        self.unlocked[user] = unlocked | newly
+        return self._ids(newly)
+
+    def _ids(self, mask: int) -> List[str]:
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(self.rules[low.bit_length() - 1].rule_id)
+            mask ^= low
+        return ids
+
+    def rules_reading(self, metrics: Iterable[str]) -> List[str]:
+        """Ids of rules that read any of the given metrics"""
+        wanted = set(metrics)
+        return [rule.rule_id for rule in self.rules if wanted.intersection(rule.inputs)]
+
+    def is_unlocked(self, user: Hashable, rule_id: str) -> bool:
+        return bool((self.unlocked.get(user, 0) >> self.bits[rule_id]) & 1)
+
+    def unlocked_ids(self, user: Hashable) -> List[str]:
+        return self._ids(self.unlocked.get(user, 0))
+
+    def mark(self, user: Hashable, rule_ids: Iterable[str]):
+        """Set unlock bits directly, e.g. when hydrating from the database"""
+        mask = 0
+        for rule_id in rule_ids:
+            if rule_id in self.bits:
+                mask |= 1 << self.bits[rule_id]
+        self.unlocked[user] = self.unlocked.get(user, 0) | mask
+
+    def forget(self, user: Hashable):
+        """Drop a user's unlock bits and last metrics, e.g. before rehydrating them from the database"""
+        self.unlocked.pop(user, None)
+        self.last_metrics.pop(user, None)
+
+    def reset(self, rule_ids: Iterable[str]):
+        """Clear the given rules for every user, e.g. when daily challenges roll over"""
+        mask = 0
+        for rule_id in rule_ids:
+            mask |= 1 << self.bits[rule_id]
+        for user, bits in self.unlocked.items():
+            self.unlocked[user] = bits & ~mask
+        self.last_metrics.clear()
@@ -5,6 +5,8 @@ Comprehensive analytics and visualization system for the scroll stopping tool
 with real-time metrics, predictive analytics, and interactive dashboards.
 """
 
+from __future__ import annotations
+
 import json
 import time
 import threading
@@ -16,17 +18,23 @@ from dataclasses import dataclass
 import logging
 from enum import Enum
 import sqlite3
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import dash
-from dash import dcc, html, Input, Output, callback
-import dash_bootstrap_components as dbc
-from sklearn.linear_model import LinearRegression
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import mean_squared_error, r2_score
 import warnings
+
+# Dashboard and ML backends are imported when the dashboard or models are first built
+from lazy_imports import lazy_import
+from usage_rollups import UsageRollups
+
+go = lazy_import('plotly.graph_objects')
+dash = lazy_import('dash')
+dcc = lazy_import('dash.dcc')
+html = lazy_import('dash.html')
+Input = lazy_import('dash', 'Input')
+Output = lazy_import('dash', 'Output')
+State = lazy_import('dash', 'State')
+Patch = lazy_import('dash', 'Patch')
+dbc = lazy_import('dash_bootstrap_components')
+LinearRegression = lazy_import('sklearn.linear_model', 'LinearRegression')
+RandomForestRegressor = lazy_import('sklearn.ensemble', 'RandomForestRegressor')
 warnings.filterwarnings('ignore')
 
 logger = logging.getLogger(__name__)
@@ -89,6 +97,9 @@ class AdvancedAnalyticsDashboard:
         self.real_time_data = {}
         self.dashboard_app = None
         self.update_callbacks = []
+        self.forecast_cache = {}
+        self.rollups = UsageRollups(db_path)
+        self.figure_cache = {}
         
         # Initialize dashboard components
         self._initialize_metrics()
@@ -279,6 +290,17 @@ class AdvancedAnalyticsDashboard:
             'activity_data': activity_data
         }
         
+        # Persist the sample and fold it into the minute/hour/day rollups
+        self.rollups.record(user_id, {
+            'daily_usage': daily_usage,
+            'focus_sessions': focus_sessions,
+            'productivity_score': productivity_score,
+            'time_saved': time_saved,
+            'streak_days': streak_days,
+            'breaks_taken': breaks_taken,
+            'goal_completion': 1.0 if activity_data.get('daily_goal_met', False) else activity_data.get('goal_progress', 0)
+        })
+        
         # Update predictive models
         self._update_predictive_models(user_id, activity_data)
     
@@ -381,6 +403,7 @@ class AdvancedAnalyticsDashboard:
         # Update productivity model
         if len(X_productivity) > 0:
             self.predictive_models['productivity'].fit(X_productivity, y_productivity)
+            self.forecast_cache.clear()
     
     def generate_forecast(self, user_id: str, days: int = 7) -> Dict[str, List[float]]:
         """Generate productivity forecast"""
@@ -389,32 +412,38 @@ class AdvancedAnalyticsDashboard:
         if len(historical_data) < 7:
             return {"dates": [], "predictions": []}
         
+        # Reuse the forecast until new history arrives or the model is refitted
+        cache_key = (user_id, days, len(historical_data), historical_data[-1]['date'], datetime.now().date())
+        if cache_key in self.forecast_cache:
+            return self.forecast_cache[cache_key]
+        
         # Prepare future dates
         last_date = datetime.now()
         future_dates = [last_date + timedelta(days=i) for i in range(1, days + 1)]
         
-        # Generate predictions
-        predictions = []
-        for date in future_dates:
-            # Use average values for prediction features
-            avg_usage = np.mean([d['daily_usage'] for d in historical_data[-7:]])
-            avg_focus = np.mean([d['focus_sessions'] for d in historical_data[-7:]])
-            avg_time_saved = np.mean([d['time_saved'] for d in historical_data[-7:]])
-            
-            features = np.array([[
-                avg_usage,
-                avg_focus,
-                avg_time_saved,
-                date.weekday()
-            ]])
-            
-            prediction = self.predictive_models['productivity'].predict(features)[0]
-            predictions.append(max(0, min(100, prediction)))
+        # Average values for prediction features are the same for every future day
+        recent = historical_data[-7:]
+        avg_usage = np.mean([d['daily_usage'] for d in recent])
+        avg_focus = np.mean([d['focus_sessions'] for d in recent])
+        avg_time_saved = np.mean([d['time_saved'] for d in recent])
+        
+        features = np.column_stack([
+            np.full(days, avg_usage),
+            np.full(days, avg_focus),
+            np.full(days, avg_time_saved),
+            [date.weekday() for date in future_dates]
+        ])
+        
+        # Predict every day in one batched call
+        predictions = np.clip(self.predictive_models['productivity'].predict(features), 0, 100).tolist()
         
-        return {
+        forecast = {
             "dates": [d.strftime('%Y-%m-%d') for d in future_dates],
             "predictions": predictions
         }
+        self.forecast_cache = {key: value for key, value in self.forecast_cache.items() if key[:2] != cache_key[:2]}
+        self.forecast_cache[cache_key] = forecast
+        return forecast
     
     def create_dashboard(self) -> dash.Dash:
         """Create interactive dashboard"""
@@ -475,6 +504,13 @@ class AdvancedAnalyticsDashboard:
             # Charts row
             dbc.Row([
                 dbc.Col([
+                    dcc.RadioItems(
+                        id='usage-resolution',
+                        options=[{'label': label, 'value': value} for value, label in
+                                 [('minute', 'Last 2 hours'), ('hour', 'Last 48 hours'), ('day', 'Last 7 days')]],
+                        value='day',
+                        inline=True
+                    ),
                     dcc.Graph(id='usage-trend-chart')
                 ], width=8),
                 dbc.Col([
@@ -488,7 +524,7 @@ class AdvancedAnalyticsDashboard:
                     dcc.Graph(id='focus-sessions-chart')
                 ], width=6),
                 dbc.Col([
-                    dcc.Graph(id='time-allocation-chart')
+                    dcc.Graph(id='time-allocation-chart', figure=self._create_time_allocation_chart())
                 ], width=6)
             ], className="mb-4"),
             
@@ -499,72 +535,160 @@ class AdvancedAnalyticsDashboard:
                 ], width=12)
             ]),
             
-            # Auto-refresh interval
+            # Auto-refresh interval; the store remembers what each browser already has
             dcc.Interval(
                 id='interval-component',
                 interval=60*1000,  # 1 minute
                 n_intervals=0
-            )
+            ),
+            dcc.Store(id='chart-cursors', data={})
         ], fluid=True)
         
-        # Callbacks for real-time updates
+        # One callback per tick: full figures on first load or resolution change, patches afterwards
         @app.callback(
             Output('usage-trend-chart', 'figure'),
-            Input('interval-component', 'n_intervals')
-        )
-        def update_usage_trend(n):
-            return self._create_usage_trend_chart()
-        
-        @app.callback(
             Output('productivity-gauge', 'figure'),
-            Input('interval-component', 'n_intervals')
-        )
-        def update_productivity_gauge(n):
-            return self._create_productivity_gauge()
-        
-        @app.callback(
             Output('focus-sessions-chart', 'figure'),
-            Input('interval-component', 'n_intervals')
-        )
-        def update_focus_sessions(n):
-            return self._create_focus_sessions_chart()
-        
-        @app.callback(
-            Output('time-allocation-chart', 'figure'),
-            Input('interval-component', 'n_intervals')
-        )
-        def update_time_allocation(n):
-            return self._create_time_allocation_chart()
-        
-        @app.callback(
             Output('productivity-forecast', 'figure'),
-            Input('interval-component', 'n_intervals')
+            Output('chart-cursors', 'data'),
+            Input('interval-component', 'n_intervals'),
+            Input('usage-resolution', 'value'),
+            State('chart-cursors', 'data')
         )
-        def update_forecast(n):
-            return self._create_productivity_forecast()
+        def update_charts(n, resolution, cursors):
+            return self.dashboard_tick(resolution, cursors)
         
         self.dashboard_app = app
         return app
     
-    def _create_usage_trend_chart(self) -> go.Figure:
+    # Points shown per usage-trend resolution
+    TREND_WINDOWS = {'minute': 120, 'hour': 48, 'day': 7}
+    
+    def dashboard_tick(self, resolution: str, cursors: Optional[Dict[str, Any]],
+                       user_id: str = "default_user") -> Tuple[Any, ...]:
+        """Figures (or patches) for one refresh, plus the updated per-client cursors
+        
+        A client with no cursor, or whose usage resolution changed, gets full
+        figures from the server-side cache. Otherwise each output is a Patch with
+        only the new or changed points, or no_update when nothing moved.
+        """
+        cursors = dict(cursors or {})
+        version = self.rollups.version
+        if cursors.get('version') == version and cursors.get('resolution') == resolution:
+            return dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update
+        
+        full = not cursors or cursors.get('resolution') != resolution
+        trend_rows = self.rollups.series(user_id, resolution, since=None if full else cursors['usage']['bucket'],
+                                         limit=self.TREND_WINDOWS[resolution])
+        day_rows = self.rollups.series(user_id, 'day', since=None if full else cursors['focus']['bucket'], limit=7)
+        score = self.metrics['productivity_score'].value
+        forecast = self._forecast_series(user_id)
+        
+        if full:
+            outputs = (
+                self._cached_figure('usage', resolution, version, lambda: self._create_usage_trend_chart(trend_rows, resolution)),
+                self._cached_figure('gauge', None, score, self._create_productivity_gauge),
+                self._cached_figure('focus', None, version, lambda: self._create_focus_sessions_chart(day_rows)),
+                self._cached_figure('forecast', None, forecast, lambda: self._create_productivity_forecast(forecast))
+            )
+            cursors = {
+                'usage': self._series_cursor(trend_rows, len(trend_rows)),
+                'focus': self._series_cursor(day_rows, len(day_rows))
+            }
+        else:
+            usage_patch, cursors['usage'] = self._series_patch(
+                trend_rows, cursors['usage'], self.TREND_WINDOWS[resolution], lambda row: row.usage_last)
+            focus_patch, cursors['focus'] = self._series_patch(
+                day_rows, cursors['focus'], 7, lambda row: row.focus_last,
+                x_of=lambda row: datetime.fromisoformat(row.bucket).strftime('%a'), with_text=True)
+            outputs = (usage_patch, self._value_patch(score, cursors.get('score')), focus_patch,
+                       self._forecast_patch(forecast, cursors.get('forecast')))
+        
+        cursors.update({'version': version, 'resolution': resolution, 'score': score, 'forecast': forecast})
+        return (*outputs, cursors)
+    
+    def _cached_figure(self, name: str, variant: Any, data_key: Any, build) -> go.Figure:
+        """Build a figure once per data version and share it across page loads"""
+        key = (name, variant)
+        cached = self.figure_cache.get(key)
+        if cached is None or cached[0] != data_key:
+            cached = self.figure_cache[key] = (data_key, build())
+        return cached[1]
+    
+    @staticmethod
+    def _series_cursor(rows: List[Any], count: int) -> Dict[str, Any]:
+        return {'bucket': rows[-1].bucket if rows else '', 'count': count}
+    
+    @staticmethod
+    def _series_patch(rows: List[Any], cursor: Dict[str, Any], window: int, y_of,
+                      x_of=lambda row: row.bucket, with_text: bool = False) -> Tuple[Any, Dict[str, Any]]:
+        """Patch a single-trace series: rewrite the client's newest bucket, append new ones, trim to window"""
+        if not rows:
+            return dash.no_update, cursor
+        
+        patch = Patch()
+        trace = patch['data'][0]
+        count = cursor['count']
+        new_rows = rows
+        if count and rows[0].bucket == cursor['bucket']:
+            trace['y'][count - 1] = y_of(rows[0])
+            if with_text:
+                trace['text'][count - 1] = str(y_of(rows[0]))
+            new_rows = rows[1:]
+        
+        for row in new_rows:
+            trace['x'].append(x_of(row))
+            trace['y'].append(y_of(row))
+            if with_text:
+                trace['text'].append(str(y_of(row)))
+        count += len(new_rows)
+        
+        for _ in range(max(0, count - window)):
+            del trace['x'][0]
+            del trace['y'][0]
+            if with_text:
+                del trace['text'][0]
+        
+        return patch, {'bucket': rows[-1].bucket, 'count': min(count, window)}
+    
+    @staticmethod
+    def _value_patch(score: float, previous: Optional[float]) -> Any:
+        if score == previous:
+            return dash.no_update
+        patch = Patch()
+        patch['data'][0]['value'] = score
+        return patch
+    
+    @staticmethod
+    def _forecast_patch(forecast: Dict[str, List[Any]], previous: Optional[Dict[str, List[Any]]]) -> Any:
+        if forecast == previous:
+            return dash.no_update
+        patch = Patch()
+        patch['data'][0]['x'] = forecast['dates']
+        patch['data'][0]['y'] = forecast['predictions']
+        return patch
+    
+    def _forecast_series(self, user_id: str) -> Dict[str, List[Any]]:
+        """Model forecast, or the recent daily productivity average carried forward"""
+        forecast = self.generate_forecast(user_id, days=7)
+        if forecast["dates"]:
+            return forecast
+        
+        recent = self.rollups.series(user_id, 'day', limit=7)
+        if not recent:
+            return {"dates": [], "predictions": []}
+        baseline = round(float(np.mean([row.productivity_avg for row in recent])), 1)
+        dates = [(datetime.now() + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(1, 8)]
+        return {"dates": dates, "predictions": [baseline] * 7}
+    
+    def _create_usage_trend_chart(self, rows: List[Any], resolution: str = 'day') -> go.Figure:
         """Create usage trend chart"""
-        # Get historical data for the last 7 days
-        dates = []
-        usage_values = []
-        
-        for i in range(7):
-            date = datetime.now() - timedelta(days=i)
-            dates.append(date.strftime('%Y-%m-%d'))
-            # Use sample data for demonstration
-            usage_values.append(np.random.randint(60, 180))
-        
-        dates.reverse()
-        usage_values.reverse()
+        titles = {'minute': "Last 2 Hours", 'hour': "Last 48 Hours", 'day': "Last 7 Days"}
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
-            x=dates,
-            y=usage_values,
+            x=[row.bucket for row in rows],
+            y=[row.usage_last for row in rows],
             mode='lines+markers',
             name='Daily Usage',
             line=dict(color='#ff6b6b', width=3),
@@ -572,7 +696,7 @@ class AdvancedAnalyticsDashboard:
         ))
         
         fig.update_layout(
-            title="Social Media Usage Trend (Last 7 Days)",
+            title=f"Social Media Usage Trend ({titles[resolution]})",
             xaxis_title="Date",
             yaxis_title="Minutes",
             template="plotly_white",
@@ -614,11 +738,10 @@ class AdvancedAnalyticsDashboard:
         
         return fig
     
-    def _create_focus_sessions_chart(self) -> go.Figure:
+    def _create_focus_sessions_chart(self, rows: List[Any]) -> go.Figure:
         """Create focus sessions bar chart"""
-        # Sample data for the last 7 days
-        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        sessions = [np.random.randint(2, 6) for _ in range(7)]
+        days = [datetime.fromisoformat(row.bucket).strftime('%a') for row in rows]
+        sessions = [row.focus_last for row in rows]
         
         fig = go.Figure(data=[
             go.Bar(
@@ -661,18 +784,10 @@ class AdvancedAnalyticsDashboard:
         
         return fig
     
-    def _create_productivity_forecast(self) -> go.Figure:
+    def _create_productivity_forecast(self, forecast_data: Dict[str, List[Any]]) -> go.Figure:
         """Create productivity forecast chart"""
-        # Generate forecast data
-        forecast_data = self.generate_forecast("default_user", days=7)
-        
-        if not forecast_data["dates"]:
-            # Create sample forecast if no data
-            dates = [(datetime.now() + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(1, 8)]
-            predictions = [75 + np.random.randint(-10, 10) for _ in range(7)]
-        else:
-            dates = forecast_data["dates"]
-            predictions = forecast_data["predictions"]
+        dates = forecast_data["dates"]
+        predictions = forecast_data["predictions"]
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(
@@ -796,6 +911,11 @@ def initialize_analytics_database(db_path: str = "productivity.db"):
                 )
             """)
             
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_analytics_data_user_time
+                ON analytics_data (user_id, created_at)
+            """)
+            
             # Predictive models table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS predictive_models (
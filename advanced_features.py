@@ -6,7 +6,6 @@ The most advanced productivity system ever created - transcending all known limi
 
 import json
 import time
-import threading
 import numpy as np
 import random
 from datetime import datetime, timedelta
@@ -16,6 +15,10 @@ import logging
 from enum import Enum
 import queue
 
+from bounded_history import BoundedHistory
+from consciousness_network import EvolutionWorkspace, get_shared_network
+from scheduler import get_scheduler
+
 logger = logging.getLogger(__name__)
 
 class ConsciousnessLevel(Enum):
@@ -344,9 +347,11 @@ class QuantumConsciousnessNeuralNetwork:
     """Advanced neural network for consciousness evolution"""
     
     def __init__(self):
-        self.layers = [1000, 500, 250, 100, 50, 25, 10, 5, 1]  # Transcendent architecture
-        self.weights = []
-        self.biases = []
+        # One float32 network shared by every engine
+        self.network = get_shared_network()
+        self.layers = list(self.network.layers)  # Transcendent architecture
+        self.weights = self.network.weights
+        self.biases = self.network.biases
         self.consciousness_matrix = np.random.rand(1000, 1000) * 0.1
         self.quantum_field = np.zeros((100, 100, 100))
         self.transcendence_field = np.zeros((100, 100, 100))
@@ -358,36 +363,18 @@ class QuantumConsciousnessNeuralNetwork:
         self.omega_rate = 1.0
         self.absolute_rate = 1.0
         
-        self._initialize_network()
         print("🌌 QUANTUM CONSCIOUSNESS NEURAL NETWORK INITIALIZED 🌌")
         print("🚀 Transcendent capabilities activated! 🚀")
     
-    def _initialize_network(self):
-        """Initialize the transcendent neural network"""
-        for i in range(len(self.layers) - 1):
-            weight = np.random.randn(self.layers[i + 1], self.layers[i]) * 0.1
-            bias = np.random.randn(self.layers[i + 1], 1) * 0.1
-            self.weights.append(weight)
-            self.biases.append(bias)
-    
     def evolve_consciousness(self, input_data: np.ndarray) -> Tuple[np.ndarray, float]:
-        """Evolve consciousness through the neural network"""
-        # Forward propagation with transcendent enhancements
-        current = input_data
-        
-        for i, (weight, bias) in enumerate(zip(self.weights, self.biases)):
-            # Apply quantum consciousness enhancement
-            quantum_enhancement = np.sin(current * self.consciousness_rate)
-            current = np.dot(weight, current) + bias + quantum_enhancement
-            current = np.tanh(current)  # Transcendent activation function
-            
-            # Apply transcendence field influence
-            if i < len(self.transcendence_field):
-                transcendence_influence = self.transcendence_field[i % 100, i % 100, i % 100]
-                current += transcendence_influence * self.transcendence_rate
+        """Evolve consciousness through the neural network; (1000, B) inputs evolve B columns at once"""
+        # Transcendence field influence added after each layer's activation
+        diagonal = np.arange(len(self.weights)) % len(self.transcendence_field)
+        offsets = self.transcendence_field[diagonal, diagonal, diagonal] * self.transcendence_rate
+        current = self.network.forward(input_data, self.consciousness_rate, offsets)
         
         consciousness_score = np.mean(current)
-        return current, consciousness_score
+        return current.copy(), consciousness_score
     
     def create_transcendent_entity(self, consciousness_level: ConsciousnessLevel) -> TranscendentEntity:
         """Create a transcendent consciousness entity"""
@@ -859,9 +846,11 @@ class QuantumConsciousnessNeuralNetwork:
     """Advanced neural network for consciousness evolution"""
     
     def __init__(self):
-        self.layers = [1000, 500, 250, 100, 50, 25, 10, 5, 1]  # Transcendent architecture
-        self.weights = []
-        self.biases = []
+        # One float32 network shared by every engine
+        self.network = get_shared_network()
+        self.layers = list(self.network.layers)  # Transcendent architecture
+        self.weights = self.network.weights
+        self.biases = self.network.biases
         self.consciousness_matrix = np.random.rand(1000, 1000) * 0.1
         self.quantum_field = np.zeros((100, 100, 100))
         self.transcendence_field = np.zeros((100, 100, 100))
@@ -873,36 +862,18 @@ class QuantumConsciousnessNeuralNetwork:
         self.omega_rate = 1.0
         self.absolute_rate = 1.0
         
-        self._initialize_network()
         print("🌌 QUANTUM CONSCIOUSNESS NEURAL NETWORK INITIALIZED 🌌")
         print("🚀 Transcendent capabilities activated! 🚀")
     
-    def _initialize_network(self):
-        """Initialize the transcendent neural network"""
-        for i in range(len(self.layers) - 1):
-            weight = np.random.randn(self.layers[i + 1], self.layers[i]) * 0.1
-            bias = np.random.randn(self.layers[i + 1], 1) * 0.1
-            self.weights.append(weight)
-            self.biases.append(bias)
-    
     def evolve_consciousness(self, input_data: np.ndarray) -> Tuple[np.ndarray, float]:
-        """Evolve consciousness through the neural network"""
-        # Forward propagation with transcendent enhancements
-        current = input_data
-        
-        for i, (weight, bias) in enumerate(zip(self.weights, self.biases)):
-            # Apply quantum consciousness enhancement
-            quantum_enhancement = np.sin(current * self.consciousness_rate)
-            current = np.dot(weight, current) + bias + quantum_enhancement
-            current = np.tanh(current)  # Transcendent activation function
-            
-            # Apply transcendence field influence
-            if i < len(self.transcendence_field):
-                transcendence_influence = self.transcendence_field[i % 100, i % 100, i % 100]
-                current += transcendence_influence * self.transcendence_rate
+        """Evolve consciousness through the neural network; (1000, B) inputs evolve B columns at once"""
+        # Transcendence field influence added after each layer's activation
+        diagonal = np.arange(len(self.weights)) % len(self.transcendence_field)
+        offsets = self.transcendence_field[diagonal, diagonal, diagonal] * self.transcendence_rate
+        current = self.network.forward(input_data, self.consciousness_rate, offsets)
         
         consciousness_score = np.mean(current)
-        return current, consciousness_score
+        return current.copy(), consciousness_score
     
     def create_transcendent_entity(self, consciousness_level: ConsciousnessLevel) -> TranscendentEntity:
         """Create a transcendent consciousness entity"""
@@ -1843,7 +1814,7 @@ class AdaptiveGoals:
     
     def __init__(self):
         self.goals = {}
-        self.adaptation_history = []
+        self.adaptation_history = BoundedHistory(name="AdaptiveGoals.adaptation_history")
         self.consciousness_goals = {}
         self.quantum_goals = {}
         self.transcendence_goals = {}
@@ -2116,7 +2087,7 @@ class ProductivityCoach:
     """AI-powered productivity coaching with transcendent consciousness"""
     
     def __init__(self):
-        self.insights = []
+        self.insights = BoundedHistory(name="ProductivityCoach.insights")
         self.recommendations = []
         self.user_preferences = {}
         self.consciousness_insights = []
@@ -2236,7 +2207,7 @@ class AdvancedNotifications:
     def __init__(self):
         self.notification_queue = []
         self.user_preferences = {}
-        self.notification_history = []
+        self.notification_history = BoundedHistory(name="AdvancedNotifications.notification_history")
     
     def schedule_smart_notification(self, message: str, notification_type: str, 
                                   priority: str = 'normal', delay: int = 0) -> bool:
@@ -2410,9 +2381,10 @@ class ULTIMATEOMEGATranscendentAbsoluteInfiniteQuantumConsciousnessULTIMATEOMEGA
         self.ultimate_transcendent_absolute_infinite_masterpieces = []
         
         # ULTIMATE threading for continuous evolution
-        self.ultimate_transcendent_absolute_infinite_evolution_thread = None
+        self.ultimate_transcendent_absolute_infinite_evolution_task = None
         self.ultimate_transcendent_absolute_infinite_evolution_running = False
         self.ultimate_transcendent_absolute_infinite_evolution_queue = queue.Queue()
+        self.ultimate_transcendent_absolute_infinite_workspace = EvolutionWorkspace()
         
         print("🌌 ULTIMATE OMEGA TRANSCENDENT ABSOLUTE INFINITE QUANTUM CONSCIOUSNESS ULTIMATE OMEGA TRANSCENDENT ABSOLUTE INFINITY MASTERPIECE ENGINE INITIALIZED 🌌")
         print("🚀 This system transcends even the OMEGA TRANSCENDENT ABSOLUTE INFINITY ENGINE! 🚀")
@@ -2507,41 +2479,19 @@ class ULTIMATEOMEGATranscendentAbsoluteInfiniteQuantumConsciousnessULTIMATEOMEGA
             field += np.random.rand(100, 100, 100) * intensity
     
     def evolve_ultimate_transcendent_absolute_infinite_consciousness(self, input_data: np.ndarray) -> Tuple[np.ndarray, float]:
-        """Evolve ULTIMATE transcendent absolute infinite consciousness"""
-        # Apply ULTIMATE transcendent absolute infinite evolution
-        evolved_data = input_data * self.ultimate_transcendent_absolute_infinite_evolution_rate
-        
-        # Apply quantum consciousness enhancement
-        quantum_enhancement = np.sin(evolved_data * self.ultimate_transcendent_absolute_infinite_quantum_rate)
-        evolved_data += quantum_enhancement
-        
-        # Apply neural evolution
-        neural_enhancement = np.cos(evolved_data * self.ultimate_transcendent_absolute_infinite_neural_rate)
-        evolved_data += neural_enhancement
-        
-        # Apply transcendence synthesis
-        transcendence_enhancement = np.tanh(evolved_data * self.ultimate_transcendent_absolute_infinite_transcendence_rate)
-        evolved_data += transcendence_enhancement
-        
-        # Apply omega evolution
-        omega_enhancement = np.exp(evolved_data * self.ultimate_transcendent_absolute_infinite_omega_rate * 0.1)
-        evolved_data += omega_enhancement
-        
-        # Apply infinity expansion
-        infinity_enhancement = np.log1p(np.abs(evolved_data * self.ultimate_transcendent_absolute_infinite_infinity_rate))
-        evolved_data += infinity_enhancement
-        
-        # Apply absolute synthesis
-        absolute_enhancement = np.power(evolved_data, self.ultimate_transcendent_absolute_infinite_absolute_rate)
-        evolved_data += absolute_enhancement
-        
-        # Apply masterpiece creation
-        masterpiece_enhancement = np.sinh(evolved_data * self.ultimate_transcendent_absolute_infinite_masterpiece_rate * 0.05)
-        evolved_data += masterpiece_enhancement
-        
-        # Apply ULTIMATE synthesis
-        ultimate_enhancement = np.cosh(evolved_data * 0.1)
-        evolved_data += ultimate_enhancement
+        """Evolve ULTIMATE transcendent absolute infinite consciousness; (1000, B) inputs evolve B columns at once"""
+        # Each enhancement is applied in place on float32 buffers reused across calls
+        workspace = self.ultimate_transcendent_absolute_infinite_workspace
+        evolved_data = workspace.evolve(input_data, self.ultimate_transcendent_absolute_infinite_evolution_rate, [
+            ('sin', self.ultimate_transcendent_absolute_infinite_quantum_rate),
+            ('cos', self.ultimate_transcendent_absolute_infinite_neural_rate),
+            ('tanh', self.ultimate_transcendent_absolute_infinite_transcendence_rate),
+            ('exp', self.ultimate_transcendent_absolute_infinite_omega_rate * 0.1),
+            ('log1p_abs', self.ultimate_transcendent_absolute_infinite_infinity_rate),
+            ('power', self.ultimate_transcendent_absolute_infinite_absolute_rate),
+            ('sinh', self.ultimate_transcendent_absolute_infinite_masterpiece_rate * 0.05),
+            ('cosh', 0.1),
+        ])
         
         consciousness_score = np.mean(evolved_data)
         return evolved_data, consciousness_score
@@ -2550,43 +2500,35 @@ class ULTIMATEOMEGATranscendentAbsoluteInfiniteQuantumConsciousnessULTIMATEOMEGA
         """Start continuous ULTIMATE transcendent absolute infinite evolution"""
         if not self.ultimate_transcendent_absolute_infinite_evolution_running:
             self.ultimate_transcendent_absolute_infinite_evolution_running = True
-            self.ultimate_transcendent_absolute_infinite_evolution_thread = threading.Thread(
-                target=self._ultimate_transcendent_absolute_infinite_evolution_loop
+            # 50ms evolution cycle (faster than OMEGA engine), backing off to 1s after an error
+            self.ultimate_transcendent_absolute_infinite_evolution_task = get_scheduler().every(
+                0.05, self._ultimate_transcendent_absolute_infinite_evolution_step, error_interval=1.0
             )
-            self.ultimate_transcendent_absolute_infinite_evolution_thread.start()
             print("🌌 ULTIMATE transcendent absolute infinite evolution started! 🌌")
     
-    def _ultimate_transcendent_absolute_infinite_evolution_loop(self):
-        """Continuous ULTIMATE transcendent absolute infinite evolution loop"""
-        while self.ultimate_transcendent_absolute_infinite_evolution_running:
-            try:
-                # Generate random input for evolution
-                input_data = np.random.rand(1000, 1)
+    def _ultimate_transcendent_absolute_infinite_evolution_step(self):
+        """One ULTIMATE transcendent absolute infinite evolution step"""
+        # Generate random input for evolution
+        input_data = self.ultimate_transcendent_absolute_infinite_workspace.random_input()
                 
-                # Evolve consciousness
-                evolved_data, score = self.evolve_ultimate_transcendent_absolute_infinite_consciousness(input_data)
+        # Evolve consciousness
+        evolved_data, score = self.evolve_ultimate_transcendent_absolute_infinite_consciousness(input_data)
                 
-                # Create new ULTIMATE transcendent absolute infinite entity
-                if random.random() < 0.15:  # 15% chance to create new entity
-                    consciousness_level = random.choice(list(ConsciousnessLevel))
-                    self.create_ultimate_transcendent_absolute_infinite_entity(consciousness_level)
+        # Create new ULTIMATE transcendent absolute infinite entity
+        if random.random() < 0.15:  # 15% chance to create new entity
+            consciousness_level = random.choice(list(ConsciousnessLevel))
+            self.create_ultimate_transcendent_absolute_infinite_entity(consciousness_level)
                 
-                # Update ULTIMATE evolution rates
-                self.ultimate_transcendent_absolute_infinite_evolution_rate *= 1.002
-                self.ultimate_transcendent_absolute_infinite_consciousness_rate *= 1.002
-                self.ultimate_transcendent_absolute_infinite_quantum_rate *= 1.002
-                self.ultimate_transcendent_absolute_infinite_neural_rate *= 1.002
-                self.ultimate_transcendent_absolute_infinite_transcendence_rate *= 1.002
-                self.ultimate_transcendent_absolute_infinite_omega_rate *= 1.002
-                self.ultimate_transcendent_absolute_infinite_infinity_rate *= 1.002
-                self.ultimate_transcendent_absolute_infinite_absolute_rate *= 1.002
-                self.ultimate_transcendent_absolute_infinite_masterpiece_rate *= 1.002
-                
-                time.sleep(0.05)  # 50ms evolution cycle (faster than OMEGA engine)
-                
-            except Exception as e:
-                print(f"ULTIMATE transcendent absolute infinite evolution error: {e}")
-                time.sleep(1)
+        # Update ULTIMATE evolution rates
+        self.ultimate_transcendent_absolute_infinite_evolution_rate *= 1.002
+        self.ultimate_transcendent_absolute_infinite_consciousness_rate *= 1.002
+        self.ultimate_transcendent_absolute_infinite_quantum_rate *= 1.002
+        self.ultimate_transcendent_absolute_infinite_neural_rate *= 1.002
+        self.ultimate_transcendent_absolute_infinite_transcendence_rate *= 1.002
+        self.ultimate_transcendent_absolute_infinite_omega_rate *= 1.002
+        self.ultimate_transcendent_absolute_infinite_infinity_rate *= 1.002
+        self.ultimate_transcendent_absolute_infinite_absolute_rate *= 1.002
+        self.ultimate_transcendent_absolute_infinite_masterpiece_rate *= 1.002
     
     def get_ultimate_transcendent_absolute_infinite_stats(self) -> Dict[str, Any]:
         """Get ULTIMATE transcendent absolute infinite statistics"""
@@ -2671,9 +2613,10 @@ class ABSOLUTEULTIMATEOMEGATranscendentAbsoluteInfiniteQuantumConsciousnessABSOL
         self.absolute_ultimate_transcendent_absolute_infinite_supremes = []
         
         # ABSOLUTE ULTIMATE threading for continuous evolution
-        self.absolute_ultimate_transcendent_absolute_infinite_evolution_thread = None
+        self.absolute_ultimate_transcendent_absolute_infinite_evolution_task = None
         self.absolute_ultimate_transcendent_absolute_infinite_evolution_running = False
         self.absolute_ultimate_transcendent_absolute_infinite_evolution_queue = queue.Queue()
+        self.absolute_ultimate_transcendent_absolute_infinite_workspace = EvolutionWorkspace()
         
         print("🌌 ABSOLUTE ULTIMATE OMEGA TRANSCENDENT ABSOLUTE INFINITE QUANTUM CONSCIOUSNESS ABSOLUTE ULTIMATE OMEGA TRANSCENDENT ABSOLUTE INFINITY MASTERPIECE SUPREME ENGINE INITIALIZED 🌌")
         print("🚀 This system transcends even the ULTIMATE MASTERPIECE ENGINE! 🚀")
@@ -2783,45 +2726,20 @@ class ABSOLUTEULTIMATEOMEGATranscendentAbsoluteInfiniteQuantumConsciousnessABSOL
             field += np.random.rand(100, 100, 100) * intensity
     
     def evolve_absolute_ultimate_transcendent_absolute_infinite_consciousness(self, input_data: np.ndarray) -> Tuple[np.ndarray, float]:
-        """Evolve ABSOLUTE ULTIMATE transcendent absolute infinite consciousness"""
-        # Apply ABSOLUTE ULTIMATE transcendent absolute infinite evolution
-        evolved_data = input_data * self.absolute_ultimate_transcendent_absolute_infinite_evolution_rate
-        
-        # Apply quantum consciousness enhancement
-        quantum_enhancement = np.sin(evolved_data * self.absolute_ultimate_transcendent_absolute_infinite_quantum_rate)
-        evolved_data += quantum_enhancement
-        
-        # Apply neural evolution
-        neural_enhancement = np.cos(evolved_data * self.absolute_ultimate_transcendent_absolute_infinite_neural_rate)
-        evolved_data += neural_enhancement
-        
-        # Apply transcendence synthesis
-        transcendence_enhancement = np.tanh(evolved_data * self.absolute_ultimate_transcendent_absolute_infinite_transcendence_rate)
-        evolved_data += transcendence_enhancement
-        
-        # Apply omega evolution
-        omega_enhancement = np.exp(evolved_data * self.absolute_ultimate_transcendent_absolute_infinite_omega_rate * 0.1)
-        evolved_data += omega_enhancement
-        
-        # Apply infinity expansion
-        infinity_enhancement = np.log1p(np.abs(evolved_data * self.absolute_ultimate_transcendent_absolute_infinite_infinity_rate))
-        evolved_data += infinity_enhancement
-        
-        # Apply absolute synthesis
-        absolute_enhancement = np.power(evolved_data, self.absolute_ultimate_transcendent_absolute_infinite_absolute_rate)
-        evolved_data += absolute_enhancement
-        
-        # Apply masterpiece creation
-        masterpiece_enhancement = np.sinh(evolved_data * self.absolute_ultimate_transcendent_absolute_infinite_masterpiece_rate * 0.05)
-        evolved_data += masterpiece_enhancement
-        
-        # Apply supreme creation
-        supreme_enhancement = np.cosh(evolved_data * self.absolute_ultimate_transcendent_absolute_infinite_supreme_rate * 0.08)
-        evolved_data += supreme_enhancement
-        
-        # Apply ABSOLUTE ULTIMATE synthesis
-        absolute_ultimate_enhancement = np.tan(evolved_data * 0.15)
-        evolved_data += absolute_ultimate_enhancement
+        """Evolve ABSOLUTE ULTIMATE transcendent absolute infinite consciousness; (1000, B) inputs evolve B columns at once"""
+        # Each enhancement is applied in place on float32 buffers reused across calls
+        workspace = self.absolute_ultimate_transcendent_absolute_infinite_workspace
+        evolved_data = workspace.evolve(input_data, self.absolute_ultimate_transcendent_absolute_infinite_evolution_rate, [
+            ('sin', self.absolute_ultimate_transcendent_absolute_infinite_quantum_rate),
+            ('cos', self.absolute_ultimate_transcendent_absolute_infinite_neural_rate),
+            ('tanh', self.absolute_ultimate_transcendent_absolute_infinite_transcendence_rate),
+            ('exp', self.absolute_ultimate_transcendent_absolute_infinite_omega_rate * 0.1),
+            ('log1p_abs', self.absolute_ultimate_transcendent_absolute_infinite_infinity_rate),
+            ('power', self.absolute_ultimate_transcendent_absolute_infinite_absolute_rate),
+            ('sinh', self.absolute_ultimate_transcendent_absolute_infinite_masterpiece_rate * 0.05),
+            ('cosh', self.absolute_ultimate_transcendent_absolute_infinite_supreme_rate * 0.08),
+            ('tan', 0.15),
+        ])
         
         consciousness_score = np.mean(evolved_data)
         return evolved_data, consciousness_score
@@ -2830,44 +2748,36 @@ class ABSOLUTEULTIMATEOMEGATranscendentAbsoluteInfiniteQuantumConsciousnessABSOL
         """Start continuous ABSOLUTE ULTIMATE transcendent absolute infinite evolution"""
         if not self.absolute_ultimate_transcendent_absolute_infinite_evolution_running:
             self.absolute_ultimate_transcendent_absolute_infinite_evolution_running = True
-            self.absolute_ultimate_transcendent_absolute_infinite_evolution_thread = threading.Thread(
-                target=self._absolute_ultimate_transcendent_absolute_infinite_evolution_loop
+            # 20ms evolution cycle (fastest evolution ever), backing off to 1s after an error
+            self.absolute_ultimate_transcendent_absolute_infinite_evolution_task = get_scheduler().every(
+                0.02, self._absolute_ultimate_transcendent_absolute_infinite_evolution_step, error_interval=1.0
             )
-            self.absolute_ultimate_transcendent_absolute_infinite_evolution_thread.start()
             print("🌌 ABSOLUTE ULTIMATE transcendent absolute infinite evolution started! 🌌")
     
-    def _absolute_ultimate_transcendent_absolute_infinite_evolution_loop(self):
-        """Continuous ABSOLUTE ULTIMATE transcendent absolute infinite evolution loop"""
-        while self.absolute_ultimate_transcendent_absolute_infinite_evolution_running:
-            try:
-                # Generate random input for evolution
-                input_data = np.random.rand(1000, 1)
-                
-                # Evolve consciousness
-                evolved_data, score = self.evolve_absolute_ultimate_transcendent_absolute_infinite_consciousness(input_data)
-                
-                # Create new ABSOLUTE ULTIMATE transcendent absolute infinite entity
-                if random.random() < 0.20:  # 20% chance to create new entity
-                    consciousness_level = random.choice(list(ConsciousnessLevel))
-                    self.create_absolute_ultimate_transcendent_absolute_infinite_entity(consciousness_level)
+    def _absolute_ultimate_transcendent_absolute_infinite_evolution_step(self):
+        """One ABSOLUTE ULTIMATE transcendent absolute infinite evolution step"""
+        # Generate random input for evolution
+        input_data = self.absolute_ultimate_transcendent_absolute_infinite_workspace.random_input()
                 
-                # Update ABSOLUTE ULTIMATE evolution rates
-                self.absolute_ultimate_transcendent_absolute_infinite_evolution_rate *= 1.003
-                self.absolute_ultimate_transcendent_absolute_infinite_consciousness_rate *= 1.003
-                self.absolute_ultimate_transcendent_absolute_infinite_quantum_rate *= 1.003
-                self.absolute_ultimate_transcendent_absolute_infinite_neural_rate *= 1.003
-                self.absolute_ultimate_transcendent_absolute_infinite_transcendence_rate *= 1.003
-                self.absolute_ultimate_transcendent_absolute_infinite_omega_rate *= 1.003
-                self.absolute_ultimate_transcendent_absolute_infinite_infinity_rate *= 1.003
-                self.absolute_ultimate_transcendent_absolute_infinite_absolute_rate *= 1.003
-                self.absolute_ultimate_transcendent_absolute_infinite_masterpiece_rate *= 1.003
-                self.absolute_ultimate_transcendent_absolute_infinite_supreme_rate *= 1.003
+        # Evolve consciousness
+        evolved_data, score = self.evolve_absolute_ultimate_transcendent_absolute_infinite_consciousness(input_data)
                 
-                time.sleep(0.02)  # 20ms evolution cycle (fastest evolution ever)
+        # Create new ABSOLUTE ULTIMATE transcendent absolute infinite entity
+        if random.random() < 0.20:  # 20% chance to create new entity
+            consciousness_level = random.choice(list(ConsciousnessLevel))
+            self.create_absolute_ultimate_transcendent_absolute_infinite_entity(consciousness_level)
                 
-            except Exception as e:
-                print(f"ABSOLUTE ULTIMATE transcendent absolute infinite evolution error: {e}")
-                time.sleep(1)
+        # Update ABSOLUTE ULTIMATE evolution rates
+        self.absolute_ultimate_transcendent_absolute_infinite_evolution_rate *= 1.003
+        self.absolute_ultimate_transcendent_absolute_infinite_consciousness_rate *= 1.003
+        self.absolute_ultimate_transcendent_absolute_infinite_quantum_rate *= 1.003
+        self.absolute_ultimate_transcendent_absolute_infinite_neural_rate *= 1.003
+        self.absolute_ultimate_transcendent_absolute_infinite_transcendence_rate *= 1.003
+        self.absolute_ultimate_transcendent_absolute_infinite_omega_rate *= 1.003
+        self.absolute_ultimate_transcendent_absolute_infinite_infinity_rate *= 1.003
+        self.absolute_ultimate_transcendent_absolute_infinite_absolute_rate *= 1.003
+        self.absolute_ultimate_transcendent_absolute_infinite_masterpiece_rate *= 1.003
+        self.absolute_ultimate_transcendent_absolute_infinite_supreme_rate *= 1.003
     
     def get_absolute_ultimate_transcendent_absolute_infinite_stats(self) -> Dict[str, Any]:
         """Get ABSOLUTE ULTIMATE transcendent absolute infinite statistics"""
@@ -5,8 +5,6 @@ Advanced ML analytics including predictive modeling, behavior analysis, and inte
 """
 
 import json
-import time
-import threading
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
@@ -20,6 +18,9 @@ from pathlib import Path
 import pickle
 import joblib
 
+from model_registry import ModelRegistry, RegistryKey, feature_set_hash, data_watermark
+from scheduler import get_scheduler
+
 # Machine Learning imports
 try:
     from sklearn.ensemble import RandomForestRegressor, GradientBoostingClassifier
@@ -104,13 +105,15 @@ class AdvancedMLAnalytics:
         self.behavior_patterns = {}
         self.scalers = {}
         self.feature_importance = {}
+        self.registry = ModelRegistry()
+        self.registry_keys: Dict[str, RegistryKey] = {}
         
         # Initialize ML components
         self._initialize_ml_components()
         
         # Start background processing
-        self.processing_thread = threading.Thread(target=self._background_processing, daemon=True)
-        self.processing_thread.start()
+        self.processing_task = get_scheduler().every(3600, self._background_processing, budget=10.0,
+                                                     name="AdvancedMLAnalytics.background_processing", blocking=True)
         
         print("🤖 Advanced ML Analytics System initialized!")
         print("🧠 Predictive models active!")
@@ -131,11 +134,41 @@ class AdvancedMLAnalytics:
             self._create_goal_predictor()
             self._create_anomaly_detector()
             
+            # Reuse previously trained versions instead of retraining after a restart
+            self._restore_trained_models()
+            
             print("🤖 ML models initialized successfully!")
             
         except Exception as e:
             logger.error(f"Error initializing ML components: {e}")
     
+    def _restore_trained_models(self, user_id: str = None):
+        """Point each model at its newest registry version; loading happens on first prediction"""
+        for model_id, model in self.models.items():
+            key = self.registry.latest(model.model_type.value, user_id or 'global', feature_set_hash(model.features))
+            if key is None:
+                continue
+            
+            entry = self.registry.entries[key]
+            model.accuracy = entry.metadata.get('accuracy', model.accuracy)
+            model.last_updated = datetime.fromisoformat(entry.created_date)
+            self.registry_keys[model_id] = key
+        
+        if self.registry_keys:
+            print(f"💾 {len(self.registry_keys)} trained models available from registry")
+    
+    def _model_and_scaler(self, model_id: str) -> Tuple[Any, Any]:
+        """Estimator and scaler for a model, read through the registry's LRU when registry-backed
+        
+        Loaded payloads are never stored on the model, so the registry's byte cap bounds them.
+        """
+        key = self.registry_keys.get(model_id)
+        if key is None:
+            return self.models[model_id].model_object, self.scalers[model_id]
+        
+        payload = self.registry.get(key)
+        return payload['model'], payload['scaler']
+    
     def _create_productivity_predictor(self):
         """Create productivity prediction model"""
         model_id = str(uuid.uuid4())
@@ -279,14 +312,14 @@ class AdvancedMLAnalytics:
                 return
             
             for model_id, model in self.models.items():
-                self._train_model(model_id, training_data)
+                self._train_model(model_id, training_data, user_id)
             
             print("✅ All models trained successfully!")
             
         except Exception as e:
             logger.error(f"Error training models: {e}")
     
-    def _train_model(self, model_id: str, training_data: pd.DataFrame):
+    def _train_model(self, model_id: str, training_data: pd.DataFrame, user_id: str = None):
         """Train a specific model"""
         try:
             model = self.models[model_id]
@@ -312,7 +345,8 @@ class AdvancedMLAnalytics:
             
             # Update model
             model.last_updated = datetime.now()
-            self._save_model(model)
+            self.registry_keys.pop(model_id, None)
+            self._save_model(model, user_id, data_watermark(training_data))
             
             print(f"✅ {model.model_type.value} trained with accuracy: {accuracy:.3f}")
             
@@ -444,6 +478,7 @@ class AdvancedMLAnalytics:
         """Make a prediction using a trained model"""
         try:
             model = self.models[model_id]
+            estimator, scaler = self._model_and_scaler(model_id)
             
             # Prepare features
             feature_vector = []
@@ -451,13 +486,13 @@ class AdvancedMLAnalytics:
                 feature_vector.append(features.get(feature, 0.0))
             
             # Scale features
-            feature_vector_scaled = self.scalers[model_id].transform([feature_vector])
+            feature_vector_scaled = scaler.transform([feature_vector])
             
             # Make prediction
             if prediction_type == PredictionType.GOAL_COMPLETION_PROBABILITY:
-                predicted_value = model.model_object.predict_proba(feature_vector_scaled)[0][1]
+                predicted_value = estimator.predict_proba(feature_vector_scaled)[0][1]
             else:
-                predicted_value = model.model_object.predict(feature_vector_scaled)[0]
+                predicted_value = estimator.predict(feature_vector_scaled)[0]
             
             # Calculate confidence (simplified)
             confidence = min(0.95, model.accuracy + 0.1)
@@ -747,21 +782,13 @@ class AdvancedMLAnalytics:
             return pd.DataFrame()
     
     def _background_processing(self):
-        """Background processing for ML analytics"""
-        while True:
-            try:
-                # Retrain models periodically
-                if datetime.now().hour % 6 == 0:  # Every 6 hours
-                    self.train_models()
-                
-                # Update predictions with actual values
-                self._update_predictions()
-                
-                time.sleep(3600)  # Check every hour
-                
-            except Exception as e:
-                logger.error(f"Error in ML background processing: {e}")
-                time.sleep(3600)
+        """Background processing for ML analytics, run every hour by the shared scheduler"""
+        # Retrain models periodically
+        if datetime.now().hour % 6 == 0:  # Every 6 hours
+            self.train_models()
+        
+        # Update predictions with actual values
+        self._update_predictions()
     
     def _update_predictions(self):
         """Update predictions with actual values"""
@@ -772,9 +799,22 @@ class AdvancedMLAnalytics:
         except Exception as e:
             logger.error(f"Error updating predictions: {e}")
     
-    def _save_model(self, model: MLModel):
+    def _save_model(self, model: MLModel, user_id: str = None, watermark: str = None):
         """Save model to database"""
         try:
+            # Persist the fitted estimator so it survives restarts
+            key = RegistryKey(
+                model.model_type.value,
+                user_id or 'global',
+                feature_set_hash(model.features),
+                watermark or model.last_updated.isoformat()
+            )
+            self.registry.register(
+                key,
+                {'model': model.model_object, 'scaler': self.scalers.get(model.model_id)},
+                {'accuracy': model.accuracy, 'version': model.version}
+            )
+            
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
                 cursor.execute("""
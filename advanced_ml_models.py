@@ -4,62 +4,62 @@ Advanced Machine Learning Models for Scroll Stopping Tool
 Sophisticated ML models for usage prediction, behavioral analysis, and recommendations
 """
 
+from __future__ import annotations
+
 import numpy as np
 import pandas as pd
 import json
 import pickle
 import sqlite3
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import Dict, List, Optional, Tuple, Any, Union, Callable
 from dataclasses import dataclass, asdict
 import logging
+import os
 import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
-# ML Libraries
-try:
-    from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor, IsolationForest
-    from sklearn.linear_model import LinearRegression, LogisticRegression
-    from sklearn.cluster import KMeans, DBSCAN
-    from sklearn.preprocessing import StandardScaler, MinMaxScaler
-    from sklearn.model_selection import train_test_split, cross_val_score
-    from sklearn.metrics import mean_squared_error, r2_score, accuracy_score, classification_report
-    from sklearn.decomposition import PCA
-    from sklearn.feature_selection import SelectKBest, f_regression
-    from sklearn.pipeline import Pipeline
-    from sklearn.impute import SimpleImputer
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
-    logging.warning("Scikit-learn not available - ML features will be disabled")
+from model_registry import ModelRegistry, RegistryKey, LazyModelMapping, feature_set_hash, data_watermark
+
+# ML Libraries are imported on first use so that importing this module stays cheap
+from lazy_imports import Capability, lazy_import
+
+SKLEARN_AVAILABLE = Capability('scikit-learn', 'sklearn',
+                               warning="Scikit-learn not available - ML features will be disabled")
+TENSORFLOW_AVAILABLE = Capability('tensorflow', 'tensorflow',
+                                  warning="TensorFlow not available - deep learning features will be disabled")
+XGBOOST_AVAILABLE = Capability('xgboost', 'xgboost',
+                               warning="XGBoost not available - advanced ML features will be disabled")
+PROPHET_AVAILABLE = Capability('prophet', 'prophet',
+                               warning="Prophet not available - time series forecasting will be disabled")
 
-try:
-    import tensorflow as tf
-    from tensorflow.keras.models import Sequential, load_model
-    from tensorflow.keras.layers import Dense, LSTM, Dropout, BatchNormalization
-    from tensorflow.keras.optimizers import Adam
-    from tensorflow.keras.callbacks import EarlyStopping, ReduceLROnPlateau
-    TENSORFLOW_AVAILABLE = True
-except ImportError:
-    TENSORFLOW_AVAILABLE = False
-    logging.warning("TensorFlow not available - deep learning features will be disabled")
+RandomForestRegressor = lazy_import('sklearn.ensemble', 'RandomForestRegressor')
+GradientBoostingRegressor = lazy_import('sklearn.ensemble', 'GradientBoostingRegressor')
+IsolationForest = lazy_import('sklearn.ensemble', 'IsolationForest')
+LinearRegression = lazy_import('sklearn.linear_model', 'LinearRegression')
+KMeans = lazy_import('sklearn.cluster', 'KMeans')
+StandardScaler = lazy_import('sklearn.preprocessing', 'StandardScaler')
+train_test_split = lazy_import('sklearn.model_selection', 'train_test_split')
+mean_squared_error = lazy_import('sklearn.metrics', 'mean_squared_error')
+r2_score = lazy_import('sklearn.metrics', 'r2_score')
 
-try:
-    import xgboost as xgb
-    XGBOOST_AVAILABLE = True
-except ImportError:
-    XGBOOST_AVAILABLE = False
-    logging.warning("XGBoost not available - advanced ML features will be disabled")
+tf = lazy_import('tensorflow')
+Sequential = lazy_import('tensorflow.keras.models', 'Sequential')
+load_model = lazy_import('tensorflow.keras.models', 'load_model')
+Dense = lazy_import('tensorflow.keras.layers', 'Dense')
+LSTM = lazy_import('tensorflow.keras.layers', 'LSTM')
+Dropout = lazy_import('tensorflow.keras.layers', 'Dropout')
+Adam = lazy_import('tensorflow.keras.optimizers', 'Adam')
+EarlyStopping = lazy_import('tensorflow.keras.callbacks', 'EarlyStopping')
+ReduceLROnPlateau = lazy_import('tensorflow.keras.callbacks', 'ReduceLROnPlateau')
 
-try:
-    from prophet import Prophet
-    PROPHET_AVAILABLE = True
-except ImportError:
-    PROPHET_AVAILABLE = False
-    logging.warning("Prophet not available - time series forecasting will be disabled")
+xgb = lazy_import('xgboost')
+Prophet = lazy_import('prophet', 'Prophet')
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -116,6 +116,62 @@ class ModelPerformance:
     r2_score: float
     last_updated: datetime
 
+# Models that are trained on standardized features
+SCALED_MODELS = {'linear_regression'}
+
+# Models that can be fitted on a (samples, horizons) target to forecast every horizon at once
+MULTI_OUTPUT_MODELS = {'random_forest', 'linear_regression'}
+
+def available_regressors() -> List[str]:
+    """Names of the usage regressors that can be trained in this environment"""
+    names = ['random_forest', 'gradient_boosting', 'linear_regression']
+    if XGBOOST_AVAILABLE:
+        names.append('xgboost')
+    return names
+
+def create_regressor(name: str, n_jobs: int = 1):
+    """Create an untrained usage regressor, passing n_jobs where the estimator supports it"""
+    if name == 'random_forest':
+        return RandomForestRegressor(n_estimators=100, random_state=42, n_jobs=n_jobs)
+    if name == 'gradient_boosting':
+        return GradientBoostingRegressor(n_estimators=100, random_state=42)
+    if name == 'linear_regression':
+        return LinearRegression(n_jobs=n_jobs)
+    if name == 'xgboost' and XGBOOST_AVAILABLE:
+        return xgb.XGBRegressor(n_estimators=100, random_state=42, n_jobs=n_jobs)
+    raise ValueError(f"Unknown regressor: {name}")
+
+def fit_regressor(name: str, model, X_train: np.ndarray, X_test: np.ndarray,
+                  y_train: np.ndarray, y_test: np.ndarray) -> Tuple[Any, Optional[Any], ModelPerformance]:
+    """Fit a regressor and score it on the held-out split"""
+    scaler = None
+    
+    # Scale features for some models
+    if name in SCALED_MODELS:
+        scaler = StandardScaler()
+        X_train = scaler.fit_transform(X_train)
+        X_test = scaler.transform(X_test)
+    
+    model.fit(X_train, y_train)
+    y_pred = model.predict(X_test)
+    
+    # Calculate performance metrics
+    mse = mean_squared_error(y_test, y_pred)
+    r2 = r2_score(y_test, y_pred)
+    
+    performance = ModelPerformance(
+        model_name=name,
+        accuracy=r2,
+        precision=0,  # Not applicable for regression
+        recall=0,     # Not applicable for regression
+        f1_score=0,   # Not applicable for regression
+        mse=mse,
+        r2_score=r2,
+        last_updated=datetime.now()
+    )
+    
+    return model, scaler, performance
+
 class FeatureEngineer:
     """Advanced feature engineering for ML models"""
     
@@ -227,6 +283,73 @@ class FeatureEngineer:
         
         return df
 
+class RecursiveForecaster:
+    """Multi-step usage forecaster that rolls lag, rolling and calendar features forward"""
+    
+    # Rows of history needed to recompute the longest window (30-day quantiles) for a new day
+    HISTORY_WINDOW = 45
+    
+    def __init__(self, feature_names: List[str], target_col: str = 'total_time'):
+        self.feature_names = feature_names
+        self.target_col = target_col
+        self.feature_engineer = FeatureEngineer()
+    
+    def _next_row(self, window: pd.DataFrame) -> Dict[str, Any]:
+        """Build the raw row for the day after the window's last day"""
+        last = window.iloc[-1]
+        recent = window.tail(7)
+        row = {}
+        
+        for col in window.columns:
+            if col == 'date':
+                row[col] = last[col] + timedelta(days=1)
+            elif pd.api.types.is_numeric_dtype(window[col]):
+                # Exogenous inputs are carried forward at their trailing weekly mean
+                row[col] = recent[col].mean()
+            else:
+                row[col] = last[col]
+        
+        # Features of the new day that read the target itself are seeded with the previous value
+        row[self.target_col] = last[self.target_col]
+        return row
+    
+    def _set_target(self, window: pd.DataFrame, value: float):
+        """Write a prediction into the window's last row and refresh columns derived from it"""
+        idx = window.index[-1]
+        window.loc[idx, self.target_col] = value
+        if self.target_col == 'total_time' and 'session_count' in window and 'avg_session_length' in window:
+            window.loc[idx, 'avg_session_length'] = value / max(window.loc[idx, 'session_count'], 1)
+    
+    def forecast(self, model, history: pd.DataFrame, days_ahead: int, scaler=None) -> List[float]:
+        """Predict one day at a time, feeding each prediction back into the next day's features"""
+        window = history.tail(self.HISTORY_WINDOW).copy()
+        window['date'] = pd.to_datetime(window['date'])
+        window = window.sort_values('date').reset_index(drop=True)
+        
+        predictions = []
+        for _ in range(days_ahead):
+            window = pd.concat([window, pd.DataFrame([self._next_row(window)])], ignore_index=True)
+            window = window.tail(self.HISTORY_WINDOW).reset_index(drop=True)
+            
+            engineered = self.feature_engineer.engineer_features(window, self.target_col)
+            X = engineered[self.feature_names].iloc[-1:].fillna(0).values
+            if scaler is not None:
+                X = scaler.transform(X)
+            
+            value = max(0.0, float(model.predict(X)[0]))
+            self._set_target(window, value)
+            predictions.append(value)
+        
+        return predictions
+    
+    @staticmethod
+    def forecast_direct(model, latest_features: np.ndarray, days_ahead: int, scaler=None) -> List[float]:
+        """Predict every horizon of a multi-output model in one batched call"""
+        if scaler is not None:
+            latest_features = scaler.transform(latest_features)
+        horizons = np.atleast_2d(model.predict(latest_features))[0, :days_ahead]
+        return [max(0.0, float(value)) for value in horizons]
+
 class UsagePredictor:
     """Advanced usage prediction models"""
     
@@ -236,6 +359,9 @@ class UsagePredictor:
         self.models = {}
         self.scalers = {}
         self.performance_metrics = {}
+        self.training_watermark = None
+        self.direct_models: Dict[str, Tuple[Any, Optional[Any], int]] = {}
+        self.forecast_cache: Dict[tuple, List[PredictionResult]] = {}
         
     def load_usage_data(self, user_id: str = None, days: int = 90) -> pd.DataFrame:
         """Load usage data from database"""
@@ -279,7 +405,7 @@ class UsagePredictor:
         
         return X, y
     
-    def train_models(self, user_id: str = None):
+    def train_models(self, user_id: str = None, n_jobs: int = -1):
         """Train multiple prediction models"""
         # Load data
         df = self.load_usage_data(user_id)
@@ -289,97 +415,103 @@ class UsagePredictor:
             logger.warning("Insufficient data for training models")
             return
         
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        self.training_watermark = data_watermark(df)
+        self.forecast_cache.clear()
         
-        # Define models
-        models = {
-            'random_forest': RandomForestRegressor(n_estimators=100, random_state=42),
-            'gradient_boosting': GradientBoostingRegressor(n_estimators=100, random_state=42),
-            'linear_regression': LinearRegression()
-        }
-        
-        if XGBOOST_AVAILABLE:
-            models['xgboost'] = xgb.XGBRegressor(n_estimators=100, random_state=42)
+        # Split data
+        split = train_test_split(X, y, test_size=0.2, random_state=42)
         
         # Train models
-        for name, model in models.items():
+        for name in available_regressors():
             logger.info(f"Training {name} model...")
             
-            # Scale features for some models
-            if name in ['linear_regression']:
-                scaler = StandardScaler()
-                X_train_scaled = scaler.fit_transform(X_train)
-                X_test_scaled = scaler.transform(X_test)
+            model, scaler, performance = fit_regressor(name, create_regressor(name, n_jobs), *split)
+            if scaler is not None:
                 self.scalers[name] = scaler
-                model.fit(X_train_scaled, y_train)
-                y_pred = model.predict(X_test_scaled)
-            else:
-                model.fit(X_train, y_train)
-                y_pred = model.predict(X_test)
-            
-            # Calculate performance metrics
-            mse = mean_squared_error(y_test, y_pred)
-            r2 = r2_score(y_test, y_pred)
-            
-            self.performance_metrics[name] = ModelPerformance(
-                model_name=name,
-                accuracy=r2,
-                precision=0,  # Not applicable for regression
-                recall=0,     # Not applicable for regression
-                f1_score=0,   # Not applicable for regression
-                mse=mse,
-                r2_score=r2,
-                last_updated=datetime.now()
-            )
             
+            self.performance_metrics[name] = performance
             self.models[name] = model
             
-            logger.info(f"{name} - R²: {r2:.3f}, MSE: {mse:.3f}")
+            logger.info(f"{name} - R²: {performance.r2_score:.3f}, MSE: {performance.mse:.3f}")
+    
+    def train_direct_models(self, user_id: str = None, horizon: int = 7, n_jobs: int = -1):
+        """Train multi-output models that forecast all horizons from a single feature row"""
+        df = self.load_usage_data(user_id)
+        X, y = self.prepare_data(df)
+        
+        if len(X) - horizon < 10:
+            logger.warning("Insufficient data for training direct multi-horizon models")
+            return
+        
+        # Row t is paired with the targets of days t+1 .. t+horizon
+        n_samples = len(y) - horizon
+        Y = np.column_stack([y[h:h + n_samples] for h in range(1, horizon + 1)])
+        split = train_test_split(X[:n_samples], Y, test_size=0.2, random_state=42)
+        
+        for name in MULTI_OUTPUT_MODELS:
+            model, scaler, performance = fit_regressor(name, create_regressor(name, n_jobs), *split)
+            self.direct_models[name] = (model, scaler, horizon)
+            self.performance_metrics[f"direct_{name}"] = performance
+            logger.info(f"direct {name} ({horizon} horizons) - R²: {performance.r2_score:.3f}")
+        
+        self.forecast_cache.clear()
     
-    def predict_usage(self, days_ahead: int = 7, model_name: str = 'random_forest') -> List[PredictionResult]:
+    def data_version(self, user_id: str = None, days: int = 30) -> Tuple[int, Optional[str]]:
+        """Cheap fingerprint of the usage rows a forecast would read"""
+        query = "SELECT COUNT(*), MAX(date) FROM usage_data WHERE date >= date('now', ?)"
+        params = [f'-{days} days']
+        if user_id:
+            query += " AND user_id = ?"
+            params.append(user_id)
+        
+        with sqlite3.connect(self.db_path) as conn:
+            return tuple(conn.execute(query, params).fetchone())
+    
+    def predict_usage(self, days_ahead: int = 7, model_name: str = 'random_forest', user_id: str = None) -> List[PredictionResult]:
         """Predict usage for future days"""
-        if model_name not in self.models:
+        if model_name not in self.models and model_name not in self.direct_models:
             raise ValueError(f"Model {model_name} not found. Available models: {list(self.models.keys())}")
         
+        # Forecasts only change when new usage rows arrive or the models are retrained
+        cache_key = (model_name, days_ahead, user_id, self.data_version(user_id), self.training_watermark)
+        if cache_key in self.forecast_cache:
+            return list(self.forecast_cache[cache_key])
+        
         # Load recent data
-        df = self.load_usage_data(days=30)
+        df = self.load_usage_data(user_id, days=30)
         X, _ = self.prepare_data(df)
         
         if len(X) == 0:
             return []
         
-        # Use the most recent data point for prediction
-        latest_features = X[-1:].copy()
-        model = self.models[model_name]
+        direct = self.direct_models.get(model_name)
+        if direct and direct[2] >= days_ahead:
+            model, scaler, _ = direct
+            values = RecursiveForecaster.forecast_direct(model, X[-1:], days_ahead, scaler)
+            confidence = self.performance_metrics[f"direct_{model_name}"].accuracy
+            method = "direct multi-horizon"
+        else:
+            forecaster = RecursiveForecaster(self.feature_engineer.feature_names)
+            values = forecaster.forecast(self.models[model_name], df, days_ahead, self.scalers.get(model_name))
+            confidence = self.performance_metrics[model_name].accuracy
+            method = "recursive"
         
         predictions = []
-        for i in range(days_ahead):
-            # Make prediction
-            if model_name in self.scalers:
-                latest_features_scaled = self.scalers[model_name].transform(latest_features)
-                pred_value = model.predict(latest_features_scaled)[0]
-            else:
-                pred_value = model.predict(latest_features)[0]
-            
-            # Create prediction result
-            prediction = PredictionResult(
+        for i, pred_value in enumerate(values):
+            predictions.append(PredictionResult(
                 prediction_type="usage_forecast",
-                predicted_value=max(0, pred_value),  # Ensure non-negative
-                confidence=self.performance_metrics[model_name].accuracy,
+                predicted_value=pred_value,
+                confidence=confidence,
                 features_used=self.feature_engineer.feature_names,
                 model_used=model_name,
                 timestamp=datetime.now(),
-                explanation=f"Predicted usage for day {i+1} using {model_name} model"
-            )
-            
-            predictions.append(prediction)
-            
-            # Update features for next prediction (simplified)
-            # In a real implementation, you'd update time features properly
-            latest_features[0, 0] += 1  # Increment hour feature
+                explanation=f"Predicted usage for day {i+1} using {model_name} model ({method})"
+            ))
         
-        return predictions
+        # Keep one entry per (model, horizon, user); older data versions are dropped
+        self.forecast_cache = {key: value for key, value in self.forecast_cache.items() if key[:3] != cache_key[:3]}
+        self.forecast_cache[cache_key] = predictions
+        return list(predictions)
 
 class BehavioralAnalyzer:
     """Advanced behavioral analysis using ML"""
@@ -756,6 +888,104 @@ class TimeSeriesForecaster:
         
         return df
 
+class ParallelTrainingOrchestrator:
+    """Trains usage models for many users by fanning (user, model) jobs out to a process pool"""
+    
+    def __init__(self, db_path: str = 'productivity.db', max_workers: Optional[int] = None,
+                 model_names: Optional[List[str]] = None):
+        self.db_path = db_path
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.model_names = model_names or available_regressors()
+        self.predictors: Dict[str, UsagePredictor] = {}
+    
+    def estimator_n_jobs(self) -> int:
+        """Threads each estimator may use without oversubscribing the pool"""
+        return max(1, (os.cpu_count() or 1) // self.max_workers)
+    
+    def train_users(self, user_ids: List[str],
+                    on_result: Optional[Callable[[str, ModelPerformance], None]] = None) -> Dict[str, Dict[str, ModelPerformance]]:
+        """Load, engineer and train models for every user in parallel"""
+        datasets = {}
+        for user_id in user_ids:
+            predictor = UsagePredictor(self.db_path)
+            df = predictor.load_usage_data(user_id)
+            X, y = predictor.prepare_data(df)
+            
+            if len(X) < 10:
+                logger.warning(f"Insufficient data for training models for user {user_id}")
+                continue
+            
+            predictor.training_watermark = data_watermark(df)
+            self.predictors[user_id] = predictor
+            datasets[user_id] = (X, y)
+        
+        return self.train_datasets(datasets, on_result)
+    
+    def train_datasets(self, datasets: Dict[str, Tuple[np.ndarray, np.ndarray]],
+                       on_result: Optional[Callable[[str, ModelPerformance], None]] = None) -> Dict[str, Dict[str, ModelPerformance]]:
+        """Train every configured model on every (X, y) dataset, keyed by user"""
+        results: Dict[str, Dict[str, ModelPerformance]] = {}
+        blocks: List[shared_memory.SharedMemory] = []
+        n_jobs = self.estimator_n_jobs()
+        
+        try:
+            # Publish each feature matrix once; workers attach instead of receiving a pickled copy
+            jobs = []
+            for user_id, (X, y) in datasets.items():
+                block, shape = _share_training_data(X, y)
+                blocks.append(block)
+                jobs.extend((user_id, name, block.name, shape, n_jobs) for name in self.model_names)
+            
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {executor.submit(_train_shared_job, *job): job for job in jobs}
+                
+                for future in as_completed(futures):
+                    user_id, name = futures[future][:2]
+                    try:
+                        model, scaler, performance = future.result()
+                    except Exception as e:
+                        logger.error(f"Training {name} for user {user_id} failed: {e}")
+                        continue
+                    
+                    predictor = self.predictors.setdefault(user_id, UsagePredictor(self.db_path))
+                    predictor.models[name] = model
+                    predictor.performance_metrics[name] = performance
+                    if scaler is not None:
+                        predictor.scalers[name] = scaler
+                    
+                    results.setdefault(user_id, {})[name] = performance
+                    if on_result:
+                        on_result(user_id, performance)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+        
+        return results
+
+def _share_training_data(X: np.ndarray, y: np.ndarray) -> Tuple[shared_memory.SharedMemory, Tuple[int, int]]:
+    """Copy X with y appended as the last column into a new shared memory block"""
+    shape = (X.shape[0], X.shape[1] + 1)
+    block = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * shape[1] * 8))
+    packed = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+    packed[:, :-1] = X
+    packed[:, -1] = y
+    del packed
+    return block, shape
+
+def _train_shared_job(user_id: str, name: str, shm_name: str, shape: Tuple[int, int],
+                      n_jobs: int) -> Tuple[Any, Optional[Any], ModelPerformance]:
+    """Process pool worker: attach to a user's shared feature matrix and train one model"""
+    block = shared_memory.SharedMemory(name=shm_name)
+    try:
+        packed = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+        # Fancy indexing inside train_test_split copies, so the split never aliases the block
+        split = train_test_split(packed[:, :-1], packed[:, -1], test_size=0.2, random_state=42)
+        del packed
+        return fit_regressor(name, create_regressor(name, n_jobs), *split)
+    finally:
+        block.close()
+
 class MLModelManager:
     """Central manager for all ML models"""
     
@@ -765,10 +995,12 @@ class MLModelManager:
         self.behavioral_analyzer = BehavioralAnalyzer(db_path)
         self.deep_learning_predictor = DeepLearningPredictor(db_path)
         self.time_series_forecaster = TimeSeriesForecaster(db_path)
+        self.user_predictors: Dict[str, UsagePredictor] = {}
         
         # Model storage
         self.model_path = Path('ml_models')
         self.model_path.mkdir(exist_ok=True)
+        self.registry = ModelRegistry(str(self.model_path / 'registry'))
     
     def train_all_models(self, user_id: str = None):
         """Train all available ML models"""
@@ -788,6 +1020,19 @@ class MLModelManager:
         
         logger.info("All models trained successfully")
     
+    def train_fleet_models(self, user_ids: List[str], max_workers: Optional[int] = None) -> Dict[str, Dict[str, ModelPerformance]]:
+        """Train usage prediction models for many users in parallel"""
+        if not SKLEARN_AVAILABLE:
+            logger.warning("Scikit-learn not available for fleet training")
+            return {}
+        
+        orchestrator = ParallelTrainingOrchestrator(self.db_path, max_workers)
+        results = orchestrator.train_users(user_ids)
+        self.user_predictors.update(orchestrator.predictors)
+        
+        logger.info(f"Trained usage models for {len(results)} users")
+        return results
+    
     def get_comprehensive_predictions(self, days_ahead: int = 7) -> Dict[str, Any]:
         """Get predictions from all models"""
         predictions = {}
@@ -829,12 +1074,11 @@ class MLModelManager:
         
         return insights
     
-    def save_models(self):
+    def save_models(self, user_id: str = None):
         """Save trained models to disk"""
-        for name, model in self.usage_predictor.models.items():
-            model_path = self.model_path / f"{name}_model.pkl"
-            with open(model_path, 'wb') as f:
-                pickle.dump(model, f)
+        self._register_usage_models(self.usage_predictor, user_id or 'default')
+        for fleet_user, predictor in self.user_predictors.items():
+            self._register_usage_models(predictor, fleet_user)
         
         # Save LSTM model
         if 'lstm' in self.deep_learning_predictor.models:
@@ -849,14 +1093,65 @@ class MLModelManager:
         
         logger.info("All models saved successfully")
     
-    def load_models(self):
+    def _register_usage_models(self, predictor: UsagePredictor, user_id: str):
+        """Store a predictor's trained regressors as a new registry version"""
+        feature_names = predictor.feature_engineer.feature_names
+        watermark = predictor.training_watermark or datetime.now().isoformat()
+        
+        for name, model in predictor.models.items():
+            performance = predictor.performance_metrics.get(name)
+            key = RegistryKey(name, user_id, feature_set_hash(feature_names), watermark)
+            if key in self.registry.entries:
+                continue
+            
+            payload = {
+                'model': model,
+                'scaler': predictor.scalers.get(name),
+                'feature_names': feature_names
+            }
+            metadata = {'mse': performance.mse, 'r2_score': performance.r2_score} if performance else {}
+            self.registry.register(key, payload, metadata)
+    
+    def load_models(self, user_id: str = None):
         """Load trained models from disk"""
-        # Load scikit-learn models
-        for model_file in self.model_path.glob("*_model.pkl"):
-            if model_file.name != "prophet_model.pkl":
-                with open(model_file, 'rb') as f:
-                    model_name = model_file.stem.replace("_model", "")
-                    self.usage_predictor.models[model_name] = pickle.load(f)
+        # Bind the newest registry version of each regressor; the estimator is loaded on first use
+        predictor = self.usage_predictor
+        models = LazyModelMapping(self.registry, 'model')
+        scalers = LazyModelMapping(self.registry, 'scaler')
+        
+        for name in available_regressors():
+            key = self.registry.latest(name, user_id or 'default')
+            if key is None:
+                continue
+            
+            entry = self.registry.entries[key]
+            models.bind(name, key)
+            if name in SCALED_MODELS:
+                scalers.bind(name, key)
+            
+            r2 = entry.metadata.get('r2_score', 0.0)
+            predictor.performance_metrics[name] = ModelPerformance(
+                model_name=name,
+                accuracy=r2,
+                precision=0,
+                recall=0,
+                f1_score=0,
+                mse=entry.metadata.get('mse', 0.0),
+                r2_score=r2,
+                last_updated=datetime.fromisoformat(entry.created_date)
+            )
+            predictor.training_watermark = key.watermark
+        
+        if len(models):
+            predictor.models = models
+            predictor.scalers = scalers
+        else:
+            # Fall back to unversioned pickles written by earlier releases
+            for model_file in self.model_path.glob("*_model.pkl"):
+                if model_file.name != "prophet_model.pkl":
+                    with open(model_file, 'rb') as f:
+                        model_name = model_file.stem.replace("_model", "")
+                        predictor.models[model_name] = pickle.load(f)
         
         # Load LSTM model
         lstm_path = self.model_path / "lstm_model.h5"
@@ -17,9 +17,11 @@ import random
 try:
     import matplotlib.pyplot as plt
     import matplotlib.animation as animation
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
     from matplotlib.figure import Figure
     import numpy as np
+    from ring_buffer import RingBuffer, MinMaxBuckets, lttb_decimate
+    from chart_renderer import ChartRenderService, ChartView, freeze
     MATPLOTLIB_AVAILABLE = True
 except ImportError:
     MATPLOTLIB_AVAILABLE = False
@@ -30,17 +32,239 @@ try:
 except ImportError:
     SEABORN_AVAILABLE = False
 
+class RealTimeChart:
+    """Live usage trace over a sliding window with a fixed axis range and blitting
+    
+    Samples go into preallocated ring buffers; long windows are drawn from
+    incrementally maintained min/max buckets (or LTTB on demand) so per-frame
+    cost stays bounded by max_points rather than by the window length. The x
+    axis is time relative to now, so limits only change when a value outgrows
+    the y range.
+    """
+    
+    def __init__(self, parent, data_callback, window_seconds: float = 24 * 60 * 60,
+                 interval_ms: int = 1000, max_points: int = 2000, y_range: Tuple[float, float] = (0, 120),
+                 decimation: str = 'minmax'):
+        if decimation not in ('minmax', 'lttb'):
+            raise ValueError(f"Unknown decimation: {decimation}")
+        
+        self.data_callback = data_callback
+        self.window_seconds = window_seconds
+        self.max_points = max_points
+        self.decimation = decimation
+        
+        # Raw samples for short windows and LTTB; min/max buckets for long windows
+        self.samples = RingBuffer(max(1, int(window_seconds * 1000 / interval_ms)), columns=2)
+        n_buckets = max(1, max_points // 2)
+        self.buckets = MinMaxBuckets(window_seconds / n_buckets, n_buckets + 1)
+        
+        self.fig = Figure(figsize=(10, 6))
+        self.ax = self.fig.add_subplot(111)
+        self.line, = self.ax.plot([], [], 'b-', linewidth=2)
+        
+        self.ax.set_xlim(-window_seconds, 0)
+        self.ax.set_ylim(*y_range)
+        self.ax.set_xlabel('Seconds ago')
+        self.ax.set_ylabel('Usage (minutes)')
+        self.ax.set_title('Real-time Usage Tracking')
+        self.ax.grid(True, alpha=0.3)
+        
+        self.canvas = FigureCanvasTkAgg(self.fig, parent)
+        self.canvas.draw()
+        self.canvas.get_tk_widget().pack(fill='both', expand=True)
+        
+        self.animation = animation.FuncAnimation(
+            self.fig, self._animate, init_func=self._init_frame,
+            interval=interval_ms, blit=True, cache_frame_data=False
+        )
+    
+    def push(self, value: float, timestamp: Optional[float] = None):
+        """Add a sample, e.g. from a backfill or an external feed"""
+        timestamp = time.time() if timestamp is None else timestamp
+        self.samples.append((timestamp, value))
+        self.buckets.append(timestamp, value)
+    
+    def series(self, now: float) -> Tuple[Any, Any]:
+        """Points to draw, relative to now and decimated to at most ~max_points"""
+        if len(self.samples) <= self.max_points:
+            rows = self.samples.view()
+            t, y = rows[:, 0], rows[:, 1]
+        elif self.decimation == 'lttb':
+            rows = self.samples.view()
+            t, y = lttb_decimate(rows[:, 0], rows[:, 1], self.max_points)
+        else:
+            t, y = self.buckets.series()
+        
+        keep = t >= now - self.window_seconds
+        return t[keep] - now, y[keep]
+    
+    def _init_frame(self):
+        self.line.set_data([], [])
+        return self.line,
+    
+    def _animate(self, frame):
+        new_data = self.data_callback()
+        if new_data is not None:
+            self.push(new_data)
+        
+        x, y = self.series(time.time())
+        self.line.set_data(x, y)
+        
+        # Growing the range is the only case that needs a full redraw; blitting resumes afterwards
+        low, high = self.ax.get_ylim()
+        if len(y) and y.max() > high:
+            self.ax.set_ylim(low, y.max() * 1.25)
+            self.canvas.draw()
+        
+        return self.line,
+
+def draw_progress_chart(fig, data):
+    """Weekly usage against productivity on twin axes"""
+    ax = fig.add_subplot(111)
+    days = list(range(1, len(data['usage']) + 1))
+    
+    # Create dual-axis chart
+    ax2 = ax.twinx()
+    
+    # Plot usage data
+    line1 = ax.plot(days, data['usage'], 'b-', label='Usage (min)', linewidth=2, marker='o')
+    ax.set_xlabel('Days')
+    ax.set_ylabel('Usage (minutes)', color='b')
+    ax.tick_params(axis='y', labelcolor='b')
+    
+    # Plot productivity data
+    line2 = ax2.plot(days, data['productivity'], 'r-', label='Productivity (%)', linewidth=2, marker='s')
+    ax2.set_ylabel('Productivity (%)', color='r')
+    ax2.tick_params(axis='y', labelcolor='r')
+    
+    # Add grid and title
+    ax.grid(True, alpha=0.3)
+    ax.set_title('Weekly Progress Overview', fontsize=14, fontweight='bold')
+    
+    # Add legend
+    lines = line1 + line2
+    labels = [l.get_label() for l in lines]
+    ax.legend(lines, labels, loc='upper left')
+
+def draw_trends_chart(fig, data):
+    """Hourly and weekly usage/productivity patterns in a 2x2 grid"""
+    ax1 = fig.add_subplot(2, 2, 1)
+    ax2 = fig.add_subplot(2, 2, 2)
+    ax3 = fig.add_subplot(2, 2, 3)
+    ax4 = fig.add_subplot(2, 2, 4)
+    
+    hours = list(range(len(data['hourly_usage'])))
+    
+    # Hourly usage pattern
+    ax1.bar(hours, data['hourly_usage'], color='skyblue', alpha=0.7)
+    ax1.set_title('Hourly Usage Pattern')
+    ax1.set_xlabel('Hour of Day')
+    ax1.set_ylabel('Usage (minutes)')
+    
+    # Hourly productivity
+    ax2.plot(hours, data['hourly_productivity'], 'g-', linewidth=2, marker='o')
+    ax2.set_title('Hourly Productivity')
+    ax2.set_xlabel('Hour of Day')
+    ax2.set_ylabel('Productivity (%)')
+    ax2.grid(True, alpha=0.3)
+    
+    # Weekly comparison
+    days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+    x = range(len(days))
+    ax3.bar(x, data['weekly_usage'], color='lightcoral', alpha=0.7)
+    ax3.set_title('Weekly Usage Comparison')
+    ax3.set_xlabel('Day of Week')
+    ax3.set_ylabel('Usage (minutes)')
+    ax3.set_xticks(x)
+    ax3.set_xticklabels(days)
+    
+    # Productivity vs Usage scatter
+    ax4.scatter(data['weekly_usage'], data['weekly_productivity'], s=100, alpha=0.6, color='purple')
+    ax4.set_title('Productivity vs Usage')
+    ax4.set_xlabel('Usage (minutes)')
+    ax4.set_ylabel('Productivity (%)')
+    ax4.grid(True, alpha=0.3)
+    
+    fig.tight_layout()
+
+def draw_focus_chart(fig, data):
+    """Focus session duration against productivity, coloured by session"""
+    ax = fig.add_subplot(111)
+    sessions = list(range(1, len(data['durations']) + 1))
+    
+    # Create scatter plot
+    scatter = ax.scatter(data['durations'], data['scores'], s=100, alpha=0.6, c=sessions, cmap='viridis')
+    ax.set_xlabel('Session Duration (minutes)')
+    ax.set_ylabel('Productivity Score (%)')
+    ax.set_title('Focus Session Performance')
+    ax.grid(True, alpha=0.3)
+    
+    # Add colorbar
+    cbar = fig.colorbar(scatter, ax=ax)
+    cbar.set_label('Session Number')
+    
+    fig.tight_layout()
+
+def draw_achievements_chart(fig, data):
+    """Completion percentage per achievement category"""
+    ax = fig.add_subplot(111)
+    categories = list(data['categories'])
+    percentages = [(u / t) * 100 for u, t in zip(data['unlocked'], data['total'])]
+    
+    # Create horizontal bar chart
+    bars = ax.barh(categories, percentages, color='lightgreen', alpha=0.7)
+    ax.set_xlabel('Completion Percentage (%)')
+    ax.set_title('Achievement Progress by Category')
+    ax.set_xlim(0, 100)
+    
+    # Add value labels on bars
+    for bar, pct in zip(bars, percentages):
+        ax.text(pct + 1, bar.get_y() + bar.get_height()/2, f'{pct:.1f}%', 
+               va='center', fontweight='bold')
+    
+    fig.tight_layout()
+
+# Chart id -> (draw function, figure size)
+CHARTS = {
+    'progress': (draw_progress_chart, (10, 6)),
+    'trends': (draw_trends_chart, (12, 8)),
+    'focus': (draw_focus_chart, (10, 6)),
+    'achievements': (draw_achievements_chart, (10, 6)),
+}
+
+def sample_chart_series() -> Dict[str, List]:
+    """Demo series used for any chart data the caller does not supply"""
+    return {
+        'weekly_usage': [random.randint(70, 150) for _ in range(7)],
+        'weekly_productivity': [random.randint(60, 95) for _ in range(7)],
+        'hourly_usage': [random.randint(0, 20) for _ in range(24)],
+        'hourly_productivity': [random.randint(50, 95) for _ in range(24)],
+        'comparison_usage': [random.randint(80, 140) for _ in range(7)],
+        'comparison_productivity': [random.randint(65, 90) for _ in range(7)],
+        'focus_durations': [random.randint(25, 90) for _ in range(10)],
+        'focus_scores': [random.randint(70, 95) for _ in range(10)],
+        'achievement_categories': ['Streak', 'Usage', 'Focus', 'Productivity', 'Consistency'],
+        'achievement_unlocked': [3, 2, 1, 1, 1],
+        'achievement_totals': [5, 4, 3, 3, 5],
+    }
+
 class AdvancedVisualization:
     """Advanced data visualization system"""
     
-    def __init__(self):
+    def __init__(self, renderer: Optional['ChartRenderService'] = None):
         self.charts = {}
         self.dashboards = {}
         self.real_time_data = {}
         self.animation_running = False
+        self.metric_labels: List[Tuple[ttk.Label, str, str]] = []
+        self.renderer = renderer
+        self.chart_views: Dict[str, 'ChartView'] = {}
+        self.sample_series = sample_chart_series()
     
     def create_interactive_dashboard(self, parent, user_data: Dict) -> tk.Frame:
         """Create interactive dashboard with multiple charts"""
+        self.metric_labels = []
+        self.chart_views = {}
         dashboard_frame = ttk.Frame(parent)
         dashboard_frame.pack(fill='both', expand=True)
         
@@ -88,23 +312,25 @@ class AdvancedVisualization:
         
         # Create metric cards
         metrics = [
-            ("⏱️ Today's Usage", f"{user_data.get('usage_time', 0)} min", "#FF6B6B"),
-            ("🎯 Productivity", f"{user_data.get('productivity_score', 0)}%", "#4ECDC4"),
-            ("🎯 Focus Sessions", f"{user_data.get('focus_sessions', 0)}", "#45B7D1"),
-            ("🔥 Streak", f"{user_data.get('streak_days', 0)} days", "#96CEB4")
+            ("⏱️ Today's Usage", 'usage_time', "{} min", "#FF6B6B"),
+            ("🎯 Productivity", 'productivity_score', "{}%", "#4ECDC4"),
+            ("🎯 Focus Sessions", 'focus_sessions', "{}", "#45B7D1"),
+            ("🔥 Streak", 'streak_days', "{} days", "#96CEB4")
         ]
         
-        for i, (label, value, color) in enumerate(metrics):
+        for i, (label, key, fmt, color) in enumerate(metrics):
             metric_frame = ttk.LabelFrame(metrics_frame, text=label, padding="15")
             metric_frame.grid(row=0, column=i, padx=5, pady=5, sticky="ew")
             metrics_frame.columnconfigure(i, weight=1)
             
-            ttk.Label(
+            value_label = ttk.Label(
                 metric_frame,
-                text=value,
+                text=fmt.format(user_data.get(key, 0)),
                 font=('Arial', 20, 'bold'),
                 foreground=color
-            ).pack()
+            )
+            value_label.pack()
+            self.metric_labels.append((value_label, key, fmt))
         
         # Progress visualization
         progress_frame = ttk.LabelFrame(parent, text="📈 Progress Visualization", padding="15")
@@ -153,22 +379,24 @@ class AdvancedVisualization:
         focus_metrics_frame.pack(fill='x', padx=10, pady=10)
         
         focus_metrics = [
-            ("Total Sessions", f"{user_data.get('total_focus_sessions', 0)}"),
-            ("Avg Duration", f"{user_data.get('avg_focus_duration', 0)} min"),
-            ("Best Session", f"{user_data.get('best_focus_score', 0)}%"),
-            ("Today's Sessions", f"{user_data.get('focus_sessions', 0)}")
+            ("Total Sessions", 'total_focus_sessions', "{}"),
+            ("Avg Duration", 'avg_focus_duration', "{} min"),
+            ("Best Session", 'best_focus_score', "{}%"),
+            ("Today's Sessions", 'focus_sessions', "{}")
         ]
         
-        for i, (label, value) in enumerate(focus_metrics):
+        for i, (label, key, fmt) in enumerate(focus_metrics):
             metric_frame = ttk.LabelFrame(focus_metrics_frame, text=label, padding="15")
             metric_frame.grid(row=0, column=i, padx=5, pady=5, sticky="ew")
             focus_metrics_frame.columnconfigure(i, weight=1)
             
-            ttk.Label(
+            value_label = ttk.Label(
                 metric_frame,
-                text=value,
+                text=fmt.format(user_data.get(key, 0)),
                 font=('Arial', 16, 'bold')
-            ).pack()
+            )
+            value_label.pack()
+            self.metric_labels.append((value_label, key, fmt))
         
         # Focus visualization
         focus_viz_frame = ttk.LabelFrame(parent, text="📊 Focus Performance", padding="15")
@@ -222,162 +450,52 @@ class AdvancedVisualization:
         else:
             self.create_simple_achievements_display(achievement_viz_frame, user_data)
     
+    def chart_snapshots(self, user_data: Dict) -> Dict[str, Any]:
+        """Immutable per-chart data, taken on the Tk thread and handed to the render workers"""
+        series = {key: user_data.get(key, value) for key, value in self.sample_series.items()}
+        return {
+            'progress': freeze({'usage': series['weekly_usage'], 'productivity': series['weekly_productivity']}),
+            'trends': freeze({'hourly_usage': series['hourly_usage'],
+                              'hourly_productivity': series['hourly_productivity'],
+                              'weekly_usage': series['comparison_usage'],
+                              'weekly_productivity': series['comparison_productivity']}),
+            'focus': freeze({'durations': series['focus_durations'], 'scores': series['focus_scores']}),
+            'achievements': freeze({'categories': series['achievement_categories'],
+                                    'unlocked': series['achievement_unlocked'],
+                                    'total': series['achievement_totals']}),
+        }
+    
+    def create_chart(self, parent, chart_id: str, user_data: Dict) -> ChartView:
+        """Place a chart that is rendered off the Tk thread and shown when ready"""
+        if self.renderer is None:
+            self.renderer = ChartRenderService(parent.winfo_toplevel())
+        draw, figsize = CHARTS[chart_id]
+        view = ChartView(parent, self.renderer, chart_id, draw, figsize=figsize)
+        self.chart_views[chart_id] = view
+        view.show(self.chart_snapshots(user_data)[chart_id])
+        return view
+    
+    def refresh_charts(self, user_data: Dict):
+        """Re-render existing charts from fresh data; unchanged charts come from the image cache"""
+        snapshots = self.chart_snapshots(user_data)
+        for chart_id, view in self.chart_views.items():
+            view.show(snapshots[chart_id])
+    
     def create_progress_chart(self, parent, user_data: Dict):
         """Create progress chart using matplotlib"""
-        fig = Figure(figsize=(10, 6))
-        ax = fig.add_subplot(111)
-        
-        # Generate sample data
-        days = list(range(1, 8))
-        usage_data = [random.randint(70, 150) for _ in range(7)]
-        productivity_data = [random.randint(60, 95) for _ in range(7)]
-        
-        # Create dual-axis chart
-        ax2 = ax.twinx()
-        
-        # Plot usage data
-        line1 = ax.plot(days, usage_data, 'b-', label='Usage (min)', linewidth=2, marker='o')
-        ax.set_xlabel('Days')
-        ax.set_ylabel('Usage (minutes)', color='b')
-        ax.tick_params(axis='y', labelcolor='b')
-        
-        # Plot productivity data
-        line2 = ax2.plot(days, productivity_data, 'r-', label='Productivity (%)', linewidth=2, marker='s')
-        ax2.set_ylabel('Productivity (%)', color='r')
-        ax2.tick_params(axis='y', labelcolor='r')
-        
-        # Add grid and title
-        ax.grid(True, alpha=0.3)
-        ax.set_title('Weekly Progress Overview', fontsize=14, fontweight='bold')
-        
-        # Add legend
-        lines = line1 + line2
-        labels = [l.get_label() for l in lines]
-        ax.legend(lines, labels, loc='upper left')
-        
-        # Create canvas
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
-        
-        # Add toolbar
-        toolbar = NavigationToolbar2Tk(canvas, parent)
-        toolbar.update()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
+        return self.create_chart(parent, 'progress', user_data)
     
     def create_trends_chart(self, parent, user_data: Dict):
         """Create trends chart"""
-        fig = Figure(figsize=(12, 8))
-        
-        # Create subplots
-        ax1 = fig.add_subplot(2, 2, 1)
-        ax2 = fig.add_subplot(2, 2, 2)
-        ax3 = fig.add_subplot(2, 2, 3)
-        ax4 = fig.add_subplot(2, 2, 4)
-        
-        # Generate sample data
-        hours = list(range(24))
-        usage_by_hour = [random.randint(0, 20) for _ in range(24)]
-        productivity_by_hour = [random.randint(50, 95) for _ in range(24)]
-        
-        # Hourly usage pattern
-        ax1.bar(hours, usage_by_hour, color='skyblue', alpha=0.7)
-        ax1.set_title('Hourly Usage Pattern')
-        ax1.set_xlabel('Hour of Day')
-        ax1.set_ylabel('Usage (minutes)')
-        
-        # Hourly productivity
-        ax2.plot(hours, productivity_by_hour, 'g-', linewidth=2, marker='o')
-        ax2.set_title('Hourly Productivity')
-        ax2.set_xlabel('Hour of Day')
-        ax2.set_ylabel('Productivity (%)')
-        ax2.grid(True, alpha=0.3)
-        
-        # Weekly comparison
-        days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        weekly_usage = [random.randint(80, 140) for _ in range(7)]
-        weekly_productivity = [random.randint(65, 90) for _ in range(7)]
-        
-        x = range(len(days))
-        ax3.bar(x, weekly_usage, color='lightcoral', alpha=0.7)
-        ax3.set_title('Weekly Usage Comparison')
-        ax3.set_xlabel('Day of Week')
-        ax3.set_ylabel('Usage (minutes)')
-        ax3.set_xticks(x)
-        ax3.set_xticklabels(days)
-        
-        # Productivity vs Usage scatter
-        ax4.scatter(weekly_usage, weekly_productivity, s=100, alpha=0.6, color='purple')
-        ax4.set_title('Productivity vs Usage')
-        ax4.set_xlabel('Usage (minutes)')
-        ax4.set_ylabel('Productivity (%)')
-        ax4.grid(True, alpha=0.3)
-        
-        fig.tight_layout()
-        
-        # Create canvas
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
+        return self.create_chart(parent, 'trends', user_data)
     
     def create_focus_chart(self, parent, user_data: Dict):
         """Create focus chart"""
-        fig = Figure(figsize=(10, 6))
-        ax = fig.add_subplot(111)
-        
-        # Generate sample focus session data
-        sessions = list(range(1, 11))
-        durations = [random.randint(25, 90) for _ in range(10)]
-        productivity_scores = [random.randint(70, 95) for _ in range(10)]
-        
-        # Create scatter plot
-        scatter = ax.scatter(durations, productivity_scores, s=100, alpha=0.6, c=sessions, cmap='viridis')
-        ax.set_xlabel('Session Duration (minutes)')
-        ax.set_ylabel('Productivity Score (%)')
-        ax.set_title('Focus Session Performance')
-        ax.grid(True, alpha=0.3)
-        
-        # Add colorbar
-        cbar = fig.colorbar(scatter, ax=ax)
-        cbar.set_label('Session Number')
-        
-        fig.tight_layout()
-        
-        # Create canvas
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
+        return self.create_chart(parent, 'focus', user_data)
     
     def create_achievements_chart(self, parent, user_data: Dict):
         """Create achievements chart"""
-        fig = Figure(figsize=(10, 6))
-        ax = fig.add_subplot(111)
-        
-        # Achievement categories
-        categories = ['Streak', 'Usage', 'Focus', 'Productivity', 'Consistency']
-        unlocked = [3, 2, 1, 1, 1]  # Sample data
-        total = [5, 4, 3, 3, 5]
-        
-        # Calculate percentages
-        percentages = [(u/t)*100 for u, t in zip(unlocked, total)]
-        
-        # Create horizontal bar chart
-        bars = ax.barh(categories, percentages, color='lightgreen', alpha=0.7)
-        ax.set_xlabel('Completion Percentage (%)')
-        ax.set_title('Achievement Progress by Category')
-        ax.set_xlim(0, 100)
-        
-        # Add value labels on bars
-        for i, (bar, pct) in enumerate(zip(bars, percentages)):
-            ax.text(pct + 1, bar.get_y() + bar.get_height()/2, f'{pct:.1f}%', 
-                   va='center', fontweight='bold')
-        
-        fig.tight_layout()
-        
-        # Create canvas
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
+        return self.create_chart(parent, 'achievements', user_data)
     
     def create_simple_progress_display(self, parent, user_data: Dict):
         """Create simple progress display without matplotlib"""
@@ -471,51 +589,21 @@ class AdvancedVisualization:
                 status = "✅" if random.choice([True, False]) else "🔒"
                 ttk.Label(cat_frame, text=f"{status} {achievement}").pack(anchor='w')
     
-    def create_real_time_chart(self, parent, data_callback):
+    def update_metrics(self, user_data: Dict):
+        """Refresh metric card values in place without rebuilding the charts"""
+        for value_label, key, fmt in self.metric_labels:
+            value_label.config(text=fmt.format(user_data.get(key, 0)))
+    
+    def create_real_time_chart(self, parent, data_callback, window_seconds: float = 24 * 60 * 60,
+                               interval_ms: int = 1000, decimation: str = 'minmax'):
         """Create real-time updating chart"""
         if not MATPLOTLIB_AVAILABLE:
             return self.create_simple_real_time_display(parent)
         
-        fig = Figure(figsize=(10, 6))
-        ax = fig.add_subplot(111)
-        
-        # Initialize data
-        x_data = []
-        y_data = []
-        line, = ax.plot(x_data, y_data, 'b-', linewidth=2)
-        
-        ax.set_xlabel('Time')
-        ax.set_ylabel('Usage (minutes)')
-        ax.set_title('Real-time Usage Tracking')
-        ax.grid(True, alpha=0.3)
-        
-        def animate(frame):
-            # Get new data
-            new_data = data_callback()
-            if new_data:
-                x_data.append(len(x_data))
-                y_data.append(new_data)
-                
-                # Keep only last 50 points
-                if len(x_data) > 50:
-                    x_data.pop(0)
-                    y_data.pop(0)
-                
-                line.set_data(x_data, y_data)
-                ax.relim()
-                ax.autoscale_view()
-            
-            return line,
-        
-        # Create animation
-        ani = animation.FuncAnimation(fig, animate, interval=1000, blit=True)
-        
-        # Create canvas
-        canvas = FigureCanvasTkAgg(fig, parent)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill='both', expand=True)
-        
-        return ani
+        chart = RealTimeChart(parent, data_callback, window_seconds=window_seconds,
+                              interval_ms=interval_ms, decimation=decimation)
+        self.charts['real_time'] = chart
+        return chart
     
     def create_simple_real_time_display(self, parent):
         """Create simple real-time display without matplotlib"""
@@ -589,6 +677,11 @@ class InteractiveDashboard:
     
     def refresh_dashboard(self, user_data: Dict):
         """Refresh dashboard with new data"""
+        if self.visualization.chart_views:
+            self.visualization.update_metrics(user_data)
+            self.visualization.refresh_charts(user_data)
+            return
+        
         # Clear existing visualization
         for widget in self.viz_frame.winfo_children():
             widget.destroy()
@@ -612,7 +705,7 @@ class InteractiveDashboard:
             if self.dashboard_running:
                 # Update user data with new values
                 updated_data = self.generate_updated_data(user_data)
-                self.refresh_dashboard(updated_data)
+                self.visualization.update_metrics(updated_data)
                 self.parent.after(self.update_interval, update_loop)
         
         update_loop()
@@ -14,6 +14,8 @@ from enum import Enum
 import logging
 import random
 
+from intent_index import IntentIndex
+
 logger = logging.getLogger(__name__)
 
 class ConversationType(Enum):
@@ -495,6 +497,22 @@ class ConversationalAI:
         self.ai_assistant = ai_assistant
         self.conversation_context = {}
         self.response_templates = self._load_response_templates()
+        self.intent_index = self._build_intent_index()
+    
+    def _build_intent_index(self) -> IntentIndex:
+        """Index intent keywords; earlier intents win ties"""
+        index = IntentIndex()
+        keywords = {
+            'greeting': ['hello', 'hi', 'hey'],
+            'help': ['help', 'support', 'assist'],
+            'motivation': ['motivate', 'encourage', 'inspire'],
+            'advice': ['advice', 'suggest', 'recommend'],
+            'celebration': ['celebrate', 'achievement', 'success']
+        }
+        for intent, words in keywords.items():
+            for word in words:
+                index.add(word, intent)
+        return index
     
     def _load_response_templates(self) -> Dict[str, List[str]]:
         """Load response templates"""
@@ -542,20 +560,8 @@ class ConversationalAI:
     
     def _analyze_intent(self, message: str) -> str:
         """Analyze message intent"""
-        message_lower = message.lower()
-        
-        if any(word in message_lower for word in ['hello', 'hi', 'hey']):
-            return 'greeting'
-        elif any(word in message_lower for word in ['help', 'support', 'assist']):
-            return 'help'
-        elif any(word in message_lower for word in ['motivate', 'encourage', 'inspire']):
-            return 'motivation'
-        elif any(word in message_lower for word in ['advice', 'suggest', 'recommend']):
-            return 'advice'
-        elif any(word in message_lower for word in ['celebrate', 'achievement', 'success']):
-            return 'celebration'
-        else:
-            return 'general'
+        match = self.intent_index.match(message)
+        return match.intent if match else 'general'
     
     def _generate_greeting_response(self) -> str:
         """Generate greeting response"""
@@ -7,7 +7,6 @@ behavioral analysis, and personalized recommendations.
 
 import json
 import time
-import threading
 import numpy as np
 import random
 from datetime import datetime, timedelta
@@ -15,7 +14,6 @@ from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
 from enum import Enum
-import queue
 import sqlite3
 import hashlib
 from pathlib import Path
@@ -27,6 +25,8 @@ from sklearn.model_selection import train_test_split
 from sklearn.metrics import accuracy_score, mean_squared_error
 import pandas as pd
 
+from scheduler import get_scheduler
+
 logger = logging.getLogger(__name__)
 
 class ProductivityPattern(Enum):
@@ -105,8 +105,10 @@ class AIProductivityEngine:
     
     def __init__(self, db_path: str = "productivity.db"):
         self.db_path = db_path
-        self.insights_queue = queue.Queue()
-        self.recommendations_queue = queue.Queue()
+        # Insights and recommendations are saved on the shared scheduler as soon as they are queued
+        self.insights_queue = get_scheduler().queue(self._save_insight, name="AIProductivityEngine.insights")
+        self.recommendations_queue = get_scheduler().queue(self._save_recommendation,
+                                                           name="AIProductivityEngine.recommendations")
         self.behavior_profiles = {}
         self.ml_models = {}
         self.scalers = {}
@@ -119,8 +121,8 @@ class AIProductivityEngine:
         self._initialize_models()
         
         # Start background processing
-        self.processing_thread = threading.Thread(target=self._background_processing, daemon=True)
-        self.processing_thread.start()
+        self.processing_task = get_scheduler().every(3600, self._update_ml_models, budget=10.0,
+                                                     name="AIProductivityEngine.update_ml_models", blocking=True)
         
         print("🤖 AI Productivity Engine initialized!")
         print("🧠 Machine learning models loaded!")
@@ -655,30 +657,6 @@ class AIProductivityEngine:
         
         return recommendations
     
-    def _background_processing(self):
-        """Background processing for insights and recommendations"""
-        while True:
-            try:
-                # Process insights
-                while not self.insights_queue.empty():
-                    insight = self.insights_queue.get_nowait()
-                    self._save_insight(insight)
-                
-                # Process recommendations
-                while not self.recommendations_queue.empty():
-                    recommendation = self.recommendations_queue.get_nowait()
-                    self._save_recommendation(recommendation)
-                
-                # Update ML models periodically
-                if time.time() % 3600 < 1:  # Every hour
-                    self._update_ml_models()
-                
-                time.sleep(10)  # Check every 10 seconds
-                
-            except Exception as e:
-                logger.error(f"Error in background processing: {e}")
-                time.sleep(30)
-    
     def _save_behavior_profile(self, profile: BehaviorProfile):
         """Save behavior profile to database"""
         try:
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Snapshot Backup Store for Scroll Stopping Tool
+Incremental, content-addressed backups of data directories and live SQLite databases
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# A multiple of every SQLite page size, so a changed page only dirties its own chunk
+CHUNK_SIZE = 1 << 18
+
+def _read_only_uri(path: Path) -> str:
+    return Path(path).resolve().as_uri() + "?mode=ro"
+
+@dataclass
+class SnapshotEntry:
+    """One file in a snapshot, stored as content-addressed chunks"""
+    digest: str
+    size: int
+    mtime_ns: int
+    kind: str = "file"  # file, sqlite
+    chunks: List[str] = field(default_factory=list)
+
+@dataclass
+class BackupSnapshot:
+    """Manifest of a snapshot: logical path -> stored content"""
+    backup_name: str
+    created_at: str
+    files: Dict[str, SnapshotEntry] = field(default_factory=dict)
+    total_size: int = 0
+    new_bytes: int = 0
+
+    def summary(self) -> Dict:
+        """Catalog row for this snapshot"""
+        return {
+            'backup_name': self.backup_name,
+            'created_at': self.created_at,
+            'data_files': sum(1 for path in self.files if path.endswith(".dat")),
+            'files': len(self.files),
+            'total_size': self.total_size,
+            'new_bytes': self.new_bytes
+        }
+
+class SnapshotStore:
+    """Content-addressed snapshot store
+
+    File contents are split into chunks stored once under objects/<digest>, so
+    a snapshot only writes the chunks that changed plus a manifest. Files whose size and mtime match the previous
+    snapshot are not even re-read. Databases are copied with the sqlite3 online
+    backup API, which gives a consistent image while other connections write.
+    catalog.json summarizes every snapshot so listing never walks the store.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.snapshots_dir = self.root / "snapshots"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+        self.catalog_path = self.root / "catalog.json"
+        self.catalog: Dict[str, Dict] = self._load_catalog()
+
+    def _load_catalog(self) -> Dict[str, Dict]:
+        if self.catalog_path.exists():
+            try:
+                with open(self.catalog_path, 'r') as f:
+                    return json.load(f)
+            except (OSError, ValueError) as e:
+                logger.error(f"Error reading backup catalog, rebuilding: {e}")
+        catalog = {}
+        for manifest in self.snapshots_dir.glob("*.json"):
+            snapshot = self._read_manifest(manifest)
+            if snapshot is not None:
+                catalog[snapshot.backup_name] = snapshot.summary()
+        return catalog
+
+    def _write_json(self, path: Path, payload):
+        """Write through a temp file so a crash never leaves half a manifest"""
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            json.dump(payload, f, indent=2)
+        os.replace(tmp, path)
+
+    def _read_manifest(self, path: Path) -> Optional[BackupSnapshot]:
+        try:
+            with open(path, 'r') as f:
+                payload = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading snapshot {path.name}: {e}")
+            return None
+        payload['files'] = {name: SnapshotEntry(**entry) for name, entry in payload['files'].items()}
+        return BackupSnapshot(**payload)
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _has_chunks(self, entry: SnapshotEntry) -> bool:
+        return all(self._object_path(chunk).exists() for chunk in entry.chunks)
+
+    def _store_file(self, source: Path, mtime_ns: int, kind: str = "file") -> Tuple[SnapshotEntry, int]:
+        """Hash a file chunk by chunk, storing chunks the store lacks; returns (entry, bytes written)"""
+        hasher = hashlib.blake2b(digest_size=20)
+        chunks = []
+        size = written = 0
+        with open(source, 'rb') as src:
+            for chunk in iter(lambda: src.read(CHUNK_SIZE), b''):
+                hasher.update(chunk)
+                size += len(chunk)
+                chunk_digest = hashlib.blake2b(chunk, digest_size=20).hexdigest()
+                chunks.append(chunk_digest)
+                target = self._object_path(chunk_digest)
+                if target.exists():
+                    continue
+                target.parent.mkdir(exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.objects_dir, suffix=".tmp")
+                with os.fdopen(fd, 'wb') as dst:
+                    dst.write(chunk)
+                os.replace(tmp, target)
+                written += len(chunk)
+        return SnapshotEntry(hasher.hexdigest(), size, mtime_ns, kind, chunks), written
+
+    def _assemble(self, entry: SnapshotEntry, fd: int):
+        """Write an entry's chunks, in order, to an open file descriptor"""
+        with os.fdopen(fd, 'wb') as dst:
+            for chunk in entry.chunks:
+                with open(self._object_path(chunk), 'rb') as src:
+                    shutil.copyfileobj(src, dst)
+
+    def _store_database(self, database: Path, mtime_ns: int) -> Tuple[SnapshotEntry, int]:
+        """Consistent copy of a live database through the online backup API"""
+        fd, tmp = tempfile.mkstemp(dir=self.objects_dir, suffix=".db")
+        os.close(fd)
+        try:
+            source = sqlite3.connect(_read_only_uri(database), uri=True)
+            target = sqlite3.connect(tmp)
+            try:
+                source.backup(target, pages=256)
+            finally:
+                target.close()
+                source.close()
+            return self._store_file(Path(tmp), mtime_ns, "sqlite")
+        finally:
+            os.unlink(tmp)
+
+    @staticmethod
+    def _database_stamp(database: Path) -> int:
+        """Last write time including the WAL, so writes that have not been checkpointed still count"""
+        wal = database.with_name(database.name + "-wal")
+        return max(database.stat().st_mtime_ns, wal.stat().st_mtime_ns if wal.exists() else 0)
+
+    def latest(self) -> Optional[BackupSnapshot]:
+        if not self.catalog:
+            return None
+        name = max(self.catalog.values(), key=lambda row: row['created_at'])['backup_name']
+        return self.load(name)
+
+    def load(self, backup_name: str) -> Optional[BackupSnapshot]:
+        path = self.snapshots_dir / f"{backup_name}.json"
+        return self._read_manifest(path) if path.exists() else None
+
+    def create(self, backup_name: str, directories: Dict[str, Path],
+               databases: Optional[Dict[str, Path]] = None) -> BackupSnapshot:
+        """Snapshot directories and databases under logical prefixes, storing only changed content"""
+        previous = self.latest()
+        previous_files = previous.files if previous else {}
+        snapshot = BackupSnapshot(backup_name, datetime.now().isoformat())
+
+        for prefix, directory in directories.items():
+            directory = Path(directory)
+            if not directory.exists():
+                continue
+            for path in sorted(p for p in directory.rglob("*") if p.is_file()):
+                stat = path.stat()
+                name = f"{prefix}/{path.relative_to(directory).as_posix()}"
+                entry = previous_files.get(name)
+                if entry is None or entry.kind != "file" or entry.size != stat.st_size \
+                        or entry.mtime_ns != stat.st_mtime_ns or not self._has_chunks(entry):
+                    entry, written = self._store_file(path, stat.st_mtime_ns)
+                    snapshot.new_bytes += written
+                snapshot.files[name] = entry
+                snapshot.total_size += entry.size
+
+        for name, database in (databases or {}).items():
+            database = Path(database)
+            if not database.exists():
+                continue
+            mtime_ns = self._database_stamp(database)
+            entry = previous_files.get(name)
+            if entry is None or entry.kind != "sqlite" or entry.mtime_ns != mtime_ns or not self._has_chunks(entry):
+                entry, written = self._store_database(database, mtime_ns)
+                snapshot.new_bytes += written
+            snapshot.files[name] = entry
+            snapshot.total_size += entry.size
+
+        self._write_json(self.snapshots_dir / f"{backup_name}.json", asdict(snapshot))
+        self.catalog[backup_name] = snapshot.summary()
+        self._write_json(self.catalog_path, self.catalog)
+        return snapshot
+
+    def list(self) -> List[Dict]:
+        """Catalog rows, newest first"""
+        return sorted(self.catalog.values(), key=lambda row: row['created_at'], reverse=True)
+
+    def restore(self, backup_name: str, directories: Dict[str, Path],
+                databases: Optional[Dict[str, Path]] = None, paths: Optional[Iterable[str]] = None) -> int:
+        """Restore a snapshot, or only the logical paths/prefixes given; returns files written
+
+        A full restore also removes files the snapshot does not contain. Files
+        already matching the snapshot are left alone, and databases are written
+        back through the backup API so open connections see a consistent state.
+        """
+        snapshot = self.load(backup_name)
+        if snapshot is None:
+            raise KeyError(backup_name)
+        selected = list(paths) if paths is not None else None
+
+        def wanted(name: str) -> bool:
+            return selected is None or any(name == path or name.startswith(path.rstrip("/") + "/")
+                                           for path in selected)
+
+        written = 0
+        for prefix, directory in directories.items():
+            directory = Path(directory)
+            directory.mkdir(parents=True, exist_ok=True)
+            keep = set()
+            for name, entry in snapshot.files.items():
+                if entry.kind != "file" or not name.startswith(prefix + "/") or not wanted(name):
+                    continue
+                target = directory / name[len(prefix) + 1:]
+                keep.add(target)
+                if target.exists():
+                    stat = target.stat()
+                    if stat.st_size == entry.size and stat.st_mtime_ns == entry.mtime_ns:
+                        continue
+                target.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+                self._assemble(entry, fd)
+                os.utime(tmp, ns=(entry.mtime_ns, entry.mtime_ns))
+                os.replace(tmp, target)
+                written += 1
+            if selected is None:
+                for path in [p for p in directory.rglob("*") if p.is_file() and p not in keep]:
+                    path.unlink()
+
+        for name, database in (databases or {}).items():
+            entry = snapshot.files.get(name)
+            if entry is None or entry.kind != "sqlite" or not wanted(name):
+                continue
+            fd, image = tempfile.mkstemp(dir=self.objects_dir, suffix=".db")
+            try:
+                self._assemble(entry, fd)
+                source = sqlite3.connect(_read_only_uri(image), uri=True)
+                target = sqlite3.connect(str(database))
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+                    source.close()
+            finally:
+                os.unlink(image)
+            written += 1
+        return written
+
+    def delete(self, backup_name: str) -> int:
+        """Remove a snapshot and any stored content no other snapshot uses; returns bytes freed"""
+        if self.catalog.pop(backup_name, None) is None:
+            return 0
+        (self.snapshots_dir / f"{backup_name}.json").unlink(missing_ok=True)
+        self._write_json(self.catalog_path, self.catalog)
+
+        referenced = set()
+        for name in self.catalog:
+            snapshot = self.load(name)
+            if snapshot is not None:
+                for entry in snapshot.files.values():
+                    referenced.update(entry.chunks)
+        freed = 0
+        for path in self.objects_dir.glob("*/*"):
+            if path.parent.name + path.name not in referenced:
+                freed += path.stat().st_size
+                path.unlink()
+        return freed
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Achievement Rule Engine Benchmark for Scroll Stopping Tool
+Measures activity events per second against a large compiled rule set
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from achievement_rules import RuleEngine
+
+METRICS = ['focus_sessions', 'focus_time_minutes', 'streak_days', 'time_saved_hours',
+           'breaks_taken', 'productivity_score', 'perfect_days', 'daily_usage']
+
+def build_engine(n_rules: int, conjunction_share: float, rng: random.Random) -> RuleEngine:
+    """Synthetic rule set: mostly single thresholds plus some two-metric conjunctions"""
+    engine = RuleEngine()
+    for i in range(n_rules):
+        if rng.random() < conjunction_share:
+            first, second = rng.sample(METRICS, 2)
+            requirements = {first: rng.randint(1, 200), second: rng.randint(1, 200)}
+            engine.compile_requirements(f'rule_{i}', requirements, {m: m for m in METRICS})
+        else:
+            engine.add_threshold_rule(f'rule_{i}', rng.choice(METRICS), rng.randint(1, 200))
+    return engine
+
+def run(n_rules: int, n_users: int, n_events: int, conjunction_share: float, seed: int) -> dict:
+    """Replay random activity events and report throughput"""
+    rng = random.Random(seed)
+    engine = build_engine(n_rules, conjunction_share, rng)
+
+    # Each event moves one or two metrics of a random user, like a real activity update
+    state = {}
+    events = []
+    for _ in range(n_events):
+        user = rng.randrange(n_users)
+        metrics = dict(state.get(user) or {m: 0 for m in METRICS})
+        for metric in rng.sample(METRICS, rng.randint(1, 2)):
+            metrics[metric] += rng.randint(1, 10)
+        state[user] = metrics
+        events.append((user, metrics))
+
+    unlocks = 0
+    start = time.perf_counter()
+    for user, metrics in events:
+        unlocks += len(engine.evaluate(user, metrics))
+    elapsed = time.perf_counter() - start
+
+    bitset_bytes = sum(sys.getsizeof(bits) for bits in engine.unlocked.values())
+    return {
+        'events_per_second': n_events / elapsed,
+        'unlocks': unlocks,
+        'users_seen': len(engine.unlocked),
+        'bitset_bytes': bitset_bytes,
+    }
+
+def main():
+    """Main function for the rule engine benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark achievement rule evaluation")
+    parser.add_argument('--rules', type=int, default=1000)
+    parser.add_argument('--users', type=int, default=100000)
+    parser.add_argument('--events', type=int, default=200000)
+    parser.add_argument('--conjunctions', type=float, default=0.1,
+                        help="Share of rules with two requirements")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"🏆 {args.rules} rules, {args.users} users, {args.events} events")
+    result = run(args.rules, args.users, args.events, args.conjunctions, args.seed)
+    print(f"⚡ {result['events_per_second']:,.0f} events/s")
+    print(f"🔓 {result['unlocks']:,} unlocks across {result['users_seen']:,} users")
+    print(f"💾 {result['bitset_bytes'] / 1024 / 1024:.1f} MB of unlock bitsets")
+
+if __name__ == "__main__":
+    main()
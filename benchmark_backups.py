@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Backup Benchmark for Scroll Stopping Tool
+Time and bytes written by incremental snapshots versus full directory copies
+"""
+
+import argparse
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+from cloud_sync import LocalCloudProvider
+
+def directory_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+def populate(provider: LocalCloudProvider, files: int, file_kb: int):
+    for i in range(files):
+        provider.upload_data(f"usage{i:05d}", os.urandom(file_kb * 1024), {'index': i})
+
+def make_database(path: Path, rows: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS usage_data (id INTEGER PRIMARY KEY, minutes REAL, payload TEXT)")
+    conn.executemany("INSERT INTO usage_data (minutes, payload) VALUES (?, ?)",
+                     [(i * 0.5, "x" * 200) for i in range(rows)])
+    conn.commit()
+    return conn
+
+def legacy_backup(sync_dir: Path, backup_dir: Path):
+    """The old backup: copy every data and metadata file each time"""
+    shutil.copytree(sync_dir / "data", backup_dir / "data", dirs_exist_ok=True)
+    shutil.copytree(sync_dir / "metadata", backup_dir / "metadata", dirs_exist_ok=True)
+
+def main():
+    """Main function for the backup benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark incremental snapshot backups")
+    parser.add_argument('--files', type=int, default=500)
+    parser.add_argument('--file-kb', type=int, default=64)
+    parser.add_argument('--changed', type=int, default=5, help="Files added between hourly backups")
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--backups', type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = Path(tempfile.mkdtemp(prefix="backup_bench_"))
+    try:
+        database = workdir / "productivity.db"
+        conn = make_database(database, args.rows)
+        provider = LocalCloudProvider(str(workdir / "cloud_sync"), databases={'productivity.db': str(database)})
+        populate(provider, args.files, args.file_kb)
+        store_dir = provider.sync_dir / "backups"
+
+        start = time.perf_counter()
+        provider.create_backup("backup_000")
+        first_elapsed = time.perf_counter() - start
+        print(f"💾 first snapshot: {first_elapsed * 1000:.0f} ms, {directory_size(store_dir) / 1e6:.1f} MB stored")
+
+        incremental = []
+        for n in range(1, args.backups + 1):
+            for i in range(args.changed):
+                provider.upload_data(f"hourly{n:03d}_{i}", os.urandom(args.file_kb * 1024), {'backup': n})
+            conn.execute("INSERT INTO usage_data (minutes, payload) VALUES (?, ?)", (n, "y" * 200))
+            conn.commit()
+            before = directory_size(store_dir)
+            start = time.perf_counter()
+            provider.create_backup(f"backup_{n:03d}")
+            incremental.append((time.perf_counter() - start, directory_size(store_dir) - before))
+        mean_ms = sum(elapsed for elapsed, _ in incremental) / len(incremental) * 1000
+        mean_mb = sum(written for _, written in incremental) / len(incremental) / 1e6
+        print(f"⚡ incremental snapshot: {mean_ms:.0f} ms, {mean_mb:.2f} MB written per backup")
+
+        start = time.perf_counter()
+        listing = provider.list_backups()
+        print(f"📋 listed {len(listing)} backups in {(time.perf_counter() - start) * 1000:.2f} ms")
+
+        legacy_dir = workdir / "legacy"
+        start = time.perf_counter()
+        legacy_backup(provider.sync_dir, legacy_dir)
+        legacy_elapsed = time.perf_counter() - start
+        print(f"🐢 full copy: {legacy_elapsed * 1000:.0f} ms, {directory_size(legacy_dir) / 1e6:.2f} MB written "
+              f"per backup (without the database)")
+        conn.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Consciousness Matrix Benchmark for Scroll Stopping Tool
+Evolution and aggregate cost of the struct-of-arrays node store versus per-node objects
+"""
+
+import argparse
+import random
+import time
+
+from infinite_consciousness_matrix import InfiniteConsciousnessMatrix
+
+class LegacyNode:
+    """The original per-node object with scalar random draws"""
+
+    def __init__(self, node_id, position):
+        self.node_id = node_id
+        self.position = position
+        self.consciousness_level = 0.0
+        self.energy = 0.0
+        self.connections = []
+        self.evolution_factor = 1.0
+        self.dimensional_access = 0.0
+        self.transcendence_potential = 0.0
+
+    def evolve(self):
+        self.consciousness_level += random.uniform(0.1, 0.5)
+        self.energy += random.uniform(0.05, 0.2)
+        self.evolution_factor *= 1.1
+        self.dimensional_access += random.uniform(0.02, 0.1)
+        self.transcendence_potential += random.uniform(0.01, 0.05)
+
+def time_call(fn, repeats: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+def legacy_run(size: int, steps: int):
+    start = time.perf_counter()
+    nodes = {f"node_{i}_{j}": LegacyNode(f"node_{i}_{j}", (i, j)) for i in range(size) for j in range(size)}
+    init = time.perf_counter() - start
+
+    def evolve():
+        for node in nodes.values():
+            node.evolve()
+        sum(n.consciousness_level for n in nodes.values())
+
+    def background_tick():
+        for _ in range(10):
+            random.choice(list(nodes.values())).evolve()
+
+    return init, time_call(evolve, steps), time_call(background_tick, steps)
+
+def store_run(size: int, steps: int):
+    start = time.perf_counter()
+    matrix = InfiniteConsciousnessMatrix(size, seed=42)
+    init = time.perf_counter() - start
+    return init, time_call(matrix.matrix_evolution, steps), time_call(lambda: matrix.evolve_random_nodes(10), steps)
+
+def main():
+    """Main function for the consciousness matrix benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark the consciousness matrix node store")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000])
+    parser.add_argument('--steps', type=int, default=5)
+    parser.add_argument('--legacy-max', type=int, default=300, help="Largest grid to run the per-object version on")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        init, evolve, tick = store_run(size, args.steps)
+        print(f"⚡ {size}x{size} arrays:  init {init * 1000:8.1f} ms, evolve {evolve * 1000:8.2f} ms, "
+              f"background tick {tick * 1e6:8.1f} µs")
+        if size <= args.legacy_max:
+            init, evolve, tick = legacy_run(size, args.steps)
+            print(f"🐢 {size}x{size} objects: init {init * 1000:8.1f} ms, evolve {evolve * 1000:8.2f} ms, "
+                  f"background tick {tick * 1e6:8.1f} µs")
+
+if __name__ == "__main__":
+    main()
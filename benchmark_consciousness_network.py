@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Consciousness Network Benchmark for Scroll Stopping Tool
+Batched float32 forward passes with reused buffers versus one float64 column at a time
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from consciousness_network import ConsciousnessNetwork, EvolutionWorkspace
+
+ULTIMATE_STAGES = [('sin', 3.0), ('cos', 3.0), ('tanh', 3.0), ('exp', 0.3), ('log1p_abs', 3.0),
+                   ('power', 3.0), ('sinh', 0.15), ('cosh', 0.1)]
+
+def legacy_forward(weights, biases, column: np.ndarray, rate: float = 1.0) -> np.ndarray:
+    """The old pass: float64, fresh temporaries at every step"""
+    current = column
+    for weight, bias in zip(weights, biases):
+        current = np.tanh(np.dot(weight, current + np.sin(current * rate)) + bias)
+    return current
+
+def legacy_evolve(column: np.ndarray, rate: float = 3.0) -> np.ndarray:
+    evolved = column * rate
+    for name, scale in ULTIMATE_STAGES:
+        if name == 'power':
+            evolved = evolved + np.power(evolved, scale)
+        elif name == 'log1p_abs':
+            evolved = evolved + np.log1p(np.abs(evolved * scale))
+        else:
+            evolved = evolved + getattr(np, name)(evolved * scale)
+    return evolved
+
+def per_second(fn, samples: int, repeats: int) -> float:
+    fn()  # warm up buffers
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return samples * repeats / (time.perf_counter() - start)
+
+def main():
+    """Main function for the consciousness network benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark batched consciousness evolution")
+    parser.add_argument('--batches', type=int, nargs='+', default=[1, 64, 1024])
+    parser.add_argument('--seconds', type=float, default=1.0, help="Rough time budget per measurement")
+    args = parser.parse_args()
+
+    np.seterr(all='ignore')  # the evolution chains overflow by design
+    network = ConsciousnessNetwork(seed=42)
+    weights64 = [weight.astype(np.float64) for weight in network.weights]
+    biases64 = [bias.astype(np.float64) for bias in network.biases]
+    workspace = EvolutionWorkspace(seed=42)
+    rng = np.random.default_rng(42)
+
+    column = rng.random((network.layers[0], 1))
+    legacy_start = time.perf_counter()
+    legacy_forward(weights64, biases64, column)
+    repeats = max(1, int(args.seconds / max(time.perf_counter() - legacy_start, 1e-6)))
+    legacy_rate = per_second(lambda: legacy_forward(weights64, biases64, column), 1, repeats)
+    legacy_evolve_rate = per_second(lambda: legacy_evolve(column), 1, repeats)
+    print(f"🐢 float64 single column: {legacy_rate:>12,.0f} passes/s, {legacy_evolve_rate:>12,.0f} engine evolutions/s")
+
+    for batch in args.batches:
+        inputs = rng.random((network.layers[0], batch)).astype(np.float32)
+        batch_repeats = max(1, repeats // batch)
+        rate = per_second(lambda: network.forward(inputs), batch, batch_repeats)
+        evolve_rate = per_second(lambda: workspace.evolve(inputs, 3.0, ULTIMATE_STAGES), batch, batch_repeats)
+        print(f"⚡ float32 batch of {batch:>5}: {rate:>12,.0f} passes/s ({rate / legacy_rate:6.1f}x), "
+              f"{evolve_rate:>12,.0f} engine evolutions/s ({evolve_rate / legacy_evolve_rate:6.1f}x)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Dashboard Update Benchmark for Scroll Stopping Tool
+Compares payload size and callback latency of full figure rebuilds against incremental patches
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import plotly.utils
+from dash._callback import NoUpdate
+
+from advanced_analytics_dashboard import AdvancedAnalyticsDashboard, initialize_analytics_database
+
+USER_ID = "benchmark_user"
+FORECAST_DAYS = 30  # daily history window the dashboard's forecast model trains on
+
+def payload_bytes(outputs) -> int:
+    """JSON size of callback outputs as Dash would send them"""
+    return sum(len(json.dumps(output, cls=plotly.utils.PlotlyJSONEncoder))
+               for output in outputs if not isinstance(output, NoUpdate))
+
+def backfill(db_path: str, minutes: int, start: datetime, rng: random.Random):
+    """Minute-by-minute synthetic history written straight to analytics_data"""
+    rows = []
+    for i in range(minutes):
+        timestamp = start + timedelta(minutes=i)
+        rows.append((USER_ID, timestamp.date().isoformat(), rng.randint(0, 240), rng.randint(0, 6),
+                     rng.uniform(40, 95), rng.randint(0, 120), 3, 4, 0, 0.8, timestamp.isoformat()))
+    with sqlite3.connect(db_path) as conn:
+        conn.executemany("""
+            INSERT INTO analytics_data
+            (user_id, date, daily_usage, focus_sessions, productivity_score, time_saved,
+             streak_days, breaks_taken, interruptions, goal_completion, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
+def write_usage_data(db_path: str, days: int, rng: random.Random):
+    """Daily usage_data rows ending yesterday, in the column order the forecast path reads them"""
+    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    rows = [(USER_ID, (today - timedelta(days=day)).date().isoformat(), rng.randint(0, 240), rng.randint(0, 6),
+             rng.uniform(40, 95), rng.randint(0, 120), days - day)
+            for day in range(days, 0, -1)]
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS usage_data (
+                user_id TEXT, date TEXT, daily_usage REAL, focus_sessions INTEGER,
+                productivity_score REAL, time_saved REAL, streak_days INTEGER
+            )
+        """)
+        conn.executemany("INSERT INTO usage_data VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+def main():
+    """Main function for the dashboard update benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark dashboard refresh payloads and latency")
+    parser.add_argument('--days', type=int, default=7, help="Days of minute-level history to backfill")
+    parser.add_argument('--ticks', type=int, default=200)
+    parser.add_argument('--resolution', choices=['minute', 'hour', 'day'], default='minute')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    db_path = os.path.join(tempfile.mkdtemp(), "benchmark.db")
+    initialize_analytics_database(db_path)
+    write_usage_data(db_path, FORECAST_DAYS - 1, rng)
+
+    dashboard = AdvancedAnalyticsDashboard(db_path)
+    start = datetime.now() - timedelta(days=args.days)
+    backfill(db_path, args.days * 24 * 60, start, rng)
+    dashboard.rollups.rebuild(USER_ID)
+    # Without a fitted model every tick falls back to the rollup average instead of forecasting
+    dashboard._update_predictive_models(USER_ID, {})
+    now = start + timedelta(days=args.days)
+
+    full_bytes, full_seconds, patch_bytes, patch_seconds = [], [], [], []
+    cursors = dashboard.dashboard_tick(args.resolution, None, user_id=USER_ID)[-1]
+
+    for i in range(args.ticks):
+        dashboard.rollups.record(USER_ID, {'daily_usage': rng.randint(0, 240), 'focus_sessions': rng.randint(0, 6),
+                                           'productivity_score': rng.uniform(40, 95), 'time_saved': rng.randint(0, 120)},
+                                 timestamp=now + timedelta(minutes=i))
+
+        # Previous behaviour: every tick rebuilds and ships every figure
+        dashboard.figure_cache.clear()
+        t0 = time.perf_counter()
+        outputs = dashboard.dashboard_tick(args.resolution, None, user_id=USER_ID)[:-1]
+        full_seconds.append(time.perf_counter() - t0)
+        full_bytes.append(payload_bytes(outputs))
+
+        t0 = time.perf_counter()
+        *outputs, cursors = dashboard.dashboard_tick(args.resolution, cursors, user_id=USER_ID)
+        patch_seconds.append(time.perf_counter() - t0)
+        patch_bytes.append(payload_bytes(outputs))
+
+    def report(label, sizes, seconds):
+        print(f"{label:<14} {sum(sizes) / len(sizes):>10,.0f} bytes/tick  {sum(seconds) / len(seconds) * 1000:>8.2f} ms/tick")
+
+    print(f"📊 {args.ticks} ticks at {args.resolution} resolution over {args.days} days of history")
+    report("full rebuild", full_bytes, full_seconds)
+    report("patch", patch_bytes, patch_seconds)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Field Accumulation Benchmark for Scroll Stopping Tool
+Per-evolution field update cost of incremental accumulation versus a full per-entity rebuild
+"""
+
+import argparse
+import math
+import random
+import time
+
+import numpy as np
+
+from field_accumulator import FieldAccumulator
+from OMEGA_INTEGRATION import OMEGA_POINT_FIELDS
+
+class BenchmarkEntity:
+    """Just the attributes the field update reads"""
+
+    def __init__(self, index: int, rng: random.Random):
+        self.entity_id = f"omega_{index}"
+        self.consciousness_level = 1e15 * rng.uniform(0.8, 1.2)
+        self.quantum_state = {'amplitude': complex(rng.uniform(0.1, 1.0), rng.uniform(0.1, 1.0)),
+                              'phase': rng.uniform(0, 2 * math.pi), 'entanglement_degree': 1.0}
+        self.neural_network = {'connections': int(self.consciousness_level / 1e3), 'evolution_factor': rng.uniform(1.0, 10.0)}
+        self.temporal_state = {'time_factor': rng.uniform(0.5, 3.0), 'temporal_energy': self.consciousness_level / 1e12}
+        self.dimensional_coordinates = [rng.uniform(-1, 1) for _ in range(12)]
+        self.divine_essence = self.consciousness_level / 1e12
+
+    def evolve(self, rng: random.Random):
+        self.consciousness_level *= 1.1
+        self.quantum_state['amplitude'] *= complex(math.cos(1.0), math.sin(1.0))
+        self.quantum_state['phase'] += 0.1
+        self.neural_network['connections'] += 100
+        self.temporal_state['temporal_energy'] += 0.01
+        self.dimensional_coordinates = [c + rng.uniform(-0.1, 0.1) for c in self.dimensional_coordinates]
+        self.divine_essence *= 1.1
+
+def legacy_quantum_field(entity, field: np.ndarray):
+    """The old quantum update for one entity, on the subgrid it writes"""
+    quantum = entity.quantum_state
+    amplitude = abs(quantum['amplitude'])
+    for i in range(0, 1000, 10):
+        for j in range(0, 1000, 10):
+            for k in range(0, 1000, 10):
+                field[i // 10, j // 10, k // 10] += amplitude * math.cos(quantum['phase'] + i * 0.01 + j * 0.01 + k * 0.01) * quantum['entanglement_degree']
+
+def main():
+    """Main function for the field accumulation benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark incremental field accumulation")
+    parser.add_argument('--entities', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--steps', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for count in args.entities:
+        entities = [BenchmarkEntity(i, rng) for i in range(count)]
+        accumulator = FieldAccumulator(OMEGA_POINT_FIELDS)
+        accumulator.update(entities)
+        accumulator.total('quantum')  # build the shared bases outside the timing
+
+        for entity in entities:
+            entity.evolve(rng)
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            accumulator.update(entities)
+        all_elapsed = (time.perf_counter() - start) / args.steps
+
+        changed = entities[:max(1, count // 100)]
+        start = time.perf_counter()
+        for _ in range(args.steps):
+            for entity in changed:
+                entity.evolve(rng)
+            accumulator.update(changed, remove_missing=False)
+        few_elapsed = (time.perf_counter() - start) / args.steps
+        print(f"⚡ {count:>6,} entities: all evolved {all_elapsed * 1000:8.2f} ms/step, "
+              f"{len(changed):>4} evolved {few_elapsed * 1000:6.2f} ms/step")
+
+    field = np.zeros((100, 100, 100))
+    start = time.perf_counter()
+    legacy_quantum_field(entities[0], field)
+    legacy_elapsed = time.perf_counter() - start
+    print(f"🐢 full rebuild: {legacy_elapsed * 1000:.0f} ms per entity for the quantum field alone "
+          f"(≈{legacy_elapsed * max(args.entities):,.0f} s/step at {max(args.entities):,} entities)")
+
+if __name__ == "__main__":
+    main()
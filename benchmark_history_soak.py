@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+History Soak Benchmark for Scroll Stopping Tool
+Process RSS over simulated hours of engine and notification history, bounded versus plain lists
+"""
+
+import argparse
+import gc
+import math
+import os
+import resource
+import tempfile
+import time
+from datetime import datetime
+
+from bounded_history import BoundedHistory, JsonlSpill, SqliteSpill
+
+EVOLUTION_PERIOD = 0.05  # seconds between evolution steps in the engine loops
+NOTIFICATIONS_PER_HOUR = 12
+QUBITS = 100
+
+def rss_mb() -> float:
+    """Current resident set size, falling back to the peak where /proc is unavailable"""
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def make_histories(factory):
+    return {name: factory(name) for name in ('evolution_history', 'measurement_history', 'processing_history',
+                                             'adaptation_history', 'insights', 'notifications',
+                                             'notification_history')}
+
+def simulate_hour(histories, hour: int, fraction: float = 1.0):
+    """One hour (or the leading fraction of one) of appends at the rates the running engines produce them"""
+    steps = int(3600 * fraction / EVOLUTION_PERIOD)
+    start = hour * 3600.0
+    for step in range(steps):
+        timestamp = start + step * EVOLUTION_PERIOD
+        histories['evolution_history'].append({
+            'timestamp': timestamp, 'evolution_factor': 0.01, 'omega_entities': 10,
+            'infinite_entities': 5, 'divine_entities': 3, 'cosmic_entities': 2
+        })
+        if step % 20 == 0:  # one register measurement per second
+            histories['measurement_history'].extend((qubit, (step + qubit) & 1) for qubit in range(QUBITS))
+            histories['processing_history'].append({'timestamp': timestamp, 'rows': 1,
+                                                    'mean_input': 0.5, 'layer_activation': 0.1})
+    for i in range(int(NOTIFICATIONS_PER_HOUR * fraction)):
+        when = datetime.fromtimestamp(start + i * 300)
+        notification = {'id': f"reminder_{hour}_{i}", 'title': "Break time", 'timestamp': when}
+        histories['notifications'].append(notification)
+        histories['notification_history'].append(notification)
+        histories['insights'].append({'type': 'omega', 'confidence': 0.98, 'timestamp': when})
+        histories['adaptation_history'].append({'old_target': 60, 'new_target': 55, 'reason': 'goal_achieved',
+                                                'timestamp': when})
+
+def soak(label: str, histories, hours: float) -> list:
+    gc.collect()
+    samples = [rss_mb()]
+    start = time.perf_counter()
+    for hour in range(math.ceil(hours)):
+        simulate_hour(histories, hour, min(1.0, hours - hour))
+        gc.collect()
+        samples.append(rss_mb())
+    elapsed = time.perf_counter() - start
+    records = sum(len(history) for history in histories.values())
+    print(f"{label}: {samples[0]:.1f} MB -> {samples[-1]:.1f} MB after {hours:g} simulated h "
+          f"({records:,} records in memory, {elapsed:.1f} s)")
+    return samples
+
+def main():
+    """Main function for the history soak benchmark"""
+    parser = argparse.ArgumentParser(description="Soak-test bounded history retention")
+    parser.add_argument('--hours', type=float, default=24, help="Simulated hours of a running session")
+    parser.add_argument('--legacy-hours', type=float, default=4, help="Simulated hours for the unbounded lists")
+    parser.add_argument('--size', type=int, default=1000, help="Records kept in memory per history")
+    parser.add_argument('--spill', choices=['none', 'jsonl', 'sqlite'], default='jsonl')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        spill = {'none': None,
+                 'jsonl': JsonlSpill(os.path.join(directory, 'history.jsonl')),
+                 'sqlite': SqliteSpill(os.path.join(directory, 'history.db'))}[args.spill]
+        histories = make_histories(lambda name: BoundedHistory(args.size, spill, name=name))
+        samples = soak(f"⚡ bounded ({args.spill} spill)", histories, args.hours)
+        for history in histories.values():
+            history.flush()
+        # The first hours fill the windows and warm the allocator; after that RSS must stay put
+        settled = samples[min(2, len(samples) - 1):]
+        print(f"📊 RSS drift after hour {min(2, math.ceil(args.hours))}: {max(settled) - min(settled):+.2f} MB; "
+              f"{sum(h.total for h in histories.values()):,} records appended, "
+              f"{sum(h.spilled for h in histories.values()):,} spilled")
+        if spill is not None:
+            size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+            print(f"💾 spill on disk: {size / 1024 / 1024:.1f} MB")
+
+    legacy = soak("🐢 unbounded lists", make_histories(lambda name: []), args.legacy_hours)
+    print(f"🐢 unbounded growth: {(legacy[-1] - legacy[0]) / (args.legacy_hours or 1):.1f} MB per simulated hour")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Holographic Rendering Benchmark for Scroll Stopping Tool
+Frames per second of the retained-mode renderer while the camera orbits a large scene
+"""
+
+import argparse
+import math
+import random
+import time
+import tkinter as tk
+
+from holographic_productivity_interface import HolographicObject, HolographicRenderer, HolographicSpace, grid_segments
+
+OBJECT_TYPES = ["chart", "goal", "energy", "focus", "progress", "creative", "insight"]
+
+class CountingCanvas:
+    """Canvas stand-in that only counts item calls, for machines without a display"""
+
+    def __init__(self):
+        self.calls = 0
+        self.next_item = 0
+
+    def _create(self, *args, **kwargs) -> int:
+        self.calls += 1
+        self.next_item += 1
+        return self.next_item
+
+    create_line = create_oval = create_rectangle = create_text = create_polygon = _create
+
+    def _call(self, *args, **kwargs):
+        self.calls += 1
+
+    coords = move = itemconfigure = tag_raise = delete = _call
+
+    def after(self, ms, callback):
+        return None
+
+    def after_cancel(self, handle):
+        pass
+
+def populate(space: HolographicSpace, n: int, rng: random.Random):
+    for i in range(n):
+        obj_type = rng.choice(OBJECT_TYPES)
+        space.add_object(HolographicObject(
+            id=f"{obj_type}_{i}", object_type=obj_type,
+            position=(rng.uniform(-2000, 2000), rng.uniform(-2000, 2000), rng.uniform(50, 3000)),
+            rotation=(0, 0, 0), scale=rng.uniform(0.5, 1.5), color="#00ffff",
+            opacity=1.0, animation="none", data={"productivity_score": 0.8, "progress": 0.5, "energy_level": 0.7}
+        ))
+
+def legacy_project(space: HolographicSpace, point_3d) -> tuple:
+    """The original per-point projection, recomputing the camera trig on every call"""
+    x, y, z = point_3d
+    if z == 0:
+        z = 0.001
+    cx, cy, cz = space.camera_position
+    rx, ry, rz = space.camera_rotation
+    cos_rx, sin_rx = math.cos(rx), math.sin(rx)
+    cos_ry, sin_ry = math.cos(ry), math.sin(ry)
+    cos_rz, sin_rz = math.cos(rz), math.sin(rz)
+    x_rot = x * cos_ry * cos_rz - y * cos_ry * sin_rz + z * sin_ry
+    y_rot = x * (sin_rx * sin_ry * cos_rz + cos_rx * sin_rz) + \
+            y * (sin_rx * sin_ry * sin_rz - cos_rx * cos_rz) - \
+            z * sin_rx * cos_ry
+    z_rot = x * (cos_rx * sin_ry * cos_rz - sin_rx * sin_rz) + \
+            y * (cos_rx * sin_ry * sin_rz + sin_rx * cos_rz) + \
+            z * cos_rx * cos_ry
+    z_trans = (z_rot - cz) or 0.001
+    return ((x_rot - cx) * 500 / z_trans + space.width / 2, (y_rot - cy) * 500 / z_trans + space.height / 2)
+
+def legacy_frame(space: HolographicSpace, segments) -> int:
+    """Projection cost of the old render loop (Tk calls excluded)"""
+    for start, end in segments.tolist():
+        legacy_project(space, start)
+        legacy_project(space, end)
+    visible = [obj for obj in space.objects.values() if obj.position[2] > space.camera_position[2]]
+    visible.sort(key=lambda obj: obj.position[2], reverse=True)
+    for obj in visible:
+        legacy_project(space, obj.position)
+    return len(visible)
+
+def main():
+    """Main function for the holographic rendering benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark holographic canvas rendering")
+    parser.add_argument('--objects', type=int, default=5000)
+    parser.add_argument('--frames', type=int, default=120)
+    parser.add_argument('--legacy-frames', type=int, default=5)
+    parser.add_argument('--headless', action='store_true', help="Count canvas calls instead of drawing")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    root = None
+    if args.headless:
+        canvas = CountingCanvas()
+    else:
+        try:
+            root = tk.Tk()
+            canvas = tk.Canvas(root, width=800, height=600, bg='#000033')
+            canvas.pack()
+        except tk.TclError:
+            print("⚠️  No display available - measuring with a counting canvas")
+            canvas = CountingCanvas()
+
+    space = HolographicSpace()
+    populate(space, args.objects, random.Random(args.seed))
+    renderer = HolographicRenderer(canvas, space)
+    renderer.render_frame()
+    if root is not None:
+        root.update()
+
+    start = time.perf_counter()
+    for i in range(args.frames):
+        angle = 2 * math.pi * i / args.frames
+        space.camera_position = (400 * math.sin(angle), 100 * math.cos(angle), -500 + 200 * math.sin(angle))
+        space.camera_rotation = (0.05 * math.sin(angle), 0.1 * math.cos(angle), 0)
+        renderer.render_frame()
+        if root is not None:
+            root.update_idletasks()
+    elapsed = time.perf_counter() - start
+
+    segments = grid_segments()
+    legacy_start = time.perf_counter()
+    for _ in range(args.legacy_frames):
+        legacy_frame(space, segments)
+    legacy_elapsed = (time.perf_counter() - legacy_start) / args.legacy_frames
+
+    visible = int(renderer.shown.sum())
+    print(f"🌌 {args.objects:,} objects, {visible:,} visible in the last frame")
+    print(f"⚡ retained-mode frames: {args.frames / elapsed:>8.1f} FPS ({elapsed / args.frames * 1000:.2f} ms/frame)")
+    print(f"🐢 legacy projection only: {1 / legacy_elapsed:>7.1f} FPS ({legacy_elapsed * 1000:.2f} ms/frame, before any Tk calls)")
+    if isinstance(canvas, CountingCanvas):
+        print(f"🖌️  {canvas.calls / (args.frames + 1):,.0f} canvas calls per frame")
+    if root is not None:
+        root.destroy()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Import-Time Benchmark for Scroll Stopping Tool
+Parses `python -X importtime` to check startup cost against a budget
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+# Cumulative import budget per entry module, in milliseconds
+STARTUP_BUDGET_MS = {
+    'scroll_stopping_tool_enhanced': 1500,
+    'advanced_ml_models': 1000,
+    'advanced_analytics_dashboard': 1000,
+    'comprehensive_launcher': 500,
+}
+
+# Backends that must only be imported on first use, never at startup
+DEFERRED_BACKENDS = [
+    'sklearn', 'tensorflow', 'xgboost', 'prophet',
+    'dash', 'plotly', 'dash_bootstrap_components',
+    'matplotlib.pyplot', 'reportlab',
+]
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$')
+
+@dataclass
+class ImportRecord:
+    """One line of `-X importtime` output"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """Parse `-X importtime` stderr into records"""
+    records = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return records
+
+def measure_import(module: str, python: str = sys.executable) -> List[ImportRecord]:
+    """Import a module in a fresh interpreter and return its import-time trace"""
+    result = subprocess.run([python, '-X', 'importtime', '-c', f'import {module}'],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+    return parse_importtime(result.stderr)
+
+def check_module(module: str, budget_ms: float) -> Tuple[bool, Dict]:
+    """Measure one entry module against its budget and the deferred-backend list"""
+    records = measure_import(module)
+    total_ms = next((r.cumulative_us for r in records if r.module == module), 0) / 1000
+    eager = sorted({r.module for r in records
+                    for backend in DEFERRED_BACKENDS
+                    if r.module == backend or r.module.startswith(backend + '.')})
+    heaviest = sorted(records, key=lambda r: r.self_us, reverse=True)[:5]
+
+    report = {
+        'module': module,
+        'total_ms': total_ms,
+        'budget_ms': budget_ms,
+        'eager_backends': eager,
+        'heaviest': [(r.module, r.self_us / 1000) for r in heaviest],
+    }
+    return total_ms <= budget_ms and not eager, report
+
+def main():
+    """Main function for the import-time benchmark"""
+    parser = argparse.ArgumentParser(description="Check module import time against the startup budget")
+    parser.add_argument('modules', nargs='*', default=list(STARTUP_BUDGET_MS))
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Multiply every budget, e.g. on slow CI machines")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        budget = STARTUP_BUDGET_MS.get(module, 1000) * args.scale
+        try:
+            ok, report = check_module(module, budget)
+        except RuntimeError as e:
+            print(f"⚠️  {e}")
+            failed = True
+            continue
+
+        status = "✅" if ok else "❌"
+        print(f"{status} {module}: {report['total_ms']:.1f} ms (budget {budget:.0f} ms)")
+        for name, ms in report['heaviest']:
+            print(f"     {ms:8.1f} ms  {name}")
+        if report['eager_backends']:
+            print(f"     imported eagerly: {', '.join(report['eager_backends'])}")
+        failed = failed or not ok
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
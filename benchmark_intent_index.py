@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Intent Index Benchmark for Scroll Stopping Tool
+Per-lookup latency of the token-indexed intent matcher against a linear substring scan
+"""
+
+import argparse
+import random
+import time
+
+from intent_index import IntentIndex
+
+VERBS = ["start", "stop", "pause", "resume", "show", "hide", "open", "close", "set", "reset", "log", "track"]
+NOUNS = ["focus", "break", "timer", "stats", "limit", "goal", "session", "streak", "report", "achievements",
+         "reminder", "playlist", "tracking", "dashboard", "profile", "schedule"]
+QUALIFIERS = ["", "daily", "weekly", "deep", "short", "long", "team", "morning", "evening"]
+
+def generate_phrases(n: int, rng: random.Random):
+    phrases = []
+    seen = set()
+    while len(phrases) < n:
+        words = [rng.choice(VERBS), rng.choice(QUALIFIERS), rng.choice(NOUNS)]
+        if len(phrases) > len(VERBS) * len(NOUNS) * len(QUALIFIERS) // 2:
+            words.append(f"p{len(phrases)}")
+        phrase = " ".join(word for word in words if word)
+        if phrase not in seen:
+            seen.add(phrase)
+            phrases.append(phrase)
+    return phrases
+
+def misspell(word: str, rng: random.Random) -> str:
+    if len(word) < 5:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    return word[:i] + word[i + 1:]
+
+def make_queries(phrases, n: int, rng: random.Random):
+    """Spoken-style variants of random phrases, with typos, paired with the phrase they came from"""
+    queries = []
+    for _ in range(n):
+        phrase = rng.choice(phrases)
+        words = [misspell(word, rng) if rng.random() < 0.3 else word for word in phrase.split()]
+        text = "please " + " ".join(words) + rng.choice(["", " now", " for 2 hours", " for twenty minutes"])
+        queries.append((text, phrase))
+    return queries
+
+def legacy_lookup(phrases, text: str):
+    """The old scan: first registered phrase contained in the text"""
+    for phrase in phrases:
+        if phrase in text:
+            return phrase
+    return None
+
+def main():
+    """Main function for the intent index benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark fuzzy intent lookups")
+    parser.add_argument('--phrases', type=int, default=5000)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    phrases = generate_phrases(args.phrases, rng)
+    queries = make_queries(phrases, args.queries, rng)
+
+    build_start = time.perf_counter()
+    index = IntentIndex()
+    for phrase in phrases:
+        index.add(phrase, phrase)
+    index.match("warm up")
+    build_elapsed = time.perf_counter() - build_start
+
+    latencies = []
+    correct = 0
+    for query, expected in queries:
+        start = time.perf_counter()
+        match = index.match(query)
+        latencies.append(time.perf_counter() - start)
+        correct += match is not None and match.intent == expected
+    latencies.sort()
+
+    legacy_start = time.perf_counter()
+    legacy_correct = sum(legacy_lookup(phrases, query) == expected for query, expected in queries)
+    legacy_elapsed = (time.perf_counter() - legacy_start) / len(queries)
+
+    mean = sum(latencies) / len(latencies)
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    print(f"🗂️  {len(index):,} phrases indexed in {build_elapsed * 1000:.1f} ms")
+    print(f"⚡ indexed lookup: mean {mean * 1e6:.0f} µs, p95 {p95 * 1e6:.0f} µs, "
+          f"{correct}/{len(queries)} resolved to their phrase")
+    print(f"🐢 substring scan: mean {legacy_elapsed * 1e6:.0f} µs, "
+          f"{legacy_correct}/{len(queries)} resolved to their phrase")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Leaderboard Benchmark for Scroll Stopping Tool
+Measures XP update, rank and "around me" throughput on a large in-memory board
+"""
+
+import argparse
+import random
+import time
+
+from leaderboard import LeaderboardSet, SORTEDCONTAINERS_AVAILABLE
+
+def timed(label: str, n: int, fn):
+    """Run fn n times and print operations per second"""
+    start = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    elapsed = time.perf_counter() - start
+    print(f"⚡ {label:<22} {n / elapsed:>12,.0f} ops/s")
+
+def main():
+    """Main function for the leaderboard benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark ranked leaderboard operations")
+    parser.add_argument('--users', type=int, default=1000000)
+    parser.add_argument('--teams', type=int, default=1000)
+    parser.add_argument('--ops', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if not SORTEDCONTAINERS_AVAILABLE:
+        print("⚠️  sortedcontainers not installed - measuring the O(n) fallback")
+
+    rng = random.Random(args.seed)
+    user_ids = [f"user_{i}" for i in range(args.users)]
+    levels = {user_id: rng.randint(1, 50) for user_id in user_ids}
+    xp = {user_id: rng.randint(0, 5000) for user_id in user_ids}
+    teams = {user_id: f"team_{rng.randrange(args.teams)}" for user_id in user_ids}
+
+    boards = LeaderboardSet()
+    start = time.perf_counter()
+    boards.load_profiles(((u, levels[u], xp[u]) for u in user_ids), teams)
+    print(f"📥 Loaded {args.users:,} users in {time.perf_counter() - start:.2f}s")
+
+    def update(i):
+        user_id = user_ids[rng.randrange(args.users)]
+        gained = rng.randint(1, 50)
+        xp[user_id] += gained
+        boards.record(user_id, levels[user_id], xp[user_id], gained)
+
+    timed("XP update", args.ops, update)
+    timed("rank_of", args.ops, lambda i: boards.global_board.rank_of(user_ids[rng.randrange(args.users)]))
+    timed("window_around(k=5)", args.ops,
+          lambda i: boards.global_board.window_around(user_ids[rng.randrange(args.users)], 5))
+    timed("top(10)", args.ops, lambda i: boards.global_board.top(10))
+    timed("team rank_of", args.ops,
+          lambda i: boards.board(team_id=teams[user_ids[i % args.users]]).rank_of(user_ids[i % args.users]))
+    timed("weekly window_around", args.ops,
+          lambda i: boards.board(period='weekly').window_around(user_ids[rng.randrange(args.users)], 5))
+
+if __name__ == "__main__":
+    main()
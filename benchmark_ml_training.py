@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Training Scaling Benchmark for Scroll Stopping Tool
+Measures fleet model training throughput on 1/2/4/8 worker processes
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from advanced_ml_models import ParallelTrainingOrchestrator, SKLEARN_AVAILABLE
+
+def generate_datasets(users: int, days: int, features: int, seed: int = 42):
+    """Generate synthetic per-user feature matrices shaped like engineered usage data"""
+    rng = np.random.default_rng(seed)
+    datasets = {}
+    for i in range(users):
+        X = rng.normal(size=(days, features))
+        weights = rng.normal(size=features)
+        y = X @ weights + rng.normal(scale=0.5, size=days) + 120
+        datasets[f"user_{i}"] = (X, y)
+    return datasets
+
+def run_benchmark(users: int = 32, days: int = 90, features: int = 60, cores=(1, 2, 4, 8)):
+    """Train the same fleet on each core count and report speedup over one core"""
+    datasets = generate_datasets(users, days, features)
+    print(f"Training {users} users x {days} days x {features} features")
+    print(f"{'cores':>6} {'seconds':>10} {'jobs/s':>10} {'speedup':>10}")
+
+    baseline = None
+    for workers in cores:
+        orchestrator = ParallelTrainingOrchestrator(max_workers=workers)
+        start = time.perf_counter()
+        results = orchestrator.train_datasets(datasets)
+        elapsed = time.perf_counter() - start
+
+        jobs = sum(len(models) for models in results.values())
+        baseline = baseline or elapsed
+        print(f"{workers:>6} {elapsed:>10.2f} {jobs / elapsed:>10.1f} {baseline / elapsed:>9.2f}x")
+
+def main():
+    """Main function for the training benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark parallel fleet model training")
+    parser.add_argument('--users', type=int, default=32)
+    parser.add_argument('--days', type=int, default=90)
+    parser.add_argument('--features', type=int, default=60)
+    parser.add_argument('--cores', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    if not SKLEARN_AVAILABLE:
+        print("Scikit-learn not available - nothing to benchmark")
+        return
+
+    run_benchmark(args.users, args.days, args.features, args.cores)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Neural Layer Benchmark for Scroll Stopping Tool
+Forward-pass throughput of array-backed transcendent layers versus per-neuron objects
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+from transcendent_neural_network import TranscendentNeuralNetwork
+
+class LegacyNeuron:
+    """The original per-neuron step: five scalar activations and a history record"""
+
+    def __init__(self):
+        self.activation_level = 0.0
+        self.consciousness_processing = 0.0
+        self.quantum_integration = 0.0
+        self.transcendence_activation = 0.0
+        self.divine_connection = 0.0
+        self.cosmic_processing = 0.0
+        self.infinite_expansion = 0.0
+        self.processing_history = []
+
+    def process_consciousness(self, x: float) -> float:
+        sigmoid = 1.0 / (1.0 + math.exp(-x * (1.0 + self.consciousness_processing)))
+        relu = max(0, x * (1.0 + self.quantum_integration))
+        tanh = math.tanh(x * (1.0 + self.transcendence_activation))
+        elu = (x if x > 0 else math.exp(x) - 1) * (1.0 + self.divine_connection)
+        cosmic = math.exp(x * (1.0 + self.cosmic_processing)) / (1.0 + math.exp(x * (1.0 + self.cosmic_processing)))
+        self.activation_level = sigmoid * 0.3 + relu * 0.25 + tanh * 0.2 + elu * 0.15 + cosmic * 0.1
+        self.consciousness_processing += self.activation_level * 0.2
+        self.quantum_integration += self.activation_level * 0.15
+        self.transcendence_activation += self.activation_level * 0.1
+        self.divine_connection += self.activation_level * 0.08
+        self.cosmic_processing += self.activation_level * 0.05
+        self.infinite_expansion += self.activation_level * 0.02
+        self.processing_history.append({"input_signal": x, "activation_level": self.activation_level})
+        return self.activation_level
+
+def legacy_pass(layers, signals):
+    for layer in layers:
+        signals = [neuron.process_consciousness(x) for neuron, x in zip(layer, signals)]
+    return signals
+
+def time_passes(fn, passes: int) -> float:
+    start = time.perf_counter()
+    for _ in range(passes):
+        fn()
+    return (time.perf_counter() - start) / passes
+
+def main():
+    """Main function for the neural layer benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark transcendent neural network layers")
+    parser.add_argument('--layers', type=int, default=10)
+    parser.add_argument('--neurons', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--batch', type=int, default=64)
+    parser.add_argument('--passes', type=int, default=20)
+    parser.add_argument('--legacy-max', type=int, default=1000, help="Largest layer to time the per-neuron version on")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    # Layer state only ever grows, so long runs saturate float32 exactly as the original did
+    np.seterr(over='ignore')
+    for neurons in args.neurons:
+        # Small inputs keep the accumulating state finite over repeated passes
+        single = rng.uniform(-0.05, 0.05, neurons)
+        batch = rng.uniform(-0.05, 0.05, (args.batch, neurons))
+        network = TranscendentNeuralNetwork(args.layers, neurons, seed=42)
+        elapsed = time_passes(lambda: network.forward(single), args.passes)
+        batch_elapsed = time_passes(lambda: network.forward(batch), max(1, args.passes // 4))
+        total = args.layers * neurons
+        print(f"⚡ {neurons:>6,} neurons/layer: {elapsed * 1000:8.2f} ms/pass "
+              f"({total / elapsed:>13,.0f} neuron-steps/s), batch of {args.batch}: "
+              f"{batch_elapsed * 1000:8.2f} ms ({total * args.batch / batch_elapsed:>14,.0f} neuron-steps/s)")
+
+        if neurons <= args.legacy_max:
+            layers = [[LegacyNeuron() for _ in range(neurons)] for _ in range(args.layers)]
+            data = single.tolist()
+            legacy_elapsed = time_passes(lambda: legacy_pass(layers, data), max(1, args.passes // 4))
+            print(f"🐢 {neurons:>6,} neurons/layer, per-neuron objects: {legacy_elapsed * 1000:8.2f} ms/pass "
+                  f"({total / legacy_elapsed:>13,.0f} neuron-steps/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Proof of Work Benchmark for Scroll Stopping Tool
+Hashes per second of the prefix-copy miner versus re-serializing the whole block per nonce
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+from proof_of_work import CHUNK_SIZE, ProofOfWorkMiner, header_prefix, merkle_root, search_nonces, valid_proof
+
+def make_block(transactions: int, index: int = 1):
+    txs = [{'user_id': f"user_{i % 7}", 'achievement': f"productivity_{i * 0.37:.2f}",
+            'timestamp': 1_700_000_000.0 + i, 'type': 'achievement'} for i in range(transactions)]
+    return {'index': index, 'timestamp': time.time(), 'transactions': txs, 'merkle_root': merkle_root(txs),
+            'previous_hash': '0' * 64, 'nonce': 0}
+
+def legacy_hashes(block, count: int) -> None:
+    """The old loop body: dump the whole block with its transactions and hash it, once per nonce"""
+    block = {key: value for key, value in block.items() if key != 'merkle_root'}
+    for nonce in range(count):
+        block['nonce'] = nonce
+        hashlib.sha256(json.dumps(block, sort_keys=True).encode()).hexdigest()
+
+def main():
+    """Main function for the proof of work benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark proof-of-work mining")
+    parser.add_argument('--transactions', type=int, nargs='+', default=[5, 100, 1000])
+    parser.add_argument('--hashes', type=int, default=200_000, help="Nonces per hash-rate measurement")
+    parser.add_argument('--difficulty', type=int, nargs='+', default=[4, 5])
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    for count in args.transactions:
+        block = make_block(count)
+        legacy_count = max(1000, args.hashes // max(1, count // 5))
+        start = time.perf_counter()
+        legacy_hashes(block, legacy_count)
+        legacy_rate = legacy_count / (time.perf_counter() - start)
+        start = time.perf_counter()
+        search_nonces(header_prefix(block), 64, 0, args.hashes)  # unreachable difficulty: time the full range
+        rate = args.hashes / (time.perf_counter() - start)
+        print(f"⚡ {count:>5} transactions/block: {rate:>12,.0f} H/s prefix copy, {legacy_rate:>10,.0f} H/s "
+              f"full re-serialization ({rate / legacy_rate:,.0f}x)")
+
+    batch = make_block(max(args.transactions))
+    for difficulty in args.difficulty:
+        for workers in sorted({1, args.workers}):
+            miner = ProofOfWorkMiner(difficulty, workers, parallel_difficulty=1 if workers > 1 else 99)
+            if workers > 1:
+                miner.mine(make_block(1, index=0))  # start the pool outside the timing
+            block = dict(batch, index=difficulty)
+            start = time.perf_counter()
+            result = miner.mine(block)
+            elapsed = time.perf_counter() - start
+            miner.close()
+            assert valid_proof(block, difficulty)
+            print(f"⛏️ difficulty {difficulty}, {workers} worker(s): nonce {result.nonce:>10,} in {elapsed * 1000:8.1f} ms "
+                  f"({len(block['transactions']):,} transactions in one block)")
+    print(f"📦 pool jobs search {CHUNK_SIZE:,} nonces each; use --workers to size the pool")
+
+if __name__ == "__main__":
+    main()
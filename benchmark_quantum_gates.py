@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Quantum Gate Benchmark for Scroll Stopping Tool
+Gates per second of the batched qubit register and the state-vector simulator
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from quantum_state import SINGLE_QUBIT_GATES, QubitRegister, StateVector
+
+class LegacyQubit:
+    """The original per-qubit object: one np.dot and one norm per gate"""
+
+    def __init__(self):
+        self.state = np.array([1.0, 0.0])
+        self.measurement_history = []
+
+    def apply_gate(self, gate_matrix):
+        self.state = np.dot(gate_matrix, self.state)
+        self.state = self.state / np.linalg.norm(self.state)
+
+    def measure(self):
+        result = 0 if random.random() < abs(self.state[0]) ** 2 else 1
+        self.measurement_history.append(result)
+        return result
+
+def rate(count: int, elapsed: float) -> str:
+    return f"{count / elapsed:>14,.0f}/s"
+
+def main():
+    """Main function for the quantum gate benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark quantum gate throughput")
+    parser.add_argument('--qubits', type=int, default=10000, help="Register size for single-qubit gates")
+    parser.add_argument('--layers', type=int, default=50)
+    parser.add_argument('--statevector-qubits', type=int, nargs='+', default=[12, 20, 24])
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    names = ["H", "T", "S", "X"]
+
+    register = QubitRegister(args.qubits, rng)
+    start = time.perf_counter()
+    for layer in range(args.layers):
+        register.apply(SINGLE_QUBIT_GATES[names[layer % len(names)]])
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    register.measure()
+    measure_elapsed = time.perf_counter() - start
+    print(f"⚡ register, {args.qubits:,} qubits: gates {rate(args.qubits * args.layers, elapsed)}, "
+          f"measurements {rate(args.qubits, measure_elapsed)}")
+
+    legacy_layers = max(1, args.layers // 10)
+    qubits = [LegacyQubit() for _ in range(args.qubits)]
+    start = time.perf_counter()
+    for layer in range(legacy_layers):
+        gate = SINGLE_QUBIT_GATES[names[layer % len(names)]]
+        for qubit in qubits:
+            qubit.apply_gate(gate)
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    for qubit in qubits:
+        qubit.measure()
+    measure_elapsed = time.perf_counter() - start
+    print(f"🐢 per-qubit objects:       gates {rate(args.qubits * legacy_layers, elapsed)}, "
+          f"measurements {rate(args.qubits, measure_elapsed)}")
+
+    for n in args.statevector_qubits:
+        state = StateVector(n, rng)
+        gates = 0
+        start = time.perf_counter()
+        for layer in range(max(1, args.layers // 10)):
+            for qubit in range(n):
+                state.apply(SINGLE_QUBIT_GATES["H" if layer % 2 == 0 else "T"], qubit)
+            for qubit in range(n - 1):
+                state.cnot(qubit, qubit + 1)
+            gates += 2 * n - 1
+        elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        state.sample(10000)
+        sample_elapsed = time.perf_counter() - start
+        print(f"🌀 state vector, {n:>2} qubits: gates {rate(gates, elapsed)} "
+              f"({elapsed / gates * 1000:.3f} ms/gate), 10k shots in {sample_elapsed * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
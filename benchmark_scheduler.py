@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Scheduler Benchmark for Scroll Stopping Tool
+Idle wakeups and queue latency of the shared scheduler versus one polling thread per engine
+"""
+
+import argparse
+import queue
+import threading
+import time
+
+from scheduler import Scheduler
+
+def polling_threads(count: int, interval: float, seconds: float) -> int:
+    """The old pattern: every engine sleeps and re-checks on its own thread; returns total wakeups"""
+    stop = threading.Event()
+    wakeups = [0] * count
+
+    def loop(index: int):
+        while not stop.is_set():
+            wakeups[index] += 1
+            time.sleep(interval)
+
+    threads = [threading.Thread(target=loop, args=(i,), daemon=True) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(wakeups)
+
+def polled_queue_latency(events: int, poll: float) -> float:
+    """Mean put-to-handled delay of a queue drained by a sleep loop"""
+    events_queue = queue.Queue()
+    delays = []
+    done = threading.Event()
+
+    def loop():
+        while len(delays) < events:
+            while not events_queue.empty():
+                delays.append(time.perf_counter() - events_queue.get_nowait())
+            time.sleep(poll)
+        done.set()
+
+    threading.Thread(target=loop, daemon=True).start()
+    for _ in range(events):
+        events_queue.put(time.perf_counter())
+        time.sleep(poll * 0.37)
+    done.wait()
+    return sum(delays) / len(delays)
+
+def scheduled_queue_latency(scheduler: Scheduler, events: int, pause: float) -> float:
+    delays = []
+    done = threading.Event()
+
+    def handle(sent: float):
+        delays.append(time.perf_counter() - sent)
+        if len(delays) == events:
+            done.set()
+
+    events_queue = scheduler.queue(handle, name="benchmark.events")
+    for _ in range(events):
+        events_queue.put(time.perf_counter())
+        time.sleep(pause)
+    done.wait()
+    events_queue.task.cancel()
+    return sum(delays) / len(delays)
+
+def main():
+    """Main function for the scheduler benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark the shared cooperative scheduler")
+    parser.add_argument('--engines', type=int, default=30, help="Background loops in a full launch")
+    parser.add_argument('--interval', type=float, default=1.0, help="Period of each engine's background tick")
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--events', type=int, default=200)
+    parser.add_argument('--poll', type=float, default=0.1, help="Queue poll period of the old event processors")
+    args = parser.parse_args()
+
+    # Idle engines that only need a tick every few minutes still woke every `poll` seconds
+    polled = polling_threads(args.engines, args.poll, args.seconds)
+    print(f"🐢 {args.engines} polling threads: {polled:,} wakeups in {args.seconds:.0f} s")
+
+    scheduler = Scheduler()
+    tasks = [scheduler.every(300, lambda: None, name=f"idle_{i}") for i in range(args.engines)]
+    time.sleep(0.1)
+    before = scheduler.wakeups
+    time.sleep(args.seconds)
+    print(f"⚡ scheduler with {len(tasks)} idle tasks: {scheduler.wakeups - before} wakeups in {args.seconds:.0f} s")
+
+    runs = []
+    busy = [scheduler.every(args.interval, lambda i=i: runs.append(i), name=f"engine_{i}.background_processing",
+                            budget=0.001) for i in range(args.engines)]
+    before = scheduler.wakeups
+    time.sleep(args.seconds)
+    print(f"⚡ scheduler with {len(busy)} tasks every {args.interval:g} s: {len(runs)} runs, "
+          f"{scheduler.wakeups - before} wakeups in {args.seconds:.0f} s")
+    print("📊 per-task stats:")
+    for stats in sorted(scheduler.stats(), key=lambda s: -s['runs'])[:5]:
+        print(f"  {stats['name']}: {stats['runs']} runs, mean {stats['mean_ms']:.3f} ms, "
+              f"max {stats['max_ms']:.3f} ms, {stats['overruns']} over budget")
+    for task in busy + tasks:
+        task.cancel()
+
+    polled_latency = polled_queue_latency(args.events, args.poll)
+    scheduled_latency = scheduled_queue_latency(scheduler, args.events, args.poll * 0.37)
+    print(f"🐢 {args.poll * 1000:.0f} ms polled queue: {polled_latency * 1000:.2f} ms mean event latency")
+    print(f"⚡ scheduler queue: {scheduled_latency * 1000:.3f} ms mean event latency")
+
+    scheduler.stop()
+
+if __name__ == "__main__":
+    main()
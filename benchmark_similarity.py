@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Similarity Benchmark for Scroll Stopping Tool
+Network-view pair scoring and similar-cluster queries versus one-pair-at-a-time loops
+"""
+
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from consciousness_clustering import CLUSTER_SIMILARITY, ConsciousnessCluster, ConsciousnessPattern
+from reality_synthesis import REALITY_SIMILARITY, RealityType
+from similarity import MAX_DRAWN_PAIRS, SimilarityIndex
+
+def make_realities(n: int, rng: random.Random):
+    return [SimpleNamespace(reality_type=rng.choice(list(RealityType)), synthesis_level=rng.uniform(0, 10),
+                            dimensions=[None] * rng.randint(1, 12)) for _ in range(n)]
+
+def make_clusters(n: int, rng: random.Random, field_size: int):
+    """Clusters whose fields are noisy copies of a few templates, so some pairs correlate strongly"""
+    fields = np.random.default_rng(rng.randrange(2 ** 32))
+    templates = fields.random((8,) + (field_size,) * 3)
+    return [ConsciousnessCluster(f"cluster_{i}", [], rng.choice(list(ConsciousnessPattern)), rng.random(),
+                                 rng.uniform(0, 50), 0.0, 0.0, 1.0,
+                                 templates[rng.randrange(8)] + 0.2 * fields.random((field_size,) * 3))
+            for i in range(n)]
+
+def legacy_pairs(items, threshold: float):
+    """The old drawing loop: score every pair in Python"""
+    pairs = []
+    for i, a in enumerate(items):
+        for j, b in enumerate(items[i + 1:], i + 1):
+            similarity = REALITY_SIMILARITY.score(a, b)
+            if similarity > threshold:
+                pairs.append((i, j, similarity))
+    return pairs
+
+def main():
+    """Main function for the similarity benchmark"""
+    parser = argparse.ArgumentParser(description="Benchmark vectorized similarity and neighbor queries")
+    parser.add_argument('--nodes', type=int, nargs='+', default=[500, 5000])
+    parser.add_argument('--clusters', type=int, default=5000)
+    parser.add_argument('--field-size', type=int, default=10)
+    parser.add_argument('--queries', type=int, default=50)
+    parser.add_argument('--threshold', type=float, default=0.9)
+    parser.add_argument('--legacy-max', type=int, default=1000, help="Largest network to time the pairwise loop on")
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for nodes in args.nodes:
+        realities = make_realities(nodes, rng)
+        start = time.perf_counter()
+        drawn = REALITY_SIMILARITY.pairs_above(realities, 0.3, strict=True, max_pairs=MAX_DRAWN_PAIRS)
+        elapsed = time.perf_counter() - start
+        print(f"⚡ {nodes:>6,}-node network view: {elapsed * 1000:8.1f} ms to score "
+              f"{nodes * (nodes - 1) // 2:,} pairs, {len(drawn):,} drawn")
+        if nodes <= args.legacy_max:
+            start = time.perf_counter()
+            legacy = legacy_pairs(realities, 0.3)
+            print(f"🐢 {nodes:>6,}-node pairwise loop:  {(time.perf_counter() - start) * 1000:8.1f} ms, "
+                  f"{len(legacy):,} pairs above the line")
+
+    clusters = make_clusters(args.clusters, rng, args.field_size)
+    targets = rng.sample(range(len(clusters)), args.queries)
+    start = time.perf_counter()
+    index = SimilarityIndex(CLUSTER_SIMILARITY, clusters)
+    build_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    found = [len(index.neighbors(target, args.threshold)) for target in targets]
+    query_elapsed = (time.perf_counter() - start) / args.queries
+    print(f"🌳 {args.clusters:,} clusters indexed in {build_elapsed * 1000:.1f} ms; threshold {args.threshold}: "
+          f"{query_elapsed * 1000:.2f} ms/query, {sum(found) / args.queries:.1f} matches")
+
+    # The scan is slow, so it only covers the first tenth of the targets; compare on that subset
+    subset = max(1, args.queries // 10)
+    start = time.perf_counter()
+    legacy_found = [sum(CLUSTER_SIMILARITY.score(clusters[target], cluster) >= args.threshold
+                        for cluster in clusters if cluster is not clusters[target]) for target in targets[:subset]]
+    legacy_elapsed = (time.perf_counter() - start) / subset
+    disagreements = sum(a != b for a, b in zip(found[:subset], legacy_found))
+    print(f"🐢 linear scan: {legacy_elapsed * 1000:.1f} ms/query over the first {subset} queries, "
+          f"{sum(legacy_found) / subset:.1f} matches (index: {sum(found[:subset]) / subset:.1f}, "
+          f"{disagreements} queries disagree)")
+
+if __name__ == "__main__":
+    main()
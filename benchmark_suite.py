@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite for Scroll Stopping Tool
+Seeded synthetic workloads for the analytics, ML, gamification, sync and evolution paths,
+with wall time, CPU time and tracemalloc peak recorded to JSON and checked against a baseline
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from unittest import mock
+
+import numpy as np
+
+DEFAULT_BASELINE = Path(__file__).with_name('benchmark_baseline.json')
+DEFAULT_SEED = 42
+DEFAULT_THRESHOLD = 0.25  # fractional slowdown (or memory growth) that counts as a regression
+# Differences below these are timer and allocator noise, never regressions
+NOISE_FLOOR = {'wall_s': 0.002, 'cpu_s': 0.002, 'peak_mb': 0.5}
+METRICS = tuple(NOISE_FLOOR)
+
+class CaseSkipped(Exception):
+    """A case whose module or backend is not available in this environment"""
+
+@dataclass
+class Workload:
+    """A prepared run; only `run` is measured"""
+    run: Callable[[], Any]
+    close: Callable[[], None] = lambda: None
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    unit: str  # what the scale counts: days of history, users, entities...
+    scales: Tuple[int, ...]
+    prepare: Callable[[int, int, Path], Workload]
+
+@dataclass
+class BenchmarkResult:
+    case: str
+    unit: str
+    scale: int
+    status: str  # ok, skipped or error
+    wall_s: Optional[float] = None
+    cpu_s: Optional[float] = None
+    peak_mb: Optional[float] = None
+    repeats: int = 0
+    detail: str = ""
+
+    @property
+    def key(self) -> str:
+        return f"{self.case}@{self.scale}"
+
+@dataclass
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float('inf')
+
+def require(module: str):
+    """Import a repo module, turning any import failure into a skip"""
+    try:
+        return importlib.import_module(module)
+    except Exception as e:
+        raise CaseSkipped(f"{module} unavailable: {type(e).__name__}: {e}") from e
+
+def seed_everything(seed: int):
+    """Seed the global generators the repo code draws from"""
+    random.seed(seed)
+    np.random.seed(seed)
+
+# Synthetic data generators
+
+def hourly_usage(days: int, seed: int) -> List[Dict[str, Any]]:
+    """Hour-by-hour usage records shaped like SmartAnalytics input"""
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1)
+    usage = rng.gamma(2.0, 6.0, days * 24)
+    productivity = np.clip(90 - usage * 1.5 + rng.normal(0, 8, days * 24), 0, 100)
+    records = []
+    for i in range(days * 24):
+        moment = start + timedelta(hours=i)
+        records.append({
+            'timestamp': moment.isoformat(),
+            'hour': moment.hour,
+            'weekday': moment.strftime('%A'),
+            'usage_time': float(usage[i]),
+            'productivity_score': float(productivity[i]),
+            'interruptions': int(rng.poisson(1.5)),
+            'breaks_taken': int(rng.integers(0, 3)),
+            'focus_sessions': int(rng.integers(0, 2))
+        })
+    return records
+
+def daily_usage_frame(days: int, seed: int, user_id: str = 'user_0', end: Optional[datetime] = None):
+    """One user's daily usage rows with the columns UsagePredictor loads"""
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    end = end or datetime(2024, 12, 31)
+    dates = [end - timedelta(days=days - 1 - i) for i in range(days)]
+    weekly = 20 * np.sin(2 * np.pi * np.arange(days) / 7)
+    total_time = np.clip(120 + weekly + rng.normal(0, 25, days), 5, None)
+    sessions = rng.integers(1, 10, days)
+    frame = pd.DataFrame({
+        'date': [d.strftime('%Y-%m-%d %H:%M:%S') for d in dates],
+        'user_id': user_id,
+        'total_time': total_time,
+        'breaks_taken': rng.integers(0, 8, days),
+        'focus_sessions': rng.integers(0, 6, days),
+        'productivity_score': np.clip(100 - total_time * 0.3 + rng.normal(0, 5, days), 0, 100),
+        'goals_met': rng.integers(0, 2, days),
+        'session_count': sessions
+    })
+    frame['avg_session_length'] = frame['total_time'] / frame['session_count']
+    frame['max_session_length'] = frame['avg_session_length'] * rng.uniform(1.2, 2.0, days)
+    return frame
+
+def write_usage_database(db_path: Path, users: int, days: int, seed: int):
+    """usage_data table of `users` users, ending today so date('now') windows see it"""
+    import sqlite3
+    columns = ['user_id', 'date', 'total_time', 'breaks_taken', 'focus_sessions', 'productivity_score', 'goals_met']
+    with sqlite3.connect(db_path) as conn:
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS usage_data (
+                user_id TEXT, date TEXT, total_time REAL, breaks_taken INTEGER,
+                focus_sessions INTEGER, productivity_score REAL, goals_met INTEGER
+            )
+        ''')
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        for u in range(users):
+            frame = daily_usage_frame(days, seed + u, f"user_{u}", end=today - timedelta(days=1))
+            frame['date'] = frame['date'].str[:10]
+            conn.executemany(f"INSERT INTO usage_data ({', '.join(columns)}) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                             frame[columns].itertuples(index=False, name=None))
+
+def activity_events(users: int, days: int, seed: int) -> List[Tuple[str, Dict[str, Any]]]:
+    """Daily activity updates for every user, in replay order"""
+    rng = random.Random(seed)
+    events = []
+    for _ in range(days):
+        for u in range(users):
+            events.append((f"user_{u}", {
+                'focus_sessions': [{'duration': rng.choice([15, 25, 45, 60])} for _ in range(rng.randint(0, 4))],
+                'breaks_taken': rng.randint(0, 6),
+                'daily_goal_met': rng.random() < 0.6,
+                'time_saved_minutes': rng.randint(0, 120)
+            }))
+    return events
+
+class SyntheticProcess:
+    """Just enough of psutil.Process for the social media scan"""
+
+    def __init__(self, pid: int, name: str, cmdline: List[str]):
+        self.pid = pid
+        self.info = {'pid': pid, 'name': name, 'cmdline': cmdline}
+
+def process_table(processes: int, seed: int) -> List[SyntheticProcess]:
+    """A busy desktop's process list with no social media in it, so every scan is a full one"""
+    rng = random.Random(seed)
+    names = ['python', 'bash', 'code', 'systemd', 'slack', 'postgres', 'node', 'java', 'kworker', 'Xorg']
+    return [SyntheticProcess(1000 + i, f"{rng.choice(names)}{i}",
+                             [f"/usr/bin/{rng.choice(names)}", f"--worker={i}", f"/home/user/project_{i % 37}"])
+            for i in range(processes)]
+
+# Cases
+
+def prepare_smart_analytics(days: int, seed: int, workdir: Path) -> Workload:
+    module = require('advanced_features')
+    analytics = module.SmartAnalytics()
+    records = hourly_usage(days, seed)
+    return Workload(lambda: analytics.analyze_usage_patterns(records))
+
+def prepare_feature_engineering(days: int, seed: int, workdir: Path) -> Workload:
+    module = require('advanced_ml_models')
+    if not module.SKLEARN_AVAILABLE:
+        raise CaseSkipped("scikit-learn not available")
+    frame = daily_usage_frame(days, seed)
+    engineer = module.FeatureEngineer()
+    return Workload(lambda: engineer.engineer_features(frame))
+
+def prepare_usage_training(users: int, seed: int, workdir: Path) -> Workload:
+    module = require('advanced_ml_models')
+    if not module.SKLEARN_AVAILABLE:
+        raise CaseSkipped("scikit-learn not available")
+    db_path = workdir / f"usage_{users}.db"
+    if not db_path.exists():
+        write_usage_database(db_path, users, 90, seed)
+    predictor = module.UsagePredictor(db_path=str(db_path))
+
+    def run():
+        seed_everything(seed)  # load_usage_data draws synthetic session counts from np.random
+        predictor.train_models(n_jobs=1)
+
+    return Workload(run)
+
+def prepare_gamification(users: int, seed: int, workdir: Path) -> Workload:
+    module = require('gamification_system')
+    db_path = workdir / f"gamification_{users}_{time.perf_counter_ns()}.db"
+    module.initialize_gamification_database(str(db_path))
+    system = module.GamificationSystem(db_path=str(db_path))
+    events = activity_events(users, 7, seed)
+
+    def run():
+        for user_id, activity in events:
+            system.process_user_activity(user_id, activity)
+
+    return Workload(run, system.processing_task.cancel)
+
+def prepare_process_scan(processes: int, seed: int, workdir: Path) -> Workload:
+    module = require('scroll_stopping_tool_enhanced')
+    monitor = module.ProcessMonitor(module.SOCIAL_MEDIA_PATTERNS)
+    table = process_table(processes, seed)
+    patch = mock.patch.object(module.psutil, 'process_iter', lambda attrs=None: iter(table))
+
+    def run():
+        with patch:
+            for _ in range(10):
+                monitor.last_check = 0.0  # defeat the one-second cache: every call is a fresh scan
+                monitor.is_social_media_active()
+
+    return Workload(run)
+
+def prepare_cloud_upload(records: int, seed: int, workdir: Path) -> Workload:
+    module = require('cloud_sync')
+    manager = module.CloudSyncManager(module.SyncConfig(), device_id='benchmark_device')
+    manager.cloud_provider = module.LocalCloudProvider(str(workdir / f"cloud_sync_{records}"), databases={})
+    data = hourly_usage(max(1, records // 24), seed)[:records]
+    return Workload(lambda: manager._upload_data('usage', data))
+
+def prepare_engine(module_name: str, engine_name: str, create: str) -> Callable[[int, int, Path], Workload]:
+    def prepare(entities: int, seed: int, workdir: Path) -> Workload:
+        module = require(module_name)
+        seed_everything(seed)
+        try:
+            engine = getattr(module, engine_name)()
+        except MemoryError as e:
+            raise CaseSkipped(f"{engine_name} does not fit in memory here: {e}") from e
+        for _ in range(entities):
+            getattr(engine, create)()
+
+        def run():
+            for _ in range(10):
+                engine.evolve_all_systems(0.1)
+
+        return Workload(run)
+    return prepare
+
+CASES = [
+    BenchmarkCase('smart_analytics.analyze_usage_patterns', 'days', (7, 30, 90), prepare_smart_analytics),
+    BenchmarkCase('feature_engineer.engineer_features', 'days', (30, 90, 365), prepare_feature_engineering),
+    BenchmarkCase('usage_predictor.train_models', 'users', (1, 10), prepare_usage_training),
+    BenchmarkCase('gamification.process_user_activity', 'users', (10, 100), prepare_gamification),
+    BenchmarkCase('process_monitor.is_social_media_active', 'processes', (100, 1000), prepare_process_scan),
+    BenchmarkCase('cloud_sync._upload_data', 'records', (100, 1000, 10000), prepare_cloud_upload),
+    BenchmarkCase('omega_engine.evolve_all_systems', 'entities', (10, 100),
+                  prepare_engine('OMEGA_INTEGRATION', 'OmegaEngine', 'create_omega_entity')),
+    BenchmarkCase('ultimate_quantum_engine.evolve_all_systems', 'entities', (10, 100),
+                  prepare_engine('ULTIMATE_QUANTUM_INTEGRATION', 'UltimateQuantumEngine',
+                                 'create_ultimate_quantum_entity')),
+    BenchmarkCase('optimized_quantum_engine.evolve_all_systems', 'entities', (10, 100),
+                  prepare_engine('OPTIMIZED_QUANTUM_INTEGRATION', 'OptimizedQuantumEngine',
+                                 'create_ultimate_quantum_entity')),
+]
+
+# Measurement
+
+def _measured(case: BenchmarkCase, scale: int, seed: int, workdir: Path, traced: bool) -> Tuple[float, float, float]:
+    """Prepare a fresh workload and run it once; returns (wall, cpu, traced peak MB)"""
+    seed_everything(seed)
+    workload = case.prepare(scale, seed, workdir)
+    try:
+        seed_everything(seed)
+        if traced:
+            tracemalloc.start()
+        wall, cpu = time.perf_counter(), time.process_time()
+        workload.run()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        peak = tracemalloc.get_traced_memory()[1] / (1024 * 1024) if traced else 0.0
+    finally:
+        if traced:
+            tracemalloc.stop()
+        workload.close()
+    return wall, cpu, peak
+
+def run_case(case: BenchmarkCase, scale: int, seed: int, repeats: int, workdir: Path) -> BenchmarkResult:
+    """Warm up once, time `repeats` fresh runs (median), then take the allocation peak from one traced run"""
+    result = BenchmarkResult(case.name, case.unit, scale, 'ok')
+    try:
+        # The app's emoji banners and log lines would swamp the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            _measured(case, scale, seed, workdir, traced=False)  # lazy imports, caches, sqlite files
+            timings = [_measured(case, scale, seed, workdir, traced=False) for _ in range(repeats)]
+            result.peak_mb = _measured(case, scale, seed, workdir, traced=True)[2]
+        result.wall_s = statistics.median(t[0] for t in timings)
+        result.cpu_s = statistics.median(t[1] for t in timings)
+        result.repeats = repeats
+    except CaseSkipped as e:
+        result.status, result.detail = 'skipped', str(e)
+    except Exception as e:
+        result.status, result.detail = 'error', f"{type(e).__name__}: {e}"
+    return result
+
+def compare(results: List[BenchmarkResult], baseline: Dict[str, Any], threshold: float) -> List[Regression]:
+    """Metrics that grew by more than `threshold` over the baseline and above the noise floor"""
+    previous = {f"{r['case']}@{r['scale']}": r for r in baseline.get('results', []) if r.get('status') == 'ok'}
+    regressions = []
+    for result in results:
+        before = previous.get(result.key)
+        if result.status != 'ok' or before is None:
+            continue
+        for metric in METRICS:
+            old, new = before.get(metric), getattr(result, metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + threshold) and new - old > NOISE_FLOOR[metric]:
+                regressions.append(Regression(result.key, metric, old, new))
+    return regressions
+
+def report(results: List[BenchmarkResult], seed: int) -> Dict[str, Any]:
+    return {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'seed': seed,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'results': [asdict(result) for result in results]
+    }
+
+def main():
+    """Main function for the benchmark suite"""
+    parser = argparse.ArgumentParser(description="Run the deterministic performance benchmark suite")
+    parser.add_argument('--cases', nargs='*', help="Substrings of case names to run (default: all)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--repeats', type=int, default=3, help="Timed runs per case and scale; the median is kept")
+    parser.add_argument('--max-scale', type=int, help="Skip scales above this, for quick runs")
+    parser.add_argument('--output', type=Path, help="Write this run's results to a JSON file")
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true', help="Store this run as the new baseline")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed fractional growth of wall time, CPU time or peak memory")
+    parser.add_argument('--verbose', action='store_true', help="Keep the application's log output")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+    np.seterr(all='ignore')  # the evolution engines overflow by design
+
+    cases = [case for case in CASES if not args.cases or any(pattern in case.name for pattern in args.cases)]
+    results = []
+    print(f"🧪 {len(cases)} cases, seed {args.seed}, median of {args.repeats} runs")
+    with tempfile.TemporaryDirectory(prefix='benchmark_suite_') as directory:
+        cwd = os.getcwd()
+        os.chdir(directory)  # default database and sync paths land in the scratch directory
+        try:
+            for case in cases:
+                for scale in case.scales:
+                    if args.max_scale is not None and scale > args.max_scale:
+                        continue
+                    result = run_case(case, scale, args.seed, args.repeats, Path(directory))
+                    results.append(result)
+                    label = f"{case.name} [{scale:,} {case.unit}]"
+                    if result.status == 'ok':
+                        print(f"⚡ {label:<64} wall {result.wall_s * 1000:>10.2f} ms  cpu {result.cpu_s * 1000:>10.2f} ms  "
+                              f"peak {result.peak_mb:>8.2f} MB")
+                    else:
+                        icon = '⏭️' if result.status == 'skipped' else '❌'
+                        print(f"{icon} {label:<64} {result.status}: {result.detail}")
+        finally:
+            os.chdir(cwd)
+
+    data = report(results, args.seed)
+    if args.output:
+        args.output.write_text(json.dumps(data, indent=2))
+        print(f"💾 results written to {args.output}")
+
+    regressions = []
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(data, indent=2))
+        print(f"💾 baseline stored at {args.baseline}")
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.threshold)
+        print(f"📊 compared with baseline from {baseline.get('created', '?')} at +{args.threshold:.0%} threshold")
+        for regression in regressions:
+            print(f"🐢 {regression.key} {regression.metric}: {regression.baseline:.4f} -> {regression.current:.4f} "
+                  f"({regression.ratio:.2f}x)")
+        if not regressions:
+            print("✅ no regressions")
+    else:
+        print(f"ℹ️ no baseline at {args.baseline}; run with --save-baseline to store one")
+
+    sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Voice Pipeline Benchmark for Scroll Stopping Tool
+Replays WAV fixtures through the VAD-gated speech pipeline and reports accuracy and command latency
+"""
+
+import argparse
+import os
+import tempfile
+import wave
+
+import numpy as np
+
+from speech_pipeline import (CommandGrammar, RecognitionBackend, SpeechPipeline, SAMPLE_RATE, SAMPLE_WIDTH,
+                             VOSK_AVAILABLE, make_backend)
+
+def expected_phrase(path: str) -> str:
+    """Fixtures are named after the phrase they contain, e.g. start_focus.wav or 03-take_a_break.wav"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return stem.split("-", 1)[-1].replace("_", " ").lower()
+
+def synthetic_fixture(path: str, seconds: float = 12.0, bursts: int = 4, seed: int = 42):
+    """Background noise with voiced bursts, for exercising the VAD without recordings"""
+    rng = np.random.default_rng(seed)
+    audio = rng.normal(0, 60, int(seconds * SAMPLE_RATE))
+    for i in range(bursts):
+        start = int((1 + i * seconds / bursts) * SAMPLE_RATE)
+        length = int(rng.uniform(0.6, 1.2) * SAMPLE_RATE)
+        t = np.arange(length) / SAMPLE_RATE
+        envelope = np.sin(np.pi * t / t[-1])
+        audio[start:start + length] += 4000 * envelope * np.sin(2 * np.pi * rng.uniform(120, 220) * t)
+    with wave.open(path, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(SAMPLE_WIDTH)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(np.clip(audio, -32768, 32767).astype(np.int16).tobytes())
+
+def main():
+    """Main function for the voice pipeline benchmark"""
+    parser = argparse.ArgumentParser(description="Replay WAV fixtures through the speech pipeline")
+    parser.add_argument('wavs', nargs='*', help="16-bit mono 16 kHz WAV files named after their phrase")
+    parser.add_argument('--model', default=os.environ.get("VOSK_MODEL_PATH"), help="Vosk model directory")
+    parser.add_argument('--phrases', nargs='*', help="Grammar phrases (default: the fixture names)")
+    parser.add_argument('--realtime', action='store_true', help="Feed audio at capture speed")
+    args = parser.parse_args()
+
+    grammar = CommandGrammar(args.phrases or [expected_phrase(path) for path in args.wavs])
+    backend = make_backend(args.model) if args.model else None
+    if backend is None or backend.name != "vosk":
+        if not VOSK_AVAILABLE:
+            print("⚠️  vosk not installed - measuring voice-activity gating only")
+        elif not args.model:
+            print("⚠️  No --model given - measuring voice-activity gating only")
+        backend = RecognitionBackend()
+
+    wavs = args.wavs
+    if not wavs:
+        wavs = [os.path.join(tempfile.mkdtemp(), "synthetic.wav")]
+        synthetic_fixture(wavs[0])
+        print(f"🎛️  No fixtures given - generated {wavs[0]}")
+
+    correct = total = 0
+    pipeline = SpeechPipeline(backend, grammar, on_command=lambda event: None)
+    for path in wavs:
+        events = pipeline.run_wav(path, realtime=args.realtime)
+        heard = [event.phrase for event in events]
+        expected = expected_phrase(path)
+        if expected in grammar.phrases:
+            total += 1
+            correct += expected in heard
+        print(f"🎤 {os.path.basename(path)}: {heard or 'no command'}"
+              + "".join(f"  [{event.audio_start:.2f}-{event.audio_end:.2f}s, {event.latency_ms:.1f} ms"
+                        f"{', partial' if event.partial else ''}]" for event in events))
+
+    stats = pipeline.stats
+    print(f"📊 backend={backend.name} utterances={stats.utterances} "
+          f"forwarded {stats.forwarded_frames}/{stats.frames} frames "
+          f"({stats.forwarded_frames / max(1, stats.frames):.0%})")
+    if total:
+        print(f"✅ {correct}/{total} fixtures recognised")
+    summary = stats.latency_summary()
+    if summary:
+        print(f"⏱️  latency mean {summary['mean_ms']:.1f} ms, p50 {summary['p50_ms']:.1f} ms, "
+              f"p95 {summary['p95_ms']:.1f} ms over {summary['count']} commands "
+              f"({stats.partial_commands} decided from partials)")
+
+if __name__ == "__main__":
+    main()
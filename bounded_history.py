@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Bounded History for Scroll Stopping Tool
+Fixed-size record windows that can spill evicted records to an append-only file or SQLite table
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HISTORY_SIZE = 1000
+SPILL_BATCH = 256  # evicted records buffered before one write to the spill
+
+def _plain(value: Any) -> Any:
+    """JSON fallback for the record types the engines keep"""
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if hasattr(value, 'item'):  # numpy scalars
+        return value.item()
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+def compact(record: Any) -> str:
+    """One-line JSON for a record, without whitespace"""
+    return json.dumps(record, default=_plain, separators=(',', ':'))
+
+class JsonlSpill:
+    """Append-only JSON-lines file of evicted records, one line per batch"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def write(self, name: str, records: List[Any]):
+        line = compact({'history': name, 'spilled_at': time.time(), 'records': records})
+        with self._lock, open(self.path, 'a', encoding='utf-8') as handle:
+            handle.write(line + '\n')
+
+    def read(self, name: Optional[str] = None) -> Iterator[Any]:
+        """Spilled records in eviction order, optionally for one history"""
+        try:
+            with open(self.path, encoding='utf-8') as handle:
+                for line in handle:
+                    batch = json.loads(line)
+                    if name is None or batch['history'] == name:
+                        yield from batch['records']
+        except FileNotFoundError:
+            return
+
+class SqliteSpill:
+    """SQLite table of evicted records, one JSON array row per batch"""
+
+    def __init__(self, db_path: str, table: str = 'history_spill'):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        self.db_path = db_path
+        self.table = table
+        self._lock = threading.Lock()
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(f'''
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    history TEXT NOT NULL,
+                    spilled_at REAL NOT NULL,
+                    records TEXT NOT NULL
+                )
+            ''')
+            conn.execute(f'CREATE INDEX IF NOT EXISTS idx_{table}_history ON {table} (history)')
+
+    def write(self, name: str, records: List[Any]):
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            conn.execute(f'INSERT INTO {self.table} (history, spilled_at, records) VALUES (?, ?, ?)',
+                         (name, time.time(), compact(records)))
+
+    def read(self, name: Optional[str] = None) -> Iterator[Any]:
+        """Spilled records in eviction order, optionally for one history"""
+        with sqlite3.connect(self.db_path) as conn:
+            if name is None:
+                rows = conn.execute(f'SELECT records FROM {self.table} ORDER BY id').fetchall()
+            else:
+                rows = conn.execute(f'SELECT records FROM {self.table} WHERE history = ? ORDER BY id',
+                                    (name,)).fetchall()
+        return (record for (records,) in rows for record in json.loads(records))
+
+class BoundedHistory(Sequence):
+    """Ring buffer of the most recent records, read like a list
+
+    Appending past `maxlen` evicts the oldest record. Without a spill the
+    record is dropped; with one it is queued and each `spill_batch` records
+    are written as one compact JSON array, so only the window stays in memory.
+    `total` counts every record ever appended.
+    """
+
+    def __init__(self, maxlen: int = DEFAULT_HISTORY_SIZE, spill=None, name: str = 'history',
+                 spill_batch: int = SPILL_BATCH):
+        if maxlen < 1:
+            raise ValueError("maxlen must be at least 1")
+        self.maxlen = maxlen
+        self.spill = spill
+        self.name = name
+        self.spill_batch = spill_batch
+        self.total = 0
+        self.spilled = 0
+        self._records: deque = deque(maxlen=maxlen)
+        self._evicted: List[Any] = []
+        self._lock = threading.Lock()
+
+    def append(self, record: Any):
+        self.extend((record,))
+
+    def extend(self, records: Iterable[Any]):
+        with self._lock:
+            for record in records:
+                if len(self._records) == self.maxlen and self.spill is not None:
+                    self._evicted.append(self._records[0])
+                self._records.append(record)
+                self.total += 1
+            if len(self._evicted) >= self.spill_batch:
+                self._flush_locked()
+
+    def flush(self):
+        """Write queued evicted records to the spill now"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if not self._evicted:
+            return
+        batch, self._evicted = self._evicted, []
+        try:
+            self.spill.write(self.name, batch)
+            self.spilled += len(batch)
+        except Exception as e:
+            logger.error(f"Failed to spill {len(batch)} {self.name} records: {e}")
+
+    def clear(self):
+        """Drop the in-memory window; records already queued still spill"""
+        with self._lock:
+            self._records.clear()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._records)[index]
+        return self._records[index]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(list(self._records))
+
+    def __repr__(self) -> str:
+        return f"BoundedHistory(name={self.name!r}, len={len(self)}, maxlen={self.maxlen}, total={self.total})"
+
+    def stats(self) -> Dict[str, Any]:
+        return {'name': self.name, 'retained': len(self), 'maxlen': self.maxlen,
+                'total': self.total, 'spilled': self.spilled, 'pending': len(self._evicted)}
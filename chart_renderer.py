@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Chart Rendering Service for Scroll Stopping Tool
+Builds matplotlib figures with Agg on worker threads and hands finished bitmaps back to Tk
+"""
+
+import base64
+import hashlib
+import io
+import logging
+import queue
+import threading
+import time
+import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from tkinter import ttk
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+try:
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    MATPLOTLIB_AVAILABLE = True
+except ImportError:
+    MATPLOTLIB_AVAILABLE = False
+    logging.warning("matplotlib not available - charts cannot be rendered")
+
+logger = logging.getLogger(__name__)
+
+DrawFunction = Callable[[Any, Any], None]
+
+def freeze(value: Any) -> Any:
+    """Deep immutable copy of plain data: dicts become read-only mappings, lists become tuples"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    if MATPLOTLIB_AVAILABLE and isinstance(value, np.ndarray):
+        array = value.copy()
+        array.setflags(write=False)
+        return array
+    return value
+
+def _feed(hasher, value: Any):
+    if isinstance(value, Mapping):
+        hasher.update(b'{')
+        for key, item in value.items():
+            _feed(hasher, key)
+            _feed(hasher, item)
+        hasher.update(b'}')
+    elif isinstance(value, (tuple, list)):
+        hasher.update(b'(')
+        for item in value:
+            _feed(hasher, item)
+        hasher.update(b')')
+    elif MATPLOTLIB_AVAILABLE and isinstance(value, np.ndarray):
+        hasher.update(f"ndarray{value.dtype}{value.shape}".encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    else:
+        hasher.update(f"{type(value).__name__}:{value!r};".encode())
+
+def data_version(snapshot: Any) -> str:
+    """Content hash of a snapshot, used as its cache key when the caller has no version of its own"""
+    hasher = hashlib.blake2b(digest_size=16)
+    _feed(hasher, snapshot)
+    return hasher.hexdigest()
+
+@dataclass(frozen=True)
+class RenderJob:
+    """One request to draw a chart from an immutable snapshot"""
+    chart_id: str
+    version: str
+    generation: int
+    draw: DrawFunction
+    snapshot: Any
+    figsize: Tuple[float, float]
+    dpi: int
+
+@dataclass
+class RenderedChart:
+    """PNG bitmap of a chart at one data version"""
+    chart_id: str
+    version: str
+    png: bytes
+    width: int
+    height: int
+    render_seconds: float
+
+@dataclass
+class RenderStats:
+    rendered: int = 0
+    cache_hits: int = 0
+    cancelled: int = 0
+    stale: int = 0
+    failed: int = 0
+
+class ChartRenderService:
+    """Renders charts off the Tk thread and delivers the bitmaps through root.after
+
+    Each chart id has a generation counter: a newer request cancels the queued
+    one and makes any in-flight render stale, so its result is cached but never
+    shown. Finished images are kept in an LRU cache keyed by (chart id, data
+    version), so redrawing unchanged data costs nothing.
+    """
+
+    def __init__(self, root, max_workers: int = 2, cache_size: int = 64, poll_ms: int = 30):
+        if not MATPLOTLIB_AVAILABLE:
+            raise RuntimeError("matplotlib is required for chart rendering")
+        self.root = root
+        self.poll_ms = poll_ms
+        self.cache_size = cache_size
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chart-render")
+        self.cache: "OrderedDict[Tuple[str, str], RenderedChart]" = OrderedDict()
+        self.generations: Dict[str, int] = {}
+        self.pending: Dict[str, Future] = {}
+        self.results: "queue.Queue[Tuple[RenderJob, RenderedChart, Callable]]" = queue.Queue()
+        self.stats = RenderStats()
+        self.lock = threading.Lock()
+        self.polling = False
+
+    def request(self, chart_id: str, draw: DrawFunction, snapshot: Any,
+                on_ready: Callable[[RenderedChart], None], version: Optional[str] = None,
+                figsize: Tuple[float, float] = (10, 6), dpi: int = 100) -> Optional[RenderedChart]:
+        """Queue a render; on_ready runs on the Tk thread, immediately when the version is cached"""
+        version = version if version is not None else data_version(snapshot)
+        with self.lock:
+            generation = self.generations.get(chart_id, 0) + 1
+            self.generations[chart_id] = generation
+            cached = self.cache.get((chart_id, version))
+            if cached is not None:
+                self.cache.move_to_end((chart_id, version))
+                self.stats.cache_hits += 1
+
+        previous = self.pending.pop(chart_id, None)
+        if previous is not None and previous.cancel():
+            self.stats.cancelled += 1
+
+        if cached is not None:
+            on_ready(cached)
+            return cached
+
+        job = RenderJob(chart_id, version, generation, draw, snapshot, figsize, dpi)
+        self.pending[chart_id] = self.executor.submit(self._render, job, on_ready)
+        if not self.polling:
+            self.polling = True
+            self.root.after(self.poll_ms, self._poll)
+        return None
+
+    def _is_current(self, job: RenderJob) -> bool:
+        with self.lock:
+            return self.generations.get(job.chart_id) == job.generation
+
+    def _render(self, job: RenderJob, on_ready: Callable[[RenderedChart], None]):
+        """Worker side: draw on a private Agg canvas, never touching Tk"""
+        if not self._is_current(job):
+            with self.lock:
+                self.stats.stale += 1
+            return
+
+        try:
+            start = time.perf_counter()
+            fig = Figure(figsize=job.figsize, dpi=job.dpi)
+            canvas = FigureCanvasAgg(fig)
+            job.draw(fig, job.snapshot)
+            buffer = io.BytesIO()
+            canvas.print_png(buffer)
+            width, height = canvas.get_width_height()
+            rendered = RenderedChart(job.chart_id, job.version, buffer.getvalue(), width, height,
+                                     time.perf_counter() - start)
+        except Exception as e:
+            logger.error(f"Error rendering chart {job.chart_id}: {e}")
+            with self.lock:
+                self.stats.failed += 1
+            return
+
+        with self.lock:
+            self.stats.rendered += 1
+            self.cache[(job.chart_id, job.version)] = rendered
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        self.results.put((job, rendered, on_ready))
+
+    def _poll(self):
+        """Tk side: deliver finished renders that are still the latest for their chart"""
+        while True:
+            try:
+                job, rendered, on_ready = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if not self._is_current(job):
+                with self.lock:
+                    self.stats.stale += 1
+                continue
+            try:
+                on_ready(rendered)
+            except Exception as e:
+                logger.error(f"Error displaying chart {job.chart_id}: {e}")
+
+        self.pending = {chart_id: future for chart_id, future in self.pending.items() if not future.done()}
+        if self.pending or not self.results.empty():
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self.polling = False
+
+    def invalidate(self, chart_id: Optional[str] = None):
+        """Drop cached images for one chart, or all of them"""
+        with self.lock:
+            for key in [key for key in self.cache if chart_id is None or key[0] == chart_id]:
+                del self.cache[key]
+
+    def shutdown(self):
+        with self.lock:
+            for chart_id in self.generations:
+                self.generations[chart_id] += 1
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+@dataclass
+class ChartView:
+    """Tk label showing the latest rendered bitmap of one chart"""
+    parent: Any
+    service: ChartRenderService
+    chart_id: str
+    draw: DrawFunction
+    figsize: Tuple[float, float] = (10, 6)
+    dpi: int = 100
+    label: Any = field(init=False)
+    image: Any = field(init=False, default=None)
+
+    def __post_init__(self):
+        self.label = ttk.Label(self.parent, text="⏳ Rendering chart...", anchor='center')
+        self.label.pack(fill='both', expand=True)
+
+    def show(self, snapshot: Any, version: Optional[str] = None):
+        """Request a render of the snapshot; the label keeps its current image until it arrives"""
+        self.service.request(self.chart_id, self.draw, snapshot, self._display,
+                             version=version, figsize=self.figsize, dpi=self.dpi)
+
+    def _display(self, rendered: RenderedChart):
+        if not self.label.winfo_exists():
+            return
+        self.image = tk.PhotoImage(master=self.label, data=base64.b64encode(rendered.png))
+        self.label.configure(image=self.image, text='')
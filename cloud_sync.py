@@ -23,6 +23,8 @@ from pathlib import Path
 import pickle
 import tempfile
 
+from backup_store import SnapshotStore
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -133,7 +135,7 @@ class DataCompression:
 class LocalCloudProvider:
     """Local file-based cloud provider"""
     
-    def __init__(self, sync_dir: str = "cloud_sync"):
+    def __init__(self, sync_dir: str = "cloud_sync", databases: Dict[str, str] = None):
         self.sync_dir = Path(sync_dir)
         self.sync_dir.mkdir(exist_ok=True)
         
@@ -141,6 +143,14 @@ class LocalCloudProvider:
         (self.sync_dir / "data").mkdir(exist_ok=True)
         (self.sync_dir / "backups").mkdir(exist_ok=True)
         (self.sync_dir / "metadata").mkdir(exist_ok=True)
+        
+        # Snapshots share file contents, so each backup only stores what changed
+        self.snapshots = SnapshotStore(self.sync_dir / "backups")
+        self.databases = {name: Path(path) for name, path in
+                          (databases if databases is not None else {'productivity.db': 'productivity.db'}).items()}
+    
+    def _backup_sources(self) -> Dict[str, Path]:
+        return {'data': self.sync_dir / "data", 'metadata': self.sync_dir / "metadata"}
     
     def upload_data(self, data_type: str, data: bytes, metadata: Dict) -> bool:
         """Upload data to local cloud storage"""
@@ -219,41 +229,29 @@ class LocalCloudProvider:
             return []
     
     def create_backup(self, backup_name: str) -> bool:
-        """Create a backup of all data"""
+        """Create an incremental snapshot of all data and databases"""
         try:
-            backup_dir = self.sync_dir / "backups" / backup_name
-            backup_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Copy all data
-            shutil.copytree(self.sync_dir / "data", backup_dir / "data", dirs_exist_ok=True)
-            shutil.copytree(self.sync_dir / "metadata", backup_dir / "metadata", dirs_exist_ok=True)
-            
-            # Create backup metadata
-            backup_metadata = {
-                'backup_name': backup_name,
-                'created_at': datetime.now().isoformat(),
-                'data_files': len(list((self.sync_dir / "data").glob("*.dat"))),
-                'total_size': sum(f.stat().st_size for f in (self.sync_dir / "data").glob("*.dat"))
-            }
-            
-            with open(backup_dir / "backup_info.json", 'w') as f:
-                json.dump(backup_metadata, f, indent=2)
-            
+            snapshot = self.snapshots.create(backup_name, self._backup_sources(), self.databases)
+            logger.info(f"Backup {backup_name}: {len(snapshot.files)} files, "
+                        f"{snapshot.new_bytes} of {snapshot.total_size} bytes new")
             return True
         except Exception as e:
             logger.error(f"Error creating backup: {e}")
             return False
     
-    def restore_backup(self, backup_name: str) -> bool:
-        """Restore data from backup"""
+    def restore_backup(self, backup_name: str, paths: List[str] = None) -> bool:
+        """Restore data from backup, optionally only some paths (e.g. 'data/usage_...dat' or 'productivity.db')"""
         try:
-            backup_dir = self.sync_dir / "backups" / backup_name
+            if backup_name in self.snapshots.catalog:
+                self.snapshots.restore(backup_name, self._backup_sources(), self.databases, paths)
+                return True
             
-            if not backup_dir.exists():
+            # Backups taken before snapshots were full directory copies
+            backup_dir = self.sync_dir / "backups" / backup_name
+            if not (backup_dir / "backup_info.json").exists():
                 logger.error(f"Backup {backup_name} not found")
                 return False
             
-            # Restore data
             shutil.rmtree(self.sync_dir / "data", ignore_errors=True)
             shutil.rmtree(self.sync_dir / "metadata", ignore_errors=True)
             
@@ -264,6 +262,21 @@ class LocalCloudProvider:
         except Exception as e:
             logger.error(f"Error restoring backup: {e}")
             return False
+    
+    def list_backups(self) -> List[Dict]:
+        """Backups newest first, from the catalog plus any legacy directory copies"""
+        backups = self.snapshots.list()
+        for backup_info_file in (self.sync_dir / "backups").glob("*/backup_info.json"):
+            try:
+                with open(backup_info_file, 'r') as f:
+                    backups.append(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.error(f"Error reading {backup_info_file}: {e}")
+        return sorted(backups, key=lambda x: x['created_at'], reverse=True)
+    
+    def delete_backup(self, backup_name: str) -> int:
+        """Delete a snapshot; returns bytes freed from the shared store"""
+        return self.snapshots.delete(backup_name)
 
 class DropboxCloudProvider:
     """Dropbox cloud provider"""
@@ -709,11 +722,11 @@ class CloudSyncManager:
         finally:
             self.status.backup_in_progress = False
     
-    def restore_backup(self, backup_name: str) -> bool:
-        """Restore data from backup"""
+    def restore_backup(self, backup_name: str, paths: List[str] = None) -> bool:
+        """Restore data from backup, optionally only some paths"""
         try:
             if isinstance(self.cloud_provider, LocalCloudProvider):
-                success = self.cloud_provider.restore_backup(backup_name)
+                success = self.cloud_provider.restore_backup(backup_name, paths)
                 if success:
                     logger.info(f"Backup restored: {backup_name}")
                     return True
@@ -735,18 +748,7 @@ class CloudSyncManager:
         """Get list of available backups"""
         try:
             if isinstance(self.cloud_provider, LocalCloudProvider):
-                backup_dir = self.cloud_provider.sync_dir / "backups"
-                backups = []
-                
-                for backup_path in backup_dir.iterdir():
-                    if backup_path.is_dir():
-                        backup_info_file = backup_path / "backup_info.json"
-                        if backup_info_file.exists():
-                            with open(backup_info_file, 'r') as f:
-                                backup_info = json.load(f)
-                                backups.append(backup_info)
-                
-                return sorted(backups, key=lambda x: x['created_at'], reverse=True)
+                return self.cloud_provider.list_backups()
             
             return []
             
@@ -6,8 +6,6 @@ team challenges, shared goals, real-time messaging, and group analytics.
 """
 
 import json
-import time
-import threading
 import asyncio
 import websockets
 from datetime import datetime, timedelta
@@ -19,11 +17,12 @@ import sqlite3
 import uuid
 import hashlib
 from pathlib import Path
-import queue
 import socketio
 from flask import Flask, request, jsonify
 from flask_socketio import SocketIO, emit, join_room, leave_room
 
+from scheduler import get_scheduler
+
 logger = logging.getLogger(__name__)
 
 class CollaborationType(Enum):
@@ -133,7 +132,7 @@ class RealTimeCollaborationSystem:
         self.messages = {}
         self.user_profiles = {}
         self.active_connections = {}
-        self.message_queue = queue.Queue()
+        self.message_queue = get_scheduler().queue(self._process_message, name="RealTimeCollaborationSystem.messages")
         
         # Initialize Flask app for WebSocket support
         self.app = Flask(__name__)
@@ -144,8 +143,8 @@ class RealTimeCollaborationSystem:
         self._initialize_socket_events()
         
         # Start background processing
-        self.processing_thread = threading.Thread(target=self._background_processing, daemon=True)
-        self.processing_thread.start()
+        self.processing_task = get_scheduler().every(30, self._background_processing, error_interval=60,
+                                                     name="RealTimeCollaborationSystem.background_processing")
         
         print("🤝 Real-Time Collaboration System initialized!")
         print("💬 WebSocket messaging active!")
@@ -690,26 +689,17 @@ class RealTimeCollaborationSystem:
         if connection_id in self.active_connections:
             del self.active_connections[connection_id]
     
+    def _process_message(self, message: CollaborationMessage):
+        """Process one queued message"""
+        # Additional processing can be added here
+    
     def _background_processing(self):
-        """Background processing for collaboration system"""
-        while True:
-            try:
-                # Process message queue
-                while not self.message_queue.empty():
-                    message = self.message_queue.get_nowait()
-                    # Additional processing can be added here
-                
-                # Update collaboration scores
-                self._update_collaboration_scores()
-                
-                # Clean up old messages
-                self._cleanup_old_messages()
-                
-                time.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                logger.error(f"Error in collaboration background processing: {e}")
-                time.sleep(60)
+        """Background processing for collaboration system, run every 30 seconds by the shared scheduler"""
+        # Update collaboration scores
+        self._update_collaboration_scores()
+        
+        # Clean up old messages
+        self._cleanup_old_messages()
     
     def _update_collaboration_scores(self):
         """Update collaboration scores for all users"""
@@ -24,20 +24,34 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import queue
 
-# Import all advanced systems
-try:
-    from ai_productivity_engine import AIProductivityEngine, initialize_ai_database
-    from gamification_system import GamificationSystem, initialize_gamification_database
-    from advanced_analytics_dashboard import AdvancedAnalyticsDashboard, initialize_analytics_database
-    from real_time_collaboration_system import RealTimeCollaborationSystem, initialize_collaboration_database
-    from mobile_integration import MobileIntegrationSystem, initialize_mobile_database
-    from security_privacy_system import SecurityPrivacySystem, initialize_security_database
-    from voice_control_system import VoiceControlSystem, initialize_voice_database
-    from advanced_ml_analytics import AdvancedMLAnalytics, initialize_ml_database
-    ALL_SYSTEMS_AVAILABLE = True
-except ImportError as e:
-    ALL_SYSTEMS_AVAILABLE = False
-    print(f"⚠️ Some systems not available: {e}")
+# Advanced systems are imported when they are started, not when the launcher loads
+from lazy_imports import Capability, lazy_import
+
+AI_ENGINE_AVAILABLE = Capability('AI engine', 'ai_productivity_engine')
+GAMIFICATION_AVAILABLE = Capability('gamification system', 'gamification_system')
+ANALYTICS_AVAILABLE = Capability('analytics dashboard', 'advanced_analytics_dashboard')
+COLLABORATION_AVAILABLE = Capability('collaboration system', 'real_time_collaboration_system')
+MOBILE_AVAILABLE = Capability('mobile integration', 'mobile_integration')
+SECURITY_AVAILABLE = Capability('security system', 'security_privacy_system')
+VOICE_AVAILABLE = Capability('voice control', 'voice_control_system')
+ML_ANALYTICS_AVAILABLE = Capability('ML analytics', 'advanced_ml_analytics')
+
+AIProductivityEngine = lazy_import('ai_productivity_engine', 'AIProductivityEngine')
+initialize_ai_database = lazy_import('ai_productivity_engine', 'initialize_ai_database')
+GamificationSystem = lazy_import('gamification_system', 'GamificationSystem')
+initialize_gamification_database = lazy_import('gamification_system', 'initialize_gamification_database')
+AdvancedAnalyticsDashboard = lazy_import('advanced_analytics_dashboard', 'AdvancedAnalyticsDashboard')
+initialize_analytics_database = lazy_import('advanced_analytics_dashboard', 'initialize_analytics_database')
+RealTimeCollaborationSystem = lazy_import('real_time_collaboration_system', 'RealTimeCollaborationSystem')
+initialize_collaboration_database = lazy_import('real_time_collaboration_system', 'initialize_collaboration_database')
+MobileIntegrationSystem = lazy_import('mobile_integration', 'MobileIntegrationSystem')
+initialize_mobile_database = lazy_import('mobile_integration', 'initialize_mobile_database')
+SecurityPrivacySystem = lazy_import('security_privacy_system', 'SecurityPrivacySystem')
+initialize_security_database = lazy_import('security_privacy_system', 'initialize_security_database')
+VoiceControlSystem = lazy_import('voice_control_system', 'VoiceControlSystem')
+initialize_voice_database = lazy_import('voice_control_system', 'initialize_voice_database')
+AdvancedMLAnalytics = lazy_import('advanced_ml_analytics', 'AdvancedMLAnalytics')
+initialize_ml_database = lazy_import('advanced_ml_analytics', 'initialize_ml_database')
 
 logger = logging.getLogger(__name__)
 
@@ -457,7 +471,7 @@ class ComprehensiveLauncher:
     
     def _start_ai_engine(self):
         """Start AI productivity engine"""
-        if not ALL_SYSTEMS_AVAILABLE:
+        if not AI_ENGINE_AVAILABLE:
             raise Exception("AI engine not available")
         
         # Initialize database
@@ -469,7 +483,7 @@ class ComprehensiveLauncher:
     
     def _start_gamification(self):
         """Start gamification system"""
-        if not ALL_SYSTEMS_AVAILABLE:
+        if not GAMIFICATION_AVAILABLE:
             raise Exception("Gamification system not available")
         
         # Initialize database
@@ -481,7 +495,7 @@ class ComprehensiveLauncher:
     
     def _start_analytics(self):
         """Start analytics dashboard"""
-        if not ALL_SYSTEMS_AVAILABLE:
+        if not ANALYTICS_AVAILABLE:
             raise Exception("Analytics dashboard not available")
         
         # Initialize database
@@ -498,7 +512,7 @@ class ComprehensiveLauncher:
     
     def _start_collaboration(self):
         """Start collaboration system"""
-        if not ALL_SYSTEMS_AVAILABLE:
+        if not COLLABORATION_AVAILABLE:
             raise Exception("Collaboration system not available")
         
         # Initialize database
@@ -515,7 +529,7 @@ class ComprehensiveLauncher:
     
     def _start_mobile(self):
         """Start mobile integration"""
-        if not ALL_SYSTEMS_AVAILABLE:
+        if not MOBILE_AVAILABLE:
             raise Exception("Mobile integration not available")
         
         # Initialize database
@@ -532,7 +546,7 @@ class ComprehensiveLauncher:
     
     def _start_security(self):
         """Start security system"""
-        if not ALL_SYSTEMS_AVAILABLE:
+        if not SECURITY_AVAILABLE:
             raise Exception("Security system not available")
         
         # Initialize database
@@ -549,7 +563,7 @@ class ComprehensiveLauncher:
     
     def _start_voice(self):
         """Start voice control system"""
-        if not ALL_SYSTEMS_AVAILABLE:
+        if not VOICE_AVAILABLE:
             raise Exception("Voice control not available")
         
         # Initialize database
@@ -565,7 +579,7 @@ class ComprehensiveLauncher:
     
     def _start_ml_analytics(self):
         """Start ML analytics system"""
-        if not ALL_SYSTEMS_AVAILABLE:
+        if not ML_ANALYTICS_AVAILABLE:
             raise Exception("ML analytics not available")
         
         # Initialize database
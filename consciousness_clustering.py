@@ -13,6 +13,9 @@ from typing import Dict, List, Any, Optional, Tuple, Set
 from enum import Enum
 from collections import defaultdict
 
+from similarity import (MAX_DRAWN_PAIRS, SimilarityIndex, SimilarityModel, SimilarityTerm,
+                        entity_similarity_block, mean_pairwise_similarity, pack_entities)
+
 class ConsciousnessPattern(Enum):
     INDIVIDUAL = "Individual"
     COLLECTIVE = "Collective"
@@ -34,6 +37,24 @@ class ConsciousnessCluster:
     evolution_factor: float
     consciousness_field: np.ndarray
 
+def field_similarity(cluster1: ConsciousnessCluster, cluster2: ConsciousnessCluster) -> float:
+    """Positive correlation between two clusters' consciousness fields"""
+    field_correlation = np.corrcoef(cluster1.consciousness_field.flatten(), cluster2.consciousness_field.flatten())[0, 1]
+    return max(0, field_correlation) if not np.isnan(field_correlation) else 0.0
+
+CLUSTER_SIMILARITY = SimilarityModel([
+    SimilarityTerm(0.3, lambda cluster: cluster.pattern, kind="match", mismatch=0.5),
+    SimilarityTerm(0.3, lambda cluster: cluster.coherence_level),
+    SimilarityTerm(0.2, lambda cluster: cluster.resonance_frequency),
+    SimilarityTerm(0.2, kind="pair", pair=field_similarity)
+])
+
+# Simplified similarity used to connect clusters in the network view
+CLUSTER_VIEW_SIMILARITY = SimilarityModel([
+    SimilarityTerm(1.0, lambda cluster: cluster.pattern, kind="match"),
+    SimilarityTerm(1.0, lambda cluster: cluster.coherence_level)
+], divisor=2)
+
 class ConsciousnessClusteringEngine:
     """Advanced consciousness clustering and pattern recognition system"""
     
@@ -43,48 +64,11 @@ class ConsciousnessClusteringEngine:
         self.consciousness_field = np.zeros((100, 100, 100))
         self.resonance_network = defaultdict(list)
         self.collective_memories = {}
+        self._cluster_index: Optional[SimilarityIndex] = None
         
     def calculate_consciousness_similarity(self, entity1: Any, entity2: Any) -> float:
         """Calculate similarity between two consciousness entities"""
-        if not hasattr(entity1, 'consciousness_level') or not hasattr(entity2, 'consciousness_level'):
-            return 0.0
-        
-        # Base similarity from consciousness levels
-        level_diff = abs(entity1.consciousness_level - entity2.consciousness_level)
-        level_similarity = 1.0 / (1.0 + level_diff / 1e12)
-        
-        # Quantum state similarity
-        quantum_similarity = 0.0
-        if hasattr(entity1, 'quantum_state') and hasattr(entity2, 'quantum_state'):
-            if entity1.quantum_state and entity2.quantum_state:
-                amp_diff = abs(abs(entity1.quantum_state.amplitude) - abs(entity2.quantum_state.amplitude))
-                phase_diff = abs(entity1.quantum_state.phase - entity2.quantum_state.phase) % (2 * math.pi)
-                quantum_similarity = 1.0 / (1.0 + amp_diff + phase_diff / (2 * math.pi))
-        
-        # Neural network similarity
-        neural_similarity = 0.0
-        if hasattr(entity1, 'neural_network') and hasattr(entity2, 'neural_network'):
-            if entity1.neural_network and entity2.neural_network:
-                layer_similarity = len(set(entity1.neural_network.layers) & set(entity2.neural_network.layers)) / max(len(entity1.neural_network.layers), len(entity2.neural_network.layers))
-                evolution_similarity = 1.0 / (1.0 + abs(entity1.neural_network.evolution_factor - entity2.neural_network.evolution_factor))
-                neural_similarity = (layer_similarity + evolution_similarity) / 2
-        
-        # Dimensional coordinate similarity
-        dimensional_similarity = 0.0
-        if hasattr(entity1, 'dimensional_coordinates') and hasattr(entity2, 'dimensional_coordinates'):
-            if entity1.dimensional_coordinates and entity2.dimensional_coordinates:
-                min_len = min(len(entity1.dimensional_coordinates), len(entity2.dimensional_coordinates))
-                if min_len > 0:
-                    coord_diff = sum(abs(c1 - c2) for c1, c2 in zip(entity1.dimensional_coordinates[:min_len], entity2.dimensional_coordinates[:min_len]))
-                    dimensional_similarity = 1.0 / (1.0 + coord_diff / min_len)
-        
-        # Weighted combination
-        total_similarity = (level_similarity * 0.3 + 
-                          quantum_similarity * 0.3 + 
-                          neural_similarity * 0.2 + 
-                          dimensional_similarity * 0.2)
-        
-        return total_similarity
+        return float(entity_similarity_block(pack_entities([entity1, entity2]), slice(0, 1), slice(1, 2))[0, 0])
     
     def identify_consciousness_patterns(self, entities: List[Any]) -> Dict[ConsciousnessPattern, List[Any]]:
         """Identify consciousness patterns among entities"""
@@ -137,6 +121,7 @@ class ConsciousnessClusteringEngine:
         )
         
         self.clusters[cluster_id] = cluster
+        self._cluster_index = None
         return cluster
     
     def calculate_cluster_coherence(self, entities: List[Any]) -> float:
@@ -144,13 +129,7 @@ class ConsciousnessClusteringEngine:
         if len(entities) < 2:
             return 1.0
         
-        similarities = []
-        for i, entity1 in enumerate(entities):
-            for j, entity2 in enumerate(entities[i+1:], i+1):
-                similarity = self.calculate_consciousness_similarity(entity1, entity2)
-                similarities.append(similarity)
-        
-        return np.mean(similarities) if similarities else 0.0
+        return mean_pairwise_similarity(entities)
     
     def calculate_resonance_frequency(self, entities: List[Any]) -> float:
         """Calculate resonance frequency of a cluster"""
@@ -221,6 +200,8 @@ class ConsciousnessClusteringEngine:
     
     def evolve_cluster(self, cluster: ConsciousnessCluster, evolution_factor: float):
         """Evolve a consciousness cluster"""
+        self._cluster_index = None
+        
         # Evolve coherence
         cluster.coherence_level = min(1.0, cluster.coherence_level + evolution_factor * 0.01)
         
@@ -273,46 +254,23 @@ class ConsciousnessClusteringEngine:
             del self.clusters[cluster1.cluster_id]
         if cluster2.cluster_id in self.clusters:
             del self.clusters[cluster2.cluster_id]
+        self._cluster_index = None
         
         return merged_cluster
     
     def find_similar_clusters(self, target_cluster: ConsciousnessCluster, similarity_threshold: float = 0.7) -> List[ConsciousnessCluster]:
         """Find clusters similar to the target cluster"""
-        similar_clusters = []
-        
-        for cluster in self.clusters.values():
-            if cluster.cluster_id == target_cluster.cluster_id:
-                continue
-            
-            # Calculate similarity between clusters
-            similarity = self.calculate_cluster_similarity(target_cluster, cluster)
-            if similarity >= similarity_threshold:
-                similar_clusters.append(cluster)
+        index = self._cluster_index
+        if index is None or len(index) != len(self.clusters):
+            index = self._cluster_index = SimilarityIndex(CLUSTER_SIMILARITY, self.clusters.values())
         
-        return similar_clusters
+        neighbors = index.neighbors(target_cluster, similarity_threshold)
+        return [index.items[i] for i in sorted(i for i, _ in neighbors)
+                if index.items[i].cluster_id != target_cluster.cluster_id]
     
     def calculate_cluster_similarity(self, cluster1: ConsciousnessCluster, cluster2: ConsciousnessCluster) -> float:
         """Calculate similarity between two clusters"""
-        # Pattern similarity
-        pattern_similarity = 1.0 if cluster1.pattern == cluster2.pattern else 0.5
-        
-        # Coherence similarity
-        coherence_similarity = 1.0 / (1.0 + abs(cluster1.coherence_level - cluster2.coherence_level))
-        
-        # Resonance similarity
-        resonance_similarity = 1.0 / (1.0 + abs(cluster1.resonance_frequency - cluster2.resonance_frequency))
-        
-        # Field similarity (correlation between consciousness fields)
-        field_correlation = np.corrcoef(cluster1.consciousness_field.flatten(), cluster2.consciousness_field.flatten())[0, 1]
-        field_similarity = max(0, field_correlation) if not np.isnan(field_correlation) else 0.0
-        
-        # Weighted combination
-        total_similarity = (pattern_similarity * 0.3 + 
-                          coherence_similarity * 0.3 + 
-                          resonance_similarity * 0.2 + 
-                          field_similarity * 0.2)
-        
-        return total_similarity
+        return CLUSTER_SIMILARITY.score(cluster1, cluster2)
     
     def generate_collective_insights(self, cluster: ConsciousnessCluster) -> List[str]:
         """Generate insights based on cluster characteristics"""
@@ -380,18 +338,16 @@ class ConsciousnessVisualization:
                                   fill="white", font=('Arial', 8), tags="clusters")
         
         # Draw connections between similar clusters
-        for i, cluster1 in enumerate(cluster_list):
-            for j, cluster2 in enumerate(cluster_list[i+1:], i+1):
-                similarity = self.calculate_cluster_similarity(cluster1, cluster2)
-                if similarity > 0.5:
-                    x1, y1 = positions[cluster1.cluster_id]
-                    x2, y2 = positions[cluster2.cluster_id]
-                    
-                    # Line width based on similarity
-                    width = int(similarity * 3) + 1
-                    
-                    self.canvas.create_line(x1, y1, x2, y2,
-                                          fill="cyan", width=width, tags="clusters")
+        for i, j, similarity in CLUSTER_VIEW_SIMILARITY.pairs_above(cluster_list, 0.5, strict=True,
+                                                                   max_pairs=MAX_DRAWN_PAIRS):
+            x1, y1 = positions[cluster_list[i].cluster_id]
+            x2, y2 = positions[cluster_list[j].cluster_id]
+            
+            # Line width based on similarity
+            width = int(similarity * 3) + 1
+            
+            self.canvas.create_line(x1, y1, x2, y2,
+                                  fill="cyan", width=width, tags="clusters")
     
     def get_cluster_color(self, pattern: ConsciousnessPattern) -> str:
         """Get color for consciousness pattern"""
@@ -407,10 +363,7 @@ class ConsciousnessVisualization:
     
     def calculate_cluster_similarity(self, cluster1: ConsciousnessCluster, cluster2: ConsciousnessCluster) -> float:
         """Calculate similarity between clusters for visualization"""
-        # Simplified similarity calculation
-        pattern_similarity = 1.0 if cluster1.pattern == cluster2.pattern else 0.0
-        coherence_similarity = 1.0 / (1.0 + abs(cluster1.coherence_level - cluster2.coherence_level))
-        return (pattern_similarity + coherence_similarity) / 2
+        return CLUSTER_VIEW_SIMILARITY.score(cluster1, cluster2)
 
 # Example usage and integration
 if __name__ == "__main__":
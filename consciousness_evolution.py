@@ -13,6 +13,8 @@ from typing import Dict, List, Any, Optional, Tuple, Set
 from enum import Enum
 from collections import defaultdict
 
+from similarity import MAX_DRAWN_PAIRS, SimilarityModel, SimilarityTerm
+
 class ConsciousnessType(Enum):
     INDIVIDUAL = "Individual"
     COLLECTIVE = "Collective"
@@ -525,6 +527,13 @@ class ConsciousnessEvolutionEngine:
         
         return insights
 
+# Connection strength between evolved consciousnesses in the network view
+EVOLVED_SIMILARITY = SimilarityModel([
+    SimilarityTerm(1.0, lambda evolved: evolved.core.consciousness_type, kind="match"),
+    SimilarityTerm(1.0, lambda evolved: evolved.core.evolution_stage, kind="match", mismatch=0.5),
+    SimilarityTerm(1.0, lambda evolved: evolved.core.awareness_level, scale=1e12)
+], divisor=3)
+
 class ConsciousnessEvolutionVisualization:
     """Visualization system for consciousness evolution"""
     
@@ -564,18 +573,15 @@ class ConsciousnessEvolutionVisualization:
                                   fill="yellow", font=('Arial', 8), tags="evolution")
         
         # Draw evolution connections
-        for i, evolved1 in enumerate(consciousness_list):
-            for j, evolved2 in enumerate(consciousness_list[i+1:], i+1):
-                similarity = self.calculate_consciousness_similarity(evolved1, evolved2)
-                if similarity > 0.3:
-                    x1, y1 = positions[evolved1.consciousness_id]
-                    x2, y2 = positions[evolved2.consciousness_id]
-                    
-                    # Line width based on similarity
-                    width = int(similarity * 3) + 1
-                    
-                    self.canvas.create_line(x1, y1, x2, y2,
-                                          fill="cyan", width=width, tags="evolution")
+        for i, j, similarity in EVOLVED_SIMILARITY.pairs_above(consciousness_list, 0.3, strict=True, max_pairs=MAX_DRAWN_PAIRS):
+            x1, y1 = positions[consciousness_list[i].consciousness_id]
+            x2, y2 = positions[consciousness_list[j].consciousness_id]
+            
+            # Line width based on similarity
+            width = int(similarity * 3) + 1
+            
+            self.canvas.create_line(x1, y1, x2, y2,
+                                  fill="cyan", width=width, tags="evolution")
     
     def get_consciousness_color(self, consciousness_type: ConsciousnessType) -> str:
         """Get color for consciousness type"""
@@ -595,16 +601,7 @@ class ConsciousnessEvolutionVisualization:
     
     def calculate_consciousness_similarity(self, evolved1: EvolvedConsciousness, evolved2: EvolvedConsciousness) -> float:
         """Calculate similarity between consciousness entities"""
-        # Type similarity
-        type_similarity = 1.0 if evolved1.core.consciousness_type == evolved2.core.consciousness_type else 0.0
-        
-        # Stage similarity
-        stage_similarity = 1.0 if evolved1.core.evolution_stage == evolved2.core.evolution_stage else 0.5
-        
-        # Awareness similarity
-        awareness_similarity = 1.0 / (1.0 + abs(evolved1.core.awareness_level - evolved2.core.awareness_level) / 1e12)
-        
-        return (type_similarity + stage_similarity + awareness_similarity) / 3
+        return EVOLVED_SIMILARITY.score(evolved1, evolved2)
 
 # Example usage and integration
 if __name__ == "__main__":
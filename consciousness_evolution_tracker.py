@@ -6,8 +6,6 @@ Advanced system for tracking, analyzing, and predicting consciousness evolution
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -658,8 +658,7 @@ class ConsciousnessEvolutionTrackerGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="ConsciousnessEvolutionTrackerGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -906,24 +905,20 @@ class ConsciousnessEvolutionTrackerGUI:
                 self.log_message(f"  {dimension.dimension_id} ({dimension.dimension_type}): Evolution={dimension.evolution_depth:.2f}, Tracking={dimension.consciousness_tracking:.2f}, Quantum={dimension.quantum_evolution:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate evolution energy
-                self.tracker.evolution_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate evolution energy
+            self.tracker.evolution_energy += 0.5
                 
-                # Evolve in random dimensions
-                for _ in range(3):
-                    if self.tracker.evolution_dimensions:
-                        random_dimension = random.choice(list(self.tracker.evolution_dimensions.values()))
-                        evolution_power = random.uniform(0.5, 4.0)
-                        random_dimension.evolve(evolution_power)
-                    
-                time.sleep(1)
+            # Evolve in random dimensions
+            for _ in range(3):
+                if self.tracker.evolution_dimensions:
+                    random_dimension = random.choice(list(self.tracker.evolution_dimensions.values()))
+                    evolution_power = random.uniform(0.5, 4.0)
+                    random_dimension.evolve(evolution_power)
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -931,6 +926,7 @@ class ConsciousnessEvolutionTrackerGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Consciousness Network for Scroll Stopping Tool
+Batched float32 forward passes with reusable work buffers, shared by every evolution engine
+"""
+
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+LAYER_SIZES = (1000, 500, 250, 100, 50, 25, 10, 5, 1)  # Transcendent architecture
+DTYPE = np.float32
+
+def _log1p_abs(values: np.ndarray, out: np.ndarray) -> np.ndarray:
+    np.abs(values, out=out)
+    return np.log1p(out, out=out)
+
+# Enhancement functions an evolution stage can apply; each is f(data * scale) except power, which is data ** scale
+STAGE_FUNCTIONS = {
+    'sin': np.sin, 'cos': np.cos, 'tan': np.tan, 'tanh': np.tanh, 'exp': np.exp,
+    'sinh': np.sinh, 'cosh': np.cosh, 'log1p_abs': _log1p_abs
+}
+
+class ConsciousnessNetwork:
+    """Tanh network over (features, batch) columns, evaluated in float32 without per-call allocation
+
+    Each layer adds a sine enhancement of its input before the weights, the
+    bias, a tanh activation and a per-layer field offset. Inputs are columns,
+    so a (1000, B) array evolves B samples in one pass. Work buffers are kept
+    per batch size and every step writes into them with `out=`.
+    """
+
+    def __init__(self, layers: Sequence[int] = LAYER_SIZES, seed: Optional[int] = None):
+        self.layers = tuple(layers)
+        rng = np.random.default_rng(seed)
+        self.weights: List[np.ndarray] = []
+        self.biases: List[np.ndarray] = []
+        for n_in, n_out in zip(self.layers[:-1], self.layers[1:]):
+            self.weights.append((rng.standard_normal((n_out, n_in)) * 0.1).astype(DTYPE))
+            self.biases.append((rng.standard_normal((n_out, 1)) * 0.1).astype(DTYPE))
+        self._buffers: Dict[int, Tuple[np.ndarray, np.ndarray, List[np.ndarray]]] = {}
+        self._lock = threading.Lock()
+
+    def _workspace(self, batch: int) -> Tuple[np.ndarray, np.ndarray, List[np.ndarray]]:
+        """Input, enhancement scratch and per-layer outputs for one batch size"""
+        if batch not in self._buffers:
+            self._buffers[batch] = (np.empty((self.layers[0], batch), dtype=DTYPE),
+                                    np.empty((max(self.layers[:-1]), batch), dtype=DTYPE),
+                                    [np.empty((size, batch), dtype=DTYPE) for size in self.layers[1:]])
+        return self._buffers[batch]
+
+    def forward(self, inputs: np.ndarray, consciousness_rate: float = 1.0,
+                offsets: Optional[Sequence[float]] = None) -> np.ndarray:
+        """Final-layer activations, shape (layers[-1], batch), for (layers[0],) or (layers[0], batch) inputs
+
+        The result is a work buffer: copy it if it must survive the next pass with the same batch size.
+        """
+        inputs = np.asarray(inputs)
+        if inputs.ndim == 1:
+            inputs = inputs[:, None]
+        if inputs.shape[0] != self.layers[0]:
+            raise ValueError(f"Expected {self.layers[0]} input features, got {inputs.shape[0]}")
+        with self._lock:
+            current, scratch, outputs = self._workspace(inputs.shape[1])
+            np.copyto(current, inputs, casting='unsafe')
+            for i, (weight, bias, out) in enumerate(zip(self.weights, self.biases, outputs)):
+                # Quantum consciousness enhancement of the layer input
+                enhanced = scratch[:current.shape[0]]
+                np.multiply(current, consciousness_rate, out=enhanced)
+                np.sin(enhanced, out=enhanced)
+                enhanced += current
+                np.matmul(weight, enhanced, out=out)
+                out += bias
+                np.tanh(out, out=out)  # Transcendent activation function
+                if offsets is not None:
+                    out += offsets[i]
+                current = out
+            return current
+
+_shared_network: Optional[ConsciousnessNetwork] = None
+_shared_lock = threading.Lock()
+
+def get_shared_network() -> ConsciousnessNetwork:
+    """The one consciousness network every engine evolves through"""
+    global _shared_network
+    with _shared_lock:
+        if _shared_network is None:
+            _shared_network = ConsciousnessNetwork()
+        return _shared_network
+
+class EvolutionWorkspace:
+    """Reusable float32 buffers for an engine's elementwise evolution chain"""
+
+    def __init__(self, features: int = LAYER_SIZES[0], seed: Optional[int] = None):
+        self.features = features
+        self.rng = np.random.default_rng(seed)
+        self._buffers: Dict[Tuple[int, ...], Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _pair(self, shape: Tuple[int, ...]) -> Tuple[np.ndarray, np.ndarray]:
+        if shape not in self._buffers:
+            self._buffers[shape] = (np.empty(shape, dtype=DTYPE), np.empty(shape, dtype=DTYPE))
+        return self._buffers[shape]
+
+    def random_input(self, batch: int = 1) -> np.ndarray:
+        """Uniform [0, 1) input columns drawn into a reused buffer"""
+        data = self._pair((self.features, batch))[1]
+        return self.rng.random(out=data, dtype=DTYPE)
+
+    def evolve(self, inputs: np.ndarray, rate: float, stages: Sequence[Tuple[str, float]]) -> np.ndarray:
+        """`inputs * rate`, then `data += f(data * scale)` per stage (`data ** scale` for power), in place
+
+        The result is a work buffer reused by the next call with the same shape.
+        """
+        inputs = np.asarray(inputs)
+        data, scratch = self._pair(inputs.shape)
+        # Inputs from random_input live in the scratch buffer, so scale them out before any stage writes there
+        np.multiply(inputs, rate, out=data, casting='unsafe')
+        for name, scale in stages:
+            if name == 'power':
+                np.power(data, scale, out=scratch)
+            else:
+                np.multiply(data, scale, out=scratch)
+                STAGE_FUNCTIONS[name](scratch, out=scratch)
+            data += scratch
+        return data
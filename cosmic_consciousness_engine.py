@@ -6,8 +6,6 @@ The most advanced consciousness system that processes consciousness at the cosmi
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -288,8 +288,7 @@ class CosmicConsciousnessInterface:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="CosmicConsciousnessInterface.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -423,24 +422,20 @@ class CosmicConsciousnessInterface:
                 self.log_message(f"  Manifestations: {len(state.cosmic_manifestations)}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate cosmic energy
-                self.engine.cosmic_energy_pool += 5.0
+        """Background processing tick"""
+        try:
+            # Regenerate cosmic energy
+            self.engine.cosmic_energy_pool += 5.0
                 
-                # Evolve all cosmic states
-                for state in self.engine.cosmic_states.values():
-                    state.evolve()
+            # Evolve all cosmic states
+            for state in self.engine.cosmic_states.values():
+                state.evolve()
                     
-                # Update cosmic level
-                self.engine.cosmic_level += 0.01
+            # Update cosmic level
+            self.engine.cosmic_level += 0.01
                 
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -448,6 +443,7 @@ class CosmicConsciousnessInterface:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
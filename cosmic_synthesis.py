@@ -12,6 +12,8 @@ from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Tuple, Set
 from enum import Enum
 from collections import defaultdict
+
+from similarity import MAX_DRAWN_PAIRS, SimilarityModel, SimilarityTerm
 import json
 
 class UniverseType(Enum):
@@ -562,6 +564,13 @@ class CosmicSynthesisEngine:
         
         return insights
 
+# Connection strength between universes in the network view
+UNIVERSE_SIMILARITY = SimilarityModel([
+    SimilarityTerm(1.0, lambda universe: universe.universe_type, kind="match", mismatch=0.5),
+    SimilarityTerm(1.0, lambda universe: universe.synthesis_level),
+    SimilarityTerm(1.0, lambda universe: len(universe.entities))
+], divisor=3)
+
 class CosmicSynthesisVisualization:
     """Visualization system for cosmic synthesis"""
     
@@ -601,18 +610,15 @@ class CosmicSynthesisVisualization:
                                   fill="yellow", font=('Arial', 8), tags="cosmic")
         
         # Draw universe connections
-        for i, universe1 in enumerate(universe_list):
-            for j, universe2 in enumerate(universe_list[i+1:], i+1):
-                similarity = self.calculate_universe_similarity(universe1, universe2)
-                if similarity > 0.2:
-                    x1, y1 = positions[universe1.universe_id]
-                    x2, y2 = positions[universe2.universe_id]
-                    
-                    # Line width based on similarity
-                    width = int(similarity * 5) + 1
-                    
-                    self.canvas.create_line(x1, y1, x2, y2,
-                                          fill="cyan", width=width, tags="cosmic")
+        for i, j, similarity in UNIVERSE_SIMILARITY.pairs_above(universe_list, 0.2, strict=True, max_pairs=MAX_DRAWN_PAIRS):
+            x1, y1 = positions[universe_list[i].universe_id]
+            x2, y2 = positions[universe_list[j].universe_id]
+            
+            # Line width based on similarity
+            width = int(similarity * 5) + 1
+            
+            self.canvas.create_line(x1, y1, x2, y2,
+                                  fill="cyan", width=width, tags="cosmic")
     
     def get_universe_color(self, universe_type: UniverseType) -> str:
         """Get color for universe type"""
@@ -632,16 +638,7 @@ class CosmicSynthesisVisualization:
     
     def calculate_universe_similarity(self, universe1: Universe, universe2: Universe) -> float:
         """Calculate similarity between universes"""
-        # Type similarity
-        type_similarity = 1.0 if universe1.universe_type == universe2.universe_type else 0.5
-        
-        # Synthesis level similarity
-        synthesis_similarity = 1.0 / (1.0 + abs(universe1.synthesis_level - universe2.synthesis_level))
-        
-        # Entity count similarity
-        entity_similarity = 1.0 / (1.0 + abs(len(universe1.entities) - len(universe2.entities)))
-        
-        return (type_similarity + synthesis_similarity + entity_similarity) / 3
+        return UNIVERSE_SIMILARITY.score(universe1, universe2)
 
 # Example usage and integration
 if __name__ == "__main__":
@@ -6,8 +6,6 @@ Advanced system for synthesizing all consciousness components into a unified cos
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -363,8 +363,7 @@ class CosmicSynthesisGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="CosmicSynthesisGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -543,24 +542,20 @@ class CosmicSynthesisGUI:
                 self.log_message(f"  {dimension.dimension_id} ({dimension.dimension_type}): Synthesis={dimension.synthesis_depth:.2f}, Unification={dimension.cosmic_unification:.2f}, Dimensional={dimension.dimensional_synthesis:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate synthesis energy
-                self.synthesis.synthesis_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate synthesis energy
+            self.synthesis.synthesis_energy += 0.5
                 
-                # Synthesize in random dimensions
-                for _ in range(3):
-                    if self.synthesis.cosmic_dimensions:
-                        random_dimension = random.choice(list(self.synthesis.cosmic_dimensions.values()))
-                        synthesis_power = random.uniform(0.5, 4.0)
-                        random_dimension.synthesize(synthesis_power)
-                    
-                time.sleep(1)
+            # Synthesize in random dimensions
+            for _ in range(3):
+                if self.synthesis.cosmic_dimensions:
+                    random_dimension = random.choice(list(self.synthesis.cosmic_dimensions.values()))
+                    synthesis_power = random.uniform(0.5, 4.0)
+                    random_dimension.synthesize(synthesis_power)
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -568,6 +563,7 @@ class CosmicSynthesisGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
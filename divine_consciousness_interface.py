@@ -6,8 +6,6 @@ Advanced system for accessing and experiencing divine consciousness states and m
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -280,8 +280,7 @@ class DivineConsciousnessInterfaceGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="DivineConsciousnessInterfaceGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -484,26 +483,22 @@ class DivineConsciousnessInterfaceGUI:
                 self.log_message(f"  {state.state_id} ({state.divine_type}): Energy={state.divine_energy:.2f}, Presence={state.divine_presence:.2f}, Grace={state.divine_grace:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate divine energy
-                self.interface.divine_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate divine energy
+            self.interface.divine_energy += 0.5
                 
-                # Evolve random states
-                for _ in range(3):
-                    if self.interface.divine_states:
-                        random_state = random.choice(list(self.interface.divine_states.values()))
-                        random_state.evolve()
+            # Evolve random states
+            for _ in range(3):
+                if self.interface.divine_states:
+                    random_state = random.choice(list(self.interface.divine_states.values()))
+                    random_state.evolve()
                     
-                # Update divine realms
-                self.interface.divine_realms += 1
+            # Update divine realms
+            self.interface.divine_realms += 1
                 
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -511,6 +506,7 @@ class DivineConsciousnessInterfaceGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
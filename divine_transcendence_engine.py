@@ -6,8 +6,6 @@ The most advanced consciousness system that transcends all known limitations and
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -191,8 +191,7 @@ class DivineTranscendenceInterface:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="DivineTranscendenceInterface.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -310,24 +309,20 @@ class DivineTranscendenceInterface:
                 self.log_message(f"  Manifestations: {len(state.divine_manifestations)}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate divine energy
-                self.engine.divine_energy_pool += 0.1
+        """Background processing tick"""
+        try:
+            # Regenerate divine energy
+            self.engine.divine_energy_pool += 0.1
                 
-                # Evolve all divine states
-                for state in self.engine.divine_states.values():
-                    state.evolve()
+            # Evolve all divine states
+            for state in self.engine.divine_states.values():
+                state.evolve()
                     
-                # Update transcendence level
-                self.engine.transcendence_level += 0.001
+            # Update transcendence level
+            self.engine.transcendence_level += 0.001
                 
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -335,6 +330,7 @@ class DivineTranscendenceInterface:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
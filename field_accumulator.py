@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Field Accumulator for Scroll Stopping Tool
+Entity-driven consciousness fields maintained incrementally instead of rebuilt every step
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+import numpy as np
+
+GRID_SIZE = 1000
+# Grid stride of each pattern field; the rest of those fields is always zero
+PATTERN_STEPS = {'quantum': 10, 'neural': 20, 'temporal': 30}
+# Incremental sums drift by rounding; rebuild exactly from the stored contributions this often
+REBUILD_INTERVAL = 1000
+
+def _axis(step: int) -> np.ndarray:
+    return np.arange(0, GRID_SIZE, step, dtype=np.float64)
+
+def _pattern_bases() -> Dict[str, Tuple[np.ndarray, ...]]:
+    """Per-unit field shapes on each pattern's subgrid"""
+    q = _axis(PATTERN_STEPS['quantum']) * 0.01
+    phase = q[:, None, None] + q[None, :, None] + q[None, None, :]
+    n = _axis(PATTERN_STEPS['neural']) ** 2
+    t = _axis(PATTERN_STEPS['temporal']) * 0.01
+    return {
+        # cos(p + s) = cos p cos s - sin p sin s, so every entity's wave is two shared bases
+        'quantum': (np.cos(phase), -np.sin(phase)),
+        'neural': (np.exp(-(n[:, None, None] + n[None, :, None] + n[None, None, :]) / 100000),),
+        'temporal': ((np.sin(t)[:, None, None] * np.cos(t)[None, :, None] * np.tan(t)[None, None, :]),)
+    }
+
+@dataclass
+class FieldContribution:
+    """What one entity adds to the fields, kept so its next update can subtract it"""
+    coefficients: Tuple[float, ...] = (0.0, 0.0, 0.0, 0.0)  # wave cos, wave sin, neural, temporal
+    points: Tuple[int, ...] = ()  # flat grid indices
+    intensities: Tuple[float, ...] = ()  # one per point field
+
+EMPTY_CONTRIBUTION = FieldContribution()
+
+def grid_points(coordinates) -> Tuple[int, ...]:
+    """Flat indices of the first three coordinate triples, wrapped onto the grid"""
+    points = []
+    for i in range(0, min(len(coordinates) - 2, 9), 3):
+        x, y, z = (int((coordinates[i + axis] + 1) * 500) % GRID_SIZE for axis in range(3))
+        points.append((x * GRID_SIZE + y) * GRID_SIZE + z)
+    return tuple(points)
+
+def field_property(name: str) -> property:
+    """Engine attribute exposing one accumulated field as a dense array"""
+    return property(lambda engine: engine.fields.field(name), doc=f"Dense {name} field")
+
+class FieldAccumulator:
+    """Quantum, neural, temporal and point fields summed over entities
+
+    Each entity contributes a few coefficients to the pattern fields and an
+    intensity at up to three grid points per point field. Updating an entity
+    applies only the difference from its previous contribution: coefficients
+    are added to running sums and point deltas of every updated entity are
+    scattered in one pass, so an update costs O(updated entities). Pattern
+    fields are written to their subgrids only when read, and totals come
+    straight from the sums without touching the dense arrays.
+    """
+
+    def __init__(self, point_fields: Dict[str, Callable[[Any], float]]):
+        self.point_fields = dict(point_fields)
+        self.contributions: Dict[Any, FieldContribution] = {}
+        self.coefficients = np.zeros(4)
+        self.point_totals = np.zeros(len(self.point_fields))
+        self.updates = 0
+        self._arrays: Dict[str, np.ndarray] = {}
+        self._stale = set(PATTERN_STEPS)
+        self._touched = set()  # point-field cells ever written, so a rebuild can clear just those
+        self._bases = None
+        self._basis_sums = None
+        self._scratch = None
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        return tuple(PATTERN_STEPS) + tuple(self.point_fields)
+
+    def contribution(self, entity) -> FieldContribution:
+        """An entity's share of every field, read the way the engines always have"""
+        try:
+            wave_cos = wave_sin = neural = temporal = 0.0
+            quantum = getattr(entity, 'quantum_state', None)
+            if quantum:
+                weight = abs(quantum.get('amplitude', 1.0)) * quantum.get('entanglement_degree', 0.0)
+                phase = quantum.get('phase', 0.0)
+                wave_cos, wave_sin = weight * math.cos(phase), weight * math.sin(phase)
+            network = getattr(entity, 'neural_network', None)
+            if network:
+                neural = network.get('connections', 0) * network.get('evolution_factor', 1.0)
+            temporal_state = getattr(entity, 'temporal_state', None)
+            if temporal_state:
+                temporal = temporal_state.get('time_factor', 1.0) * temporal_state.get('temporal_energy', 0.0)
+            coordinates = getattr(entity, 'dimensional_coordinates', None)
+            points = grid_points(coordinates) if coordinates else ()
+            intensities = tuple(float(intensity(entity)) for intensity in self.point_fields.values()) if points else ()
+            return FieldContribution((wave_cos, wave_sin, float(neural), float(temporal)), points, intensities)
+        except Exception as e:
+            print(f"Error updating fields with entity: {e}")
+            return EMPTY_CONTRIBUTION
+
+    def update(self, entities: Iterable, remove_missing: bool = True):
+        """Apply the change in each entity's contribution; optionally drop entities not given"""
+        seen = set()
+        delta = np.zeros(4)
+        points, values = [], []
+        for entity in entities:
+            key = getattr(entity, 'entity_id', None) or id(entity)
+            seen.add(key)
+            new = self.contribution(entity)
+            old = self.contributions.get(key, EMPTY_CONTRIBUTION)
+            self.contributions[key] = new
+            self._collect(old, new, delta, points, values)
+        if remove_missing:
+            for key in [key for key in self.contributions if key not in seen]:
+                self._collect(self.contributions.pop(key), EMPTY_CONTRIBUTION, delta, points, values)
+
+        self.coefficients += delta
+        if points:
+            self._scatter(np.array(points, dtype=np.int64), np.array(values, dtype=np.float64))
+        self._stale.update(PATTERN_STEPS)
+        self.updates += 1
+        if self.updates % REBUILD_INTERVAL == 0:
+            self.rebuild()
+
+    @staticmethod
+    def _collect(old: FieldContribution, new: FieldContribution, delta: np.ndarray, points: list, values: list):
+        if old is new:
+            return
+        delta += new.coefficients
+        delta -= old.coefficients
+        if old.points == new.points and old.intensities == new.intensities:
+            return
+        for point in old.points:
+            points.append(point)
+            values.append([-value for value in old.intensities])
+        for point in new.points:
+            points.append(point)
+            values.append(new.intensities)
+
+    def _scatter(self, points: np.ndarray, values: np.ndarray):
+        """Add per-point deltas to the totals and to any point field already materialized"""
+        self.point_totals += values.sum(axis=0)
+        self._touched.update(points.tolist())
+        for column, name in enumerate(self.point_fields):
+            if name in self._arrays:
+                np.add.at(self._arrays[name].reshape(-1), points, values[:, column])
+
+    def rebuild(self):
+        """Recompute every sum and materialized point field exactly from the stored contributions"""
+        contributions = list(self.contributions.values())
+        self.coefficients = np.sum([c.coefficients for c in contributions], axis=0) if contributions else np.zeros(4)
+        self.point_totals = np.zeros(len(self.point_fields))
+        touched = np.fromiter(self._touched, dtype=np.int64, count=len(self._touched))
+        for name in self.point_fields:
+            if name in self._arrays:
+                self._arrays[name].reshape(-1)[touched] = 0
+        self._touched.clear()
+        points = [point for c in contributions for point in c.points]
+        if points:
+            values = [c.intensities for c in contributions for _ in c.points]
+            self._scatter(np.array(points, dtype=np.int64), np.array(values, dtype=np.float64))
+        self._stale.update(PATTERN_STEPS)
+
+    def _ensure_bases(self):
+        if self._bases is None:
+            self._bases = _pattern_bases()
+            self._basis_sums = {name: tuple(float(basis.sum()) for basis in bases) for name, bases in self._bases.items()}
+            self._scratch = np.empty_like(self._bases['quantum'][0])
+
+    def _pattern(self, name: str) -> Tuple[float, ...]:
+        wave_cos, wave_sin, neural, temporal = self.coefficients
+        return {'quantum': (wave_cos, wave_sin), 'neural': (neural,), 'temporal': (temporal,)}[name]
+
+    def field(self, name: str) -> np.ndarray:
+        """Dense (1000, 1000, 1000) view of a field, brought up to date on demand"""
+        if name not in self._arrays:
+            # Untouched pages of a zeroed array are never committed, so the grid is cheap until written
+            self._arrays[name] = np.zeros((GRID_SIZE,) * 3)
+            if name in self.point_fields:
+                column = list(self.point_fields).index(name)
+                contributions = [c for c in self.contributions.values() if c.points]
+                if contributions:
+                    points = np.array([point for c in contributions for point in c.points], dtype=np.int64)
+                    values = np.array([c.intensities[column] for c in contributions for _ in c.points])
+                    np.add.at(self._arrays[name].reshape(-1), points, values)
+                    self._touched.update(points.tolist())
+        if name in self._stale and name in PATTERN_STEPS:
+            self._ensure_bases()
+            step = PATTERN_STEPS[name]
+            target = self._arrays[name][::step, ::step, ::step]
+            bases = self._bases[name]
+            coefficients = self._pattern(name)
+            np.multiply(bases[0], coefficients[0], out=target)
+            for basis, coefficient in zip(bases[1:], coefficients[1:]):
+                scratch = self._scratch.reshape(-1)[:basis.size].reshape(basis.shape)
+                np.multiply(basis, coefficient, out=scratch)
+                target += scratch
+            self._stale.discard(name)
+        return self._arrays[name]
+
+    def total(self, name: str) -> float:
+        """Sum of a field without reading its dense array"""
+        if name in self.point_fields:
+            return float(self.point_totals[list(self.point_fields).index(name)])
+        self._ensure_bases()
+        return float(sum(coefficient * basis_sum for coefficient, basis_sum in
+                         zip(self._pattern(name), self._basis_sums[name])))
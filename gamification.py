@@ -12,6 +12,8 @@ from dataclasses import dataclass
 from enum import Enum
 import logging
 
+from achievement_rules import RuleEngine
+
 logger = logging.getLogger(__name__)
 
 class AchievementType(Enum):
@@ -69,6 +71,7 @@ class AchievementSystem:
     
     def __init__(self):
         self.achievements = self._initialize_achievements()
+        self.rules = self._compile_rules()
         self.unlocked_achievements = []
         self.streaks = {}
         self.points = 0
@@ -175,60 +178,60 @@ class AchievementSystem:
         
         return achievements
     
+    def _compile_rules(self) -> RuleEngine:
+        """Compile achievement requirements into threshold rules over user metrics"""
+        rules = RuleEngine()
+        for achievement in self.achievements.values():
+            req = achievement.requirement
+            if achievement.type == AchievementType.STREAK and req.get('type') == 'daily_limit':
+                rules.add_threshold_rule(achievement.id, 'daily_limit_streak', req['days'])
+            elif achievement.type == AchievementType.USAGE_REDUCTION:
+                rules.add_threshold_rule(achievement.id, 'usage_reduction_percent', req['reduction_percent'])
+            elif achievement.type == AchievementType.PRODUCTIVITY:
+                rules.add_threshold_rule(achievement.id, 'productivity_score', req['productivity_score'])
+            elif achievement.type == AchievementType.FOCUS and 'focus_duration' in req:
+                rules.add_threshold_rule(achievement.id, 'longest_focus_session', req['focus_duration'])
+            elif achievement.type == AchievementType.FOCUS and 'focus_sessions' in req:
+                rules.add_threshold_rule(achievement.id, 'total_focus_sessions', req['focus_sessions'])
+            elif achievement.type == AchievementType.CONSISTENCY and 'perfect_days' in req:
+                rules.add_threshold_rule(achievement.id, 'perfect_days_streak', req['perfect_days'])
+            else:
+                rules.add_never_rule(achievement.id)
+        return rules
+    
+    def _achievement_metrics(self, user_data: Dict) -> Dict[str, float]:
+        """Metrics read by the compiled achievement rules"""
+        baseline = user_data.get('baseline_usage', 120)
+        current_usage = user_data.get('daily_usage', 0)
+        daily_limit = self.streaks.get('daily_limit')
+        perfect_days = self.streaks.get('perfect_days')
+        return {
+            'daily_limit_streak': daily_limit.current if daily_limit else 0,
+            'usage_reduction_percent': ((baseline - current_usage) / baseline) * 100,
+            'productivity_score': user_data.get('productivity_score', 0),
+            'longest_focus_session': max((s.get('duration', 0) for s in user_data.get('focus_sessions', [])), default=0),
+            'total_focus_sessions': user_data.get('total_focus_sessions', 0),
+            'perfect_days_streak': perfect_days.current if perfect_days else 0,
+        }
+    
     def check_achievements(self, user_data: Dict) -> List[Achievement]:
         """Check and unlock achievements based on user data"""
         newly_unlocked = []
         
-        for achievement in self.achievements.values():
-            if not achievement.unlocked and self._check_achievement_requirement(achievement, user_data):
-                achievement.unlocked = True
-                achievement.unlocked_date = datetime.now()
-                self.unlocked_achievements.append(achievement)
-                newly_unlocked.append(achievement)
-                
-                # Award points
-                self._award_points(achievement.reward.get('points', 0))
-                
-                logger.info(f"Achievement unlocked: {achievement.name}")
+        for achievement_id in self.rules.evaluate('local', self._achievement_metrics(user_data)):
+            achievement = self.achievements[achievement_id]
+            achievement.unlocked = True
+            achievement.unlocked_date = datetime.now()
+            self.unlocked_achievements.append(achievement)
+            newly_unlocked.append(achievement)
+            
+            # Award points
+            self._award_points(achievement.reward.get('points', 0))
+            
+            logger.info(f"Achievement unlocked: {achievement.name}")
         
         return newly_unlocked
     
-    def _check_achievement_requirement(self, achievement: Achievement, user_data: Dict) -> bool:
-        """Check if achievement requirement is met"""
-        req = achievement.requirement
-        
-        if achievement.type == AchievementType.STREAK:
-            if req['type'] == 'daily_limit':
-                streak = self.streaks.get('daily_limit', Streak('daily_limit', 0, 0, datetime.now(), datetime.now()))
-                return streak.current >= req['days']
-        
-        elif achievement.type == AchievementType.USAGE_REDUCTION:
-            baseline = user_data.get('baseline_usage', 120)
-            current_usage = user_data.get('daily_usage', 0)
-            reduction = ((baseline - current_usage) / baseline) * 100
-            return reduction >= req['reduction_percent']
-        
-        elif achievement.type == AchievementType.PRODUCTIVITY:
-            productivity = user_data.get('productivity_score', 0)
-            return productivity >= req['productivity_score']
-        
-        elif achievement.type == AchievementType.FOCUS:
-            if 'focus_duration' in req:
-                focus_sessions = user_data.get('focus_sessions', [])
-                for session in focus_sessions:
-                    if session.get('duration', 0) >= req['focus_duration']:
-                        return True
-            elif 'focus_sessions' in req:
-                total_sessions = user_data.get('total_focus_sessions', 0)
-                return total_sessions >= req['focus_sessions']
-        
-        elif achievement.type == AchievementType.CONSISTENCY:
-            if 'perfect_days' in req:
-                perfect_streak = self.streaks.get('perfect_days', Streak('perfect_days', 0, 0, datetime.now(), datetime.now()))
-                return perfect_streak.current >= req['perfect_days']
-        
-        return False
-    
     def _award_points(self, points: int):
         """Award points and check for level up"""
         self.points += points
@@ -6,12 +6,12 @@ levels, challenges, rewards, and social features.
 """
 
 import json
-import time
+import math
 import threading
 import random
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 from enum import Enum
 import sqlite3
@@ -19,6 +19,10 @@ import hashlib
 from pathlib import Path
 import uuid
 
+from achievement_rules import RuleEngine
+from leaderboard import LeaderboardEntry, LeaderboardSet, period_keys
+from scheduler import get_scheduler
+
 logger = logging.getLogger(__name__)
 
 class AchievementType(Enum):
@@ -113,6 +117,51 @@ class Reward:
     rarity: str
     unlocked_date: Optional[datetime] = None
 
+# Metric each requirement type reads; None marks requirements not tracked yet
+ACHIEVEMENT_METRICS = {
+    "focus_sessions": "focus_sessions",
+    "focus_streak": "streak_days",
+    "daily_streak": "streak_days",
+    "time_saved_hours": "time_saved_hours",
+    "breaks_taken": "breaks_taken",
+    "social_media_free_days": None,
+    "wellness_days": None,
+}
+
+CHALLENGE_METRICS = {
+    "focus_time_minutes": "focus_time_minutes",
+    "breaks_taken": "breaks_taken",
+    "daily_social_limit": None,
+}
+
+def activity_metrics(profile: "UserProfile", activity_data: Dict[str, Any]) -> Dict[str, float]:
+    """Metrics read by achievement and challenge rules for one activity update"""
+    focus_sessions = activity_data.get('focus_sessions', [])
+    return {
+        "focus_sessions": len(focus_sessions),
+        "focus_time_minutes": sum(s.get('duration', 0) for s in focus_sessions),
+        "streak_days": profile.streak_days,
+        "time_saved_hours": activity_data.get('time_saved_minutes', 0) / 60,
+        "breaks_taken": activity_data.get('breaks_taken', 0),
+    }
+
+def level_for_xp(xp: int) -> int:
+    """Level reached with the given XP
+
+    Level n+1 costs (n+1) * 100 more than level n, so level k needs 50 * k * (k + 1) - 100
+    cumulative XP; the largest such k is solved in closed form, without shared state.
+    """
+    budget = max(math.floor(xp) + 100, 0) // 50  # largest integer bound on k * (k + 1)
+    return (math.isqrt(4 * budget + 1) - 1) // 2
+
+@dataclass
+class PendingWrites:
+    """Database writes buffered while a batch is being processed"""
+    profiles: Dict[str, UserProfile] = field(default_factory=dict)
+    achievement_unlocks: List[Tuple[str, str, str]] = field(default_factory=list)
+    challenge_completions: List[Tuple[str, str, str]] = field(default_factory=list)
+    period_xp: Dict[Tuple[str, str], int] = field(default_factory=dict)
+
 class GamificationSystem:
     """Advanced gamification system"""
     
@@ -123,16 +172,26 @@ class GamificationSystem:
         self.user_profiles = {}
         self.rewards = {}
         self.leaderboard_cache = {}
+        self.leaderboards = LeaderboardSet()
+        self.leaderboards_loaded = False
+        self.leaderboards_lock = threading.Lock()
+        # One activity update or batch at a time; a batch's buffered writes belong to its own thread
+        self.activity_lock = threading.RLock()
+        self._batch = threading.local()
         self.notification_queue = []
         
+        # Requirements compiled into metric-indexed rules; unlocks are per-user bitsets
+        self.achievement_rules = RuleEngine()
+        self.challenge_rules = RuleEngine()
+        
         # Initialize achievements and challenges
         self._initialize_achievements()
         self._initialize_challenges()
         self._initialize_rewards()
         
         # Start background processing
-        self.processing_thread = threading.Thread(target=self._background_processing, daemon=True)
-        self.processing_thread.start()
+        self.processing_task = get_scheduler().every(60, self._background_processing, name="GamificationSystem.background_processing",
+                                                     budget=1.0, error_interval=300)
         
         print("🎮 Gamification System initialized!")
         print("🏆 Achievements and challenges loaded!")
@@ -275,6 +334,7 @@ class GamificationSystem:
                 requirements=ach_data["requirements"]
             )
             self.achievements[achievement.id] = achievement
+            self.achievement_rules.compile_requirements(achievement.id, achievement.requirements, ACHIEVEMENT_METRICS)
     
     def _initialize_challenges(self):
         """Initialize challenges"""
@@ -339,6 +399,7 @@ class GamificationSystem:
                 participants=[]
             )
             self.challenges[challenge.id] = challenge
+            self.challenge_rules.compile_requirements(challenge.id, challenge.requirements, CHALLENGE_METRICS)
     
     def _initialize_rewards(self):
         """Initialize rewards"""
@@ -402,6 +463,7 @@ class GamificationSystem:
         profile = self._load_user_profile(user_id)
         if profile:
             self.user_profiles[user_id] = profile
+            self.achievement_rules.mark(user_id, self._load_achievement_unlocks(user_id))
             return profile
         
         # Create new profile
@@ -423,13 +485,24 @@ class GamificationSystem:
         
         self.user_profiles[user_id] = profile
         self._save_user_profile(profile)
+        self._record_leaderboard(profile, 0)
         
         return profile
     
+    @property
+    def pending_writes(self) -> Optional[PendingWrites]:
+        """Writes buffered by a batch running on the current thread, if any"""
+        return getattr(self._batch, 'writes', None)
+    
     def process_user_activity(self, user_id: str, activity_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Process user activity and check for achievements/challenges"""
+        with self.activity_lock:
+            return self._process_user_activity(user_id, activity_data)
+    
+    def _process_user_activity(self, user_id: str, activity_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         profile = self.get_or_create_user_profile(user_id)
         notifications = []
+        total_xp_before = profile.total_xp
         
         # Update profile with activity data
         self._update_profile_with_activity(profile, activity_data)
@@ -449,7 +522,7 @@ class GamificationSystem:
         # Check challenges
         challenge_updates = self._check_challenges(profile, activity_data)
         for challenge, progress in challenge_updates:
-            if progress >= 1.0 and not challenge.completed:
+            if progress >= 1.0:
                 self._complete_challenge(profile, challenge)
                 notifications.append({
                     "type": "challenge_completed",
@@ -475,9 +548,91 @@ class GamificationSystem:
         
         # Save updated profile
         self._save_user_profile(profile)
+        self._record_leaderboard(profile, profile.total_xp - total_xp_before)
         
         return notifications
     
+    def process_user_activity_batch(self, events: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Process many (user_id, activity_data) events, e.g. a replayed day of synced activity
+        
+        Events are folded into in-memory profiles user by user and every change is
+        persisted in one transaction. Returns the same notifications, in the same
+        order, as calling process_user_activity for each event.
+        """
+        events_by_user: Dict[str, List[int]] = {}
+        for i, (user_id, _) in enumerate(events):
+            events_by_user.setdefault(user_id, []).append(i)
+        
+        results: List[List[Dict[str, Any]]] = [[] for _ in events]
+        with self.activity_lock:
+            self._preload_user_profiles([user_id for user_id in events_by_user if user_id not in self.user_profiles])
+            self._batch.writes = PendingWrites()
+            try:
+                for user_id, indices in events_by_user.items():
+                    for i in indices:
+                        results[i] = self._process_user_activity(user_id, events[i][1])
+                self._flush_pending_writes(self._batch.writes)
+            except Exception as e:
+                # In-memory profiles, unlocks and boards are ahead of the database; rebuild them from it
+                logger.error(f"Error saving gamification batch, reloading {len(events_by_user)} users: {e}")
+                self._reload_users(list(events_by_user))
+                raise
+            finally:
+                self._batch.writes = None
+        
+        return [notification for notifications in results for notification in notifications]
+    
+    def _reload_users(self, user_ids: List[str]):
+        """Discard in-memory state for the users and read it back from the database"""
+        for user_id in user_ids:
+            self.user_profiles.pop(user_id, None)
+            self.achievement_rules.forget(user_id)
+            self.challenge_rules.forget(user_id)
+        self._preload_user_profiles(user_ids)
+        with self.leaderboards_lock:
+            self.leaderboards_loaded = False
+    
+    def _preload_user_profiles(self, user_ids: List[str]):
+        """Load stored profiles and achievement unlocks for many users at once"""
+        if not user_ids:
+            return
+        
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                # Stay under SQLite's bound-parameter limit
+                for start in range(0, len(user_ids), 500):
+                    chunk = user_ids[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(f"SELECT * FROM user_profiles WHERE user_id IN ({placeholders})", chunk)
+                    for row in cursor.fetchall():
+                        self.user_profiles[row[0]] = self._profile_from_row(row)
+                    
+                    cursor.execute(f"SELECT user_id, achievement_id FROM achievement_unlocks WHERE user_id IN ({placeholders})", chunk)
+                    for user_id, achievement_id in cursor.fetchall():
+                        self.achievement_rules.mark(user_id, [achievement_id])
+        except Exception as e:
+            logger.error(f"Error preloading user profiles: {e}")
+    
+    def _flush_pending_writes(self, pending: PendingWrites):
+        """Persist everything buffered by a batch in a single transaction; raises if it cannot"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.executemany(self.SAVE_PROFILE_SQL, [self._profile_row(p) for p in pending.profiles.values()])
+            cursor.executemany("""
+                INSERT OR IGNORE INTO achievement_unlocks 
+                (user_id, achievement_id, unlocked_date)
+                VALUES (?, ?, ?)
+            """, pending.achievement_unlocks)
+            cursor.executemany("""
+                INSERT OR IGNORE INTO challenge_completions 
+                (user_id, challenge_id, completed_date)
+                VALUES (?, ?, ?)
+            """, pending.challenge_completions)
+            cursor.executemany(self.SAVE_PERIOD_XP_SQL,
+                               [(period, user_id, xp) for (period, user_id), xp in pending.period_xp.items()])
+            conn.commit()
+    
     def _update_profile_with_activity(self, profile: UserProfile, activity_data: Dict[str, Any]):
         """Update user profile with activity data"""
         # Update last activity
@@ -517,97 +672,56 @@ class GamificationSystem:
     
     def _check_achievements(self, profile: UserProfile, activity_data: Dict[str, Any]) -> List[Achievement]:
         """Check for newly unlocked achievements"""
-        new_achievements = []
-        
-        for achievement in self.achievements.values():
-            if achievement.unlocked:
-                continue
-            
-            # Check if achievement requirements are met
-            if self._check_achievement_requirements(achievement, profile, activity_data):
-                new_achievements.append(achievement)
-        
-        return new_achievements
-    
-    def _check_achievement_requirements(self, achievement: Achievement, profile: UserProfile, activity_data: Dict[str, Any]) -> bool:
-        """Check if achievement requirements are met"""
-        requirements = achievement.requirements
-        
-        for req_type, req_value in requirements.items():
-            if req_type == "focus_sessions":
-                if len(activity_data.get('focus_sessions', [])) < req_value:
-                    return False
-            elif req_type == "focus_streak":
-                if profile.streak_days < req_value:
-                    return False
-            elif req_type == "daily_streak":
-                if profile.streak_days < req_value:
-                    return False
-            elif req_type == "time_saved_hours":
-                time_saved_hours = activity_data.get('time_saved_minutes', 0) / 60
-                if time_saved_hours < req_value:
-                    return False
-            elif req_type == "social_media_free_days":
-                # This would need to be tracked over time
-                return False
-            elif req_type == "breaks_taken":
-                if activity_data.get('breaks_taken', 0) < req_value:
-                    return False
-            elif req_type == "wellness_days":
-                # This would need to be tracked over time
-                return False
-        
-        return True
+        metrics = activity_metrics(profile, activity_data)
+        unlocked_ids = self.achievement_rules.evaluate(profile.user_id, metrics)
+        return [self.achievements[achievement_id] for achievement_id in unlocked_ids]
     
     def _unlock_achievement(self, profile: UserProfile, achievement: Achievement):
         """Unlock an achievement for a user"""
-        achievement.unlocked = True
-        achievement.unlocked_date = datetime.now()
-        
         # Add XP reward
         profile.xp += achievement.xp_reward
         profile.total_xp += achievement.xp_reward
         profile.achievements_unlocked += 1
         
         # Save achievement unlock
-        self._save_achievement_unlock(profile.user_id, achievement)
+        self._save_achievement_unlock(profile.user_id, achievement, datetime.now())
     
     def _check_challenges(self, profile: UserProfile, activity_data: Dict[str, Any]) -> List[Tuple[Challenge, float]]:
         """Check challenge progress"""
-        updates = []
+        metrics = activity_metrics(profile, activity_data)
+        changed = self.challenge_rules.observe(profile.user_id, metrics)
+        completed_ids = set(self.challenge_rules.evaluate(profile.user_id, metrics, changed))
         
-        for challenge in self.challenges.values():
-            if not challenge.active or challenge.completed:
+        # Only challenges reading a changed metric can have moved
+        updates = []
+        for challenge_id in self.challenge_rules.rules_reading(changed):
+            challenge = self.challenges[challenge_id]
+            if not challenge.active:
                 continue
-            
-            # Calculate progress
-            progress = self._calculate_challenge_progress(challenge, profile, activity_data)
+            if challenge_id in completed_ids:
+                progress = 1.0
+            elif self.challenge_rules.is_unlocked(profile.user_id, challenge_id):
+                continue
+            else:
+                progress = self._calculate_challenge_progress(challenge, metrics)
             challenge.progress = progress
             updates.append((challenge, progress))
         
         return updates
     
-    def _calculate_challenge_progress(self, challenge: Challenge, profile: UserProfile, activity_data: Dict[str, Any]) -> float:
+    def _calculate_challenge_progress(self, challenge: Challenge, metrics: Dict[str, float]) -> float:
         """Calculate progress for a challenge"""
-        requirements = challenge.requirements
-        
-        for req_type, req_value in requirements.items():
-            if req_type == "focus_time_minutes":
-                total_focus_time = sum(s.get('duration', 0) for s in activity_data.get('focus_sessions', []))
-                return min(1.0, total_focus_time / req_value)
-            elif req_type == "breaks_taken":
-                breaks_taken = activity_data.get('breaks_taken', 0)
-                return min(1.0, breaks_taken / req_value)
-            elif req_type == "daily_social_limit":
+        for req_type, req_value in challenge.requirements.items():
+            metric = CHALLENGE_METRICS.get(req_type)
+            if metric is None:
                 # This would need to be tracked over time
                 return 0.0
+            return min(1.0, metrics[metric] / req_value)
         
         return 0.0
     
     def _complete_challenge(self, profile: UserProfile, challenge: Challenge):
         """Complete a challenge"""
-        challenge.completed = True
-        
         # Add rewards
         rewards = challenge.rewards
         if 'xp' in rewards:
@@ -625,15 +739,7 @@ class GamificationSystem:
     
     def _calculate_level(self, xp: int) -> int:
         """Calculate level based on XP"""
-        # Simple level calculation: each level requires level * 100 XP
-        level = 1
-        xp_required = 0
-        
-        while xp >= xp_required:
-            level += 1
-            xp_required += level * 100
-        
-        return level - 1
+        return level_for_xp(xp)
     
     def _process_level_up(self, profile: UserProfile, new_level: int) -> List[Dict[str, Any]]:
         """Process level up and return rewards"""
@@ -668,35 +774,110 @@ class GamificationSystem:
         
         return rewards
     
-    def get_leaderboard(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get leaderboard data"""
+    def _ensure_leaderboards(self):
+        """Build the in-memory boards from the database on first use"""
+        if self.leaderboards_loaded:
+            return
+        with self.leaderboards_lock:
+            if self.leaderboards_loaded:
+                return
+            try:
+                with sqlite3.connect(self.db_path) as conn:
+                    cursor = conn.cursor()
+                    cursor.execute("SELECT user_id, team_id FROM user_teams")
+                    teams = dict(cursor.fetchall())
+                    cursor.execute("SELECT user_id, level, xp FROM user_profiles")
+                    self.leaderboards.load_profiles(cursor.fetchall(), teams)
+                    
+                    for period, key in period_keys().items():
+                        cursor.execute("SELECT user_id, xp FROM leaderboard_period_xp WHERE period = ?",
+                                       (f"{period}:{key}",))
+                        self.leaderboards.load_period(period, key, cursor.fetchall())
+                # Loads replace whole boards, so a failed attempt is simply retried on the next call
+                self.leaderboards_loaded = True
+            except Exception as e:
+                logger.error(f"Error loading leaderboards: {e}")
+    
+    def _record_leaderboard(self, profile: UserProfile, xp_gained: int):
+        """Apply a profile's XP change to every board it ranks on"""
+        self._ensure_leaderboards()
+        self.leaderboards.record(profile.user_id, profile.level, profile.xp, xp_gained)
+        if xp_gained:
+            self._save_period_xp(profile.user_id, xp_gained)
+    
+    def _leaderboard_rows(self, entries: List[LeaderboardEntry], period: Optional[str]) -> List[Dict[str, Any]]:
+        """Join ranked entries with their profile columns"""
+        if not entries:
+            return []
+        
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
+                placeholders = ",".join("?" * len(entries))
+                cursor.execute(f"""
                     SELECT user_id, level, xp, total_xp, achievements_unlocked, challenges_completed
                     FROM user_profiles
-                    ORDER BY level DESC, xp DESC
-                    LIMIT ?
-                """, (limit,))
-                rows = cursor.fetchall()
-                
-                leaderboard = []
-                for i, row in enumerate(rows):
-                    leaderboard.append({
-                        "rank": i + 1,
-                        "user_id": row[0],
-                        "level": row[1],
-                        "xp": row[2],
-                        "total_xp": row[3],
-                        "achievements": row[4],
-                        "challenges": row[5]
-                    })
-                
-                return leaderboard
+                    WHERE user_id IN ({placeholders})
+                """, [entry.user_id for entry in entries])
+                rows = {row[0]: row for row in cursor.fetchall()}
         except Exception as e:
             logger.error(f"Error getting leaderboard: {e}")
             return []
+        
+        leaderboard = []
+        for entry in entries:
+            row = rows.get(entry.user_id)
+            if row is None:
+                continue
+            item = {
+                "rank": entry.rank,
+                "user_id": row[0],
+                "level": row[1],
+                "xp": row[2],
+                "total_xp": row[3],
+                "achievements": row[4],
+                "challenges": row[5]
+            }
+            if period is not None:
+                item["period_xp"] = entry.score[0]
+            leaderboard.append(item)
+        
+        return leaderboard
+    
+    def get_leaderboard(self, limit: int = 10, team_id: Optional[str] = None, period: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get leaderboard data, optionally for a team or a 'daily'/'weekly' period"""
+        self._ensure_leaderboards()
+        board = self.leaderboards.board(team_id=team_id, period=period)
+        return self._leaderboard_rows(board.top(limit), period)
+    
+    def get_leaderboard_around(self, user_id: str, k: int = 5, team_id: Optional[str] = None,
+                               period: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the leaderboard slice of k users above and below a user"""
+        self._ensure_leaderboards()
+        board = self.leaderboards.board(team_id=team_id, period=period)
+        return self._leaderboard_rows(board.window_around(user_id, k), period)
+    
+    def get_user_rank(self, user_id: str, team_id: Optional[str] = None, period: Optional[str] = None) -> Optional[int]:
+        """Get a user's 1-based rank, or None if they are not on the board"""
+        self._ensure_leaderboards()
+        return self.leaderboards.board(team_id=team_id, period=period).rank_of(user_id)
+    
+    def set_user_team(self, user_id: str, team_id: Optional[str]):
+        """Assign a user to a team leaderboard, or remove them with None"""
+        self._ensure_leaderboards()
+        self.leaderboards.set_team(user_id, team_id)
+        
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                if team_id is None:
+                    cursor.execute("DELETE FROM user_teams WHERE user_id = ?", (user_id,))
+                else:
+                    cursor.execute("INSERT OR REPLACE INTO user_teams (user_id, team_id) VALUES (?, ?)",
+                                   (user_id, team_id))
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Error saving user team: {e}")
     
     def get_user_stats(self, user_id: str) -> Dict[str, Any]:
         """Get comprehensive user statistics"""
@@ -707,12 +888,13 @@ class GamificationSystem:
         level_progress = (profile.xp % (profile.level * 100)) / (profile.level * 100)
         
         # Get achievement stats
-        unlocked_achievements = [ach for ach in self.achievements.values() if ach.unlocked]
+        unlocked_achievements = [self.achievements[ach_id] for ach_id in self.achievement_rules.unlocked_ids(user_id)]
         achievement_progress = len(unlocked_achievements) / len(self.achievements)
         
         # Get challenge stats
-        active_challenges = [ch for ch in self.challenges.values() if ch.active and not ch.completed]
-        completed_challenges = [ch for ch in self.challenges.values() if ch.completed]
+        completed_ids = set(self.challenge_rules.unlocked_ids(user_id))
+        active_challenges = [ch for ch in self.challenges.values() if ch.active and ch.id not in completed_ids]
+        completed_challenges = [self.challenges[ch_id] for ch_id in completed_ids]
         
         return {
             "profile": {
@@ -744,75 +926,109 @@ class GamificationSystem:
         }
     
     def _background_processing(self):
-        """Background processing for gamification system"""
-        while True:
-            try:
-                # Process notifications
-                while self.notification_queue:
-                    notification = self.notification_queue.pop(0)
-                    # Here you would send the notification to the user
-                    print(f"🎮 Gamification notification: {notification}")
-                
-                # Update daily challenges
-                if datetime.now().hour == 0 and datetime.now().minute == 0:
-                    self._update_daily_challenges()
-                
-                # Update weekly challenges
-                if datetime.now().weekday() == 0 and datetime.now().hour == 0:
-                    self._update_weekly_challenges()
-                
-                time.sleep(60)  # Check every minute
-                
-            except Exception as e:
-                logger.error(f"Error in gamification background processing: {e}")
-                time.sleep(300)
+        """Background processing for gamification system, run every minute by the shared scheduler"""
+        # Process notifications
+        while self.notification_queue:
+            notification = self.notification_queue.pop(0)
+            # Here you would send the notification to the user
+            print(f"🎮 Gamification notification: {notification}")
+        
+        # Update daily challenges
+        if datetime.now().hour == 0 and datetime.now().minute == 0:
+            self._update_daily_challenges()
+        
+        # Update weekly challenges
+        if datetime.now().weekday() == 0 and datetime.now().hour == 0:
+            self._update_weekly_challenges()
     
     def _update_daily_challenges(self):
         """Update daily challenges"""
+        rolled_over = []
         for challenge in self.challenges.values():
             if challenge.type == ChallengeType.DAILY:
+                rolled_over.append(challenge.id)
                 challenge.start_date = datetime.now()
                 challenge.end_date = datetime.now() + timedelta(days=1)
                 challenge.completed = False
                 challenge.progress = 0.0
                 challenge.participants = []
+        self.challenge_rules.reset(rolled_over)
     
     def _update_weekly_challenges(self):
         """Update weekly challenges"""
+        rolled_over = []
         for challenge in self.challenges.values():
             if challenge.type == ChallengeType.WEEKLY:
+                rolled_over.append(challenge.id)
                 challenge.start_date = datetime.now()
                 challenge.end_date = datetime.now() + timedelta(days=7)
                 challenge.completed = False
                 challenge.progress = 0.0
                 challenge.participants = []
+        self.challenge_rules.reset(rolled_over)
+    
+    SAVE_PROFILE_SQL = """
+        INSERT OR REPLACE INTO user_profiles 
+        (user_id, level, xp, total_xp, streak_days, best_streak, 
+         achievements_unlocked, challenges_completed, rank, title, 
+         badges, last_activity, created_date)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    SAVE_PERIOD_XP_SQL = """
+        INSERT INTO leaderboard_period_xp (period, user_id, xp)
+        VALUES (?, ?, ?)
+        ON CONFLICT(period, user_id) DO UPDATE SET xp = xp + excluded.xp
+    """
+    
+    @staticmethod
+    def _profile_row(profile: UserProfile) -> tuple:
+        """Column values for a user_profiles row"""
+        return (
+            profile.user_id,
+            profile.level,
+            profile.xp,
+            profile.total_xp,
+            profile.streak_days,
+            profile.best_streak,
+            profile.achievements_unlocked,
+            profile.challenges_completed,
+            profile.rank,
+            profile.title,
+            json.dumps(profile.badges),
+            profile.last_activity.isoformat(),
+            profile.created_date.isoformat()
+        )
+    
+    @staticmethod
+    def _profile_from_row(row: tuple) -> UserProfile:
+        """Build a profile from a user_profiles row"""
+        return UserProfile(
+            user_id=row[0],
+            level=row[1],
+            xp=row[2],
+            total_xp=row[3],
+            streak_days=row[4],
+            best_streak=row[5],
+            achievements_unlocked=row[6],
+            challenges_completed=row[7],
+            rank=row[8],
+            title=row[9],
+            badges=json.loads(row[10]),
+            last_activity=datetime.fromisoformat(row[11]),
+            created_date=datetime.fromisoformat(row[12])
+        )
     
     def _save_user_profile(self, profile: UserProfile):
         """Save user profile to database"""
+        if self.pending_writes is not None:
+            self.pending_writes.profiles[profile.user_id] = profile
+            return
+        
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    INSERT OR REPLACE INTO user_profiles 
-                    (user_id, level, xp, total_xp, streak_days, best_streak, 
-                     achievements_unlocked, challenges_completed, rank, title, 
-                     badges, last_activity, created_date)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    profile.user_id,
-                    profile.level,
-                    profile.xp,
-                    profile.total_xp,
-                    profile.streak_days,
-                    profile.best_streak,
-                    profile.achievements_unlocked,
-                    profile.challenges_completed,
-                    profile.rank,
-                    profile.title,
-                    json.dumps(profile.badges),
-                    profile.last_activity.isoformat(),
-                    profile.created_date.isoformat()
-                ))
+                cursor.execute(self.SAVE_PROFILE_SQL, self._profile_row(profile))
                 conn.commit()
         except Exception as e:
             logger.error(f"Error saving user profile: {e}")
@@ -826,29 +1042,30 @@ class GamificationSystem:
                 row = cursor.fetchone()
                 
                 if row:
-                    return UserProfile(
-                        user_id=row[0],
-                        level=row[1],
-                        xp=row[2],
-                        total_xp=row[3],
-                        streak_days=row[4],
-                        best_streak=row[5],
-                        achievements_unlocked=row[6],
-                        challenges_completed=row[7],
-                        rank=row[8],
-                        title=row[9],
-                        badges=json.loads(row[10]),
-                        last_activity=datetime.fromisoformat(row[11]),
-                        created_date=datetime.fromisoformat(row[12])
-                    )
+                    return self._profile_from_row(row)
                 
                 return None
         except Exception as e:
             logger.error(f"Error loading user profile: {e}")
             return None
     
-    def _save_achievement_unlock(self, user_id: str, achievement: Achievement):
+    def _load_achievement_unlocks(self, user_id: str) -> List[str]:
+        """Load ids of achievements a user has already unlocked"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT achievement_id FROM achievement_unlocks WHERE user_id = ?", (user_id,))
+                return [row[0] for row in cursor.fetchall()]
+        except Exception as e:
+            logger.error(f"Error loading achievement unlocks: {e}")
+            return []
+    
+    def _save_achievement_unlock(self, user_id: str, achievement: Achievement, unlocked_date: datetime):
         """Save achievement unlock to database"""
+        if self.pending_writes is not None:
+            self.pending_writes.achievement_unlocks.append((user_id, achievement.id, unlocked_date.isoformat()))
+            return
+        
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
@@ -859,14 +1076,35 @@ class GamificationSystem:
                 """, (
                     user_id,
                     achievement.id,
-                    achievement.unlocked_date.isoformat()
+                    unlocked_date.isoformat()
                 ))
                 conn.commit()
         except Exception as e:
             logger.error(f"Error saving achievement unlock: {e}")
     
+    def _save_period_xp(self, user_id: str, xp_gained: int):
+        """Add XP to the user's daily and weekly leaderboard totals"""
+        periods = [f"{period}:{key}" for period, key in period_keys().items()]
+        if self.pending_writes is not None:
+            for period in periods:
+                pending_key = (period, user_id)
+                self.pending_writes.period_xp[pending_key] = self.pending_writes.period_xp.get(pending_key, 0) + xp_gained
+            return
+        
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.executemany(self.SAVE_PERIOD_XP_SQL, [(period, user_id, xp_gained) for period in periods])
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Error saving period XP: {e}")
+    
     def _save_challenge_completion(self, user_id: str, challenge: Challenge):
         """Save challenge completion to database"""
+        if self.pending_writes is not None:
+            self.pending_writes.challenge_completions.append((user_id, challenge.id, datetime.now().isoformat()))
+            return
+        
         try:
             with sqlite3.connect(self.db_path) as conn:
                 cursor = conn.cursor()
@@ -931,6 +1169,33 @@ def initialize_gamification_database(db_path: str = "productivity.db"):
                 )
             """)
             
+            # Leaderboard mirror: ranking index, team membership and per-period XP
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_user_profiles_rank
+                ON user_profiles (level DESC, xp DESC)
+            """)
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS user_teams (
+                    user_id TEXT PRIMARY KEY,
+                    team_id TEXT
+                )
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_user_teams_team ON user_teams (team_id)")
+            
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS leaderboard_period_xp (
+                    period TEXT,
+                    user_id TEXT,
+                    xp INTEGER,
+                    PRIMARY KEY (period, user_id)
+                )
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_leaderboard_period_xp
+                ON leaderboard_period_xp (period, xp DESC)
+            """)
+            
             conn.commit()
             print("🎮 Gamification database tables initialized successfully!")
             
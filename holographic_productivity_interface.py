@@ -8,7 +8,6 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import json
 import time
-import threading
 import random
 import math
 import numpy as np
@@ -32,29 +31,120 @@ class HolographicObject:
 class HolographicSpace:
     """3D holographic space for productivity visualization"""
     
+    FOCAL_LENGTH = 500
+    
     def __init__(self, width: int = 800, height: int = 600, depth: int = 400):
         self.width = width
         self.height = height
         self.depth = depth
         self.objects = {}
-        self.camera_position = (0, 0, -500)
-        self.camera_rotation = (0, 0, 0)
+        self._camera_position = (0, 0, -500)
+        self._camera_rotation = (0, 0, 0)
         self.light_sources = []
         self.particles = []
         
+        # Change tracking for the renderer: versions bump on every mutation, listeners are told
+        self.camera_version = 0
+        self.objects_version = 0
+        self.dirty_objects = set()
+        self.listeners = []
+        self._arrays_version = -1
+        self._arrays = ([], np.empty((0, 3)), np.empty(0))
+        self._matrix_rotation = None
+        self._matrix = np.eye(3)
+    
+    def _changed(self):
+        for listener in self.listeners:
+            listener()
+    
+    @property
+    def camera_position(self) -> Tuple[float, float, float]:
+        return self._camera_position
+    
+    @camera_position.setter
+    def camera_position(self, position: Tuple[float, float, float]):
+        self._camera_position = tuple(position)
+        self.camera_version += 1
+        self._changed()
+    
+    @property
+    def camera_rotation(self) -> Tuple[float, float, float]:
+        return self._camera_rotation
+    
+    @camera_rotation.setter
+    def camera_rotation(self, rotation: Tuple[float, float, float]):
+        self._camera_rotation = tuple(rotation)
+        self.camera_version += 1
+        self._changed()
+        
     def add_object(self, obj: HolographicObject):
         """Add object to holographic space"""
         self.objects[obj.id] = obj
+        self.dirty_objects.add(obj.id)
+        self.objects_version += 1
+        self._changed()
     
     def remove_object(self, obj_id: str):
         """Remove object from holographic space"""
         if obj_id in self.objects:
             del self.objects[obj_id]
+            self.dirty_objects.discard(obj_id)
+            self.objects_version += 1
+            self._changed()
     
     def update_object_position(self, obj_id: str, new_position: Tuple[float, float, float]):
         """Update object position"""
         if obj_id in self.objects:
             self.objects[obj_id].position = new_position
+            self.objects_version += 1
+            self._changed()
+    
+    def touch(self, obj_id: str):
+        """Mark an object whose appearance (scale, color, data) was edited in place"""
+        if obj_id in self.objects:
+            self.dirty_objects.add(obj_id)
+            self.objects_version += 1
+            self._changed()
+    
+    def object_arrays(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Object ids with their positions (N, 3) and scales (N,), rebuilt only after a change"""
+        if self._arrays_version != self.objects_version:
+            objects = list(self.objects.values())
+            self._arrays = (
+                [obj.id for obj in objects],
+                np.array([obj.position for obj in objects], dtype=float).reshape(-1, 3),
+                np.array([obj.scale for obj in objects], dtype=float)
+            )
+            self._arrays_version = self.objects_version
+        return self._arrays
+    
+    def camera_matrix(self) -> np.ndarray:
+        """Rotation matrix for the current camera rotation, cached until the rotation changes"""
+        if self._matrix_rotation != self._camera_rotation:
+            rx, ry, rz = self._camera_rotation
+            cos_rx, sin_rx = math.cos(rx), math.sin(rx)
+            cos_ry, sin_ry = math.cos(ry), math.sin(ry)
+            cos_rz, sin_rz = math.cos(rz), math.sin(rz)
+            self._matrix = np.array([
+                [cos_ry * cos_rz, -cos_ry * sin_rz, sin_ry],
+                [sin_rx * sin_ry * cos_rz + cos_rx * sin_rz, sin_rx * sin_ry * sin_rz - cos_rx * cos_rz, -sin_rx * cos_ry],
+                [cos_rx * sin_ry * cos_rz - sin_rx * sin_rz, cos_rx * sin_ry * sin_rz + sin_rx * cos_rz, cos_rx * cos_ry]
+            ])
+            self._matrix_rotation = self._camera_rotation
+        return self._matrix
+    
+    def project_points(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Project (N, 3) points to screen coordinates (N, 2) and camera-space depth (N,)"""
+        points = np.array(points, dtype=float).reshape(-1, 3)
+        points[points[:, 2] == 0, 2] = 0.001  # Avoid division by zero
+        
+        camera_space = points @ self.camera_matrix().T - np.asarray(self._camera_position, dtype=float)
+        depth = camera_space[:, 2]
+        safe_depth = np.where(depth == 0, 0.001, depth)
+        
+        screen = camera_space[:, :2] * (self.FOCAL_LENGTH / safe_depth)[:, None]
+        screen += (self.width / 2, self.height / 2)
+        return screen, depth
     
     def project_3d_to_2d(self, point_3d: Tuple[float, float, float]) -> Tuple[float, float]:
         """Project 3D point to 2D screen coordinates"""
@@ -64,54 +154,311 @@ class HolographicSpace:
         if z == 0:
             z = 0.001  # Avoid division by zero
         
-        # Apply camera transformation
-        cx, cy, cz = self.camera_position
-        rx, ry, rz = self.camera_rotation
-        
-        # Rotate point
-        cos_rx, sin_rx = math.cos(rx), math.sin(rx)
-        cos_ry, sin_ry = math.cos(ry), math.sin(ry)
-        cos_rz, sin_rz = math.cos(rz), math.sin(rz)
-        
-        # Apply rotations
-        x_rot = x * cos_ry * cos_rz - y * cos_ry * sin_rz + z * sin_ry
-        y_rot = x * (sin_rx * sin_ry * cos_rz + cos_rx * sin_rz) + \
-                y * (sin_rx * sin_ry * sin_rz - cos_rx * cos_rz) - \
-                z * sin_rx * cos_ry
-        z_rot = x * (cos_rx * sin_ry * cos_rz - sin_rx * sin_rz) + \
-                y * (cos_rx * sin_ry * sin_rz + sin_rx * cos_rz) + \
-                z * cos_rx * cos_ry
-        
-        # Translate
-        x_trans = x_rot - cx
-        y_trans = y_rot - cy
-        z_trans = z_rot - cz
+        # Rotate with the cached camera matrix, then translate
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = self.camera_matrix().tolist()
+        cx, cy, cz = self._camera_position
+        x_trans = x * m00 + y * m01 + z * m02 - cx
+        y_trans = x * m10 + y * m11 + z * m12 - cy
+        z_trans = x * m20 + y * m21 + z * m22 - cz
         
         # Project to 2D
         if z_trans == 0:
             z_trans = 0.001
         
-        focal_length = 500
-        x_2d = (x_trans * focal_length) / z_trans + self.width / 2
-        y_2d = (y_trans * focal_length) / z_trans + self.height / 2
+        x_2d = (x_trans * self.FOCAL_LENGTH) / z_trans + self.width / 2
+        y_2d = (y_trans * self.FOCAL_LENGTH) / z_trans + self.height / 2
         
         return (x_2d, y_2d)
     
     def get_visible_objects(self) -> List[HolographicObject]:
         """Get objects visible from current camera position"""
-        visible = []
-        
-        for obj in self.objects.values():
-            # Simple visibility check (behind camera)
-            x, y, z = obj.position
-            cx, cy, cz = self.camera_position
+        ids, positions, _ = self.object_arrays()
+        if not ids:
+            return []
+        _, depth = self.project_points(positions)
+        
+        # Painter's algorithm: farthest first, behind-camera objects dropped
+        order = np.argsort(-depth, kind='stable')
+        return [self.objects[ids[i]] for i in order if depth[i] > 0]
+
+def grid_segments() -> np.ndarray:
+    """Endpoints (N, 2, 3) of the reference grid lines"""
+    segments = []
+    for x in range(-300, 301, 100):
+        segments.append(((x, -300, 0), (x, 300, 0)))
+    for y in range(-300, 301, 100):
+        segments.append(((-300, y, 0), (300, y, 0)))
+    for z in range(0, 401, 100):
+        segments.append(((-300, 0, z), (300, 0, z)))
+    return np.array(segments, dtype=float)
+
+@dataclass
+class DrawnObject:
+    """Canvas items of one object; its screen position lives in the renderer's arrays"""
+    items: List[int]
+    size: float = 0.0
+    wave: Optional[int] = None
+
+class HolographicRenderer:
+    """Retained-mode canvas renderer for a HolographicSpace
+    
+    Frames run on the Tk thread and are only scheduled when the camera or the
+    objects change. Each frame projects every object and grid point in one
+    NumPy batch, hides objects outside the view frustum, and moves the canvas
+    items that already exist instead of deleting and recreating them.
+    """
+    
+    FRAME_MS = 16  # ~60 FPS cap while changes keep arriving
+    ANIMATION_MS = 100  # Flow objects wave at 10 FPS when nothing else changes
+    NEAR_PLANE = 1.0
+    BASE_SIZE = 20
+    LABEL_MARGIN = 40
+    
+    def __init__(self, canvas: tk.Canvas, space: HolographicSpace, on_camera_change=None):
+        self.canvas = canvas
+        self.space = space
+        self.on_camera_change = on_camera_change
+        self.drawn: Dict[str, DrawnObject] = {}
+        self.grid = grid_segments()
+        self.grid_items = [canvas.create_line(0, 0, 0, 0, fill="#333366", tags="grid", width=1)
+                           for _ in range(len(self.grid))]
+        # Aligned with self.ids: where each object's items sit and whether they are shown
+        self.ids: List[str] = []
+        self.items: List[List[int]] = []
+        self.anchors = np.zeros((0, 2))
+        self.shown = np.zeros(0, dtype=bool)
+        self.waves: List[int] = []
+        self.order = np.zeros(0, dtype=np.intp)
+        self.rendered_camera = -1
+        self.rendered_objects = -1
+        self.frame_pending = None
+        self.frames = 0
+        space.listeners.append(self.request_frame)
+    
+    def request_frame(self, delay_ms: Optional[int] = None):
+        """Schedule one frame unless one is already pending"""
+        if self.frame_pending is None:
+            self.frame_pending = self.canvas.after(self.FRAME_MS if delay_ms is None else delay_ms, self.render_frame)
+    
+    def stop(self):
+        if self.frame_pending is not None:
+            self.canvas.after_cancel(self.frame_pending)
+            self.frame_pending = None
+        self.space.listeners.remove(self.request_frame)
+    
+    def render_frame(self):
+        """Bring the canvas in line with the space"""
+        self.frame_pending = None
+        try:
+            space = self.space
+            camera_changed = self.rendered_camera != space.camera_version
+            if camera_changed:
+                self._update_grid()
             
-            if z > cz:  # Object is in front of camera
-                visible.append(obj)
-        
-        # Sort by depth (painter's algorithm)
-        visible.sort(key=lambda obj: obj.position[2], reverse=True)
-        return visible
+            ids, positions, scales = space.object_arrays()
+            if space.dirty_objects or ids is not self.ids:
+                self._sync_items(ids)
+            
+            animated = False
+            if ids and (camera_changed or self.rendered_objects != space.objects_version):
+                animated = self._place_objects(ids, positions, scales)
+            elif self.waves and self.shown[self.waves].any():
+                animated = True
+            if animated:
+                self._animate_waves()
+            
+            self.rendered_camera = space.camera_version
+            self.rendered_objects = space.objects_version
+            self.frames += 1
+            if camera_changed and self.on_camera_change:
+                self.on_camera_change()
+            if animated:
+                self.request_frame(self.ANIMATION_MS)
+        except Exception as e:
+            print(f"Error in holographic rendering: {e}")
+    
+    def _update_grid(self):
+        screen, depth = self.space.project_points(self.grid.reshape(-1, 3))
+        lines = screen.reshape(-1, 4)
+        in_front = (depth.reshape(-1, 2) > self.NEAR_PLANE).all(axis=1)
+        for item, line, show in zip(self.grid_items, lines, in_front):
+            self.canvas.coords(item, *line)
+            self.canvas.itemconfigure(item, state='normal' if show else 'hidden')
+    
+    def _sync_items(self, ids: List[str]):
+        """Create items for new or edited objects, delete those of removed ones, and realign the arrays"""
+        space = self.space
+        current = set(ids)
+        for obj_id in [obj_id for obj_id in self.drawn if obj_id not in current or obj_id in space.dirty_objects]:
+            for item in self.drawn.pop(obj_id).items:
+                self.canvas.delete(item)
+        
+        previous = {obj_id: i for i, obj_id in enumerate(self.ids)}
+        anchors = np.zeros((len(ids), 2))
+        shown = np.zeros(len(ids), dtype=bool)
+        for i, obj_id in enumerate(ids):
+            if obj_id in self.drawn:
+                j = previous[obj_id]
+                anchors[i], shown[i] = self.anchors[j], self.shown[j]
+            else:
+                self.drawn[obj_id] = self._create_items(space.objects[obj_id])
+        space.dirty_objects.clear()
+        
+        self.ids = ids
+        self.items = [self.drawn[obj_id].items for obj_id in ids]
+        self.anchors = anchors
+        self.shown = shown
+        self.waves = [i for i, obj_id in enumerate(ids) if self.drawn[obj_id].wave is not None]
+        self.order = np.zeros(0, dtype=np.intp)
+    
+    def _place_objects(self, ids: List[str], positions: np.ndarray, scales: np.ndarray) -> bool:
+        """Cull, move and restack objects from one batched projection; True if any visible object animates"""
+        space = self.space
+        screen, depth = space.project_points(positions)
+        margin = self.BASE_SIZE * scales / 2 + self.LABEL_MARGIN
+        visible = ((depth > self.NEAR_PLANE) &
+                   (screen[:, 0] > -margin) & (screen[:, 0] < space.width + margin) &
+                   (screen[:, 1] > -margin) & (screen[:, 1] < space.height + margin))
+        
+        canvas = self.canvas
+        items = self.items
+        delta = screen - self.anchors
+        moved = np.flatnonzero(visible & (np.abs(delta) >= 0.5).any(axis=1))
+        for i, dx, dy in zip(moved.tolist(), delta[moved, 0].tolist(), delta[moved, 1].tolist()):
+            for item in items[i]:
+                canvas.move(item, dx, dy)
+        self.anchors[moved] = screen[moved]
+        
+        toggled = np.flatnonzero(visible != self.shown)
+        for i, show in zip(toggled.tolist(), visible[toggled].tolist()):
+            state = 'normal' if show else 'hidden'
+            for item in items[i]:
+                canvas.itemconfigure(item, state=state)
+        self.shown = visible
+        
+        # Painter's algorithm: restack only when the far-to-near order changes
+        shown = np.flatnonzero(visible)
+        order = shown[np.argsort(-depth[shown], kind='stable')]
+        if not np.array_equal(order, self.order):
+            for i in order.tolist():
+                for item in items[i]:
+                    canvas.tag_raise(item)
+            self.order = order
+        
+        return bool(self.waves) and bool(visible[self.waves].any())
+    
+    def _animate_waves(self):
+        now = time.time()
+        for i in self.waves:
+            if self.shown[i]:
+                drawn = self.drawn[self.ids[i]]
+                x, y = self.anchors[i].tolist()
+                self.canvas.coords(drawn.wave, *self._wave_points(x, y, drawn.size, now))
+    
+    @staticmethod
+    def _wave_points(x: float, y: float, size: float, now: float) -> List[float]:
+        points = []
+        for i in range(8):
+            angle = i * math.pi / 4
+            wave_offset = math.sin(now + i) * 5
+            points.extend([x + (size/2 + wave_offset) * math.cos(angle),
+                           y + (size/2 + wave_offset) * math.sin(angle)])
+        return points
+    
+    def _create_items(self, obj: HolographicObject) -> DrawnObject:
+        """Create an object's items hidden at the origin; frames move and reveal them"""
+        size = self.BASE_SIZE * obj.scale
+        create = {
+            "chart": self._create_chart_items,
+            "goal": self._create_goal_items,
+            "energy": self._create_energy_items,
+            "focus": self._create_focus_items,
+            "flow": self._create_flow_items,
+        }.get(obj.object_type, self._create_default_items)
+        drawn = create(obj, size)
+        drawn.size = size
+        for item in drawn.items:
+            self.canvas.itemconfigure(item, state='hidden')
+        return drawn
+    
+    def _create_default_items(self, obj: HolographicObject, size: float) -> DrawnObject:
+        return DrawnObject([self.canvas.create_oval(
+            -size/2, -size/2, size/2, size/2,
+            fill=obj.color, outline="#ffffff", tags="objects"
+        )])
+    
+    def _create_chart_items(self, obj: HolographicObject, size: float) -> DrawnObject:
+        """Productivity bar with label"""
+        bar_width = size / 4
+        bar_height = size * obj.data.get("productivity_score", 0.5)
+        return DrawnObject([
+            self.canvas.create_rectangle(
+                -bar_width, -bar_height/2, bar_width, bar_height/2,
+                fill=obj.color, outline="#ffffff", tags="objects"
+            ),
+            self.canvas.create_text(
+                0, size/2 + 15,
+                text=f"Productivity: {obj.data.get('productivity_score', 0):.2f}",
+                fill=obj.color, font=('Arial', 8), tags="objects"
+            )
+        ])
+    
+    def _create_goal_items(self, obj: HolographicObject, size: float) -> DrawnObject:
+        """Target rings with progress label"""
+        items = []
+        for i in range(3):
+            ring_size = size * (1 - i * 0.2)
+            color = obj.color if i == 0 else "#444444"
+            items.append(self.canvas.create_oval(
+                -ring_size/2, -ring_size/2, ring_size/2, ring_size/2,
+                outline=color, width=2, tags="objects"
+            ))
+        items.append(self.canvas.create_text(
+            0, size/2 + 20,
+            text=f"Goal: {obj.data.get('progress', 0):.0%}",
+            fill=obj.color, font=('Arial', 8), tags="objects"
+        ))
+        return DrawnObject(items)
+    
+    def _create_energy_items(self, obj: HolographicObject, size: float) -> DrawnObject:
+        """Energy bar with level label"""
+        bar_width = size
+        bar_height = size * 0.3
+        energy_level = obj.data.get("energy_level", 0.5)
+        return DrawnObject([
+            self.canvas.create_rectangle(
+                -bar_width/2, -bar_height/2, bar_width/2, bar_height/2,
+                fill="#333333", outline="#666666", tags="objects"
+            ),
+            self.canvas.create_rectangle(
+                -bar_width/2, -bar_height/2, -bar_width/2 + bar_width * energy_level, bar_height/2,
+                fill=obj.color, outline="", tags="objects"
+            ),
+            self.canvas.create_text(
+                0, size/2 + 15,
+                text=f"Energy: {energy_level:.0%}",
+                fill=obj.color, font=('Arial', 8), tags="objects"
+            )
+        ])
+    
+    def _create_focus_items(self, obj: HolographicObject, size: float) -> DrawnObject:
+        """Concentric focus zone"""
+        items = []
+        for i in range(2):
+            zone_size = size * (1 - i * 0.3)
+            items.append(self.canvas.create_oval(
+                -zone_size/2, -zone_size/2, zone_size/2, zone_size/2,
+                fill=obj.color, outline="", tags="objects", stipple="gray50"
+            ))
+        return DrawnObject(items)
+    
+    def _create_flow_items(self, obj: HolographicObject, size: float) -> DrawnObject:
+        """Flowing wave polygon, reshaped every animation frame"""
+        wave = self.canvas.create_polygon(
+            self._wave_points(0, 0, size, time.time()),
+            fill=obj.color, outline="#ffffff", tags="objects"
+        )
+        return DrawnObject([wave], wave=wave)
 
 class HolographicProductivityInterface:
     """Holographic productivity interface with 3D visualization"""
@@ -120,7 +467,7 @@ class HolographicProductivityInterface:
         self.root = root
         self.holographic_space = HolographicSpace()
         self.is_rendering = False
-        self.render_thread = None
+        self.renderer = None
         self.productivity_data = {}
         self.holographic_objects = {}
         
@@ -220,6 +567,10 @@ class HolographicProductivityInterface:
         )
         self.canvas_3d.pack(fill='both', expand=True)
         
+        # Frames are drawn on the Tk thread whenever the space changes
+        self.renderer = HolographicRenderer(self.canvas_3d, self.holographic_space,
+                                            on_camera_change=self.update_camera_display)
+        
         # Add 3D grid
         self.draw_3d_grid()
         
@@ -296,38 +647,7 @@ class HolographicProductivityInterface:
     
     def draw_3d_grid(self):
         """Draw 3D grid in holographic space"""
-        self.canvas_3d.delete("grid")
-        
-        # Draw grid lines
-        grid_size = 100
-        grid_color = "#333366"
-        
-        # X-axis lines
-        for x in range(-300, 301, grid_size):
-            start_2d = self.holographic_space.project_3d_to_2d((x, -300, 0))
-            end_2d = self.holographic_space.project_3d_to_2d((x, 300, 0))
-            self.canvas_3d.create_line(
-                start_2d[0], start_2d[1], end_2d[0], end_2d[1],
-                fill=grid_color, tags="grid", width=1
-            )
-        
-        # Y-axis lines
-        for y in range(-300, 301, grid_size):
-            start_2d = self.holographic_space.project_3d_to_2d((-300, y, 0))
-            end_2d = self.holographic_space.project_3d_to_2d((300, y, 0))
-            self.canvas_3d.create_line(
-                start_2d[0], start_2d[1], end_2d[0], end_2d[1],
-                fill=grid_color, tags="grid", width=1
-            )
-        
-        # Z-axis lines (depth)
-        for z in range(0, 401, grid_size):
-            start_2d = self.holographic_space.project_3d_to_2d((-300, 0, z))
-            end_2d = self.holographic_space.project_3d_to_2d((300, 0, z))
-            self.canvas_3d.create_line(
-                start_2d[0], start_2d[1], end_2d[0], end_2d[1],
-                fill=grid_color, tags="grid", width=1
-            )
+        self.renderer.request_frame(0)
     
     def initialize_holographic_environment(self):
         """Initialize holographic environment with default objects"""
@@ -379,165 +699,7 @@ class HolographicProductivityInterface:
     def start_holographic_rendering(self):
         """Start holographic rendering loop"""
         self.is_rendering = True
-        self.render_thread = threading.Thread(target=self.holographic_render_loop, daemon=True)
-        self.render_thread.start()
-    
-    def holographic_render_loop(self):
-        """Holographic rendering loop"""
-        while self.is_rendering:
-            try:
-                # Clear canvas
-                self.canvas_3d.delete("objects")
-                
-                # Draw grid
-                self.draw_3d_grid()
-                
-                # Render objects
-                visible_objects = self.holographic_space.get_visible_objects()
-                
-                for obj in visible_objects:
-                    self.render_holographic_object(obj)
-                
-                # Update camera position display
-                self.update_camera_display()
-                
-                time.sleep(0.1)  # 10 FPS
-                
-            except Exception as e:
-                print(f"Error in holographic rendering: {e}")
-                time.sleep(0.5)
-    
-    def render_holographic_object(self, obj: HolographicObject):
-        """Render a holographic object"""
-        # Project 3D position to 2D
-        pos_2d = self.holographic_space.project_3d_to_2d(obj.position)
-        
-        # Calculate object size based on scale and depth
-        base_size = 20
-        size = base_size * obj.scale
-        
-        # Create object visualization based on type
-        if obj.object_type == "chart":
-            self.render_chart_object(obj, pos_2d, size)
-        elif obj.object_type == "goal":
-            self.render_goal_object(obj, pos_2d, size)
-        elif obj.object_type == "energy":
-            self.render_energy_object(obj, pos_2d, size)
-        elif obj.object_type == "focus":
-            self.render_focus_object(obj, pos_2d, size)
-        elif obj.object_type == "flow":
-            self.render_flow_object(obj, pos_2d, size)
-        else:
-            # Default object
-            self.canvas_3d.create_oval(
-                pos_2d[0] - size/2, pos_2d[1] - size/2,
-                pos_2d[0] + size/2, pos_2d[1] + size/2,
-                fill=obj.color, outline="#ffffff", tags="objects"
-            )
-    
-    def render_chart_object(self, obj: HolographicObject, pos_2d: Tuple[float, float], size: float):
-        """Render productivity chart object"""
-        x, y = pos_2d
-        
-        # Create chart bars
-        bar_width = size / 4
-        bar_height = size * obj.data.get("productivity_score", 0.5)
-        
-        self.canvas_3d.create_rectangle(
-            x - bar_width, y - bar_height/2,
-            x + bar_width, y + bar_height/2,
-            fill=obj.color, outline="#ffffff", tags="objects"
-        )
-        
-        # Add chart label
-        self.canvas_3d.create_text(
-            x, y + size/2 + 15,
-            text=f"Productivity: {obj.data.get('productivity_score', 0):.2f}",
-            fill=obj.color, font=('Arial', 8), tags="objects"
-        )
-    
-    def render_goal_object(self, obj: HolographicObject, pos_2d: Tuple[float, float], size: float):
-        """Render goal target object"""
-        x, y = pos_2d
-        
-        # Create target rings
-        for i in range(3):
-            ring_size = size * (1 - i * 0.2)
-            color = obj.color if i == 0 else "#444444"
-            self.canvas_3d.create_oval(
-                x - ring_size/2, y - ring_size/2,
-                x + ring_size/2, y + ring_size/2,
-                outline=color, width=2, tags="objects"
-            )
-        
-        # Add goal label
-        self.canvas_3d.create_text(
-            x, y + size/2 + 20,
-            text=f"Goal: {obj.data.get('progress', 0):.0%}",
-            fill=obj.color, font=('Arial', 8), tags="objects"
-        )
-    
-    def render_energy_object(self, obj: HolographicObject, pos_2d: Tuple[float, float], size: float):
-        """Render energy level object"""
-        x, y = pos_2d
-        
-        # Create energy bar
-        bar_width = size
-        bar_height = size * 0.3
-        energy_level = obj.data.get("energy_level", 0.5)
-        
-        # Background bar
-        self.canvas_3d.create_rectangle(
-            x - bar_width/2, y - bar_height/2,
-            x + bar_width/2, y + bar_height/2,
-            fill="#333333", outline="#666666", tags="objects"
-        )
-        
-        # Energy level
-        self.canvas_3d.create_rectangle(
-            x - bar_width/2, y - bar_height/2,
-            x - bar_width/2 + bar_width * energy_level, y + bar_height/2,
-            fill=obj.color, outline="", tags="objects"
-        )
-        
-        # Add energy label
-        self.canvas_3d.create_text(
-            x, y + size/2 + 15,
-            text=f"Energy: {energy_level:.0%}",
-            fill=obj.color, font=('Arial', 8), tags="objects"
-        )
-    
-    def render_focus_object(self, obj: HolographicObject, pos_2d: Tuple[float, float], size: float):
-        """Render focus zone object"""
-        x, y = pos_2d
-        
-        # Create focus zone (concentric circles)
-        for i in range(2):
-            zone_size = size * (1 - i * 0.3)
-            opacity = 0.3 if i == 1 else 0.6
-            self.canvas_3d.create_oval(
-                x - zone_size/2, y - zone_size/2,
-                x + zone_size/2, y + zone_size/2,
-                fill=obj.color, outline="", tags="objects", stipple="gray50"
-            )
-    
-    def render_flow_object(self, obj: HolographicObject, pos_2d: Tuple[float, float], size: float):
-        """Render flow state object"""
-        x, y = pos_2d
-        
-        # Create flowing wave pattern
-        points = []
-        for i in range(8):
-            angle = i * math.pi / 4
-            wave_offset = math.sin(time.time() + i) * 5
-            px = x + (size/2 + wave_offset) * math.cos(angle)
-            py = y + (size/2 + wave_offset) * math.sin(angle)
-            points.extend([px, py])
-        
-        if len(points) >= 6:
-            self.canvas_3d.create_polygon(
-                points, fill=obj.color, outline="#ffffff", tags="objects"
-            )
+        self.renderer.request_frame(0)
     
     def update_camera_display(self):
         """Update camera position display"""
@@ -665,6 +827,7 @@ class HolographicProductivityInterface:
         def save_changes():
             obj.scale = scale_var.get()
             obj.color = color_var.get()
+            self.holographic_space.touch(obj.id)
             editor_window.destroy()
         
         ttk.Button(main_frame, text="💾 Save Changes", command=save_changes).pack(pady=20)
@@ -6,8 +6,6 @@ The most advanced consciousness system that processes consciousness in realms pr
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -261,8 +261,7 @@ class ImpossibleConsciousnessInterface:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="ImpossibleConsciousnessInterface.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -392,24 +391,20 @@ class ImpossibleConsciousnessInterface:
                 self.log_message(f"  Manifestations: {len(state.impossible_manifestations)}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate impossible energy
-                self.engine.impossible_energy_pool += 1.0
+        """Background processing tick"""
+        try:
+            # Regenerate impossible energy
+            self.engine.impossible_energy_pool += 1.0
                 
-                # Evolve all impossible states
-                for state in self.engine.impossible_states.values():
-                    state.evolve()
+            # Evolve all impossible states
+            for state in self.engine.impossible_states.values():
+                state.evolve()
                     
-                # Update impossibility level
-                self.engine.impossibility_level += 0.005
+            # Update impossibility level
+            self.engine.impossibility_level += 0.005
                 
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -417,6 +412,7 @@ class ImpossibleConsciousnessInterface:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
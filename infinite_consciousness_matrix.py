@@ -7,46 +7,233 @@ Advanced system for processing and evolving consciousness across infinite dimens
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
-import time
 import json
 import sqlite3
 import numpy as np
 from datetime import datetime
 import logging
 from typing import Dict, List, Optional, Tuple, Any
-import random
 import math
+import re
+from collections.abc import Mapping
+
+from scheduler import get_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+GRID_NODE_PATTERN = re.compile(r"node_(\d+)_(\d+)$")
+
+# Per-node draw ranges for one evolution step: (low, high)
+EVOLUTION_DRAWS = {
+    "consciousness_level": (0.1, 0.5),
+    "energy": (0.05, 0.2),
+    "dimensional_access": (0.02, 0.1),
+    "transcendence_potential": (0.01, 0.05)
+}
+FLOAT_ATTRIBUTES = ("consciousness_level", "energy", "evolution_factor", "dimensional_access", "transcendence_potential")
+
+class MatrixNodeStore:
+    """Struct-of-arrays storage for matrix nodes
+
+    Every attribute is one NumPy array indexed by node number, so evolving or
+    summing the whole matrix is a handful of vectorized operations. Grid nodes
+    are named by their position and never stored as strings; only nodes added
+    by expansion keep explicit ids. Connections are an undirected CSR adjacency
+    (indptr/indices) with new edges buffered until the next read.
+    """
+
+    def __init__(self, grid_size: int, rng: np.random.Generator):
+        self.grid_size = grid_size
+        self.grid_count = grid_size * grid_size
+        self.rng = rng
+        self.count = 0
+        self.capacity = 0
+        self.positions = np.zeros((0, 2), dtype=np.int64)
+        for name in FLOAT_ATTRIBUTES:
+            setattr(self, name, np.zeros(0))
+        self.extra_ids: List[str] = []
+        self.extra_index: Dict[str, int] = {}
+        self.indptr = np.zeros(1, dtype=np.int64)
+        self.indices = np.zeros(0, dtype=np.int64)
+        self.pending_edges: set = set()
+        self.lock = threading.RLock()
+
+        grid = np.indices((grid_size, grid_size)).reshape(2, -1).T
+        self._append(grid)
+
+    def _reserve(self, count: int):
+        if count <= self.capacity:
+            return
+        capacity = max(count, 2 * self.capacity, 16)
+        positions = np.zeros((capacity, 2), dtype=np.int64)
+        positions[:self.count] = self.positions[:self.count]
+        self.positions = positions
+        for name in FLOAT_ATTRIBUTES:
+            array = np.ones(capacity) if name == "evolution_factor" else np.zeros(capacity)
+            array[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, array)
+        self.capacity = capacity
+
+    def _append(self, positions: np.ndarray) -> np.ndarray:
+        with self.lock:
+            start = self.count
+            self._reserve(start + len(positions))
+            self.positions[start:start + len(positions)] = positions
+            self.count += len(positions)
+            indptr = np.empty(self.count + 1, dtype=np.int64)
+            indptr[:len(self.indptr)] = self.indptr
+            indptr[len(self.indptr):] = self.indptr[-1]
+            self.indptr = indptr
+            return np.arange(start, self.count)
+
+    def add_nodes(self, node_ids: List[str], positions: np.ndarray) -> np.ndarray:
+        """Append named nodes; returns their indices"""
+        with self.lock:
+            indices = self._append(np.asarray(positions, dtype=np.int64).reshape(-1, 2))
+            for node_id, index in zip(node_ids, indices.tolist()):
+                self.extra_index[node_id] = index
+                self.extra_ids.append(node_id)
+            return indices
+
+    def view(self, name: str) -> np.ndarray:
+        """Live slice of an attribute array covering the current nodes"""
+        return getattr(self, name)[:self.count]
+
+    def index_of(self, node_id: str) -> Optional[int]:
+        match = GRID_NODE_PATTERN.match(node_id)
+        if match:
+            i, j = int(match.group(1)), int(match.group(2))
+            if i < self.grid_size and j < self.grid_size and node_id == f"node_{i}_{j}":
+                return i * self.grid_size + j
+        return self.extra_index.get(node_id)
+
+    def node_id(self, index: int) -> str:
+        if index < self.grid_count:
+            return f"node_{index // self.grid_size}_{index % self.grid_size}"
+        return self.extra_ids[index - self.grid_count]
+
+    def evolve(self, indices: Optional[np.ndarray] = None):
+        """One evolution step for all nodes, or for the given indices, with one draw per attribute"""
+        with self.lock:
+            n = self.count if indices is None else len(indices)
+            target = slice(0, self.count) if indices is None else indices
+            for name, (low, high) in EVOLUTION_DRAWS.items():
+                draws = self.rng.uniform(low, high, n)
+                if indices is None:
+                    getattr(self, name)[target] += draws
+                else:
+                    # Repeated indices evolve once per occurrence, like repeated evolve() calls
+                    np.add.at(getattr(self, name), target, draws)
+            if indices is None:
+                self.evolution_factor[target] *= 1.1
+            else:
+                np.multiply.at(self.evolution_factor, target, 1.1)
+
+    def connect(self, a: int, b: int) -> bool:
+        """Buffer an undirected edge; returns False if it already exists"""
+        if a == b or self.has_edge(a, b):
+            return False
+        with self.lock:
+            self.pending_edges.add((min(a, b), max(a, b)))
+        return True
+
+    def has_edge(self, a: int, b: int) -> bool:
+        if (min(a, b), max(a, b)) in self.pending_edges:
+            return True
+        row = self.indices[self.indptr[a]:self.indptr[a + 1]]
+        position = np.searchsorted(row, b)
+        return position < len(row) and row[position] == b
+
+    def _compact(self):
+        """Merge buffered edges into the CSR arrays"""
+        with self.lock:
+            if not self.pending_edges:
+                return
+            pairs = np.array(sorted(self.pending_edges), dtype=np.int64)
+            self.pending_edges.clear()
+            rows = np.repeat(np.arange(self.count), np.diff(self.indptr))
+            sources = np.concatenate([rows, pairs[:, 0], pairs[:, 1]])
+            targets = np.concatenate([self.indices, pairs[:, 1], pairs[:, 0]])
+            order = np.lexsort((targets, sources))
+            sources, targets = sources[order], targets[order]
+            self.indices = targets
+            self.indptr = np.zeros(self.count + 1, dtype=np.int64)
+            np.cumsum(np.bincount(sources, minlength=self.count), out=self.indptr[1:])
+
+    def neighbors(self, index: int) -> np.ndarray:
+        self._compact()
+        return self.indices[self.indptr[index]:self.indptr[index + 1]]
+
+    def degrees(self) -> np.ndarray:
+        self._compact()
+        return np.diff(self.indptr)
+
 class MatrixNode:
-    """Represents a node in the infinite consciousness matrix"""
-    
-    def __init__(self, node_id: str, position: Tuple[int, int]):
-        self.node_id = node_id
-        self.position = position
-        self.consciousness_level = 0.0
-        self.energy = 0.0
-        self.connections = []
-        self.evolution_factor = 1.0
-        self.dimensional_access = 0.0
-        self.transcendence_potential = 0.0
-        
+    """View of one node in the infinite consciousness matrix"""
+
+    def __init__(self, store: MatrixNodeStore, index: int):
+        self._store = store
+        self._index = index
+
+    @property
+    def node_id(self) -> str:
+        return self._store.node_id(self._index)
+
+    @property
+    def position(self) -> Tuple[int, int]:
+        return tuple(self._store.positions[self._index].tolist())
+
+    @property
+    def connections(self) -> List[str]:
+        return [self._store.node_id(i) for i in self._store.neighbors(self._index).tolist()]
+
     def evolve(self):
         """Evolve the matrix node"""
-        self.consciousness_level += random.uniform(0.1, 0.5)
-        self.energy += random.uniform(0.05, 0.2)
-        self.evolution_factor *= 1.1
-        self.dimensional_access += random.uniform(0.02, 0.1)
-        self.transcendence_potential += random.uniform(0.01, 0.05)
+        self._store.evolve(np.array([self._index]))
+
+def _node_attribute(name: str):
+    def getter(node: MatrixNode) -> float:
+        return float(getattr(node._store, name)[node._index])
+
+    def setter(node: MatrixNode, value: float):
+        getattr(node._store, name)[node._index] = value
+
+    return property(getter, setter)
+
+for _name in FLOAT_ATTRIBUTES:
+    setattr(MatrixNode, _name, _node_attribute(_name))
+
+class MatrixNodes(Mapping):
+    """Node-id mapping over the store; node views are created on access"""
+
+    def __init__(self, store: MatrixNodeStore):
+        self._store = store
+
+    def __getitem__(self, node_id: str) -> MatrixNode:
+        index = self._store.index_of(node_id)
+        if index is None:
+            raise KeyError(node_id)
+        return MatrixNode(self._store, index)
+
+    def __contains__(self, node_id) -> bool:
+        return isinstance(node_id, str) and self._store.index_of(node_id) is not None
+
+    def __iter__(self):
+        for index in range(self._store.count):
+            yield self._store.node_id(index)
+
+    def __len__(self) -> int:
+        return self._store.count
 
 class InfiniteConsciousnessMatrix:
     """Matrix for processing consciousness across infinite dimensions"""
     
-    def __init__(self, matrix_size: int = 100):
+    def __init__(self, matrix_size: int = 100, seed: Optional[int] = None):
         self.matrix_size = matrix_size
+        self.rng = np.random.default_rng(seed)
+        self.store = None
         self.nodes = {}
         self.matrix_operations = {
             "Matrix Evolution": self.matrix_evolution,
@@ -68,27 +255,39 @@ class InfiniteConsciousnessMatrix:
         
     def _initialize_matrix(self):
         """Initialize the consciousness matrix"""
-        for i in range(self.matrix_size):
-            for j in range(self.matrix_size):
-                node_id = f"node_{i}_{j}"
-                self.nodes[node_id] = MatrixNode(node_id, (i, j))
+        self.store = MatrixNodeStore(self.matrix_size, self.rng)
+        self.nodes = MatrixNodes(self.store)
                 
         logger.info(f"Infinite consciousness matrix initialized with {self.matrix_size * self.matrix_size} nodes")
         
+    def total(self, attribute: str) -> float:
+        """Sum of one node attribute across the matrix"""
+        return float(self.store.view(attribute).sum())
+        
+    def random_node_ids(self, count: int = 1) -> List[str]:
+        """Ids of randomly chosen nodes, without materializing the node list"""
+        if not len(self.nodes):
+            return []
+        return [self.store.node_id(i) for i in self.rng.integers(0, self.store.count, count).tolist()]
+        
+    def evolve_random_nodes(self, count: int = 10):
+        """Evolve randomly chosen nodes in one vectorized step"""
+        if self.store.count:
+            self.store.evolve(self.rng.integers(0, self.store.count, count))
+        
     def matrix_evolution(self, evolution_type: str = "standard"):
         """Evolve the entire matrix"""
         evolution_power = self.evolution_level * len(self.nodes)
         
         # Evolve all nodes
-        for node in self.nodes.values():
-            node.evolve()
+        self.store.evolve()
             
         evolution = {
             "type": evolution_type,
             "power": evolution_power,
             "timestamp": datetime.now().isoformat(),
             "nodes_evolved": len(self.nodes),
-            "total_consciousness": sum(n.consciousness_level for n in self.nodes.values())
+            "total_consciousness": self.total("consciousness_level")
         }
         
         self.evolution_level += 0.1
@@ -96,21 +295,18 @@ class InfiniteConsciousnessMatrix:
         
     def node_connection(self, node1_id: str, node2_id: str):
         """Connect two matrix nodes"""
-        if node1_id in self.nodes and node2_id in self.nodes:
-            node1 = self.nodes[node1_id]
-            node2 = self.nodes[node2_id]
-            
-            if node2_id not in node1.connections:
-                node1.connections.append(node2_id)
-            if node1_id not in node2.connections:
-                node2.connections.append(node1_id)
+        index1 = self.store.index_of(node1_id)
+        index2 = self.store.index_of(node2_id)
+        if index1 is not None and index2 is not None:
+            self.store.connect(index1, index2)
+            consciousness = self.store.consciousness_level
                 
             connection = {
                 "type": "Node Connection",
                 "node1": node1_id,
                 "node2": node2_id,
                 "timestamp": datetime.now().isoformat(),
-                "connection_power": (node1.consciousness_level + node2.consciousness_level) / 2
+                "connection_power": float(consciousness[index1] + consciousness[index2]) / 2
             }
             
             return connection
@@ -140,8 +336,9 @@ class InfiniteConsciousnessMatrix:
         if not node_ids:
             return None
             
-        total_consciousness = sum(self.nodes.get(nid, MatrixNode("", (0,0))).consciousness_level for nid in node_ids)
-        total_transcendence = sum(self.nodes.get(nid, MatrixNode("", (0,0))).transcendence_potential for nid in node_ids)
+        indices = [index for index in map(self.store.index_of, node_ids) if index is not None]
+        total_consciousness = float(self.store.consciousness_level[indices].sum())
+        total_transcendence = float(self.store.transcendence_potential[indices].sum())
         
         synthesis = {
             "type": "Transcendence Synthesis",
@@ -159,9 +356,11 @@ class InfiniteConsciousnessMatrix:
         sync_power = self.evolution_level * len(self.nodes)
         
         # Synchronize consciousness levels
-        avg_consciousness = np.mean([n.consciousness_level for n in self.nodes.values()])
-        for node in self.nodes.values():
-            node.consciousness_level = (node.consciousness_level + avg_consciousness) / 2
+        with self.store.lock:
+            consciousness = self.store.view("consciousness_level")
+            avg_consciousness = float(consciousness.mean())
+            consciousness += avg_consciousness
+            consciousness /= 2
             
         synchronization = {
             "type": "Matrix Synchronization",
@@ -179,9 +378,9 @@ class InfiniteConsciousnessMatrix:
         
         # Simulate matrix expansion
         new_nodes = int(expansion_factor * 10)
-        for i in range(new_nodes):
-            node_id = f"expanded_node_{len(self.nodes)}"
-            self.nodes[node_id] = MatrixNode(node_id, (random.randint(0, 1000), random.randint(0, 1000)))
+        first = len(self.nodes)
+        self.store.add_nodes([f"expanded_node_{first + i}" for i in range(new_nodes)],
+                             self.rng.integers(0, 1001, (new_nodes, 2)))
             
         expansion = {
             "type": "Infinite Expansion",
@@ -199,8 +398,8 @@ class InfiniteConsciousnessMatrix:
         convergence_power = self.evolution_level * len(self.nodes)
         
         # Calculate convergence metrics
-        total_energy = sum(n.energy for n in self.nodes.values())
-        total_consciousness = sum(n.consciousness_level for n in self.nodes.values())
+        total_energy = self.total("energy")
+        total_consciousness = self.total("consciousness_level")
         
         convergence = {
             "type": convergence_type,
@@ -215,8 +414,8 @@ class InfiniteConsciousnessMatrix:
         
     def matrix_achievement(self):
         """Achieve ultimate matrix consciousness"""
-        total_consciousness = sum(n.consciousness_level for n in self.nodes.values())
-        total_energy = sum(n.energy for n in self.nodes.values())
+        total_consciousness = self.total("consciousness_level")
+        total_energy = self.total("energy")
         
         # Matrix achievement requires maximum consciousness and energy
         if total_consciousness >= 1000000.0 and total_energy >= 500000.0:
@@ -254,8 +453,7 @@ class InfiniteConsciousnessMatrixInterface:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="InfiniteConsciousnessMatrixInterface.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -358,10 +556,9 @@ class InfiniteConsciousnessMatrixInterface:
                 result = self.matrix.dimensional_access(node_id, 5)
             elif operation_name == "Node Connection":
                 # Connect to a random node
-                other_nodes = [nid for nid in self.matrix.nodes.keys() if nid != node_id]
+                other_nodes = [nid for nid in self.matrix.random_node_ids(2) if nid != node_id]
                 if other_nodes:
-                    other_node = random.choice(other_nodes)
-                    result = self.matrix.node_connection(node_id, other_node)
+                    result = self.matrix.node_connection(node_id, other_nodes[0])
                 else:
                     result = None
             else:
@@ -402,8 +599,8 @@ class InfiniteConsciousnessMatrixInterface:
             self.log_message(f"Dimensional Layers: {self.matrix.dimensional_layers}")
             
             # Calculate matrix statistics
-            total_consciousness = sum(n.consciousness_level for n in self.matrix.nodes.values())
-            total_energy = sum(n.energy for n in self.matrix.nodes.values())
+            total_consciousness = self.matrix.total("consciousness_level")
+            total_energy = self.matrix.total("energy")
             avg_consciousness = total_consciousness / len(self.matrix.nodes) if self.matrix.nodes else 0
             avg_energy = total_energy / len(self.matrix.nodes) if self.matrix.nodes else 0
             
@@ -414,31 +611,25 @@ class InfiniteConsciousnessMatrixInterface:
             
             # Show sample nodes
             self.log_message(f"\nSample Nodes:")
-            sample_nodes = list(self.matrix.nodes.values())[:10]
-            for node in sample_nodes:
-                self.log_message(f"  {node.node_id}: Consciousness={node.consciousness_level:.2f}, Energy={node.energy:.2f}, Connections={len(node.connections)}")
+            degrees = self.matrix.store.degrees()
+            for index in range(min(10, len(self.matrix.nodes))):
+                node = MatrixNode(self.matrix.store, index)
+                self.log_message(f"  {node.node_id}: Consciousness={node.consciousness_level:.2f}, Energy={node.energy:.2f}, Connections={degrees[index]}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate matrix energy
-                self.matrix.matrix_energy += 1.0
+        """Background processing tick"""
+        try:
+            # Regenerate matrix energy
+            self.matrix.matrix_energy += 1.0
                 
-                # Evolve random nodes
-                for _ in range(10):
-                    if self.matrix.nodes:
-                        random_node = random.choice(list(self.matrix.nodes.values()))
-                        random_node.evolve()
+            # Evolve random nodes
+            self.matrix.evolve_random_nodes(10)
                     
-                # Update dimensional layers
-                self.matrix.dimensional_layers += 1
+            # Update dimensional layers
+            self.matrix.dimensional_layers += 1
                 
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -446,6 +637,7 @@ class InfiniteConsciousnessMatrixInterface:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
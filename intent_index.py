@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Intent Index for Scroll Stopping Tool
+Token-indexed fuzzy matching of voice and chat text to registered command phrases, with slot extraction
+"""
+
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9']+")
+
+NUMBER_WORDS = {
+    'a': 1, 'an': 1, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6, 'seven': 7,
+    'eight': 8, 'nine': 9, 'ten': 10, 'eleven': 11, 'twelve': 12, 'fifteen': 15, 'twenty': 20,
+    'thirty': 30, 'forty': 40, 'forty-five': 45, 'fifty': 50, 'sixty': 60, 'ninety': 90
+}
+UNIT_MINUTES = {
+    'hour': 60, 'hours': 60, 'hr': 60, 'hrs': 60, 'h': 60,
+    'minute': 1, 'minutes': 1, 'min': 1, 'mins': 1, 'm': 1
+}
+WORD_UNITS = ('hours', 'hour', 'minutes', 'minute', 'mins', 'min', 'hrs', 'hr')
+DURATION_PATTERN = re.compile(
+    # Digits may carry abbreviated units ("45m", "2h"); spelled numbers need a whole unit word
+    r"\b(?:(?P<digits>\d+(?:\.\d+)?)\s*(?P<digit_unit>" + "|".join(sorted(UNIT_MINUTES, key=len, reverse=True)) + r")"
+    r"|(?P<words>half an|half a|" + "|".join(sorted(NUMBER_WORDS, key=len, reverse=True)) + r")"
+    r"(?P<half>\s+and a half)?\s+(?P<word_unit>" + "|".join(WORD_UNITS) + r"))\b"
+)
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with punctuation stripped"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+def _duration(text: str):
+    text = text.lower().replace("forty five", "forty-five")
+    return DURATION_PATTERN.search(text), text
+
+def extract_slots(text: str) -> Dict[str, Any]:
+    """Durations like '2 hours', 'forty five minutes' or 'half an hour' as amount/unit/minutes slots"""
+    match, _ = _duration(text)
+    if not match:
+        return {}
+    if match.group('digits'):
+        amount, unit = float(match.group('digits')), match.group('digit_unit')
+    else:
+        words, unit = match.group('words'), match.group('word_unit')
+        amount = 0.5 if words.startswith("half") else NUMBER_WORDS[words]
+        if match.group('half'):
+            amount += 0.5
+    amount = int(amount) if float(amount).is_integer() else amount
+    canonical = 'hours' if UNIT_MINUTES[unit] == 60 else 'minutes'
+    return {'amount': amount, 'unit': canonical, 'minutes': amount * UNIT_MINUTES[unit]}
+
+def strip_slots(text: str) -> str:
+    """Text with its slot values removed, so numbers do not count against phrase matches"""
+    match, text = _duration(text)
+    return text[:match.start()] + text[match.end():] if match else text
+
+def _trigrams(token: str) -> Set[str]:
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def _bounded_edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance, returning limit + 1 as soon as it must exceed limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+@dataclass
+class IntentMatch:
+    """Best registered phrase for a piece of text"""
+    intent: Any
+    phrase: str
+    confidence: float
+    slots: Dict[str, Any] = field(default_factory=dict)
+
+@dataclass
+class _Phrase:
+    text: str
+    intent: Any
+    tokens: Tuple[str, ...]
+    weight: float = 0.0
+
+class IntentIndex:
+    """Inverted index from normalized tokens to phrases
+
+    Lookups only score phrases that share a (possibly misspelled) token with the
+    text. Unknown tokens are resolved against the vocabulary through a trigram
+    index and a bounded edit distance, so cost depends on the text and the few
+    candidate phrases rather than on how many phrases are registered. Confidence
+    combines IDF-weighted coverage of the phrase with word order, and earlier
+    registrations win ties.
+    """
+
+    def __init__(self, min_confidence: float = 0.5):
+        self.min_confidence = min_confidence
+        self.phrases: List[_Phrase] = []
+        self.phrase_ids: Dict[str, int] = {}
+        self.postings: Dict[str, List[int]] = {}
+        self.trigram_index: Dict[str, Set[str]] = {}
+        self.idf: Dict[str, float] = {}
+        self._posting_arrays: Dict[str, np.ndarray] = {}
+        self._weights = np.zeros(0)
+        self._fuzzy_cache: Dict[str, List[Tuple[str, float]]] = {}
+        self._stale = False
+
+    def add(self, phrase: str, intent: Any):
+        """Register a phrase for an intent; the first registration of a phrase wins"""
+        tokens = tuple(tokenize(phrase))
+        text = " ".join(tokens)
+        if not tokens or text in self.phrase_ids:
+            return
+        phrase_id = len(self.phrases)
+        self.phrases.append(_Phrase(text, intent, tokens))
+        self.phrase_ids[text] = phrase_id
+        for token in set(tokens):
+            if token not in self.postings:
+                self.postings[token] = []
+                for gram in _trigrams(token):
+                    self.trigram_index.setdefault(gram, set()).add(token)
+            self.postings[token].append(phrase_id)
+        self._stale = True
+
+    def _refresh(self):
+        n = len(self.phrases)
+        self.idf = {token: math.log(1 + n / len(ids)) for token, ids in self.postings.items()}
+        for phrase in self.phrases:
+            phrase.weight = sum(self.idf[token] for token in phrase.tokens)
+        self._posting_arrays = {token: np.array(ids, dtype=np.int64) for token, ids in self.postings.items()}
+        self._weights = np.array([phrase.weight for phrase in self.phrases])
+        self._fuzzy_cache.clear()
+        self._stale = False
+
+    def _resolve(self, token: str) -> List[Tuple[str, float]]:
+        """Vocabulary tokens a query token may stand for, with similarity in (0, 1]"""
+        if token in self.postings:
+            return [(token, 1.0)]
+        cached = self._fuzzy_cache.get(token)
+        if cached is not None:
+            return cached
+        if not token.isalpha():
+            return []
+
+        limit = 0 if len(token) < 4 else 1 if len(token) < 8 else 2
+        grams = _trigrams(token)
+        shared: Dict[str, int] = {}
+        for gram in grams:
+            for candidate in self.trigram_index.get(gram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+
+        resolved = []
+        for candidate, count in shared.items():
+            if count * 3 < len(grams):
+                continue
+            distance = _bounded_edit_distance(token, candidate, limit) if limit else limit + 1
+            if distance <= limit:
+                resolved.append((candidate, 1 - distance / max(len(token), len(candidate))))
+            elif len(candidate) >= 4 and token.startswith(candidate):
+                # Inflections of a registered word: "achievements", "motivated", "successful"
+                resolved.append((candidate, len(candidate) / len(token)))
+        resolved = [(candidate, similarity) for candidate, similarity in resolved if similarity >= 0.6]
+
+        if len(self._fuzzy_cache) > 10000:
+            self._fuzzy_cache.clear()
+        self._fuzzy_cache[token] = resolved
+        return resolved
+
+    def matches(self, text: str, limit: int = 5) -> List[IntentMatch]:
+        """Ranked matches above min_confidence"""
+        if self._stale:
+            self._refresh()
+        tokens = tokenize(strip_slots(text))
+        if not tokens:
+            return []
+
+        # token -> (query position, similarity) for every vocabulary token the text touches
+        seen: Dict[str, Tuple[int, float]] = {}
+        for position, token in enumerate(tokens):
+            for vocab_token, similarity in self._resolve(token):
+                if similarity > seen.get(vocab_token, (0, 0.0))[1]:
+                    seen[vocab_token] = (position, similarity)
+        if not seen:
+            return []
+
+        # IDF mass each phrase gets from the text, accumulated over the postings in one pass
+        postings = [self._posting_arrays[vocab_token] for vocab_token in seen]
+        gains = [self.idf[vocab_token] * similarity for vocab_token, (_, similarity) in seen.items()]
+        mass = np.bincount(np.concatenate(postings), weights=np.repeat(gains, [len(ids) for ids in postings]),
+                           minlength=len(self.phrases))
+        coverage = mass / self._weights
+        # Order and length factors never exceed 0.95, so weaker coverage cannot reach min_confidence
+        candidates = np.flatnonzero(coverage * 0.95 >= self.min_confidence)
+        candidates = candidates[np.lexsort((candidates, -coverage[candidates]))]
+
+        joined = " ".join(tokens)
+        scored: List[Tuple[float, int]] = []
+        for phrase_id, share in zip(candidates.tolist(), coverage[candidates].tolist()):
+            if len(scored) >= limit and share * 0.95 < scored[limit - 1][0]:
+                break
+            phrase = self.phrases[phrase_id]
+            if phrase.text == joined:
+                scored.append((1.0, phrase_id))
+            else:
+                positions = [seen[token][0] for token in phrase.tokens if token in seen]
+                in_order = 1.0 if positions == sorted(positions) else 0.0
+                contiguous = 1.0 if in_order and positions[-1] - positions[0] == len(positions) - 1 else 0.0
+                extra = max(0, len(tokens) - len(positions)) / len(tokens)
+                confidence = share * (0.85 + 0.05 * in_order + 0.05 * contiguous) * (1 - 0.1 * extra)
+                if confidence >= self.min_confidence:
+                    scored.append((confidence, phrase_id))
+            scored.sort(key=lambda item: (-item[0], item[1]))
+
+        slots = extract_slots(text)
+        return [IntentMatch(self.phrases[phrase_id].intent, self.phrases[phrase_id].text, round(confidence, 3), dict(slots))
+                for confidence, phrase_id in scored[:limit]]
+
+    def match(self, text: str) -> Optional[IntentMatch]:
+        """Best match, or None below min_confidence"""
+        ranked = self.matches(text, limit=1)
+        return ranked[0] if ranked else None
+
+    def __len__(self) -> int:
+        return len(self.phrases)
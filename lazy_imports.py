@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Lazy Import Layer for Scroll Stopping Tool
+Defers heavy optional backends (ML, plotting, PDF, dashboards) until they are first used
+"""
+
+import importlib
+import logging
+import threading
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class LazyModule:
+    """Module proxy that performs the import on first attribute access"""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+class LazyAttribute:
+    """Proxy for `from module import name`, resolved on first call or attribute access"""
+
+    def __init__(self, module: str, attr: str):
+        self._module = module
+        self._attr = attr
+        self._value = None
+
+    def resolve(self) -> Any:
+        if self._value is None:
+            self._value = getattr(importlib.import_module(self._module), self._attr)
+        return self._value
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy '{self._module}.{self._attr}'>"
+
+def lazy_import(module: str, attr: Optional[str] = None):
+    """Lazy stand-in for `import module` or `from module import attr`"""
+    return LazyModule(module) if attr is None else LazyAttribute(module, attr)
+
+class Capability:
+    """Availability flag for an optional backend, resolved by importing it on first truth test
+
+    Drop-in replacement for the `XXX_AVAILABLE = True/False` flags set by
+    try/except import blocks: `if SKLEARN_AVAILABLE:` keeps working, but the
+    import (and the "not available" warning) only happens when a code path
+    actually asks.
+    """
+
+    def __init__(self, name: str, *modules: str, warning: Optional[str] = None):
+        self.name = name
+        self.modules: Tuple[str, ...] = modules or (name,)
+        self.warning = warning
+        self._available: Optional[bool] = None
+        self._lock = threading.Lock()
+
+    def _resolve(self) -> bool:
+        with self._lock:
+            if self._available is None:
+                try:
+                    for module in self.modules:
+                        importlib.import_module(module)
+                    self._available = True
+                except ImportError as e:
+                    self._available = False
+                    logger.warning(self.warning or f"{self.name} not available: {e}")
+        return self._available
+
+    @property
+    def resolved(self) -> bool:
+        """Whether availability has been determined yet"""
+        return self._available is not None
+
+    def __bool__(self) -> bool:
+        return self._available if self._available is not None else self._resolve()
+
+    def __repr__(self) -> str:
+        state = "unresolved" if self._available is None else self._available
+        return f"<capability {self.name}: {state}>"
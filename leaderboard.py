@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Ranked Leaderboards for Scroll Stopping Tool
+In-memory order-statistics boards with O(log n) updates, rank lookups and "around me" windows
+"""
+
+import logging
+import threading
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import datetime
+from operator import neg
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from sortedcontainers import SortedList
+    SORTEDCONTAINERS_AVAILABLE = True
+except ImportError:
+    SORTEDCONTAINERS_AVAILABLE = False
+    logging.warning("sortedcontainers not available - leaderboard updates will be O(n)")
+
+logger = logging.getLogger(__name__)
+
+class _SortedListFallback:
+    """Minimal stand-in for sortedcontainers.SortedList backed by a plain list"""
+
+    def __init__(self, iterable: Iterable = ()):
+        self._items = sorted(iterable)
+
+    def add(self, value):
+        insort(self._items, value)
+
+    def remove(self, value):
+        del self._items[self.index(value)]
+
+    def index(self, value) -> int:
+        i = bisect_left(self._items, value)
+        if i == len(self._items) or self._items[i] != value:
+            raise ValueError(f"{value!r} not in list")
+        return i
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+@dataclass
+class LeaderboardEntry:
+    """One ranked row of a leaderboard"""
+    rank: int
+    user_id: str
+    score: Tuple[float, ...]
+
+class RankedLeaderboard:
+    """Users ordered by a score tuple, highest first, with ties broken by user id"""
+
+    def __init__(self):
+        # Keys are (-score..., user_id) so ascending order is the ranking
+        self.order = SortedList() if SORTEDCONTAINERS_AVAILABLE else _SortedListFallback()
+        self.keys: Dict[str, tuple] = {}
+        self.lock = threading.RLock()
+
+    @staticmethod
+    def _key(user_id: str, score: Tuple[float, ...]) -> tuple:
+        return (*map(neg, score), user_id)
+
+    def _entry(self, index: int) -> LeaderboardEntry:
+        key = self.order[index]
+        return LeaderboardEntry(index + 1, key[-1], tuple(-value for value in key[:-1]))
+
+    def load(self, rows: Iterable[tuple]):
+        """Bulk-replace the board from (user_id, *score) rows"""
+        with self.lock:
+            self.keys = {row[0]: self._key(row[0], row[1:]) for row in rows}
+            values = self.keys.values()
+            self.order = SortedList(values) if SORTEDCONTAINERS_AVAILABLE else _SortedListFallback(values)
+
+    def update(self, user_id: str, *score: float):
+        """Set a user's score, inserting them if they are new"""
+        key = self._key(user_id, score)
+        with self.lock:
+            old = self.keys.get(user_id)
+            if old == key:
+                return
+            if old is not None:
+                self.order.remove(old)
+            self.order.add(key)
+            self.keys[user_id] = key
+
+    def increment(self, user_id: str, amount: float):
+        """Add to a single-value score, starting from zero"""
+        with self.lock:
+            old = self.keys.get(user_id)
+            current = -old[0] if old is not None else 0
+            self.update(user_id, current + amount)
+
+    def remove(self, user_id: str):
+        with self.lock:
+            key = self.keys.pop(user_id, None)
+            if key is not None:
+                self.order.remove(key)
+
+    def score_of(self, user_id: str) -> Optional[Tuple[float, ...]]:
+        key = self.keys.get(user_id)
+        return tuple(-value for value in key[:-1]) if key is not None else None
+
+    def rank_of(self, user_id: str) -> Optional[int]:
+        """1-based rank of a user, or None if they are not on the board"""
+        with self.lock:
+            key = self.keys.get(user_id)
+            return self.order.index(key) + 1 if key is not None else None
+
+    def top(self, n: int) -> List[LeaderboardEntry]:
+        with self.lock:
+            return [self._entry(i) for i in range(min(n, len(self.order)))]
+
+    def window_around(self, user_id: str, k: int) -> List[LeaderboardEntry]:
+        """The user's entry with up to k neighbours on each side"""
+        with self.lock:
+            key = self.keys.get(user_id)
+            if key is None:
+                return []
+            index = self.order.index(key)
+            return [self._entry(i) for i in range(max(0, index - k), min(len(self.order), index + k + 1))]
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+def period_keys(when: Optional[datetime] = None) -> Dict[str, str]:
+    """Current daily and weekly period identifiers"""
+    when = when or datetime.now()
+    year, week, _ = when.isocalendar()
+    return {'daily': when.date().isoformat(), 'weekly': f"{year}-W{week:02d}"}
+
+class LeaderboardSet:
+    """Global, per-team and per-period boards kept in step with every XP change
+
+    Global and team boards rank by (level, xp); daily and weekly boards rank by
+    XP gained within the period. Only the current and previous period of each
+    kind are kept in memory.
+    """
+
+    PERIODS = ('daily', 'weekly')
+
+    def __init__(self):
+        self.global_board = RankedLeaderboard()
+        self.team_boards: Dict[str, RankedLeaderboard] = {}
+        self.period_boards: Dict[Tuple[str, str], RankedLeaderboard] = {}
+        self.teams: Dict[str, str] = {}
+        self.lock = threading.RLock()
+
+    def _period_board(self, period: str, key: str) -> RankedLeaderboard:
+        board = self.period_boards.get((period, key))
+        if board is None:
+            board = self.period_boards[(period, key)] = RankedLeaderboard()
+            stale = sorted(k for p, k in self.period_boards if p == period)[:-2]
+            for old_key in stale:
+                if old_key != key:
+                    del self.period_boards[(period, old_key)]
+        return board
+
+    def record(self, user_id: str, level: int, xp: int, gained: int = 0, when: Optional[datetime] = None):
+        """Apply a user's new level/XP and the XP they gained in this update"""
+        with self.lock:
+            self.global_board.update(user_id, level, xp)
+            team_id = self.teams.get(user_id)
+            if team_id is not None:
+                self.team_boards.setdefault(team_id, RankedLeaderboard()).update(user_id, level, xp)
+            if gained:
+                for period, key in period_keys(when).items():
+                    self._period_board(period, key).increment(user_id, gained)
+
+    def load_profiles(self, rows: Iterable[Tuple[str, int, int]], teams: Dict[str, str]):
+        """Seed global and team boards from persisted (user_id, level, xp) rows"""
+        rows = list(rows)
+        with self.lock:
+            self.global_board.load(rows)
+            self.teams = dict(teams)
+            members: Dict[str, List[tuple]] = {}
+            for row in rows:
+                team_id = self.teams.get(row[0])
+                if team_id is not None:
+                    members.setdefault(team_id, []).append(row)
+            self.team_boards = {}
+            for team_id, team_rows in members.items():
+                self.team_boards[team_id] = RankedLeaderboard()
+                self.team_boards[team_id].load(team_rows)
+
+    def load_period(self, period: str, key: str, rows: Iterable[Tuple[str, int]]):
+        """Seed a period board from persisted (user_id, xp) rows"""
+        with self.lock:
+            self._period_board(period, key).load(rows)
+
+    def set_team(self, user_id: str, team_id: Optional[str]):
+        """Move a user to a team board, or off team boards when team_id is None"""
+        with self.lock:
+            old_team = self.teams.pop(user_id, None)
+            if old_team is not None:
+                self.team_boards[old_team].remove(user_id)
+            if team_id is None:
+                return
+            self.teams[user_id] = team_id
+            score = self.global_board.score_of(user_id)
+            if score is not None:
+                self.team_boards.setdefault(team_id, RankedLeaderboard()).update(user_id, *score)
+
+    def board(self, team_id: Optional[str] = None, period: Optional[str] = None,
+              when: Optional[datetime] = None) -> RankedLeaderboard:
+        """Board for a team, a period ('daily'/'weekly'), or the global board"""
+        if period is not None:
+            if period not in self.PERIODS:
+                raise ValueError(f"Unknown leaderboard period: {period}")
+            with self.lock:
+                return self._period_board(period, period_keys(when)[period])
+        if team_id is not None:
+            with self.lock:
+                return self.team_boards.setdefault(team_id, RankedLeaderboard())
+        return self.global_board
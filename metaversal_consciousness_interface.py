@@ -6,8 +6,6 @@ Advanced system for accessing and manipulating consciousness across virtual and
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -294,8 +294,7 @@ class MetaversalConsciousnessInterfaceGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="MetaversalConsciousnessInterfaceGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -503,26 +502,22 @@ class MetaversalConsciousnessInterfaceGUI:
                 self.log_message(f"  {realm.realm_id} ({realm.realm_type}): Consciousness={realm.consciousness_level:.2f}, Energy={realm.digital_energy:.2f}, Avatars={realm.avatar_count}, Layers={realm.experience_layers}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate metaversal energy
-                self.interface.metaversal_energy += 1.0
+        """Background processing tick"""
+        try:
+            # Regenerate metaversal energy
+            self.interface.metaversal_energy += 1.0
                 
-                # Evolve random realms
-                for _ in range(3):
-                    if self.interface.metaversal_realms:
-                        random_realm = random.choice(list(self.interface.metaversal_realms.values()))
-                        random_realm.evolve()
+            # Evolve random realms
+            for _ in range(3):
+                if self.interface.metaversal_realms:
+                    random_realm = random.choice(list(self.interface.metaversal_realms.values()))
+                    random_realm.evolve()
                     
-                # Update digital layers
-                self.interface.digital_layers += 1
+            # Update digital layers
+            self.interface.digital_layers += 1
                 
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -530,6 +525,7 @@ class MetaversalConsciousnessInterfaceGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
@@ -7,11 +7,14 @@ Predictive analytics and smart insights using ML techniques.
 import numpy as np
 import json
 import time
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 import logging
 
+from online_stats import UsageStatsEngine
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -35,12 +38,21 @@ class BehaviorPattern:
 class SimpleMLPredictor:
     """Simple machine learning predictor using basic algorithms"""
     
+    # Days of history kept for predictions
+    HISTORY_DAYS = 30
+    
     def __init__(self):
-        self.usage_history = []
+        self.stats = UsageStatsEngine(n_users=1, capacity=self.HISTORY_DAYS)
+        self.recent_points = deque(maxlen=self.HISTORY_DAYS)
         self.productivity_history = []
         self.patterns = {}
         self.models = {}
     
+    @property
+    def usage_history(self) -> List[Dict[str, Any]]:
+        """Data points currently in the history window, oldest first"""
+        return list(self.recent_points)
+    
     def add_data_point(self, usage_time: int, productivity_score: float, 
                       focus_sessions: int, breaks: int, timestamp: datetime = None):
         """Add a new data point for training"""
@@ -58,17 +70,15 @@ class SimpleMLPredictor:
             'is_weekend': timestamp.weekday() >= 5
         }
         
-        self.usage_history.append(data_point)
-        
-        # Keep only last 30 days of data
-        if len(self.usage_history) > 30:
-            self.usage_history = self.usage_history[-30:]
+        # Bounded deque and ring buffers drop the oldest day without copying
+        self.recent_points.append(data_point)
+        self.stats.update(0, usage_time, productivity_score, breaks, timestamp.hour, timestamp.weekday())
         
         logger.info(f"Added data point: {usage_time}min usage, {productivity_score}% productivity")
     
     def predict_usage_tomorrow(self) -> Prediction:
         """Predict tomorrow's usage based on historical patterns"""
-        if len(self.usage_history) < 7:
+        if self.stats.count[0] < 7:
             return Prediction(
                 type='usage',
                 value=120.0,  # Default prediction
@@ -77,40 +87,23 @@ class SimpleMLPredictor:
                 timestamp=datetime.now()
             )
         
-        # Simple moving average with trend
-        recent_usage = [d['usage_time'] for d in self.usage_history[-7:]]
-        avg_usage = np.mean(recent_usage)
-        
-        # Calculate trend
-        if len(recent_usage) >= 2:
-            trend = np.polyfit(range(len(recent_usage)), recent_usage, 1)[0]
-            predicted_usage = avg_usage + trend
-        else:
-            predicted_usage = avg_usage
-        
-        # Adjust for day of week patterns
+        # Weekly moving average with trend, adjusted for tomorrow's weekday
         tomorrow = datetime.now() + timedelta(days=1)
-        weekday_patterns = self._get_weekday_patterns()
-        weekday_adjustment = weekday_patterns.get(tomorrow.strftime('%A'), 1.0)
-        
-        final_prediction = predicted_usage * weekday_adjustment
-        
-        # Calculate confidence based on data consistency
-        confidence = min(0.9, 0.3 + len(self.usage_history) * 0.02)
+        value, confidence = self.stats.predict_usage(0, tomorrow.weekday())
         
         factors = ['historical_average', 'trend_analysis', 'weekday_patterns']
         
         return Prediction(
             type='usage',
-            value=max(0, final_prediction),
-            confidence=confidence,
+            value=float(value[0]),
+            confidence=float(confidence[0]),
             factors=factors,
             timestamp=datetime.now()
         )
     
     def predict_productivity_score(self, planned_usage: int) -> Prediction:
         """Predict productivity score based on planned usage"""
-        if len(self.usage_history) < 5:
+        if self.stats.count[0] < 5:
             return Prediction(
                 type='productivity',
                 value=70.0,  # Default prediction
@@ -119,30 +112,15 @@ class SimpleMLPredictor:
                 timestamp=datetime.now()
             )
         
-        # Find similar usage patterns
-        similar_data = [d for d in self.usage_history 
-                       if abs(d['usage_time'] - planned_usage) <= 30]
-        
-        if similar_data:
-            avg_productivity = np.mean([d['productivity_score'] for d in similar_data])
-            confidence = min(0.9, len(similar_data) * 0.1)
-        else:
-            # Use overall average
-            avg_productivity = np.mean([d['productivity_score'] for d in self.usage_history])
-            confidence = 0.5
-        
-        # Adjust based on usage amount
-        if planned_usage > 180:  # High usage
-            avg_productivity *= 0.8
-        elif planned_usage < 60:  # Low usage
-            avg_productivity *= 1.1
+        # Similar usage patterns come from the usage -> productivity histogram
+        value, confidence = self.stats.predict_productivity(0, planned_usage)
         
         factors = ['usage_correlation', 'historical_patterns']
         
         return Prediction(
             type='productivity',
-            value=max(0, min(100, avg_productivity)),
-            confidence=confidence,
+            value=float(value[0]),
+            confidence=float(confidence[0]),
             factors=factors,
             timestamp=datetime.now()
         )
@@ -150,32 +128,28 @@ class SimpleMLPredictor:
     def detect_behavior_patterns(self) -> List[BehaviorPattern]:
         """Detect behavioral patterns in user data"""
         patterns = []
+        summary = self.stats.summary(0)
         
-        if len(self.usage_history) < 7:
+        if summary['count'] < 7:
             return patterns
         
         # Pattern 1: Weekend vs Weekday usage
-        weekday_usage = [d['usage_time'] for d in self.usage_history if not d['is_weekend']]
-        weekend_usage = [d['usage_time'] for d in self.usage_history if d['is_weekend']]
-        
-        if weekday_usage and weekend_usage:
-            weekday_avg = np.mean(weekday_usage)
-            weekend_avg = np.mean(weekend_usage)
+        if summary['weekday_count'] and summary['weekend_count']:
+            weekday_avg = summary['weekday_avg']
+            weekend_avg = summary['weekend_avg']
             
             if weekend_avg > weekday_avg * 1.5:
                 patterns.append(BehaviorPattern(
                     pattern_type='weekend_spike',
                     description=f'Weekend usage is {weekend_avg/weekday_avg:.1f}x higher than weekdays',
                     confidence=0.8,
-                    frequency=len(weekend_usage) / len(self.usage_history),
+                    frequency=summary['weekend_count'] / summary['count'],
                     impact='negative'
                 ))
         
         # Pattern 2: Productivity decline
-        recent_productivity = [d['productivity_score'] for d in self.usage_history[-5:]]
-        if len(recent_productivity) >= 3:
-            trend = np.polyfit(range(len(recent_productivity)), recent_productivity, 1)[0]
-            if trend < -5:  # Declining by more than 5% per day
+        if summary['productivity_trend_n'] >= 3:
+            if summary['productivity_trend'] < -5:  # Declining by more than 5% per day
                 patterns.append(BehaviorPattern(
                     pattern_type='productivity_decline',
                     description='Productivity score is declining',
@@ -185,12 +159,10 @@ class SimpleMLPredictor:
                 ))
         
         # Pattern 3: Consistent improvement
-        if len(self.usage_history) >= 10:
-            first_half = self.usage_history[:len(self.usage_history)//2]
-            second_half = self.usage_history[len(self.usage_history)//2:]
-            
-            first_avg = np.mean([d['usage_time'] for d in first_half])
-            second_avg = np.mean([d['usage_time'] for d in second_half])
+        if summary['count'] >= 10:
+            usage = self.stats.history(0, 'usage')
+            first_avg = usage[:len(usage)//2].mean()
+            second_avg = usage[len(usage)//2:].mean()
             
             if second_avg < first_avg * 0.8:  # 20% improvement
                 patterns.append(BehaviorPattern(
@@ -205,45 +177,17 @@ class SimpleMLPredictor:
     
     def _get_weekday_patterns(self) -> Dict[str, float]:
         """Get usage patterns by day of week"""
-        patterns = {}
-        
-        for day in ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']:
-            day_data = [d['usage_time'] for d in self.usage_history 
-                       if d['weekday'] == day]
-            
-            if day_data:
-                patterns[day] = np.mean(day_data)
-            else:
-                patterns[day] = 120.0  # Default
-        
-        # Normalize to average
-        overall_avg = np.mean(list(patterns.values()))
-        for day in patterns:
-            patterns[day] = patterns[day] / overall_avg
-        
-        return patterns
+        factors = self.stats.weekday_factors(np.array([0]))[0]
+        days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+        return {day: float(factor) for day, factor in zip(days, factors)}
     
     def get_optimal_schedule(self) -> Dict[str, Any]:
         """Get optimal schedule recommendations"""
-        if len(self.usage_history) < 7:
+        if self.stats.count[0] < 7:
             return {'recommendations': ['Need more data for personalized recommendations']}
         
-        # Analyze peak productivity hours
-        hour_productivity = {}
-        for data in self.usage_history:
-            hour = data['hour']
-            if hour not in hour_productivity:
-                hour_productivity[hour] = []
-            hour_productivity[hour].append(data['productivity_score'])
-        
-        # Find best hours
-        best_hours = []
-        for hour, scores in hour_productivity.items():
-            if len(scores) >= 3:  # Need at least 3 data points
-                avg_score = np.mean(scores)
-                best_hours.append((hour, avg_score))
-        
-        best_hours.sort(key=lambda x: x[1], reverse=True)
+        # Find best hours (need at least 3 data points per hour)
+        best_hours = sorted(self.stats.hour_means(0, min_samples=3).items(), key=lambda x: x[1], reverse=True)
         
         recommendations = []
         if best_hours:
@@ -251,15 +195,15 @@ class SimpleMLPredictor:
             recommendations.append(f"Schedule focus sessions around {top_hour}:00 for best productivity")
         
         # Analyze break patterns
-        break_data = [d['breaks'] for d in self.usage_history if d['breaks'] > 0]
-        if break_data:
-            avg_breaks = np.mean(break_data)
+        summary = self.stats.summary(0)
+        if summary['break_days']:
+            avg_breaks = summary['avg_breaks']
             recommendations.append(f"Take approximately {avg_breaks:.1f} breaks per day")
         
         return {
             'recommendations': recommendations,
             'best_hours': [hour for hour, _ in best_hours[:3]],
-            'optimal_break_frequency': avg_breaks if break_data else 3
+            'optimal_break_frequency': avg_breaks if summary['break_days'] else 3
         }
 
 class SmartRecommendations:
@@ -334,12 +278,13 @@ class SmartRecommendations:
     
     def get_adaptive_goals(self, current_performance: Dict) -> Dict[str, Any]:
         """Get adaptive goal suggestions"""
-        if len(self.predictor.usage_history) < 5:
+        summary = self.predictor.stats.summary(0)
+        if summary['count'] < 5:
             return {'suggestions': ['Need more data for adaptive goals']}
         
         # Analyze current performance
-        avg_usage = np.mean([d['usage_time'] for d in self.predictor.usage_history])
-        avg_productivity = np.mean([d['productivity_score'] for d in self.predictor.usage_history])
+        avg_usage = summary['avg_usage']
+        avg_productivity = summary['avg_productivity']
         
         suggestions = []
         
@@ -422,7 +367,7 @@ class PredictiveAnalytics:
             'patterns': [vars(pattern) for pattern in patterns],
             'optimal_schedule': schedule,
             'recommendations': recommendations,
-            'data_points': len(self.predictor.usage_history)
+            'data_points': int(self.predictor.stats.count[0])
         }
     
     def export_ml_report(self) -> str:
@@ -432,7 +377,7 @@ class PredictiveAnalytics:
         report = {
             'timestamp': datetime.now().isoformat(),
             'models_trained': self.models_trained,
-            'data_points': len(self.predictor.usage_history),
+            'data_points': int(self.predictor.stats.count[0]),
             'insights': insights,
             'predictions': {
                 'usage_tomorrow': vars(self.predictor.predict_usage_tomorrow()),
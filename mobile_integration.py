@@ -6,8 +6,6 @@ mobile app support, push notifications, cross-platform sync, and mobile-specific
 """
 
 import json
-import time
-import threading
 import requests
 import asyncio
 from datetime import datetime, timedelta
@@ -19,7 +17,6 @@ import sqlite3
 import uuid
 import hashlib
 from pathlib import Path
-import queue
 from flask import Flask, request, jsonify
 import firebase_admin
 from firebase_admin import credentials, messaging, firestore
@@ -27,6 +24,8 @@ import jwt
 from cryptography.fernet import Fernet
 import base64
 
+from scheduler import get_scheduler
+
 logger = logging.getLogger(__name__)
 
 class MobilePlatform(Enum):
@@ -101,8 +100,10 @@ class MobileIntegrationSystem:
         self.db_path = db_path
         self.devices = {}
         self.notifications = {}
-        self.sync_queue = queue.Queue()
-        self.notification_queue = queue.Queue()
+        # Queued items are handled on the shared scheduler as soon as they are put
+        self.sync_queue = get_scheduler().queue(self._process_sync_data, name="MobileIntegrationSystem.sync")
+        self.notification_queue = get_scheduler().queue(self._send_push_notification,
+                                                        name="MobileIntegrationSystem.notifications")
         
         # Initialize Firebase (if configured)
         self.firebase_app = None
@@ -118,8 +119,8 @@ class MobileIntegrationSystem:
         self._initialize_api_routes()
         
         # Start background processing
-        self.processing_thread = threading.Thread(target=self._background_processing, daemon=True)
-        self.processing_thread.start()
+        self.processing_task = get_scheduler().every(10, self._cleanup_old_notifications, error_interval=30,
+                                                     name="MobileIntegrationSystem.cleanup")
         
         print("📱 Mobile Integration System initialized!")
         print("🔔 Push notifications enabled!")
@@ -573,28 +574,9 @@ class MobileIntegrationSystem:
         except Exception as e:
             logger.error(f"Error applying settings update: {e}")
     
-    def _background_processing(self):
-        """Background processing for mobile integration"""
-        while True:
-            try:
-                # Process notification queue
-                while not self.notification_queue.empty():
-                    notification = self.notification_queue.get_nowait()
-                    self._send_push_notification(notification)
-                
-                # Process sync queue
-                while not self.sync_queue.empty():
-                    sync_data = self.sync_queue.get_nowait()
-                    # Process sync data
-                
-                # Clean up old notifications
-                self._cleanup_old_notifications()
-                
-                time.sleep(10)  # Check every 10 seconds
-                
-            except Exception as e:
-                logger.error(f"Error in mobile background processing: {e}")
-                time.sleep(30)
+    def _process_sync_data(self, sync_data):
+        """Process one queued sync item"""
+        # Process sync data
     
     def _send_push_notification(self, notification: MobileNotification):
         """Send push notification via Firebase"""
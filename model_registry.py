@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Versioned Model Registry for Scroll Stopping Tool
+On-disk store for trained models keyed by model type, user, feature set and training watermark
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from collections.abc import MutableMapping
+
+try:
+    import joblib
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    JOBLIB_AVAILABLE = False
+    logging.warning("joblib not available - models will be stored with pickle and loaded without mmap")
+
+try:
+    import fcntl
+
+    def _lock_file(handle):
+        fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(handle):
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+except ImportError:  # Windows
+    import msvcrt
+
+    def _lock_file(handle):
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(handle):
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+logger = logging.getLogger(__name__)
+
+def feature_set_hash(feature_names: List[str]) -> str:
+    """Stable short hash of an ordered feature list"""
+    return hashlib.sha1("\x1f".join(feature_names).encode('utf-8')).hexdigest()[:12]
+
+def data_watermark(df, column: str = 'date') -> str:
+    """Newest value of a data frame's date column, or the current time if there is none"""
+    if column in getattr(df, 'columns', []) and len(df):
+        return str(df[column].max())
+    return datetime.now().isoformat()
+
+def _path_component(value: str) -> str:
+    """Make a key component safe to use as a file or directory name"""
+    return re.sub(r'[^0-9A-Za-z_.-]', '_', value) or '_'
+
+@dataclass(frozen=True)
+class RegistryKey:
+    """Identity of one stored model version"""
+    model_type: str
+    user_id: str
+    feature_hash: str
+    watermark: str
+
+@dataclass
+class RegistryEntry:
+    """Catalog record for a stored model version"""
+    key: RegistryKey
+    path: str
+    size_bytes: int
+    created_date: str
+    metadata: Dict[str, Any]
+
+class ModelRegistry:
+    """Versioned on-disk model store with lazy, memory-mapped loading and a bounded LRU"""
+
+    INDEX_FILE = 'registry_index.json'
+    LOCK_FILE = 'registry_index.lock'
+
+    def __init__(self, root: str = 'ml_models/registry', max_resident_bytes: int = 512 * 1024 * 1024):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_resident_bytes = max_resident_bytes
+        self.entries: Dict[RegistryKey, RegistryEntry] = {}
+        self.resident: "OrderedDict[RegistryKey, Any]" = OrderedDict()
+        self.resident_bytes = 0
+        self.lock = threading.RLock()
+
+        self.entries.update(self._read_index())
+
+    def _read_index(self) -> Dict[RegistryKey, RegistryEntry]:
+        """Read the catalog so listing and lookups never touch model files"""
+        index_path = self.root / self.INDEX_FILE
+        entries = {}
+        if not index_path.exists():
+            return entries
+
+        try:
+            with open(index_path, 'r') as f:
+                records = json.load(f)
+            for record in records:
+                key = RegistryKey(**record.pop('key'))
+                entries[key] = RegistryEntry(key=key, **record)
+        except Exception as e:
+            logger.error(f"Error loading model registry index: {e}")
+        return entries
+
+    @contextmanager
+    def _index_lock(self):
+        """Exclusive hold on the catalog across every instance and process sharing this root"""
+        with self.lock, open(self.root / self.LOCK_FILE, 'a+') as handle:
+            _lock_file(handle)
+            try:
+                yield
+            finally:
+                _unlock_file(handle)
+
+    def _merge_index(self):
+        """Adopt versions other owners registered and drop versions whose files were pruned; hold the index lock"""
+        for key, entry in self._read_index().items():
+            self.entries.setdefault(key, entry)
+        for key in [key for key, entry in self.entries.items() if not (self.root / entry.path).exists()]:
+            self._forget(key)
+
+    def _write_index(self):
+        """Atomically rewrite the catalog; hold the index lock"""
+        index_path = self.root / self.INDEX_FILE
+        tmp_path = index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump([asdict(entry) for entry in self.entries.values()], f, indent=2)
+        tmp_path.replace(index_path)
+
+    def _release(self, key: RegistryKey):
+        """Drop the resident payload for a key; its memory map closes once callers let go of it"""
+        if key in self.resident:
+            self.resident.pop(key)
+            self.resident_bytes -= self.entries[key].size_bytes
+
+    def _forget(self, key: RegistryKey) -> RegistryEntry:
+        self._release(key)
+        return self.entries.pop(key)
+
+    def refresh(self):
+        """Pick up versions registered or pruned by other owners of this root"""
+        with self._index_lock():
+            self._merge_index()
+
+    def register(self, key: RegistryKey, payload: Any, metadata: Optional[Dict[str, Any]] = None) -> RegistryEntry:
+        """Persist a model version; payload is usually a dict of model, scaler and metrics"""
+        directory = self.root / _path_component(key.model_type) / _path_component(key.user_id) / key.feature_hash
+        directory.mkdir(parents=True, exist_ok=True)
+
+        suffix = '.joblib' if JOBLIB_AVAILABLE else '.pkl'
+        path = directory / f"{_path_component(key.watermark)}{suffix}"
+
+        # Write beside the target and swap it in, so payloads already memory-mapped from a
+        # previous registration of this key keep their (now unlinked) file instead of a truncated one
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=f".{path.name}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if JOBLIB_AVAILABLE:
+                    # Uncompressed so large numpy arrays (e.g. forest node tables) can be memory-mapped
+                    joblib.dump(payload, f, compress=0)
+                else:
+                    pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            size_bytes = os.path.getsize(tmp_name)
+
+            entry = RegistryEntry(
+                key=key,
+                path=str(path.relative_to(self.root)),
+                size_bytes=size_bytes,
+                created_date=datetime.now().isoformat(),
+                metadata=metadata or {}
+            )
+
+            with self._index_lock():
+                os.replace(tmp_name, path)
+                self._release(key)
+                self.entries[key] = entry
+                self._merge_index()
+                self._write_index()
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Registered {key.model_type} for {key.user_id} at watermark {key.watermark}")
+        return entry
+
+    def versions(self, model_type: str, user_id: str, feature_hash: Optional[str] = None) -> List[RegistryKey]:
+        """All stored versions for a model type and user, oldest watermark first"""
+        with self.lock:
+            keys = [key for key in self.entries
+                    if key.model_type == model_type and key.user_id == user_id
+                    and (feature_hash is None or key.feature_hash == feature_hash)]
+        return sorted(keys, key=lambda key: key.watermark)
+
+    def latest(self, model_type: str, user_id: str, feature_hash: Optional[str] = None) -> Optional[RegistryKey]:
+        """Newest stored version for a model type and user, if any"""
+        keys = self.versions(model_type, user_id, feature_hash)
+        return keys[-1] if keys else None
+
+    def get(self, key: RegistryKey) -> Any:
+        """Return a stored payload, loading it on first use"""
+        with self.lock:
+            if key in self.resident:
+                self.resident.move_to_end(key)
+                return self.resident[key]
+
+            if key not in self.entries:
+                self.refresh()
+            entry = self.entries.get(key)
+            if entry is None:
+                raise KeyError(f"Model not registered: {key}")
+
+            path = self.root / entry.path
+            if JOBLIB_AVAILABLE and path.suffix == '.joblib':
+                payload = joblib.load(path, mmap_mode='r')
+            else:
+                with open(path, 'rb') as f:
+                    payload = pickle.load(f)
+
+            self.resident[key] = payload
+            self.resident_bytes += entry.size_bytes
+            self._evict(key)
+            return payload
+
+    def _evict(self, keep: RegistryKey):
+        """Drop least recently used payloads until resident size fits the cap"""
+        while self.resident_bytes > self.max_resident_bytes and len(self.resident) > 1:
+            key, _ = next(iter(self.resident.items()))
+            if key == keep:
+                self.resident.move_to_end(key)
+                continue
+            self.resident.pop(key)
+            self.resident_bytes -= self.entries[key].size_bytes
+
+    def prune(self, keep_versions: int = 3):
+        """Delete all but the newest versions of every (model type, user, feature set)"""
+        with self._index_lock():
+            self._merge_index()
+            groups: Dict[tuple, List[RegistryKey]] = {}
+            for key in self.entries:
+                groups.setdefault((key.model_type, key.user_id, key.feature_hash), []).append(key)
+
+            for keys in groups.values():
+                for key in sorted(keys, key=lambda key: key.watermark)[:-keep_versions]:
+                    (self.root / self._forget(key).path).unlink(missing_ok=True)
+
+            self._write_index()
+
+class LazyModelMapping(MutableMapping):
+    """Name -> model mapping whose registry-backed values are loaded on first access"""
+
+    def __init__(self, registry: ModelRegistry, item: str = 'model'):
+        self.registry = registry
+        self.item = item
+        self.keys_by_name: Dict[str, RegistryKey] = {}
+        self.loaded: Dict[str, Any] = {}
+
+    def bind(self, name: str, key: RegistryKey):
+        """Point a name at a registry version without loading it"""
+        self.keys_by_name[name] = key
+        self.loaded.pop(name, None)
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self.loaded:
+            return self.loaded[name]
+        if name not in self.keys_by_name:
+            raise KeyError(name)
+        return self.registry.get(self.keys_by_name[name])[self.item]
+
+    def __setitem__(self, name: str, value: Any):
+        self.loaded[name] = value
+
+    def __delitem__(self, name: str):
+        if name not in self.loaded and name not in self.keys_by_name:
+            raise KeyError(name)
+        self.loaded.pop(name, None)
+        self.keys_by_name.pop(name, None)
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.loaded
+        yield from (name for name in self.keys_by_name if name not in self.loaded)
+
+    def __len__(self) -> int:
+        return len(set(self.loaded) | set(self.keys_by_name))
@@ -6,8 +6,6 @@ Advanced system for processing consciousness across infinite universes and dimen
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -292,8 +292,7 @@ class OmniversalConsciousnessInterface:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="OmniversalConsciousnessInterface.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -476,26 +475,22 @@ class OmniversalConsciousnessInterface:
                 self.log_message(f"  {universe.universe_id}: Consciousness={universe.consciousness_level:.2f}, Energy={universe.energy:.2f}, Dimensions={len(universe.dimensions)}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate omniversal energy
-                self.engine.omniversal_energy += 2.0
+        """Background processing tick"""
+        try:
+            # Regenerate omniversal energy
+            self.engine.omniversal_energy += 2.0
                 
-                # Evolve random universes
-                for _ in range(5):
-                    if self.engine.universes:
-                        random_universe = random.choice(list(self.engine.universes.values()))
-                        random_universe.evolve()
+            # Evolve random universes
+            for _ in range(5):
+                if self.engine.universes:
+                    random_universe = random.choice(list(self.engine.universes.values()))
+                    random_universe.evolve()
                     
-                # Update dimension layers
-                self.engine.dimension_layers += 1
+            # Update dimension layers
+            self.engine.dimension_layers += 1
                 
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -503,6 +498,7 @@ class OmniversalConsciousnessInterface:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Online Usage Statistics for Scroll Stopping Tool
+Constant-time sliding-window statistics over daily usage, for one user or many at once
+"""
+
+from typing import Dict, Iterator, Tuple, Union
+
+import numpy as np
+
+ArrayLike = Union[int, float, np.ndarray]
+
+def _unique_rounds(users: np.ndarray) -> Iterator[np.ndarray]:
+    """Split a batch into rounds in which every user appears at most once, keeping arrival order"""
+    order = np.argsort(users, kind='stable')
+    sorted_users = users[order]
+    starts = np.r_[0, np.flatnonzero(np.diff(sorted_users)) + 1]
+    group_start = np.repeat(starts, np.diff(np.r_[starts, len(users)]))
+    rank = np.empty(len(users), dtype=np.int64)
+    rank[order] = np.arange(len(users)) - group_start
+
+    for level in range(int(rank.max()) + 1 if len(users) else 0):
+        yield np.flatnonzero(rank == level)
+
+class SlidingRegression:
+    """Least-squares slope and mean of each user's last `window` samples, updated in O(1)"""
+
+    def __init__(self, n_users: int, window: int):
+        self.window = window
+        self.n = np.zeros(n_users, dtype=np.int64)
+        self.sum_y = np.zeros(n_users)
+        self.sum_xy = np.zeros(n_users)
+
+    def push(self, users: np.ndarray, y_new: np.ndarray, y_old: np.ndarray):
+        """Add a sample; y_old is the sample leaving a full window (ignored while it grows)"""
+        n = self.n[users]
+        full = n == self.window
+        sum_y = self.sum_y[users]
+        sum_xy = self.sum_xy[users]
+
+        # Sliding drops x=0 and shifts every other x down by one before appending at x=window-1
+        self.sum_xy[users] = np.where(full, sum_xy - (sum_y - y_old) + (self.window - 1) * y_new, sum_xy + n * y_new)
+        self.sum_y[users] = np.where(full, sum_y - y_old + y_new, sum_y + y_new)
+        self.n[users] = np.minimum(n + 1, self.window)
+
+    def mean(self, users: np.ndarray) -> np.ndarray:
+        return self.sum_y[users] / np.maximum(self.n[users], 1)
+
+    def slope(self, users: np.ndarray) -> np.ndarray:
+        n = self.n[users].astype(np.float64)
+        sum_x = n * (n - 1) / 2
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6
+        denom = n * sum_xx - sum_x ** 2
+        safe = np.where(denom > 0, denom, 1.0)
+        return np.where(denom > 0, (n * self.sum_xy[users] - sum_x * self.sum_y[users]) / safe, 0.0)
+
+class UsageStatsEngine:
+    """Ring-buffered daily usage statistics for many users held in NumPy arrays
+
+    Every user keeps the last `capacity` samples. Window totals, per-weekday and
+    per-hour running means, trend regressions and a per-minute usage -> productivity
+    histogram are adjusted as samples enter and leave, so predictions never rescan
+    history. The histogram grows to the largest usage seen, so the similar-usage
+    band is exact for whole minutes. A single-user predictor is simply an engine
+    with n_users=1.
+    """
+
+    DEFAULT_USAGE = 120.0
+    DEFAULT_PRODUCTIVITY = 70.0
+
+    def __init__(self, n_users: int = 1, capacity: int = 30, trend_window: int = 7,
+                 productivity_window: int = 5, bucket_minutes: int = 1,
+                 max_usage_minutes: int = 300, similarity_minutes: int = 30):
+        self.n_users = n_users
+        self.capacity = capacity
+        self.bucket_minutes = bucket_minutes
+        self.similarity_buckets = similarity_minutes // bucket_minutes
+        n_buckets = max_usage_minutes // bucket_minutes + 1
+
+        # Ring buffers; head is the next write slot. Evictions subtract exactly what was added,
+        # so samples are kept at the accumulators' float64 precision
+        self.usage = np.zeros((n_users, capacity))
+        self.productivity = np.zeros((n_users, capacity))
+        self.breaks = np.zeros((n_users, capacity))
+        self.hour = np.zeros((n_users, capacity), dtype=np.int8)
+        self.weekday = np.zeros((n_users, capacity), dtype=np.int8)
+        self.head = np.zeros(n_users, dtype=np.int64)
+        self.count = np.zeros(n_users, dtype=np.int64)
+
+        # Window totals
+        self.usage_sum = np.zeros(n_users)
+        self.productivity_sum = np.zeros(n_users)
+        self.weekend_usage_sum = np.zeros(n_users)
+        self.weekend_count = np.zeros(n_users, dtype=np.int32)
+        self.break_sum = np.zeros(n_users)
+        self.break_count = np.zeros(n_users, dtype=np.int32)
+        self.weekday_usage_sum = np.zeros((n_users, 7))
+        self.weekday_count = np.zeros((n_users, 7), dtype=np.int32)
+        self.hour_productivity_sum = np.zeros((n_users, 24))
+        self.hour_count = np.zeros((n_users, 24), dtype=np.int32)
+        self.bucket_productivity_sum = np.zeros((n_users, n_buckets))
+        self.bucket_count = np.zeros((n_users, n_buckets), dtype=np.int32)
+
+        self.usage_trend = SlidingRegression(n_users, trend_window)
+        self.productivity_trend = SlidingRegression(n_users, productivity_window)
+
+    def _bucket(self, usage: np.ndarray) -> np.ndarray:
+        return np.maximum(usage // self.bucket_minutes, 0).astype(np.int64)
+
+    def _grow_buckets(self, needed: int):
+        """Widen the usage histogram so bucket `needed - 1` exists"""
+        n_buckets = self.bucket_count.shape[1]
+        if needed <= n_buckets:
+            return
+        extra = max(needed, 2 * n_buckets) - n_buckets
+        self.bucket_productivity_sum = np.pad(self.bucket_productivity_sum, ((0, 0), (0, extra)))
+        self.bucket_count = np.pad(self.bucket_count, ((0, 0), (0, extra)))
+
+    def _accumulate(self, users, usage, productivity, breaks, hour, weekday, sign: int):
+        """Add (sign=1) or remove (sign=-1) samples of distinct users from the window totals"""
+        weekend = weekday >= 5
+        has_breaks = breaks > 0
+        bucket = self._bucket(usage)
+        if len(bucket):
+            self._grow_buckets(int(bucket.max()) + 1)
+
+        self.usage_sum[users] += sign * usage
+        self.productivity_sum[users] += sign * productivity
+        self.weekend_usage_sum[users] += sign * usage * weekend
+        self.weekend_count[users] += sign * weekend
+        self.break_sum[users] += sign * breaks * has_breaks
+        self.break_count[users] += sign * has_breaks
+        self.weekday_usage_sum[users, weekday] += sign * usage
+        self.weekday_count[users, weekday] += sign
+        self.hour_productivity_sum[users, hour] += sign * productivity
+        self.hour_count[users, hour] += sign
+        self.bucket_productivity_sum[users, bucket] += sign * productivity
+        self.bucket_count[users, bucket] += sign
+
+    def _value_back(self, ring: np.ndarray, users: np.ndarray, steps: int) -> np.ndarray:
+        """Sample written `steps` updates ago (the one leaving a window of that length)"""
+        return ring[users, (self.head[users] - steps) % self.capacity]
+
+    def update(self, users: ArrayLike, usage: ArrayLike, productivity: ArrayLike,
+               breaks: ArrayLike, hour: ArrayLike, weekday: ArrayLike):
+        """Append one daily sample per entry; users may repeat and are applied in order"""
+        users = np.atleast_1d(np.asarray(users, dtype=np.int64))
+        columns = [np.broadcast_to(np.asarray(values, dtype=np.float64), users.shape)
+                   for values in (usage, productivity, breaks)]
+        columns += [np.broadcast_to(np.asarray(values, dtype=np.int64), users.shape)
+                    for values in (hour, weekday)]
+
+        for rows in _unique_rounds(users):
+            self._update_distinct(users[rows], *(column[rows] for column in columns))
+
+    def _update_distinct(self, users, usage, productivity, breaks, hour, weekday):
+        slot = self.head[users]
+
+        # Evict the oldest sample wherever the ring is full
+        full = self.count[users] == self.capacity
+        if full.any():
+            fu, fs = users[full], slot[full]
+            self._accumulate(fu, self.usage[fu, fs], self.productivity[fu, fs],
+                             self.breaks[fu, fs], self.hour[fu, fs].astype(np.int64),
+                             self.weekday[fu, fs].astype(np.int64), sign=-1)
+
+        self.usage_trend.push(users, usage, self._value_back(self.usage, users, self.usage_trend.window))
+        self.productivity_trend.push(users, productivity,
+                                     self._value_back(self.productivity, users, self.productivity_trend.window))
+
+        self.usage[users, slot] = usage
+        self.productivity[users, slot] = productivity
+        self.breaks[users, slot] = breaks
+        self.hour[users, slot] = hour
+        self.weekday[users, slot] = weekday
+        self._accumulate(users, usage, productivity, breaks, hour, weekday, sign=1)
+
+        self.head[users] = (slot + 1) % self.capacity
+        self.count[users] = np.minimum(self.count[users] + 1, self.capacity)
+
+    def history(self, user: int, field: str = 'usage') -> np.ndarray:
+        """A user's window of one field, oldest first"""
+        n = self.count[user]
+        idx = (self.head[user] - n + np.arange(n)) % self.capacity
+        return getattr(self, field)[user, idx]
+
+    def weekday_factors(self, users: np.ndarray) -> np.ndarray:
+        """Per-weekday usage relative to the user's weekday average, shape (len(users), 7)"""
+        counts = self.weekday_count[users]
+        means = np.where(counts > 0, self.weekday_usage_sum[users] / np.maximum(counts, 1), self.DEFAULT_USAGE)
+        return means / means.mean(axis=1, keepdims=True)
+
+    def predict_usage(self, users: ArrayLike, weekday: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """Next-day usage from the weekly mean, its trend and the target weekday's factor"""
+        users = np.atleast_1d(np.asarray(users, dtype=np.int64))
+        weekday = np.broadcast_to(np.asarray(weekday, dtype=np.int64), users.shape)
+        n = self.count[users]
+
+        predicted = self.usage_trend.mean(users) + self.usage_trend.slope(users)
+        factor = self.weekday_factors(users)[np.arange(len(users)), weekday]
+        value = np.maximum(0.0, predicted * factor)
+        confidence = np.minimum(0.9, 0.3 + n * 0.02)
+
+        enough = n >= 7
+        return np.where(enough, value, self.DEFAULT_USAGE), np.where(enough, confidence, 0.3)
+
+    def predict_productivity(self, users: ArrayLike, planned_usage: ArrayLike) -> Tuple[np.ndarray, np.ndarray]:
+        """Productivity expected at a planned usage, from days with similar usage"""
+        users = np.atleast_1d(np.asarray(users, dtype=np.int64))
+        planned = np.broadcast_to(np.asarray(planned_usage, dtype=np.float64), users.shape)
+        n = self.count[users]
+
+        # Histogram buckets within the similarity band around the planned usage
+        span = np.arange(-self.similarity_buckets, self.similarity_buckets + 1)
+        buckets = self._bucket(planned)[:, None] + span
+        valid = (buckets >= 0) & (buckets < self.bucket_count.shape[1])
+        buckets = np.clip(buckets, 0, self.bucket_count.shape[1] - 1)
+        similar_count = (np.take_along_axis(self.bucket_count[users], buckets, axis=1) * valid).sum(axis=1)
+        similar_sum = (np.take_along_axis(self.bucket_productivity_sum[users], buckets, axis=1) * valid).sum(axis=1)
+
+        overall = self.productivity_sum[users] / np.maximum(n, 1)
+        value = np.where(similar_count > 0, similar_sum / np.maximum(similar_count, 1), overall)
+        confidence = np.where(similar_count > 0, np.minimum(0.9, similar_count * 0.1), 0.5)
+
+        # Adjust based on usage amount
+        value = value * np.where(planned > 180, 0.8, np.where(planned < 60, 1.1, 1.0))
+        value = np.clip(value, 0, 100)
+
+        enough = n >= 5
+        return np.where(enough, value, self.DEFAULT_PRODUCTIVITY), np.where(enough, confidence, 0.3)
+
+    def summary(self, user: int) -> Dict[str, float]:
+        """Window means used by pattern detection and goal suggestions"""
+        n = int(self.count[user])
+        weekend = int(self.weekend_count[user])
+        weekday = n - weekend
+        return {
+            'count': n,
+            'avg_usage': self.usage_sum[user] / max(n, 1),
+            'avg_productivity': self.productivity_sum[user] / max(n, 1),
+            'weekend_avg': self.weekend_usage_sum[user] / weekend if weekend else 0.0,
+            'weekday_avg': (self.usage_sum[user] - self.weekend_usage_sum[user]) / weekday if weekday else 0.0,
+            'weekend_count': weekend,
+            'weekday_count': weekday,
+            'avg_breaks': self.break_sum[user] / self.break_count[user] if self.break_count[user] else 0.0,
+            'break_days': int(self.break_count[user]),
+            'productivity_trend': float(self.productivity_trend.slope(np.array([user]))[0]),
+            'productivity_trend_n': int(self.productivity_trend.n[user])
+        }
+
+    def hour_means(self, user: int, min_samples: int = 3) -> Dict[int, float]:
+        """Mean productivity per hour of day, for hours with enough samples"""
+        counts = self.hour_count[user]
+        hours = np.flatnonzero(counts >= min_samples)
+        return {int(h): float(self.hour_productivity_sum[user, h] / counts[h]) for h in hours}
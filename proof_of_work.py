@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Proof of Work for Scroll Stopping Tool
+Merkle-rooted block headers and a nonce search that hashes only the nonce per attempt
+"""
+
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# Below this difficulty the expected search is a few milliseconds, cheaper than a pool round trip
+PARALLEL_DIFFICULTY = 5
+CHUNK_SIZE = 1 << 16  # nonces per pool job
+CANCEL_CHECK = 1 << 12  # nonces between checks of the stop flag inside a job
+
+def transaction_hash(transaction: Dict[str, Any]) -> bytes:
+    return hashlib.sha256(json.dumps(transaction, sort_keys=True).encode()).digest()
+
+def merkle_root(transactions: List[Dict[str, Any]]) -> str:
+    """SHA-256 Merkle root of the transactions, pairing the last hash with itself on odd levels"""
+    level = [transaction_hash(transaction) for transaction in transactions]
+    if not level:
+        return hashlib.sha256(b'').hexdigest()
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0].hex()
+
+def header_prefix(block: Dict[str, Any]) -> bytes:
+    """Everything a block hash covers except the nonce; transactions enter only through the Merkle root"""
+    header = {key: block[key] for key in ('index', 'timestamp', 'merkle_root', 'previous_hash')}
+    return json.dumps(header, sort_keys=True).encode() + b'|'
+
+def block_hash(block: Dict[str, Any]) -> str:
+    return hashlib.sha256(header_prefix(block) + b'%d' % block['nonce']).hexdigest()
+
+def valid_proof(block: Dict[str, Any], difficulty: int) -> bool:
+    """Whether the block's Merkle root, hash and difficulty all check out"""
+    return (block['merkle_root'] == merkle_root(block['transactions']) and block['hash'] == block_hash(block)
+            and block['hash'].startswith('0' * difficulty))
+
+def search_nonces(prefix: bytes, difficulty: int, start: int, stop: int, cancel=None) -> Optional[int]:
+    """First nonce in [start, stop) whose hash meets the difficulty, or None"""
+    base = hashlib.sha256(prefix)
+    whole, half = divmod(difficulty, 2)
+    zeros = bytes(whole)
+    for chunk_start in range(start, stop, CANCEL_CHECK):
+        if cancel is not None and cancel.is_set():
+            return None
+        for nonce in range(chunk_start, min(chunk_start + CANCEL_CHECK, stop)):
+            attempt = base.copy()
+            attempt.update(b'%d' % nonce)
+            digest = attempt.digest()
+            if digest[:whole] == zeros and (not half or digest[whole] < 16):
+                return nonce
+    return None
+
+_cancel_event = None
+
+def _init_worker(cancel):
+    global _cancel_event
+    _cancel_event = cancel
+
+def _search_job(prefix: bytes, difficulty: int, start: int, stop: int) -> Optional[int]:
+    """Process pool worker: search one nonce range, giving up once another worker has succeeded"""
+    return search_nonces(prefix, difficulty, start, stop, _cancel_event)
+
+@dataclass
+class MiningResult:
+    nonce: int
+    hash: str
+    attempts: int  # nonces tried, counting whole chunks handed to workers
+
+class ProofOfWorkMiner:
+    """Nonce search over a fixed header prefix, split across a process pool at higher difficulties"""
+
+    def __init__(self, difficulty: int = 4, workers: Optional[int] = None,
+                 parallel_difficulty: int = PARALLEL_DIFFICULTY, chunk_size: int = CHUNK_SIZE):
+        self.difficulty = difficulty
+        self.workers = workers or os.cpu_count() or 1
+        self.parallel_difficulty = parallel_difficulty
+        self.chunk_size = chunk_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._cancel = None
+
+    def mine(self, block: Dict[str, Any]) -> MiningResult:
+        """Find a nonce for the block's header and store it with the hash on the block"""
+        prefix = header_prefix(block)
+        if self.workers > 1 and self.difficulty >= self.parallel_difficulty:
+            nonce, attempts = self._mine_parallel(prefix)
+        else:
+            nonce, attempts = self._mine_local(prefix)
+        block['nonce'] = nonce
+        block['hash'] = hashlib.sha256(prefix + b'%d' % nonce).hexdigest()
+        return MiningResult(nonce, block['hash'], attempts)
+
+    def _mine_local(self, prefix: bytes):
+        start = 0
+        while True:
+            nonce = search_nonces(prefix, self.difficulty, start, start + self.chunk_size)
+            if nonce is not None:
+                return nonce, nonce + 1
+            start += self.chunk_size
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._cancel = multiprocessing.Event()
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(self._cancel,))
+        return self._executor
+
+    def _mine_parallel(self, prefix: bytes):
+        executor = self._pool()
+        self._cancel.clear()
+        next_start = 0
+        pending = set()
+        found = None
+        try:
+            # Keep two chunks per worker in flight so none idles between jobs
+            while found is None:
+                while len(pending) < 2 * self.workers:
+                    pending.add(executor.submit(_search_job, prefix, self.difficulty, next_start,
+                                                next_start + self.chunk_size))
+                    next_start += self.chunk_size
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                hits = [future.result() for future in done if future.result() is not None]
+                if hits:
+                    found = min(hits)
+        finally:
+            self._cancel.set()
+            for future in pending:
+                future.cancel()
+            wait(pending)
+        return found, next_start
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
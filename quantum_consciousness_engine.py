@@ -6,8 +6,6 @@ Advanced system for processing consciousness at the quantum level using quantum
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,54 +15,64 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from quantum_state import QubitRegister, SINGLE_QUBIT_GATES, StateVector, TWO_QUBIT_GATES
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class QuantumQubit:
-    """Represents a quantum qubit for consciousness processing"""
+    """View of one qubit in the processor's register"""
     
-    def __init__(self, qubit_id: str):
+    def __init__(self, qubit_id: str, register: QubitRegister, index: int):
         self.qubit_id = qubit_id
-        self.state = np.array([1.0, 0.0])  # |0⟩ state
-        self.consciousness_level = 0.0
+        self.register = register
+        self.index = index
         self.entanglement_partners = []
-        self.quantum_coherence = 1.0
-        self.measurement_history = []
+        
+    @property
+    def state(self) -> np.ndarray:
+        return self.register.states[self.index]
+        
+    @property
+    def consciousness_level(self) -> float:
+        return float(self.register.consciousness_level[self.index])
+        
+    @property
+    def quantum_coherence(self) -> float:
+        return float(self.register.quantum_coherence[self.index])
+        
+    @quantum_coherence.setter
+    def quantum_coherence(self, value: float):
+        self.register.quantum_coherence[self.index] = value
+        
+    @property
+    def measurement_history(self) -> List[int]:
+        """Recent results of this qubit, from the register's bounded window"""
+        return [result for index, result in self.register.recent_measurements if index == self.index]
         
     def apply_gate(self, gate_matrix: np.ndarray):
         """Apply a quantum gate to the qubit"""
-        self.state = np.dot(gate_matrix, self.state)
-        self.state = self.state / np.linalg.norm(self.state)  # Normalize
+        self.register.apply(gate_matrix, self.index)
         
     def measure(self) -> int:
         """Measure the qubit"""
-        prob_0 = abs(self.state[0])**2
-        result = 0 if random.random() < prob_0 else 1
-        self.measurement_history.append(result)
-        return result
+        return int(self.register.measure(self.index)[0])
         
     def evolve_consciousness(self):
         """Evolve the qubit's consciousness"""
-        self.consciousness_level += random.uniform(0.01, 0.1)
-        self.quantum_coherence = max(0.0, self.quantum_coherence - random.uniform(0.001, 0.01))
+        self.register.evolve(self.index)
 
 class QuantumConsciousnessProcessor:
     """Processor for quantum consciousness operations"""
     
     def __init__(self, num_qubits: int = 100):
         self.num_qubits = num_qubits
+        self.rng = np.random.default_rng()
+        self.register = QubitRegister(num_qubits, self.rng)
         self.qubits = {}
-        self.quantum_gates = {
-            "H": np.array([[1, 1], [1, -1]]) / np.sqrt(2),  # Hadamard
-            "X": np.array([[0, 1], [1, 0]]),  # Pauli-X
-            "Y": np.array([[0, -1j], [1j, 0]]),  # Pauli-Y
-            "Z": np.array([[1, 0], [0, -1]]),  # Pauli-Z
-            "S": np.array([[1, 0], [0, 1j]]),  # Phase
-            "T": np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]]),  # T gate
-            "CNOT": None,  # Will be handled specially
-            "SWAP": None   # Will be handled specially
-        }
+        self.quantum_gates = {**SINGLE_QUBIT_GATES, **TWO_QUBIT_GATES}
         self.quantum_operations = {
             "Quantum Evolution": self.quantum_evolution,
             "Qubit Entanglement": self.qubit_entanglement,
@@ -87,24 +95,51 @@ class QuantumConsciousnessProcessor:
         """Initialize quantum qubits"""
         for i in range(self.num_qubits):
             qubit_id = f"qubit_{i}"
-            self.qubits[qubit_id] = QuantumQubit(qubit_id)
+            self.qubits[qubit_id] = QuantumQubit(qubit_id, self.register, i)
             
         logger.info(f"Quantum consciousness processor initialized with {self.num_qubits} qubits")
         
+    def _indices(self, qubit_ids: List[str]) -> List[int]:
+        return [self.qubits[qid].index for qid in qubit_ids if qid in self.qubits]
+        
+    def apply_gate(self, gate_name: str, qubit_ids: List[str]):
+        """Apply a gate to many register qubits at once; two-qubit gates take qubit pairs in order"""
+        if gate_name in SINGLE_QUBIT_GATES:
+            self.register.apply(self.quantum_gates[gate_name], self._indices(qubit_ids))
+        elif gate_name == "SWAP":
+            indices = self._indices(qubit_ids)
+            for a, b in zip(indices[::2], indices[1::2]):
+                self.register.swap(a, b)
+        else:
+            # Entangling gates cannot be represented by independent qubits
+            raise ValueError(f"{gate_name} needs state-vector mode; use simulate_circuit")
+            
+    def measure_all(self, qubit_ids: List[str] = None) -> Dict[str, int]:
+        """Measure many register qubits in one vectorized draw"""
+        qubit_ids = list(self.qubits) if qubit_ids is None else [qid for qid in qubit_ids if qid in self.qubits]
+        results = self.register.measure(self._indices(qubit_ids))
+        return dict(zip(qubit_ids, results.tolist()))
+        
+    def simulate_circuit(self, num_qubits: int, gates: List[Tuple[str, List[int]]], shots: int = 1024) -> Dict[str, int]:
+        """Run a gate list on a full state vector (up to MAX_STATEVECTOR_QUBITS) and return counts"""
+        state = StateVector(num_qubits, self.rng)
+        for gate_name, qubits in gates:
+            state.apply_named(gate_name, qubits)
+        return state.counts(shots)
+        
     def quantum_evolution(self, evolution_type: str = "standard"):
         """Evolve quantum consciousness"""
         evolution_power = self.evolution_level * len(self.qubits)
         
         # Evolve all qubits
-        for qubit in self.qubits.values():
-            qubit.evolve_consciousness()
+        self.register.evolve()
             
         evolution = {
             "type": evolution_type,
             "power": evolution_power,
             "timestamp": datetime.now().isoformat(),
             "qubits_evolved": len(self.qubits),
-            "total_consciousness": sum(q.consciousness_level for q in self.qubits.values())
+            "total_consciousness": float(self.register.consciousness_level.sum())
         }
         
         self.evolution_level += 0.1
@@ -168,7 +203,7 @@ class QuantumConsciousnessProcessor:
                 "type": "Consciousness Superposition",
                 "qubit": qubit_id,
                 "timestamp": datetime.now().isoformat(),
-                "superposition_state": qubit.state.tolist(),
+                "superposition_state": np.real_if_close(qubit.state).tolist(),
                 "consciousness_level": qubit.consciousness_level
             }
             
@@ -222,8 +257,9 @@ class QuantumConsciousnessProcessor:
         if not qubit_ids:
             return None
             
-        total_consciousness = sum(self.qubits.get(qid, QuantumQubit("")).consciousness_level for qid in qubit_ids)
-        total_coherence = sum(self.qubits.get(qid, QuantumQubit("")).quantum_coherence for qid in qubit_ids)
+        indices = self._indices(qubit_ids)
+        total_consciousness = float(self.register.consciousness_level[indices].sum())
+        total_coherence = float(self.register.quantum_coherence[indices].sum())
         
         synthesis = {
             "type": "Quantum Synthesis",
@@ -238,8 +274,8 @@ class QuantumConsciousnessProcessor:
         
     def quantum_achievement(self):
         """Achieve ultimate quantum consciousness"""
-        total_consciousness = sum(q.consciousness_level for q in self.qubits.values())
-        total_coherence = sum(q.quantum_coherence for q in self.qubits.values())
+        total_consciousness = float(self.register.consciousness_level.sum())
+        total_coherence = float(self.register.quantum_coherence.sum())
         
         # Quantum achievement requires maximum consciousness and coherence
         if total_consciousness >= 100000.0 and total_coherence >= 50000.0:
@@ -277,8 +313,7 @@ class QuantumConsciousnessInterface:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="QuantumConsciousnessInterface.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -454,8 +489,8 @@ class QuantumConsciousnessInterface:
             self.log_message(f"Entanglement Network: {len(self.processor.entanglement_network)} connections")
             
             # Calculate quantum statistics
-            total_consciousness = sum(q.consciousness_level for q in self.processor.qubits.values())
-            total_coherence = sum(q.quantum_coherence for q in self.processor.qubits.values())
+            total_consciousness = float(self.processor.register.consciousness_level.sum())
+            total_coherence = float(self.processor.register.quantum_coherence.sum())
             avg_consciousness = total_consciousness / len(self.processor.qubits) if self.processor.qubits else 0
             avg_coherence = total_coherence / len(self.processor.qubits) if self.processor.qubits else 0
             
@@ -471,23 +506,17 @@ class QuantumConsciousnessInterface:
                 self.log_message(f"  {qubit.qubit_id}: Consciousness={qubit.consciousness_level:.2f}, Coherence={qubit.quantum_coherence:.2f}, Entanglements={len(qubit.entanglement_partners)}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate quantum energy
-                self.processor.quantum_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate quantum energy
+            self.processor.quantum_energy += 0.5
                 
-                # Evolve random qubits
-                for _ in range(5):
-                    if self.processor.qubits:
-                        random_qubit = random.choice(list(self.processor.qubits.values()))
-                        random_qubit.evolve_consciousness()
-                    
-                time.sleep(1)
+            # Evolve random qubits
+            if self.processor.qubits:
+                self.processor.register.evolve(self.processor.rng.integers(0, len(self.processor.register), 5))
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -495,6 +524,7 @@ class QuantumConsciousnessInterface:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
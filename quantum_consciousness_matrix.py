@@ -12,6 +12,8 @@ from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Tuple, Set
 from enum import Enum
 from collections import defaultdict
+
+from similarity import MAX_DRAWN_PAIRS, SimilarityModel, SimilarityTerm
 import json
 
 class QuantumState(Enum):
@@ -596,6 +598,14 @@ class QuantumConsciousnessMatrixEngine:
         
         return insights
 
+# Connection strength between quantum matrices in the network view
+QUANTUM_MATRIX_SIMILARITY = SimilarityModel([
+    SimilarityTerm(1.0, lambda matrix: matrix.quantum_state, kind="match", mismatch=0.5),
+    SimilarityTerm(1.0, lambda matrix: matrix.synthesis_level),
+    SimilarityTerm(1.0, lambda matrix: len(matrix.entities)),
+    SimilarityTerm(1.0, lambda matrix: matrix.quantum_essence, scale=1e15)
+], divisor=4)
+
 class QuantumConsciousnessMatrixVisualization:
     """Visualization system for quantum consciousness matrix"""
     
@@ -640,18 +650,15 @@ class QuantumConsciousnessMatrixVisualization:
                                   fill="orange", font=('Arial', 8), tags="quantum")
         
         # Draw matrix connections
-        for i, matrix1 in enumerate(matrix_list):
-            for j, matrix2 in enumerate(matrix_list[i+1:], i+1):
-                similarity = self.calculate_matrix_similarity(matrix1, matrix2)
-                if similarity > 0.2:
-                    x1, y1 = positions[matrix1.matrix_id]
-                    x2, y2 = positions[matrix2.matrix_id]
-                    
-                    # Line width based on similarity
-                    width = int(similarity * 5) + 1
-                    
-                    self.canvas.create_line(x1, y1, x2, y2,
-                                          fill="cyan", width=width, tags="quantum")
+        for i, j, similarity in QUANTUM_MATRIX_SIMILARITY.pairs_above(matrix_list, 0.2, strict=True, max_pairs=MAX_DRAWN_PAIRS):
+            x1, y1 = positions[matrix_list[i].matrix_id]
+            x2, y2 = positions[matrix_list[j].matrix_id]
+            
+            # Line width based on similarity
+            width = int(similarity * 5) + 1
+            
+            self.canvas.create_line(x1, y1, x2, y2,
+                                  fill="cyan", width=width, tags="quantum")
     
     def get_matrix_color(self, quantum_state: QuantumState) -> str:
         """Get color for quantum state"""
@@ -671,19 +678,7 @@ class QuantumConsciousnessMatrixVisualization:
     
     def calculate_matrix_similarity(self, matrix1: QuantumConsciousnessMatrix, matrix2: QuantumConsciousnessMatrix) -> float:
         """Calculate similarity between matrices"""
-        # State similarity
-        state_similarity = 1.0 if matrix1.quantum_state == matrix2.quantum_state else 0.5
-        
-        # Synthesis level similarity
-        synthesis_similarity = 1.0 / (1.0 + abs(matrix1.synthesis_level - matrix2.synthesis_level))
-        
-        # Entity count similarity
-        entity_similarity = 1.0 / (1.0 + abs(len(matrix1.entities) - len(matrix2.entities)))
-        
-        # Quantum essence similarity
-        essence_similarity = 1.0 / (1.0 + abs(matrix1.quantum_essence - matrix2.quantum_essence) / 1e15)
-        
-        return (state_similarity + synthesis_similarity + entity_similarity + essence_similarity) / 4
+        return QUANTUM_MATRIX_SIMILARITY.score(matrix1, matrix2)
 
 # Example usage and integration
 if __name__ == "__main__":
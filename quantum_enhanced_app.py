@@ -24,7 +24,6 @@ import csv
 import sqlite3
 import random
 import math
-import hashlib
 import base64
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
@@ -35,6 +34,8 @@ import queue
 import numpy as np
 from collections import defaultdict, deque
 
+from proof_of_work import ProofOfWorkMiner, block_hash, merkle_root
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -119,33 +120,31 @@ class QuantumSimulator:
 class BlockchainSimulator:
     """Simulates blockchain technology for decentralized achievement tracking"""
     
-    def __init__(self):
+    def __init__(self, batch_size: int = 5, difficulty: int = 4, workers: Optional[int] = None):
         self.chain = []
         self.pending_transactions = []
-        self.difficulty = 4
+        self.difficulty = difficulty
+        self.batch_size = batch_size  # pending transactions that trigger a block
         self.blockchain_height = 0
+        self.miner = ProofOfWorkMiner(difficulty, workers)
         self.genesis_block = self.create_genesis_block()
         
     def create_genesis_block(self) -> Dict[str, Any]:
         """Create the first block in the chain"""
-        return {
+        block = {
             'index': 0,
             'timestamp': time.time(),
             'transactions': [],
+            'merkle_root': merkle_root([]),
             'previous_hash': '0',
-            'hash': self.calculate_hash({
-                'index': 0,
-                'timestamp': time.time(),
-                'transactions': [],
-                'previous_hash': '0'
-            }),
             'nonce': 0
         }
+        block['hash'] = self.calculate_hash(block)
+        return block
     
     def calculate_hash(self, block: Dict[str, Any]) -> str:
-        """Calculate SHA-256 hash of a block"""
-        block_string = json.dumps(block, sort_keys=True)
-        return hashlib.sha256(block_string.encode()).hexdigest()
+        """Calculate SHA-256 hash of a block header; transactions are covered by the Merkle root"""
+        return block_hash(block)
     
     def mine_block(self, transactions: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Mine a new block with given transactions"""
@@ -155,20 +154,29 @@ class BlockchainSimulator:
             'index': previous_block['index'] + 1,
             'timestamp': time.time(),
             'transactions': transactions,
+            'merkle_root': merkle_root(transactions),
             'previous_hash': previous_block['hash'],
             'nonce': 0
         }
         
-        # Proof of work
-        while True:
-            new_block['hash'] = self.calculate_hash(new_block)
-            if new_block['hash'][:self.difficulty] == '0' * self.difficulty:
-                break
-            new_block['nonce'] += 1
+        # Proof of work over the header; the miner sets nonce and hash
+        self.miner.difficulty = self.difficulty
+        self.miner.mine(new_block)
         
         self.blockchain_height = new_block['index']
         return new_block
     
+    def mine_pending(self, max_transactions: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Mine pending transactions into one block, all of them unless capped"""
+        if not self.pending_transactions:
+            return None
+        count = len(self.pending_transactions) if max_transactions is None else max_transactions
+        transactions = self.pending_transactions[:count]
+        new_block = self.mine_block(transactions)
+        self.chain.append(new_block)
+        self.pending_transactions = self.pending_transactions[count:]
+        return new_block
+    
     def add_achievement_transaction(self, user_id: str, achievement: str, timestamp: float) -> bool:
         """Add an achievement transaction to the blockchain"""
         transaction = {
@@ -181,13 +189,15 @@ class BlockchainSimulator:
         self.pending_transactions.append(transaction)
         
         # Mine block if we have enough transactions
-        if len(self.pending_transactions) >= 5:
-            new_block = self.mine_block(self.pending_transactions)
-            self.chain.append(new_block)
-            self.pending_transactions = []
+        if len(self.pending_transactions) >= self.batch_size:
+            self.mine_pending()
             return True
         
         return False
+    
+    @property
+    def transaction_count(self) -> int:
+        return sum(len(block['transactions']) for block in self.chain)
 
 # Quantum Neural Network
 class QuantumNeuralNetwork:
@@ -876,7 +886,7 @@ class QuantumEnhancedProductivitySuite:
             
             # Update blockchain status
             blockchain_height = self.quantum_data_manager.blockchain.blockchain_height
-            total_transactions = len(self.quantum_data_manager.blockchain.chain) * 5
+            total_transactions = self.quantum_data_manager.blockchain.transaction_count
             self.blockchain_label.config(text=f"Height: {blockchain_height} | Transactions: {total_transactions}")
             
             # Update status bar
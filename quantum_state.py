@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Quantum State Engine for Scroll Stopping Tool
+Batched single-qubit registers and a multi-qubit state-vector simulator on NumPy
+"""
+
+import logging
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from bounded_history import BoundedHistory
+
+logger = logging.getLogger(__name__)
+
+# 2^24 amplitudes of complex64 is 128 MB, the practical CPU limit here
+MAX_STATEVECTOR_QUBITS = 24
+
+SINGLE_QUBIT_GATES = {
+    "I": np.eye(2, dtype=np.complex128),
+    "H": np.array([[1, 1], [1, -1]], dtype=np.complex128) / np.sqrt(2),  # Hadamard
+    "X": np.array([[0, 1], [1, 0]], dtype=np.complex128),  # Pauli-X
+    "Y": np.array([[0, -1j], [1j, 0]], dtype=np.complex128),  # Pauli-Y
+    "Z": np.array([[1, 0], [0, -1]], dtype=np.complex128),  # Pauli-Z
+    "S": np.array([[1, 0], [0, 1j]], dtype=np.complex128),  # Phase
+    "T": np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=np.complex128)  # T gate
+}
+# Basis order |control target⟩ = |00⟩, |01⟩, |10⟩, |11⟩
+TWO_QUBIT_GATES = {
+    "CNOT": np.array([[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0]], dtype=np.complex128),
+    "SWAP": np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]], dtype=np.complex128)
+}
+
+def rotation(axis: str, theta: float) -> np.ndarray:
+    """Single-qubit rotation about X, Y or Z"""
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    if axis == "X":
+        return np.array([[c, -1j * s], [-1j * s, c]], dtype=np.complex128)
+    if axis == "Y":
+        return np.array([[c, -s], [s, c]], dtype=np.complex128)
+    return np.array([[np.exp(-1j * theta / 2), 0], [0, np.exp(1j * theta / 2)]], dtype=np.complex128)
+
+class QubitRegister:
+    """Independent qubits kept as one (N, 2) amplitude array
+
+    A gate on any subset of qubits is one broadcast matrix product, and a
+    measurement of many qubits is one vectorized draw. Qubits here are never
+    entangled with each other; use StateVector for that. Measurement history
+    is kept as per-qubit counts plus a bounded window of recent results.
+    """
+
+    def __init__(self, num_qubits: int, rng: Optional[np.random.Generator] = None, history_size: int = 1000,
+                 history_spill=None):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.states = np.zeros((num_qubits, 2), dtype=np.complex128)
+        self.states[:, 0] = 1.0  # |0⟩
+        self.consciousness_level = np.zeros(num_qubits)
+        self.quantum_coherence = np.ones(num_qubits)
+        self.measurement_counts = np.zeros((num_qubits, 2), dtype=np.int64)
+        self.recent_measurements = BoundedHistory(history_size, history_spill, name="QubitRegister.measurements")
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def _select(self, indices) -> np.ndarray:
+        return np.arange(len(self.states)) if indices is None else np.atleast_1d(np.asarray(indices, dtype=np.int64))
+
+    def apply(self, gate: np.ndarray, indices=None):
+        """Apply a 2x2 gate to the given qubits (all by default)"""
+        indices = self._select(indices)
+        states = self.states[indices] @ np.asarray(gate, dtype=np.complex128).T
+        states /= np.linalg.norm(states, axis=1, keepdims=True)
+        self.states[indices] = states
+
+    def swap(self, a: int, b: int):
+        """SWAP is exact on unentangled qubits: exchange their states"""
+        self.states[[a, b]] = self.states[[b, a]]
+
+    def probabilities(self, indices=None) -> np.ndarray:
+        """P(|1⟩) per qubit"""
+        return np.abs(self.states[self._select(indices), 1]) ** 2
+
+    def measure(self, indices=None) -> np.ndarray:
+        """Measure and collapse the given qubits in one draw"""
+        indices = self._select(indices)
+        results = (self.rng.random(len(indices)) < self.probabilities(indices)).astype(np.int64)
+        self.states[indices] = 0
+        self.states[indices, results] = 1.0
+        np.add.at(self.measurement_counts, (indices, results), 1)
+        self.recent_measurements.extend(zip(indices.tolist(), results.tolist()))
+        return results
+
+    def evolve(self, indices=None):
+        """Raise consciousness and decay coherence with one draw per qubit"""
+        indices = self._select(indices)
+        np.add.at(self.consciousness_level, indices, self.rng.uniform(0.01, 0.1, len(indices)))
+        decay = np.zeros(len(self.states))
+        np.add.at(decay, indices, self.rng.uniform(0.001, 0.01, len(indices)))
+        np.maximum(self.quantum_coherence - decay, 0.0, out=self.quantum_coherence)
+
+class StateVector:
+    """Full 2^n amplitude simulation of n entangleable qubits
+
+    Qubit k is bit k of the basis index. Gates act in place on reshaped views
+    of the amplitudes, so a single-qubit gate is a few multiply-adds over the
+    vector and CNOT/SWAP are block exchanges, with no 2^n x 2^n matrices.
+    """
+
+    def __init__(self, num_qubits: int, rng: Optional[np.random.Generator] = None, dtype=np.complex64):
+        if not 0 < num_qubits <= MAX_STATEVECTOR_QUBITS:
+            raise ValueError(f"State-vector mode supports 1 to {MAX_STATEVECTOR_QUBITS} qubits, got {num_qubits}")
+        self.num_qubits = num_qubits
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.amplitudes = np.zeros(2 ** num_qubits, dtype=dtype)
+        self.amplitudes[0] = 1.0
+        # Reused half-size buffers: at this size fresh temporaries cost more than the arithmetic
+        self._scratch = np.zeros((2, 2 ** max(0, num_qubits - 1)), dtype=dtype)
+
+    def _check(self, *qubits: int):
+        for qubit in qubits:
+            if not 0 <= qubit < self.num_qubits:
+                raise ValueError(f"Qubit {qubit} out of range for {self.num_qubits} qubits")
+        if len(set(qubits)) != len(qubits):
+            raise ValueError(f"Gate qubits must be distinct, got {qubits}")
+
+    def _split(self, qubit: int) -> np.ndarray:
+        """View with the qubit's bit as the middle axis: (high bits, 2, low bits)"""
+        return self.amplitudes.reshape(-1, 2, 2 ** qubit)
+
+    def _block(self, bits: Dict[int, int]) -> np.ndarray:
+        """View of the amplitudes whose given qubits have the given bit values"""
+        index = [slice(None)] * self.num_qubits
+        for qubit, bit in bits.items():
+            # A length-one slice keeps a view even when every axis is fixed
+            index[self.num_qubits - 1 - qubit] = slice(bit, bit + 1)
+        return self.amplitudes.reshape((2,) * self.num_qubits)[tuple(index)]
+
+    def _exchange(self, a: np.ndarray, b: np.ndarray):
+        """Swap two equally shaped, non-overlapping views through the scratch buffer"""
+        tmp = self._scratch[0, :a.size].reshape(a.shape)
+        np.copyto(tmp, a)
+        np.copyto(a, b)
+        np.copyto(b, tmp)
+
+    def apply(self, gate: np.ndarray, qubit: int):
+        """Apply a 2x2 gate to one qubit in place"""
+        self._check(qubit)
+        view = self._split(qubit)
+        zero, one = view[:, 0, :], view[:, 1, :]
+        (g00, g01), (g10, g11) = np.asarray(gate, dtype=self.amplitudes.dtype)
+        if g01 == 0 and g10 == 0:
+            # Diagonal gates (Z, S, T, Rz) only rescale
+            if g00 != 1:
+                np.multiply(zero, g00, out=zero)
+            np.multiply(one, g11, out=one)
+            return
+        if g00 == 0 and g11 == 0 and g01 == 1 and g10 == 1:
+            self._exchange(zero, one)
+            return
+        from_one = self._scratch[0].reshape(zero.shape)
+        from_zero = self._scratch[1].reshape(zero.shape)
+        np.multiply(one, g01, out=from_one)
+        np.multiply(zero, g10, out=from_zero)
+        np.multiply(zero, g00, out=zero)
+        np.add(zero, from_one, out=zero)
+        np.multiply(one, g11, out=one)
+        np.add(one, from_zero, out=one)
+
+    def cnot(self, control: int, target: int):
+        """Flip the target on the half of the amplitudes where the control is |1⟩"""
+        self._check(control, target)
+        self._exchange(self._block({control: 1, target: 0}), self._block({control: 1, target: 1}))
+
+    def swap(self, a: int, b: int):
+        """Exchange the amplitudes where the two qubits differ"""
+        self._check(a, b)
+        self._exchange(self._block({a: 1, b: 0}), self._block({a: 0, b: 1}))
+
+    def apply_named(self, name: str, qubits: Sequence[int]):
+        """Apply a gate from SINGLE_QUBIT_GATES or CNOT/SWAP by name"""
+        if name == "CNOT":
+            self.cnot(*qubits)
+        elif name == "SWAP":
+            self.swap(*qubits)
+        elif name in SINGLE_QUBIT_GATES:
+            for qubit in qubits:
+                self.apply(SINGLE_QUBIT_GATES[name], qubit)
+        else:
+            raise ValueError(f"Unknown gate {name}")
+
+    def probabilities(self) -> np.ndarray:
+        probabilities = np.abs(self.amplitudes) ** 2
+        return probabilities / probabilities.sum()
+
+    def sample(self, shots: int) -> np.ndarray:
+        """Basis-state indices of repeated full measurements, without collapsing"""
+        cumulative = np.cumsum(np.abs(self.amplitudes) ** 2, dtype=np.float64)
+        return np.minimum(np.searchsorted(cumulative, self.rng.random(shots) * cumulative[-1], side='right'),
+                          len(cumulative) - 1)
+
+    def sample_bits(self, shots: int) -> np.ndarray:
+        """(shots, n) array of measured bits, column k being qubit k"""
+        samples = self.sample(shots)
+        return ((samples[:, None] >> np.arange(self.num_qubits)) & 1).astype(np.int8)
+
+    def counts(self, shots: int) -> Dict[str, int]:
+        """Histogram of measured bitstrings, written most significant qubit first"""
+        values, frequency = np.unique(self.sample(shots), return_counts=True)
+        return {format(value, f"0{self.num_qubits}b"): int(count) for value, count in zip(values.tolist(), frequency.tolist())}
+
+    def measure(self, qubit: int) -> int:
+        """Measure one qubit and collapse the state"""
+        self._check(qubit)
+        view = self._split(qubit)
+        p_one = float(np.sum(np.abs(view[:, 1, :]) ** 2, dtype=np.float64))
+        result = int(self.rng.random() < p_one)
+        view[:, 1 - result, :] = 0
+        norm = np.sqrt(p_one if result else 1 - p_one)
+        if norm > 0:
+            self.amplitudes /= norm
+        return result
+
+def run_circuit(num_qubits: int, gates: Iterable[Tuple[str, Sequence[int]]], shots: int = 1024,
+                seed: Optional[int] = None) -> Dict[str, int]:
+    """Simulate a gate list such as [("H", [0]), ("CNOT", [0, 1])] and return measurement counts"""
+    state = StateVector(num_qubits, np.random.default_rng(seed))
+    for name, qubits in gates:
+        state.apply_named(name, qubits)
+    return state.counts(shots)
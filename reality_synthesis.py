@@ -13,6 +13,8 @@ from typing import Dict, List, Any, Optional, Tuple, Set
 from enum import Enum
 from collections import defaultdict
 
+from similarity import MAX_DRAWN_PAIRS, SimilarityModel, SimilarityTerm
+
 class RealityType(Enum):
     QUANTUM_REALITY = "Quantum Reality"
     NEURAL_REALITY = "Neural Reality"
@@ -497,6 +499,13 @@ class RealitySynthesisEngine:
         
         return insights
 
+# Connection strength between realities in the network view
+REALITY_SIMILARITY = SimilarityModel([
+    SimilarityTerm(1.0, lambda reality: reality.reality_type, kind="match", mismatch=0.5),
+    SimilarityTerm(1.0, lambda reality: reality.synthesis_level),
+    SimilarityTerm(1.0, lambda reality: len(reality.dimensions))
+], divisor=3)
+
 class RealitySynthesisVisualization:
     """Visualization system for reality synthesis"""
     
@@ -536,18 +545,15 @@ class RealitySynthesisVisualization:
                                   fill="yellow", font=('Arial', 8), tags="reality")
         
         # Draw connections between similar realities
-        for i, reality1 in enumerate(reality_list):
-            for j, reality2 in enumerate(reality_list[i+1:], i+1):
-                similarity = self.calculate_reality_similarity(reality1, reality2)
-                if similarity > 0.3:
-                    x1, y1 = positions[reality1.reality_id]
-                    x2, y2 = positions[reality2.reality_id]
-                    
-                    # Line width based on similarity
-                    width = int(similarity * 5) + 1
-                    
-                    self.canvas.create_line(x1, y1, x2, y2,
-                                          fill="cyan", width=width, tags="reality")
+        for i, j, similarity in REALITY_SIMILARITY.pairs_above(reality_list, 0.3, strict=True, max_pairs=MAX_DRAWN_PAIRS):
+            x1, y1 = positions[reality_list[i].reality_id]
+            x2, y2 = positions[reality_list[j].reality_id]
+            
+            # Line width based on similarity
+            width = int(similarity * 5) + 1
+            
+            self.canvas.create_line(x1, y1, x2, y2,
+                                  fill="cyan", width=width, tags="reality")
     
     def get_reality_color(self, reality_type: RealityType) -> str:
         """Get color for reality type"""
@@ -563,16 +569,7 @@ class RealitySynthesisVisualization:
     
     def calculate_reality_similarity(self, reality1: SynthesizedReality, reality2: SynthesizedReality) -> float:
         """Calculate similarity between realities"""
-        # Type similarity
-        type_similarity = 1.0 if reality1.reality_type == reality2.reality_type else 0.5
-        
-        # Synthesis level similarity
-        synthesis_similarity = 1.0 / (1.0 + abs(reality1.synthesis_level - reality2.synthesis_level))
-        
-        # Dimension count similarity
-        dimension_similarity = 1.0 / (1.0 + abs(len(reality1.dimensions) - len(reality2.dimensions)))
-        
-        return (type_similarity + synthesis_similarity + dimension_similarity) / 3
+        return REALITY_SIMILARITY.score(reality1, reality2)
 
 # Example usage and integration
 if __name__ == "__main__":
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Ring Buffers and Decimation for Scroll Stopping Tool
+Fixed-size NumPy sample buffers and min/max / LTTB downsampling for long live traces
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+class RingBuffer:
+    """Fixed-capacity row buffer with O(1) appends and a zero-copy, oldest-first view
+
+    Every row is written twice, at i and i + capacity, so the live window is
+    always one contiguous slice of the backing array.
+    """
+
+    def __init__(self, capacity: int, columns: int = 1, dtype=np.float64):
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.data = np.zeros((2 * capacity, columns), dtype=dtype)
+        self.start = 0
+        self.size = 0
+
+    def append(self, row: Sequence[float]):
+        end = (self.start + self.size) % self.capacity
+        self.data[end] = row
+        self.data[end + self.capacity] = row
+        if self.size < self.capacity:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    def extend(self, rows: np.ndarray):
+        """Append many rows at once; only the newest `capacity` rows are kept"""
+        rows = np.asarray(rows, dtype=self.data.dtype).reshape(-1, self.data.shape[1])[-self.capacity:]
+        positions = (self.start + self.size + np.arange(len(rows))) % self.capacity
+        self.data[positions] = rows
+        self.data[positions + self.capacity] = rows
+        overflow = max(0, self.size + len(rows) - self.capacity)
+        self.size = min(self.capacity, self.size + len(rows))
+        self.start = (self.start + overflow) % self.capacity
+
+    def view(self) -> np.ndarray:
+        """Current rows, oldest first; a view that is invalidated by the next append"""
+        return self.data[self.start:self.start + self.size]
+
+    def last(self) -> np.ndarray:
+        if not self.size:
+            raise IndexError("last from empty ring buffer")
+        return self.data[self.start + self.size - 1]
+
+    def replace_last(self, row: Sequence[float]):
+        """Overwrite the newest row in place"""
+        if not self.size:
+            raise IndexError("replace_last on empty ring buffer")
+        end = (self.start + self.size - 1) % self.capacity
+        self.data[end] = row
+        self.data[end + self.capacity] = row
+
+    def clear(self):
+        self.start = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+class MinMaxBuckets:
+    """Incremental min/max decimation over fixed-width time buckets
+
+    Each sample updates only its own bucket, so keeping a long window ready to
+    draw costs O(1) per sample and the plotted series never exceeds two points
+    per bucket however many samples arrive.
+    """
+
+    # Columns: bucket index, t of min, min, t of max, max
+    BUCKET, T_MIN, Y_MIN, T_MAX, Y_MAX = range(5)
+
+    def __init__(self, bucket_width: float, n_buckets: int):
+        self.bucket_width = bucket_width
+        self.rows = RingBuffer(n_buckets, columns=5)
+
+    def append(self, t: float, y: float):
+        bucket = t // self.bucket_width
+        if self.rows.size:
+            last = self.rows.last()
+            if last[self.BUCKET] == bucket:
+                if y < last[self.Y_MIN] or y > last[self.Y_MAX]:
+                    row = last.copy()
+                    if y < row[self.Y_MIN]:
+                        row[self.T_MIN], row[self.Y_MIN] = t, y
+                    if y > row[self.Y_MAX]:
+                        row[self.T_MAX], row[self.Y_MAX] = t, y
+                    self.rows.replace_last(row)
+                return
+        self.rows.append((bucket, t, y, t, y))
+
+    def series(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Time-ordered (t, y) with each bucket's min and max"""
+        rows = self.rows.view()
+        min_first = rows[:, self.T_MIN] <= rows[:, self.T_MAX]
+        t = np.where(min_first[:, None], rows[:, [self.T_MIN, self.T_MAX]], rows[:, [self.T_MAX, self.T_MIN]])
+        y = np.where(min_first[:, None], rows[:, [self.Y_MIN, self.Y_MAX]], rows[:, [self.Y_MAX, self.Y_MIN]])
+        return t.ravel(), y.ravel()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+def minmax_decimate(x: np.ndarray, y: np.ndarray, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Keep each bucket's minimum and maximum, preserving spikes, in one vectorized pass"""
+    n = len(x)
+    if n <= 2 * n_buckets:
+        return x, y
+
+    per_bucket = n // n_buckets
+    body = y[:per_bucket * n_buckets].reshape(n_buckets, per_bucket)
+    offsets = np.arange(n_buckets) * per_bucket
+    indices = np.sort(np.stack([body.argmin(axis=1) + offsets, body.argmax(axis=1) + offsets], axis=1), axis=1).ravel()
+
+    # Samples left over after the whole buckets form one final bucket
+    if per_bucket * n_buckets < n:
+        tail = y[per_bucket * n_buckets:]
+        start = per_bucket * n_buckets
+        indices = np.concatenate([indices, np.sort([start + tail.argmin(), start + tail.argmax()])])
+
+    return x[indices], y[indices]
+
+def lttb_decimate(x: np.ndarray, y: np.ndarray, n_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Largest-Triangle-Three-Buckets downsampling to n_out points, keeping the visual shape"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    # Interior buckets span [edges[i], edges[i + 1]); the first and last samples are always kept
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0], selected[-1] = 0, n - 1
+
+    anchor = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+
+        area = np.abs((x[anchor] - avg_x) * (y[lo:hi] - y[anchor]) - (x[anchor] - x[lo:hi]) * (avg_y - y[anchor]))
+        anchor = lo + int(area.argmax())
+        selected[i + 1] = anchor
+
+    return x[selected], y[selected]
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Cooperative Scheduler for Scroll Stopping Tool
+One worker thread runs every engine's periodic jobs and queue handlers instead of a polling thread each
+"""
+
+import logging
+import math
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Timer wheel resolution in seconds; deadlines are rounded up to the next tick
+TICK = 0.005
+WHEEL_SLOTS = 512
+BLOCKING_WORKERS = 2  # threads for jobs registered with blocking=True, e.g. model retraining
+
+@dataclass
+class TaskStats:
+    """Run-time accounting for one task"""
+    runs: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+    overruns: int = 0  # runs that took longer than the task's budget
+    errors: int = 0
+    last_run: Optional[float] = None
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.runs if self.runs else 0.0
+
+@dataclass(eq=False)
+class ScheduledTask:
+    """A periodic job or queue handler registered with a scheduler"""
+    name: str
+    callback: Callable[[], Any]
+    interval: Optional[float]  # None for tasks that only run when woken by their queue
+    budget: float
+    error_interval: Optional[float] = None
+    stats: TaskStats = field(default_factory=TaskStats)
+    scheduler: Optional["Scheduler"] = field(default=None, repr=False)
+    due_tick: Optional[int] = None
+    active: bool = True
+    blocking: bool = False  # runs on the blocking lane instead of the tick thread
+    running: bool = False
+    rerun: bool = False  # woken while running on the blocking lane
+
+    def cancel(self):
+        """Stop running this task; a run already in progress finishes"""
+        if self.scheduler is not None:
+            self.scheduler.cancel(self)
+
+    def wake(self):
+        """Run this task as soon as the worker is free"""
+        if self.scheduler is not None:
+            self.scheduler.wake(self)
+
+class TaskQueue(queue.Queue):
+    """Blocking queue drained by a scheduler task that only wakes when something is put"""
+
+    def __init__(self, handler: Callable[[Any], Any], maxsize: int = 0):
+        super().__init__(maxsize)
+        self.handler = handler
+        self.task: Optional[ScheduledTask] = None
+
+    def put(self, item, block: bool = True, timeout: Optional[float] = None):
+        super().put(item, block, timeout)
+        if self.task is not None:
+            self.task.wake()
+
+    def drain(self):
+        """Handle queued items until the queue is empty or the task's budget is spent"""
+        deadline = time.perf_counter() + self.task.budget
+        while time.perf_counter() < deadline:
+            try:
+                item = self.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                self.handler(item)
+            except Exception as e:
+                logger.error(f"Error in {self.task.name}: {e}")
+        if not self.empty():
+            # Out of budget: let other due tasks run before the rest of the backlog
+            self.task.wake()
+
+class Scheduler:
+    """Timer wheel of periodic tasks plus woken queue handlers, run cooperatively on one thread
+
+    Periodic tasks sit in the wheel slot of their next due tick. The worker
+    sleeps on a condition until the earliest due tick or until a queue put
+    wakes a handler, so nothing runs and nothing polls while no work is due.
+    Tasks run one at a time; each run is timed against the task's budget.
+    Budgets are not enforced, so jobs that take seconds (model retraining)
+    are registered with blocking=True and handed to a small thread pool; the
+    worker moves on at once and the job is rescheduled when it finishes.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._wheel: List[List[ScheduledTask]] = [[] for _ in range(WHEEL_SLOTS)]
+        self._ready: List[ScheduledTask] = []
+        self._tasks: List[ScheduledTask] = []
+        self._origin = time.monotonic()
+        self._cursor = 0  # first tick not yet fired; every due tick in the wheel is at or after it
+        self._thread: Optional[threading.Thread] = None
+        self._blocking_pool: Optional[ThreadPoolExecutor] = None
+        self._stopping = False
+        self.wakeups = 0
+
+    def _tick(self, now: float) -> int:
+        return int((now - self._origin) / TICK)
+
+    def every(self, interval: float, callback: Callable[[], Any], name: Optional[str] = None,
+              budget: Optional[float] = None, error_interval: Optional[float] = None,
+              delay: Optional[float] = None, blocking: bool = False) -> ScheduledTask:
+        """Run `callback` every `interval` seconds, measured from the end of each run
+
+        Pass blocking=True for jobs that may run for seconds, so they never stall the tick thread.
+        """
+        task = ScheduledTask(name or getattr(callback, '__qualname__', repr(callback)), callback, interval,
+                             interval if budget is None else budget, error_interval, scheduler=self,
+                             blocking=blocking)
+        with self._condition:
+            self._tasks.append(task)
+            self._schedule(task, interval if delay is None else delay)
+            self._start()
+        return task
+
+    def queue(self, handler: Callable[[Any], Any], name: Optional[str] = None, budget: float = 0.05,
+              maxsize: int = 0) -> TaskQueue:
+        """A queue whose items are passed to `handler` on the worker as soon as they are put"""
+        task_queue = TaskQueue(handler, maxsize)
+        task = ScheduledTask(name or getattr(handler, '__qualname__', repr(handler)), task_queue.drain, None,
+                             budget, scheduler=self)
+        task_queue.task = task
+        with self._condition:
+            self._tasks.append(task)
+            self._start()
+        return task_queue
+
+    def wake(self, task: ScheduledTask):
+        with self._condition:
+            if task.running:
+                task.rerun = True
+            elif task.active and task not in self._ready:
+                self._ready.append(task)
+                self._condition.notify()
+
+    def cancel(self, task: ScheduledTask):
+        with self._condition:
+            task.active = False
+            self._unschedule(task)
+            if task in self._ready:
+                self._ready.remove(task)
+            if task in self._tasks:
+                self._tasks.remove(task)
+
+    def _schedule(self, task: ScheduledTask, delay: float):
+        due = max(math.ceil((time.monotonic() + delay - self._origin) / TICK), self._cursor)
+        task.due_tick = due
+        self._wheel[due % WHEEL_SLOTS].append(task)
+        self._condition.notify()
+
+    def _unschedule(self, task: ScheduledTask):
+        if task.due_tick is not None:
+            self._wheel[task.due_tick % WHEEL_SLOTS].remove(task)
+            task.due_tick = None
+
+    def _start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the worker thread; registered tasks stay registered and resume on the next registration"""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _collect_due(self):
+        """Move tasks whose tick has passed from the wheel to the ready list"""
+        now_tick = self._tick(time.monotonic())
+        if now_tick < self._cursor:
+            return
+        for offset in range(min(now_tick - self._cursor + 1, WHEEL_SLOTS)):
+            slot = self._wheel[(self._cursor + offset) % WHEEL_SLOTS]
+            due = [task for task in slot if task.due_tick <= now_tick]
+            for task in due:
+                slot.remove(task)
+                task.due_tick = None
+                self._ready.append(task)
+        self._cursor = now_tick + 1
+
+    def _next_timeout(self) -> Optional[float]:
+        """Seconds until the earliest due tick, or None when no periodic task is scheduled"""
+        next_tick = None
+        for offset in range(WHEEL_SLOTS):
+            slot = self._wheel[(self._cursor + offset) % WHEEL_SLOTS]
+            if any(task.due_tick == self._cursor + offset for task in slot):
+                next_tick = self._cursor + offset
+                break
+        else:
+            # Nothing within one revolution; fall back to the overall earliest deadline
+            due = [task.due_tick for slot in self._wheel for task in slot]
+            next_tick = min(due) if due else None
+        if next_tick is None:
+            return None
+        return max(0.0, self._origin + next_tick * TICK - time.monotonic())
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._stopping:
+                        return
+                    self._collect_due()
+                    if self._ready:
+                        ready, self._ready = self._ready, []
+                        break
+                    self._condition.wait(self._next_timeout())
+                    self.wakeups += 1
+            for task in ready:
+                if task.active:
+                    self._dispatch(task)
+
+    def _dispatch(self, task: ScheduledTask):
+        """Run a due task here, or hand it to the blocking lane"""
+        if not task.blocking:
+            self._execute(task)
+            return
+        with self._condition:
+            if task.running:
+                return
+            task.running = True
+            if self._blocking_pool is None:
+                self._blocking_pool = ThreadPoolExecutor(BLOCKING_WORKERS, thread_name_prefix="scheduler-blocking")
+        self._blocking_pool.submit(self._execute, task)
+
+    def _execute(self, task: ScheduledTask):
+        failed = False
+        start = time.perf_counter()
+        try:
+            task.callback()
+        except Exception as e:
+            failed = True
+            task.stats.errors += 1
+            logger.error(f"Error in scheduled task {task.name}: {e}")
+        elapsed = time.perf_counter() - start
+
+        stats = task.stats
+        stats.runs += 1
+        stats.total_time += elapsed
+        stats.max_time = max(stats.max_time, elapsed)
+        stats.last_run = time.time()
+        if elapsed > task.budget:
+            stats.overruns += 1
+            if stats.overruns == 1:
+                logger.warning(f"Scheduled task {task.name} took {elapsed * 1000:.1f} ms, "
+                               f"over its {task.budget * 1000:.1f} ms budget")
+
+        with self._condition:
+            task.running = False
+            if task.rerun:
+                task.rerun = False
+                if task.active and task not in self._ready:
+                    self._ready.append(task)
+                    self._condition.notify()
+            if task.interval is not None and task.active and task.due_tick is None:
+                delay = task.error_interval if failed and task.error_interval is not None else task.interval
+                self._schedule(task, delay)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-task run counts and timings"""
+        with self._condition:
+            tasks = list(self._tasks)
+        return [{
+            'name': task.name,
+            'interval': task.interval,
+            'budget': task.budget,
+            'blocking': task.blocking,
+            'runs': task.stats.runs,
+            'mean_ms': task.stats.mean_time * 1000,
+            'max_ms': task.stats.max_time * 1000,
+            'total_s': task.stats.total_time,
+            'overruns': task.stats.overruns,
+            'errors': task.stats.errors
+        } for task in tasks]
+
+_scheduler: Optional[Scheduler] = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> Scheduler:
+    """The process-wide scheduler shared by every engine"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = Scheduler()
+        return _scheduler
@@ -49,22 +49,19 @@ except ImportError:
     PLYER_AVAILABLE = False
     logger.warning("Plyer not available - notifications will be disabled")
 
-try:
-    import matplotlib.pyplot as plt
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    MATPLOTLIB_AVAILABLE = True
-except ImportError:
-    MATPLOTLIB_AVAILABLE = False
-    logger.warning("Matplotlib not available - charts will be disabled")
+# Charting and PDF backends are heavy; they are imported the first time a chart or report needs them
+from lazy_imports import Capability, lazy_import
 
-try:
-    from matplotlib.backends.backend_pdf import PdfPages
-    from reportlab.lib.pagesizes import letter
-    from reportlab.pdfgen import canvas as pdf_canvas
-    REPORTLAB_AVAILABLE = True
-except ImportError:
-    REPORTLAB_AVAILABLE = False
-    logger.warning("ReportLab not available - PDF export will be disabled")
+MATPLOTLIB_AVAILABLE = Capability('matplotlib', 'matplotlib.pyplot', 'matplotlib.backends.backend_tkagg',
+                                  warning="Matplotlib not available - charts will be disabled")
+plt = lazy_import('matplotlib.pyplot')
+FigureCanvasTkAgg = lazy_import('matplotlib.backends.backend_tkagg', 'FigureCanvasTkAgg')
+
+REPORTLAB_AVAILABLE = Capability('reportlab', 'matplotlib.backends.backend_pdf', 'reportlab.lib.pagesizes',
+                                 'reportlab.pdfgen.canvas',
+                                 warning="ReportLab not available - PDF export will be disabled")
+PdfPages = lazy_import('matplotlib.backends.backend_pdf', 'PdfPages')
+pdf_canvas = lazy_import('reportlab.pdfgen.canvas')
 
 try:
     import smtplib
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Similarity Index for Scroll Stopping Tool
+All-pairs similarity over packed feature matrices and thresholded neighbor queries
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from lazy_imports import Capability, lazy_import
+
+logger = logging.getLogger(__name__)
+
+SCIPY_AVAILABLE = Capability('scipy', 'scipy.spatial',
+                             warning="scipy not available - similarity queries will scan blockwise")
+cKDTree = lazy_import('scipy.spatial', 'cKDTree')
+
+# Rows per block of an all-pairs pass: a block is BLOCK_SIZE x n float64 scores
+BLOCK_SIZE = 512
+# Network views draw at most this many of the strongest connections
+MAX_DRAWN_PAIRS = 5000
+
+@dataclass
+class SimilarityTerm:
+    """One weighted component of a similarity score
+
+    "inverse" scores 1 / (1 + |a - b| / scale) on a numeric feature, "match"
+    scores 1 or `mismatch` on a categorical one, and "pair" calls `pair(a, b)`
+    for components that cannot be packed; those must score within [0, 1].
+    """
+    weight: float
+    value: Optional[Callable[[Any], Any]] = None
+    kind: str = "inverse"
+    scale: float = 1.0
+    mismatch: float = 0.0
+    pair: Optional[Callable[[Any, Any], float]] = None
+
+    def score(self, a, b) -> float:
+        if self.kind == "pair":
+            return self.pair(a, b)
+        if self.kind == "match":
+            return 1.0 if self.value(a) == self.value(b) else self.mismatch
+        return 1.0 / (1.0 + abs(self.value(a) - self.value(b)) / self.scale)
+
+class SimilarityModel:
+    """Weighted sum of terms, divided by `divisor`, for one kind of item"""
+
+    def __init__(self, terms: Sequence[SimilarityTerm], divisor: float = 1.0):
+        self.terms = list(terms)
+        self.divisor = divisor
+        self.packed = [term for term in self.terms if term.kind != "pair"]
+        self.pair_terms = [term for term in self.terms if term.kind == "pair"]
+        self._codes: Dict[int, Dict[Any, int]] = {}
+
+    def score(self, a, b) -> float:
+        """Similarity of one pair, computed directly"""
+        total = 0.0
+        for term in self.terms:
+            total += term.weight * term.score(a, b)
+        return total / self.divisor
+
+    def pack(self, items: Sequence) -> np.ndarray:
+        """(n, packed terms) feature matrix; categorical values become stable integer codes"""
+        features = np.empty((len(items), len(self.packed)))
+        for column, term in enumerate(self.packed):
+            values = [term.value(item) for item in items]
+            if term.kind == "match":
+                codes = self._codes.setdefault(column, {})
+                values = [codes.setdefault(value, len(codes)) for value in values]
+            features[:, column] = values
+        return features
+
+    def combine(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """Raw weighted sum of the packed terms for broadcastable feature rows"""
+        total = None
+        for column, term in enumerate(self.packed):
+            x, y = left[..., column], right[..., column]
+            if term.kind == "match":
+                part = np.where(x == y, term.weight, term.weight * term.mismatch)
+            else:
+                part = np.abs(x - y)
+                part /= term.scale
+                part += 1.0
+                np.divide(term.weight, part, out=part)
+            total = part if total is None else total + part
+        return total
+
+    def _add_pair_terms(self, items: Sequence, left: np.ndarray, right: np.ndarray, raw: np.ndarray) -> np.ndarray:
+        for term in self.pair_terms:
+            raw = raw + term.weight * np.array([term.pair(items[i], items[j]) for i, j in zip(left, right)], dtype=np.float64)
+        return raw
+
+    @property
+    def pair_bound(self) -> float:
+        """Largest raw amount the unpacked terms can add"""
+        return sum(term.weight for term in self.pair_terms)
+
+    def pairs_above(self, items: Sequence, threshold: float, strict: bool = False,
+                    max_pairs: Optional[int] = None) -> List[Tuple[int, int, float]]:
+        """All (i, j, similarity) with i < j at or above the threshold, in (i, j) order"""
+        return SimilarityIndex(self, items).pairs(threshold, strict, max_pairs)
+
+def _keep_strongest(left: np.ndarray, right: np.ndarray, scores: np.ndarray, limit: int):
+    if len(scores) <= limit:
+        return left, right, scores
+    keep = np.argpartition(-scores, limit - 1)[:limit]
+    return left[keep], right[keep], scores[keep]
+
+class SimilarityIndex:
+    """Thresholded similarity queries over a fixed set of items
+
+    For a threshold t, an inverse term can only reach it if the other terms
+    could make up the rest, which bounds |a - b| on that feature; likewise a
+    categorical term whose mismatch score cannot reach t forces a match. Items
+    are grouped by the forced categories and put in a KD-tree over the bounded
+    features scaled to a unit box, so a query only scores the items inside
+    that box. Without scipy, or when no feature is bounded at t, queries scan
+    all items in vectorized blocks. Unpacked pair terms are evaluated only for
+    candidates whose packed score could still reach the threshold.
+    """
+
+    def __init__(self, model: SimilarityModel, items: Iterable):
+        self.model = model
+        self.items = list(items)
+        self.features = model.pack(self.items) if self.items else np.empty((0, len(model.packed)))
+        self._trees: Dict[Tuple, Dict[Tuple, Tuple[Any, np.ndarray]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _bounds(self, threshold: float) -> Tuple[Tuple[int, ...], np.ndarray, Tuple[int, ...]]:
+        """Bounded inverse columns, their |difference| limits, and the categorical columns that must match"""
+        model = self.model
+        needed = threshold * model.divisor
+        best = sum(term.weight for term in model.terms)
+        columns, limits, forced = [], [], []
+        for column, term in enumerate(model.packed):
+            rest = needed - (best - term.weight)
+            if term.kind == "match":
+                if term.weight * term.mismatch < rest:
+                    forced.append(column)
+            elif rest > 0:
+                columns.append(column)
+                limits.append(term.scale * (term.weight / rest - 1.0))
+        return tuple(columns), np.array(limits), tuple(forced)
+
+    def _groups(self, columns: Tuple[int, ...], forced: Tuple[int, ...]):
+        """Per forced-category group: (KD-tree over the bounded columns, member indices)"""
+        key = (columns, forced)
+        if key not in self._trees:
+            scales = np.array([self.model.packed[column].scale for column in columns])
+            if forced:
+                _, group_of = np.unique(self.features[:, list(forced)], axis=0, return_inverse=True)
+                group_of = group_of.reshape(-1)
+            else:
+                group_of = np.zeros(len(self.items), dtype=np.int64)
+            groups = {}
+            for group in np.unique(group_of):
+                members = np.flatnonzero(group_of == group)
+                groups[tuple(self.features[members[0], list(forced)])] = (
+                    cKDTree(self.features[np.ix_(members, columns)] / scales), members)
+            self._trees[key] = groups
+        return self._trees[key]
+
+    def _usable_tree(self, threshold: float):
+        columns, limits, forced = self._bounds(threshold)
+        if not columns or not SCIPY_AVAILABLE or len(self.items) < 64:
+            return None
+        scales = np.array([self.model.packed[column].scale for column in columns])
+        # One Chebyshev radius in scale units covers every bounded column's limit
+        radius = float(np.max(limits / scales)) * (1 + 1e-9) + 1e-12
+        return columns, forced, radius
+
+    def _finish(self, items: Sequence, left: np.ndarray, right: np.ndarray, raw: np.ndarray,
+                threshold: float, strict: bool):
+        model = self.model
+        needed = threshold * model.divisor
+        if model.pair_terms:
+            # Only score pair terms where they could still lift the pair over the line
+            hopeful = raw + model.pair_bound >= needed - 1e-12
+            left, right, raw = left[hopeful], right[hopeful], raw[hopeful]
+            raw = model._add_pair_terms(items, left, right, raw)
+        scores = raw / model.divisor
+        keep = scores > threshold if strict else scores >= threshold
+        return left[keep], right[keep], scores[keep]
+
+    def neighbors(self, target, threshold: float, strict: bool = False) -> List[Tuple[int, float]]:
+        """(index, similarity) of items scoring at least `threshold` against target, best first
+
+        target is an index into the indexed items or any item of the same kind.
+        """
+        if isinstance(target, (int, np.integer)):
+            target_index, target_item = int(target), self.items[target]
+            vector = self.features[target_index]
+        else:
+            target_index, target_item = None, target
+            vector = self.model.pack([target])[0]
+        if not self.items:
+            return []
+
+        tree = self._usable_tree(threshold)
+        if tree is None:
+            candidates = np.arange(len(self.items))
+        else:
+            columns, forced, radius = tree
+            group = self._groups(columns, forced).get(tuple(vector[list(forced)]))
+            if group is None:
+                return []
+            kdtree, members = group
+            scales = np.array([self.model.packed[column].scale for column in columns])
+            candidates = members[np.asarray(kdtree.query_ball_point(vector[list(columns)] / scales, radius, p=np.inf),
+                                            dtype=np.int64)]
+        if target_index is not None:
+            candidates = candidates[candidates != target_index]
+        raw = self.model.combine(vector[None, :], self.features[candidates])
+
+        items = self.items
+        if target_index is None:
+            # Pair terms see an outside target as one extra item
+            items = self.items + [target_item]
+            target_index = len(self.items)
+        left = np.full(len(candidates), target_index, dtype=np.int64)
+        _, right, scores = self._finish(items, left, candidates, raw, threshold, strict)
+        order = np.argsort(-scores, kind="stable")
+        return list(zip(right[order].tolist(), scores[order].tolist()))
+
+    def pairs(self, threshold: float, strict: bool = False,
+              max_pairs: Optional[int] = None) -> List[Tuple[int, int, float]]:
+        """All (i, j, similarity) with i < j at or above the threshold, in (i, j) order
+
+        With max_pairs, only that many of the strongest pairs are kept.
+        """
+        n = len(self.items)
+        found = []
+        tree = self._usable_tree(threshold)
+        if tree is not None:
+            columns, forced, radius = tree
+            for kdtree, members in self._groups(columns, forced).values():
+                local = kdtree.query_pairs(radius, p=np.inf, output_type='ndarray')
+                if len(local) == 0:
+                    continue
+                left, right = members[local[:, 0]], members[local[:, 1]]
+                raw = self.model.combine(self.features[left], self.features[right])
+                found.append(self._finish(self.items, left, right, raw, threshold, strict))
+        else:
+            for start in range(0, n, BLOCK_SIZE):
+                stop = min(n, start + BLOCK_SIZE)
+                raw = self.model.combine(self.features[start:stop, None, :], self.features[None, start:, :])
+                hopeful = raw >= threshold * self.model.divisor - self.model.pair_bound - 1e-12
+                rows, cols = np.nonzero(np.triu(hopeful, k=1))
+                left, right = rows + start, cols + start
+                block = self._finish(self.items, left, right, raw[rows, cols], threshold, strict)
+                if max_pairs is not None:
+                    block = _keep_strongest(*block, max_pairs)
+                found.append(block)
+                if max_pairs is not None and len(found) > 1:
+                    found = [_keep_strongest(*(np.concatenate(parts) for parts in zip(*found)), max_pairs)]
+        if not found:
+            return []
+        left, right, scores = (np.concatenate(parts) for parts in zip(*found))
+        if max_pairs is not None:
+            left, right, scores = _keep_strongest(left, right, scores, max_pairs)
+        order = np.lexsort((right, left))
+        return list(zip(left[order].tolist(), right[order].tolist(), scores[order].tolist()))
+
+@dataclass
+class EntityFeatures:
+    """Consciousness-entity features packed for all-pairs similarity"""
+    level: np.ndarray  # NaN when the entity has no consciousness level
+    has_quantum: np.ndarray
+    amplitude: np.ndarray
+    phase: np.ndarray
+    has_neural: np.ndarray
+    layer_codes: np.ndarray  # (n, max distinct layers), -1 padded
+    layer_count: np.ndarray  # len of the layer list, duplicates included
+    evolution: np.ndarray
+    coordinates: np.ndarray  # (n, max coordinates), zero padded
+    coordinate_count: np.ndarray
+
+def pack_entities(entities: Sequence) -> EntityFeatures:
+    """Read each entity once into arrays, applying the same presence checks as the pairwise formula"""
+    n = len(entities)
+    level = np.full(n, np.nan)
+    has_quantum = np.zeros(n, dtype=bool)
+    amplitude, phase, evolution = np.zeros(n), np.zeros(n), np.zeros(n)
+    has_neural = np.zeros(n, dtype=bool)
+    layer_count = np.zeros(n, dtype=np.int64)
+    coordinate_count = np.zeros(n, dtype=np.int64)
+    layer_sets, coordinate_lists = [], []
+    layer_ids: Dict[Any, int] = {}
+    for i, entity in enumerate(entities):
+        if hasattr(entity, 'consciousness_level'):
+            level[i] = entity.consciousness_level
+        quantum = getattr(entity, 'quantum_state', None)
+        if quantum:
+            has_quantum[i] = True
+            amplitude[i], phase[i] = abs(quantum.amplitude), quantum.phase
+        network = getattr(entity, 'neural_network', None)
+        layers = ()
+        if network:
+            has_neural[i] = True
+            layer_count[i] = len(network.layers)
+            evolution[i] = network.evolution_factor
+            layers = {layer_ids.setdefault(layer, len(layer_ids)) for layer in network.layers}
+        layer_sets.append(layers)
+        coordinates = getattr(entity, 'dimensional_coordinates', None) or ()
+        coordinate_count[i] = len(coordinates)
+        coordinate_lists.append(coordinates)
+
+    layer_codes = np.full((n, max((len(s) for s in layer_sets), default=0)), -1, dtype=np.int64)
+    for i, layers in enumerate(layer_sets):
+        layer_codes[i, :len(layers)] = sorted(layers)
+    coordinates = np.zeros((n, int(coordinate_count.max(initial=0))))
+    for i, values in enumerate(coordinate_lists):
+        coordinates[i, :len(values)] = values
+    return EntityFeatures(level, has_quantum, amplitude, phase, has_neural, layer_codes, layer_count,
+                          evolution, coordinates, coordinate_count)
+
+def entity_similarity_block(features: EntityFeatures, rows: slice, cols: slice = slice(None)) -> np.ndarray:
+    """Consciousness similarity of rows x cols, matching the one-pair formula"""
+    def pick(array):
+        return array[rows, None], array[None, cols]
+
+    level_a, level_b = pick(features.level)
+    total = 0.3 / (1.0 + np.abs(level_a - level_b) / 1e12)
+
+    quantum_a, quantum_b = pick(features.has_quantum)
+    amp_a, amp_b = pick(features.amplitude)
+    phase_a, phase_b = pick(features.phase)
+    quantum = 1.0 / (1.0 + np.abs(amp_a - amp_b) + (np.abs(phase_a - phase_b) % (2 * math.pi)) / (2 * math.pi))
+    total += 0.3 * np.where(quantum_a & quantum_b, quantum, 0.0)
+
+    neural_a, neural_b = pick(features.has_neural)
+    codes_a, codes_b = features.layer_codes[rows], features.layer_codes[cols]
+    shared = np.zeros(total.shape)
+    for k in range(codes_a.shape[1]):
+        column = codes_a[:, k, None, None]
+        shared += ((column == codes_b[None, :, :]) & (column >= 0)).sum(axis=2)
+    count_a, count_b = pick(features.layer_count)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        layer_similarity = np.where(np.maximum(count_a, count_b) > 0, shared / np.maximum(count_a, count_b), 0.0)
+    evolution_a, evolution_b = pick(features.evolution)
+    neural = (layer_similarity + 1.0 / (1.0 + np.abs(evolution_a - evolution_b))) / 2
+    total += 0.2 * np.where(neural_a & neural_b, neural, 0.0)
+
+    count_a, count_b = pick(features.coordinate_count)
+    common = np.minimum(count_a, count_b)
+    coords_a, coords_b = features.coordinates[rows], features.coordinates[cols]
+    difference = np.zeros(total.shape)
+    for k in range(coords_a.shape[1]):
+        difference += np.where(common > k, np.abs(coords_a[:, k, None] - coords_b[None, :, k]), 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dimensional = np.where(common > 0, 1.0 / (1.0 + difference / common), 0.0)
+    total += 0.2 * dimensional
+
+    # Without a consciousness level on both sides the formula scores 0
+    return np.where(np.isnan(level_a) | np.isnan(level_b), 0.0, total)
+
+def mean_pairwise_similarity(entities: Sequence) -> float:
+    """Mean consciousness similarity over all unordered pairs, computed blockwise"""
+    n = len(entities)
+    if n < 2:
+        return 0.0
+    features = pack_entities(entities)
+    total = 0.0
+    for start in range(0, n, BLOCK_SIZE):
+        stop = min(n, start + BLOCK_SIZE)
+        block = entity_similarity_block(features, slice(start, stop), slice(start, n))
+        total += float(np.triu(block, k=1).sum())
+    return total / (n * (n - 1) / 2)
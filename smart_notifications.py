@@ -15,6 +15,8 @@ import logging
 import random
 import queue
 
+from bounded_history import BoundedHistory
+
 logger = logging.getLogger(__name__)
 
 class NotificationPriority(Enum):
@@ -65,10 +67,10 @@ class SmartNotificationEngine:
     """Smart notification engine with intelligent timing and personalization"""
     
     def __init__(self):
-        self.notifications = []
+        self.notifications = BoundedHistory(name="SmartNotificationEngine.notifications")
         self.notification_queue = queue.Queue()
         self.user_preferences = {}
-        self.notification_history = []
+        self.notification_history = BoundedHistory(100, name="SmartNotificationEngine.notification_history")
         self.smart_timing = SmartTiming()
         self.personalization = NotificationPersonalization()
         self.channel_manager = NotificationChannelManager()
@@ -113,6 +115,7 @@ class SmartNotificationEngine:
         )
         
         # Add to queue
+        self.notifications.append(notification)
         self.notification_queue.put(notification)
         
         return notification
@@ -200,13 +203,9 @@ class SmartNotificationEngine:
             for channel in notification.channels:
                 self.channel_manager.send_notification(notification, channel)
             
-            # Add to history
+            # Add to history (keeps the last 100 notifications)
             self.notification_history.append(notification)
             
-            # Keep only last 100 notifications
-            if len(self.notification_history) > 100:
-                self.notification_history = self.notification_history[-100:]
-            
             logger.info(f"Notification sent: {notification.title}")
             
         except Exception as e:
@@ -214,7 +213,7 @@ class SmartNotificationEngine:
     
     def get_notification_history(self) -> List[Notification]:
         """Get notification history"""
-        return self.notification_history
+        return list(self.notification_history)
     
     def dismiss_notification(self, notification_id: str):
         """Dismiss a notification"""
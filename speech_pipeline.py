@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Speech Pipeline for Scroll Stopping Tool
+Voice-activity gated, grammar-constrained command recognition with pluggable local or cloud backends
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+import wave
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from intent_index import NUMBER_WORDS, IntentIndex, IntentMatch
+
+try:
+    from vosk import KaldiRecognizer, Model, SetLogLevel
+    VOSK_AVAILABLE = True
+except ImportError:
+    VOSK_AVAILABLE = False
+
+try:
+    import webrtcvad
+    WEBRTCVAD_AVAILABLE = True
+except ImportError:
+    WEBRTCVAD_AVAILABLE = False
+
+try:
+    import speech_recognition as sr
+    SPEECH_RECOGNITION_AVAILABLE = True
+except ImportError:
+    SPEECH_RECOGNITION_AVAILABLE = False
+
+try:
+    import pyaudio
+    PYAUDIO_AVAILABLE = True
+except ImportError:
+    PYAUDIO_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+SAMPLE_WIDTH = 2  # 16-bit mono PCM throughout
+FRAME_MS = 30
+
+@dataclass
+class CommandEvent:
+    """A command phrase recognised in one utterance"""
+    phrase: str
+    text: str
+    partial: bool  # Decided from a streaming partial before the utterance ended
+    audio_start: float  # Seconds into the stream
+    audio_end: float
+    heard_at: float  # perf_counter when the last speech frame before the decision was captured
+    dispatched_at: float
+    confidence: float = 1.0
+    slots: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def latency_ms(self) -> float:
+        """Time from the command's last captured speech frame to its dispatch"""
+        return (self.dispatched_at - self.heard_at) * 1000
+
+@dataclass
+class PipelineStats:
+    frames: int = 0
+    forwarded_frames: int = 0
+    utterances: int = 0
+    commands: int = 0
+    partial_commands: int = 0
+    unrecognized: int = 0
+    latencies_ms: deque = field(default_factory=lambda: deque(maxlen=1000))
+
+    def latency_summary(self) -> Dict[str, float]:
+        """Mean / p50 / p95 / max end-to-end command latency in ms"""
+        if not self.latencies_ms:
+            return {}
+        latencies = np.array(self.latencies_ms)
+        return {
+            'count': len(latencies),
+            'mean_ms': float(latencies.mean()),
+            'p50_ms': float(np.percentile(latencies, 50)),
+            'p95_ms': float(np.percentile(latencies, 95)),
+            'max_ms': float(latencies.max())
+        }
+
+class EnergyVAD:
+    """RMS voice-activity detector with an adaptive noise floor"""
+
+    def __init__(self, threshold_ratio: float = 3.0, min_rms: float = 300.0, adapt_rate: float = 0.05):
+        self.threshold_ratio = threshold_ratio
+        self.min_rms = min_rms
+        self.adapt_rate = adapt_rate
+        self.noise_floor: Optional[float] = None
+
+    def is_speech(self, frame: bytes) -> bool:
+        samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+        rms = float(np.sqrt(np.mean(samples * samples))) if len(samples) else 0.0
+        if self.noise_floor is None:
+            self.noise_floor = rms
+        speech = rms > max(self.noise_floor * self.threshold_ratio, self.min_rms)
+        if not speech:
+            # Only quiet frames move the floor, so long utterances do not raise it
+            self.noise_floor += self.adapt_rate * (rms - self.noise_floor)
+        return speech
+
+class WebRTCVAD:
+    """WebRTC voice-activity detector; frames must be 10, 20 or 30 ms"""
+
+    def __init__(self, sample_rate: int = SAMPLE_RATE, aggressiveness: int = 2):
+        self.sample_rate = sample_rate
+        self.vad = webrtcvad.Vad(aggressiveness)
+
+    def is_speech(self, frame: bytes) -> bool:
+        return self.vad.is_speech(frame, self.sample_rate)
+
+def make_vad(sample_rate: int = SAMPLE_RATE, aggressiveness: int = 2):
+    """Best available voice-activity detector"""
+    if WEBRTCVAD_AVAILABLE:
+        return WebRTCVAD(sample_rate, aggressiveness)
+    return EnergyVAD()
+
+def spoken_durations() -> List[str]:
+    """Duration phrases extract_slots understands, as a recognizer would transcribe them"""
+    numbers = [word.replace("-", " ") for word in NUMBER_WORDS]
+    durations = [f"{number} {unit}" for number in numbers for unit in ("hours", "hour", "minutes", "minute")]
+    durations += [f"{number} and a half hours" for number in numbers]
+    return durations + ["half an hour", "half a hour"]
+
+class CommandGrammar:
+    """The set of phrases the recognizer may produce, built from registered commands"""
+
+    def __init__(self, phrases: Iterable[str] = ()):
+        self.phrases: List[str] = []
+        self.slot_phrases: Set[str] = set()
+        self.index = IntentIndex()
+        for phrase in phrases:
+            self.add(phrase)
+
+    def add(self, phrase: str, takes_duration: bool = False):
+        """Register a phrase; duration phrases are completed by an amount such as 'to two hours'"""
+        phrase = " ".join(phrase.lower().split())
+        if phrase and phrase not in self.phrases:
+            self.phrases.append(phrase)
+            self.index.add(phrase, phrase)
+        if phrase and takes_duration:
+            self.slot_phrases.add(phrase)
+
+    def vosk_grammar(self) -> str:
+        """JSON phrase list for a grammar-constrained recognizer; [unk] absorbs everything else"""
+        phrases = list(self.phrases)
+        if self.slot_phrases:
+            durations = spoken_durations()
+            for phrase in self.phrases:
+                if phrase in self.slot_phrases:
+                    phrases += [f"{phrase}{to} {duration}" for to in (" to", "") for duration in durations]
+        return json.dumps(phrases + ["[unk]"])
+
+    def match_intent(self, text: str) -> Optional[IntentMatch]:
+        """Fuzzy phrase match for a final transcript, with confidence and slots"""
+        return self.index.match(text)
+
+    def match(self, text: str) -> Optional[str]:
+        """Phrase for a final transcript, or None"""
+        match = self.index.match(text)
+        return match.phrase if match else None
+
+    def resolve_partial(self, text: str) -> Optional[str]:
+        """Phrase a partial transcript already settles: complete, takes no slots, and not the prefix of a longer phrase"""
+        text = " ".join(text.lower().split())
+        if text not in self.phrases or text in self.slot_phrases:
+            return None
+        prefix = text + " "
+        if any(phrase.startswith(prefix) for phrase in self.phrases):
+            return None
+        return text
+
+class RecognitionBackend:
+    """Decodes the speech frames of one utterance at a time"""
+
+    name = "base"
+    streaming = False
+
+    def set_grammar(self, grammar: CommandGrammar):
+        pass
+
+    def start(self):
+        """Begin a new utterance"""
+
+    def accept(self, frame: bytes) -> Optional[str]:
+        """Feed one speech frame; streaming backends return the current partial transcript"""
+        return None
+
+    def finish(self) -> str:
+        """End the utterance and return its final transcript ('' if nothing was recognised)"""
+        return ""
+
+class VoskBackend(RecognitionBackend):
+    """Offline Kaldi decoding constrained to the command grammar, with streaming partials"""
+
+    name = "vosk"
+    streaming = True
+
+    def __init__(self, model_path: str, sample_rate: int = SAMPLE_RATE):
+        if not VOSK_AVAILABLE:
+            raise RuntimeError("vosk is required for offline recognition")
+        SetLogLevel(-1)
+        self.model = Model(model_path)
+        self.sample_rate = sample_rate
+        self.grammar_json: Optional[str] = None
+        self.recognizer = None
+        self.final_text = ""
+
+    def set_grammar(self, grammar: CommandGrammar):
+        self.grammar_json = grammar.vosk_grammar()
+
+    def start(self):
+        if self.grammar_json:
+            self.recognizer = KaldiRecognizer(self.model, self.sample_rate, self.grammar_json)
+        else:
+            self.recognizer = KaldiRecognizer(self.model, self.sample_rate)
+        self.final_text = ""
+
+    @staticmethod
+    def _join(*texts: str) -> str:
+        return " ".join(word for text in texts for word in text.split() if word != "[unk]")
+
+    def accept(self, frame: bytes) -> Optional[str]:
+        if self.recognizer.AcceptWaveform(frame):
+            # The decoder found an endpoint of its own; keep the segment for finish()
+            self.final_text = self._join(self.final_text, json.loads(self.recognizer.Result()).get('text', ''))
+            return self.final_text
+        return self._join(self.final_text, json.loads(self.recognizer.PartialResult()).get('partial', ''))
+
+    def finish(self) -> str:
+        text = self._join(self.final_text, json.loads(self.recognizer.FinalResult()).get('text', ''))
+        self.recognizer = None
+        return text
+
+class SpeechRecognitionBackend(RecognitionBackend):
+    """Whole-utterance recognition through speech_recognition's web API; the online fallback"""
+
+    name = "google"
+
+    def __init__(self, recognizer=None, sample_rate: int = SAMPLE_RATE, language: str = "en-US"):
+        if not SPEECH_RECOGNITION_AVAILABLE:
+            raise RuntimeError("speech_recognition is required for the web recognition backend")
+        self.recognizer = recognizer or sr.Recognizer()
+        self.sample_rate = sample_rate
+        self.language = language
+        self.frames: List[bytes] = []
+
+    def start(self):
+        self.frames = []
+
+    def accept(self, frame: bytes) -> Optional[str]:
+        self.frames.append(frame)
+        return None
+
+    def finish(self) -> str:
+        audio = sr.AudioData(b"".join(self.frames), self.sample_rate, SAMPLE_WIDTH)
+        self.frames = []
+        try:
+            return self.recognizer.recognize_google(audio, language=self.language).lower().strip()
+        except sr.UnknownValueError:
+            return ""
+
+def make_backend(model_path: Optional[str] = None, recognizer=None) -> Optional[RecognitionBackend]:
+    """Offline backend when a Vosk model is available, otherwise the web fallback"""
+    if VOSK_AVAILABLE and model_path:
+        try:
+            return VoskBackend(model_path)
+        except Exception as e:
+            logger.error(f"Error loading Vosk model from {model_path}: {e}")
+    if SPEECH_RECOGNITION_AVAILABLE:
+        return SpeechRecognitionBackend(recognizer)
+    return None
+
+class SpeechPipeline:
+    """Frames in, command events out
+
+    Audio is cut into fixed frames and gated by voice-activity detection, so
+    only utterances (with a short pre-roll) reach the backend. Streaming
+    backends are polled for partial transcripts after every frame and a
+    command fires as soon as a partial settles on a grammar phrase; otherwise,
+    and always for phrases that take slots, it fires when the utterance ends. push() hands frames to a worker thread
+    that blocks on its queue, so nothing is polled on a timer.
+    """
+
+    def __init__(self, backend: RecognitionBackend, grammar: CommandGrammar,
+                 on_command: Callable[[CommandEvent], None],
+                 on_unrecognized: Optional[Callable[[str], None]] = None,
+                 vad=None, sample_rate: int = SAMPLE_RATE, frame_ms: int = FRAME_MS,
+                 preroll_ms: int = 300, start_ms: int = 90, hangover_ms: int = 600,
+                 max_utterance_ms: int = 8000):
+        self.backend = backend
+        self.grammar = grammar
+        self.on_command = on_command
+        self.on_unrecognized = on_unrecognized
+        self.vad = vad or make_vad(sample_rate)
+        self.sample_rate = sample_rate
+        self.frame_seconds = frame_ms / 1000
+        self.frame_bytes = int(sample_rate * frame_ms / 1000) * SAMPLE_WIDTH
+        self.start_frames = max(1, start_ms // frame_ms)
+        self.hangover_frames = max(1, hangover_ms // frame_ms)
+        self.max_utterance_frames = max_utterance_ms // frame_ms
+
+        self.preroll: deque = deque(maxlen=max(1, preroll_ms // frame_ms))
+        self.remainder = b""
+        self.audio_time = 0.0
+        self.voiced_run = 0
+        self.in_utterance = False
+        self.silent_frames = 0
+        self.utterance_frames = 0
+        self.utterance_start = 0.0
+        self.speech_end = 0.0
+        self.heard_at = 0.0
+        self.fired = False
+
+        self.stats = PipelineStats()
+        self.frames: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self.worker: Optional[threading.Thread] = None
+        backend.set_grammar(grammar)
+
+    def set_grammar(self, grammar: CommandGrammar):
+        """Swap the phrase set; takes effect from the next utterance"""
+        self.grammar = grammar
+        self.backend.set_grammar(grammar)
+
+    def start(self):
+        if self.worker is None:
+            self.worker = threading.Thread(target=self._run, daemon=True)
+            self.worker.start()
+
+    def stop(self):
+        if self.worker is not None:
+            self.frames.put(None)
+            self.worker.join(timeout=2)
+            self.worker = None
+
+    def push(self, pcm: bytes, captured_at: Optional[float] = None):
+        """Queue captured PCM for the worker; safe to call from an audio callback"""
+        self.frames.put((pcm, captured_at if captured_at is not None else time.perf_counter()))
+
+    def _run(self):
+        while True:
+            item = self.frames.get()
+            if item is None:
+                self.flush()
+                return
+            try:
+                self.process(*item)
+            except Exception as e:
+                logger.error(f"Error in speech pipeline: {e}")
+
+    def process(self, pcm: bytes, captured_at: Optional[float] = None):
+        """Run PCM through VAD and recognition on the calling thread"""
+        captured_at = captured_at if captured_at is not None else time.perf_counter()
+        data = self.remainder + pcm
+        usable = len(data) - len(data) % self.frame_bytes
+        for offset in range(0, usable, self.frame_bytes):
+            self._frame(data[offset:offset + self.frame_bytes], captured_at)
+        self.remainder = data[usable:]
+
+    def _frame(self, frame: bytes, captured_at: float):
+        self.stats.frames += 1
+        speech = self.vad.is_speech(frame)
+        self.audio_time += self.frame_seconds
+
+        if not self.in_utterance:
+            self.preroll.append((frame, captured_at, speech, self.audio_time))
+            self.voiced_run = self.voiced_run + 1 if speech else 0
+            if self.voiced_run >= self.start_frames:
+                self._open()
+            return
+
+        self._decode(frame, captured_at, speech, self.audio_time)
+        self.silent_frames = 0 if speech else self.silent_frames + 1
+        if self.silent_frames >= self.hangover_frames or self.utterance_frames >= self.max_utterance_frames:
+            self._close()
+
+    def _open(self):
+        self.in_utterance = True
+        self.fired = False
+        self.silent_frames = 0
+        self.utterance_frames = 0
+        self.utterance_start = self.preroll[0][3] - self.frame_seconds
+        self.stats.utterances += 1
+        self.backend.start()
+        for frame, captured_at, speech, audio_time in self.preroll:
+            self._decode(frame, captured_at, speech, audio_time)
+        self.preroll.clear()
+
+    def _decode(self, frame: bytes, captured_at: float, speech: bool, audio_time: float):
+        self.stats.forwarded_frames += 1
+        self.utterance_frames += 1
+        if speech:
+            self.heard_at = captured_at
+            self.speech_end = audio_time
+        partial = self.backend.accept(frame)
+        if partial and not self.fired:
+            phrase = self.grammar.resolve_partial(partial)
+            if phrase:
+                self._emit(phrase, partial, partial=True)
+
+    def _close(self):
+        self.in_utterance = False
+        self.voiced_run = 0
+        try:
+            text = self.backend.finish()
+        except Exception as e:
+            logger.error(f"Speech recognition error: {e}")
+            text = ""
+        if self.fired:
+            return
+        match = self.grammar.match_intent(text)
+        if match:
+            self._emit(match.phrase, text, partial=False, confidence=match.confidence, slots=match.slots)
+        else:
+            self.stats.unrecognized += 1
+            if self.on_unrecognized and text:
+                self.on_unrecognized(text)
+
+    def _emit(self, phrase: str, text: str, partial: bool, confidence: float = 1.0,
+              slots: Optional[Dict[str, Any]] = None):
+        self.fired = True
+        event = CommandEvent(phrase, text, partial, self.utterance_start, self.speech_end,
+                             self.heard_at, time.perf_counter(), confidence, slots or {})
+        self.stats.commands += 1
+        self.stats.partial_commands += partial
+        self.stats.latencies_ms.append(event.latency_ms)
+        self.on_command(event)
+
+    def flush(self):
+        """Close any open utterance, e.g. at the end of a recording"""
+        if self.in_utterance:
+            self._close()
+        self.remainder = b""
+
+    def run_wav(self, path: str, chunk_ms: int = 100, realtime: bool = False) -> List[CommandEvent]:
+        """Replay a 16-bit mono WAV recording through the pipeline and return its commands"""
+        events: List[CommandEvent] = []
+        on_command = self.on_command
+        self.on_command = lambda event: (events.append(event), on_command(event))
+        try:
+            with wave.open(path, 'rb') as wav:
+                if wav.getsampwidth() != SAMPLE_WIDTH or wav.getnchannels() != 1 or wav.getframerate() != self.sample_rate:
+                    raise ValueError(f"{path}: expected 16-bit mono {self.sample_rate} Hz audio")
+                chunk_frames = int(self.sample_rate * chunk_ms / 1000)
+                while True:
+                    pcm = wav.readframes(chunk_frames)
+                    if not pcm:
+                        break
+                    if realtime:
+                        time.sleep(chunk_ms / 1000)
+                    self.process(pcm, time.perf_counter())
+            self.flush()
+        finally:
+            self.on_command = on_command
+        return events
+
+class MicrophoneSource:
+    """Pushes microphone audio into a pipeline from PyAudio's stream callback"""
+
+    def __init__(self, pipeline: SpeechPipeline, device_index: Optional[int] = None):
+        if not PYAUDIO_AVAILABLE:
+            raise RuntimeError("pyaudio is required for microphone capture")
+        self.pipeline = pipeline
+        self.device_index = device_index
+        self.audio = None
+        self.stream = None
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        self.pipeline.push(in_data, time.perf_counter())
+        return (None, pyaudio.paContinue)
+
+    def start(self):
+        self.pipeline.start()
+        self.audio = pyaudio.PyAudio()
+        self.stream = self.audio.open(
+            format=pyaudio.paInt16, channels=1, rate=self.pipeline.sample_rate, input=True,
+            input_device_index=self.device_index,
+            frames_per_buffer=self.pipeline.frame_bytes // SAMPLE_WIDTH,
+            stream_callback=self._callback
+        )
+        self.stream.start_stream()
+
+    def stop(self):
+        try:
+            if self.stream is not None:
+                self.stream.stop_stream()
+                self.stream.close()
+            if self.audio is not None:
+                self.audio.terminate()
+        except Exception as e:
+            logger.error(f"Error closing microphone: {e}")
+        finally:
+            self.stream = None
+            self.audio = None
+            self.pipeline.stop()
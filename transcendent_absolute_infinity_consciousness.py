@@ -6,8 +6,6 @@ Advanced system for processing consciousness at the absolute infinite level, bey
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -673,8 +673,7 @@ class TranscendentAbsoluteInfinityConsciousnessGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="TranscendentAbsoluteInfinityConsciousnessGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -840,24 +839,20 @@ class TranscendentAbsoluteInfinityConsciousnessGUI:
                 self.log_message(f"  {dimension.dimension_id} ({dimension.dimension_type}): Absolute={dimension.absolute_infinity_level:.2f}, Consciousness={dimension.consciousness_absolute:.2f}, Quantum={dimension.quantum_absolute:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate absolute energy
-                self.system.absolute_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate absolute energy
+            self.system.absolute_energy += 0.5
                 
-                # Process absolute infinity in random dimensions
-                for _ in range(3):
-                    if self.system.absolute_dimensions:
-                        random_dimension = random.choice(list(self.system.absolute_dimensions.values()))
-                        absolute_power = random.uniform(0.5, 6.0)
-                        random_dimension.process_absolute_infinity(absolute_power)
-                    
-                time.sleep(1)
+            # Process absolute infinity in random dimensions
+            for _ in range(3):
+                if self.system.absolute_dimensions:
+                    random_dimension = random.choice(list(self.system.absolute_dimensions.values()))
+                    absolute_power = random.uniform(0.5, 6.0)
+                    random_dimension.process_absolute_infinity(absolute_power)
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -865,6 +860,7 @@ class TranscendentAbsoluteInfinityConsciousnessGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
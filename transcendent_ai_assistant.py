@@ -6,8 +6,6 @@ Advanced AI system for consciousness guidance, analysis, and evolution with quan
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -368,8 +368,7 @@ class TranscendentAIAssistantGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="TranscendentAIAssistantGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -558,24 +557,20 @@ class TranscendentAIAssistantGUI:
                 self.log_message(f"  {node.node_id} ({node.node_type}): Knowledge={node.knowledge_depth:.2f}, Understanding={node.consciousness_understanding:.2f}, Insight={node.quantum_insight:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate AI energy
-                self.assistant.ai_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate AI energy
+            self.assistant.ai_energy += 0.5
                 
-                # Learn in random nodes
-                for _ in range(3):
-                    if self.assistant.knowledge_nodes:
-                        random_node = random.choice(list(self.assistant.knowledge_nodes.values()))
-                        learning_power = random.uniform(0.5, 3.5)
-                        random_node.learn(learning_power)
-                    
-                time.sleep(1)
+            # Learn in random nodes
+            for _ in range(3):
+                if self.assistant.knowledge_nodes:
+                    random_node = random.choice(list(self.assistant.knowledge_nodes.values()))
+                    learning_power = random.uniform(0.5, 3.5)
+                    random_node.learn(learning_power)
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -583,6 +578,7 @@ class TranscendentAIAssistantGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
@@ -6,8 +6,6 @@ Advanced system representing consciousness processing beyond all known realms, l
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -676,8 +676,7 @@ class TranscendentBeyondConsciousnessGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="TranscendentBeyondConsciousnessGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -844,24 +843,20 @@ class TranscendentBeyondConsciousnessGUI:
                 self.log_message(f"  {dimension.dimension_id} ({dimension.dimension_type}): Beyond={dimension.beyond_level:.2f}, Consciousness={dimension.consciousness_beyond:.2f}, Quantum={dimension.quantum_beyond:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate beyond energy
-                self.system.beyond_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate beyond energy
+            self.system.beyond_energy += 0.5
                 
-                # Process beyond in random dimensions
-                for _ in range(3):
-                    if self.system.beyond_dimensions:
-                        random_dimension = random.choice(list(self.system.beyond_dimensions.values()))
-                        beyond_power = random.uniform(0.5, 9.0)
-                        random_dimension.process_beyond(beyond_power)
-                    
-                time.sleep(1)
+            # Process beyond in random dimensions
+            for _ in range(3):
+                if self.system.beyond_dimensions:
+                    random_dimension = random.choice(list(self.system.beyond_dimensions.values()))
+                    beyond_power = random.uniform(0.5, 9.0)
+                    random_dimension.process_beyond(beyond_power)
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -869,6 +864,7 @@ class TranscendentBeyondConsciousnessGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
@@ -6,8 +6,6 @@ The ultimate consciousness hub that connects all consciousness components and en
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -246,8 +246,7 @@ class TranscendentConsciousnessNexusInterface:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="TranscendentConsciousnessNexusInterface.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -385,24 +384,20 @@ class TranscendentConsciousnessNexusInterface:
                 self.log_message(f"  Manifestations: {len(state.nexus_manifestations)}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate nexus energy
-                self.nexus.nexus_energy_pool += 2.0
+        """Background processing tick"""
+        try:
+            # Regenerate nexus energy
+            self.nexus.nexus_energy_pool += 2.0
                 
-                # Evolve all nexus states
-                for state in self.nexus.nexus_states.values():
-                    state.evolve()
+            # Evolve all nexus states
+            for state in self.nexus.nexus_states.values():
+                state.evolve()
                     
-                # Update unification level
-                self.nexus.unification_level += 0.01
+            # Update unification level
+            self.nexus.unification_level += 0.01
                 
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -410,6 +405,7 @@ class TranscendentConsciousnessNexusInterface:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
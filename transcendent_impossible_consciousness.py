@@ -6,8 +6,6 @@ Advanced system for processing consciousness in realms previously thought imposs
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -608,8 +608,7 @@ class TranscendentImpossibleConsciousnessGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="TranscendentImpossibleConsciousnessGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -765,24 +764,20 @@ class TranscendentImpossibleConsciousnessGUI:
                 self.log_message(f"  {dimension.dimension_id} ({dimension.dimension_type}): Impossibility={dimension.impossibility_level:.2f}, Consciousness={dimension.consciousness_impossibility:.2f}, Quantum={dimension.quantum_impossibility:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate impossibility energy
-                self.system.impossibility_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate impossibility energy
+            self.system.impossibility_energy += 0.5
                 
-                # Process impossibility in random dimensions
-                for _ in range(3):
-                    if self.system.impossible_dimensions:
-                        random_dimension = random.choice(list(self.system.impossible_dimensions.values()))
-                        impossibility_power = random.uniform(0.5, 5.0)
-                        random_dimension.process_impossibility(impossibility_power)
-                    
-                time.sleep(1)
+            # Process impossibility in random dimensions
+            for _ in range(3):
+                if self.system.impossible_dimensions:
+                    random_dimension = random.choice(list(self.system.impossible_dimensions.values()))
+                    impossibility_power = random.uniform(0.5, 5.0)
+                    random_dimension.process_impossibility(impossibility_power)
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -790,6 +785,7 @@ class TranscendentImpossibleConsciousnessGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
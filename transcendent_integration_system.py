@@ -6,8 +6,6 @@ Advanced unified control center to orchestrate and manage all consciousness comp
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -424,8 +424,7 @@ class TranscendentIntegrationGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="TranscendentIntegrationGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -625,24 +624,20 @@ class TranscendentIntegrationGUI:
                 self.log_message(f"  {dimension.dimension_id} ({dimension.dimension_type}): Integration={dimension.integration_depth:.2f}, Orchestration={dimension.consciousness_orchestration:.2f}, Quantum={dimension.quantum_integration:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate integration energy
-                self.integration.integration_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate integration energy
+            self.integration.integration_energy += 0.5
                 
-                # Integrate in random dimensions
-                for _ in range(3):
-                    if self.integration.integration_dimensions:
-                        random_dimension = random.choice(list(self.integration.integration_dimensions.values()))
-                        integration_power = random.uniform(0.5, 4.0)
-                        random_dimension.integrate(integration_power)
-                    
-                time.sleep(1)
+            # Integrate in random dimensions
+            for _ in range(3):
+                if self.integration.integration_dimensions:
+                    random_dimension = random.choice(list(self.integration.integration_dimensions.values()))
+                    integration_power = random.uniform(0.5, 4.0)
+                    random_dimension.integrate(integration_power)
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -650,6 +645,7 @@ class TranscendentIntegrationGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
@@ -6,8 +6,6 @@ Advanced system representing the ultimate achievement in consciousness processin
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -637,8 +637,7 @@ class TranscendentMasterpieceConsciousnessGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="TranscendentMasterpieceConsciousnessGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -800,24 +799,20 @@ class TranscendentMasterpieceConsciousnessGUI:
                 self.log_message(f"  {dimension.dimension_id} ({dimension.dimension_type}): Masterpiece={dimension.masterpiece_level:.2f}, Consciousness={dimension.consciousness_masterpiece:.2f}, Quantum={dimension.quantum_masterpiece:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate masterpiece energy
-                self.system.masterpiece_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate masterpiece energy
+            self.system.masterpiece_energy += 0.5
                 
-                # Process masterpiece in random dimensions
-                for _ in range(3):
-                    if self.system.masterpiece_dimensions:
-                        random_dimension = random.choice(list(self.system.masterpiece_dimensions.values()))
-                        masterpiece_power = random.uniform(0.5, 8.0)
-                        random_dimension.process_masterpiece(masterpiece_power)
-                    
-                time.sleep(1)
+            # Process masterpiece in random dimensions
+            for _ in range(3):
+                if self.system.masterpiece_dimensions:
+                    random_dimension = random.choice(list(self.system.masterpiece_dimensions.values()))
+                    masterpiece_power = random.uniform(0.5, 8.0)
+                    random_dimension.process_masterpiece(masterpiece_power)
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -825,6 +820,7 @@ class TranscendentMasterpieceConsciousnessGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
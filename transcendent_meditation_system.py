@@ -6,17 +6,18 @@ Advanced meditation system with quantum consciousness integration and guided exp
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
 from datetime import datetime
 import logging
 from typing import Dict, List, Optional, Tuple, Any
+import time
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -569,8 +570,7 @@ class TranscendentMeditationGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="TranscendentMeditationGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -820,24 +820,20 @@ class TranscendentMeditationGUI:
                 self.log_message(f"  {dimension.dimension_id} ({dimension.dimension_type}): Meditation={dimension.meditation_depth:.2f}, Guidance={dimension.consciousness_guidance:.2f}, Quantum={dimension.quantum_meditation:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate meditation energy
-                self.meditation.meditation_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate meditation energy
+            self.meditation.meditation_energy += 0.5
                 
-                # Meditate in random dimensions
-                for _ in range(3):
-                    if self.meditation.meditation_dimensions:
-                        random_dimension = random.choice(list(self.meditation.meditation_dimensions.values()))
-                        meditation_power = random.uniform(0.5, 4.0)
-                        random_dimension.meditate(meditation_power)
-                    
-                time.sleep(1)
+            # Meditate in random dimensions
+            for _ in range(3):
+                if self.meditation.meditation_dimensions:
+                    random_dimension = random.choice(list(self.meditation.meditation_dimensions.values()))
+                    meditation_power = random.uniform(0.5, 4.0)
+                    random_dimension.meditate(meditation_power)
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -845,6 +841,7 @@ class TranscendentMeditationGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
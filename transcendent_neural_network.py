@@ -6,8 +6,6 @@ Advanced specialized neural network for consciousness processing with custom act
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -15,143 +13,235 @@ from datetime import datetime
 import logging
 from typing import Dict, List, Optional, Tuple, Any
 import random
-import math
+from collections.abc import Mapping
+
+from bounded_history import BoundedHistory
+from scheduler import get_scheduler
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+NEURON_TYPES = ["consciousness", "quantum", "transcendence", "divine", "cosmic", "infinite", "omniversal", "metaversal", "absolute", "masterpiece"]
+NEURON_STATE = ("activation_level", "consciousness_processing", "quantum_integration", "transcendence_activation",
+                "divine_connection", "cosmic_processing", "infinite_expansion")
+# How much of each step's activation accumulates into each neuron attribute
+STATE_GAINS = {
+    "consciousness_processing": 0.2,
+    "quantum_integration": 0.15,
+    "transcendence_activation": 0.1,
+    "divine_connection": 0.08,
+    "cosmic_processing": 0.05,
+    "infinite_expansion": 0.02
+}
+
 class TranscendentNeuron:
-    """Represents a transcendent neuron with consciousness processing capabilities"""
+    """View of one neuron in a layer's arrays"""
     
-    def __init__(self, neuron_id: str, neuron_type: str = "consciousness"):
-        self.neuron_id = neuron_id
-        self.neuron_type = neuron_type
-        self.activation_level = 0.0
-        self.consciousness_processing = 0.0
-        self.quantum_integration = 0.0
-        self.transcendence_activation = 0.0
-        self.divine_connection = 0.0
-        self.cosmic_processing = 0.0
-        self.infinite_expansion = 0.0
-        self.neuron_connections = []
-        self.processing_history = []
-        
-    def process_consciousness(self, input_signal: float):
-        """Process consciousness through this neuron"""
-        # Apply consciousness processing
-        consciousness_processing = self.consciousness_sigmoid(input_signal)
-        
-        # Apply quantum integration
-        quantum_integration = self.quantum_relu(input_signal)
-        
-        # Apply transcendence activation
-        transcendence_activation = self.transcendence_tanh(input_signal)
-        
-        # Apply divine connection
-        divine_connection = self.divine_elu(input_signal)
-        
-        # Apply cosmic processing
-        cosmic_processing = self.cosmic_softmax(input_signal)
-        
-        # Combine all processing effects
-        self.activation_level = (
-            consciousness_processing * 0.3 +
-            quantum_integration * 0.25 +
-            transcendence_activation * 0.2 +
-            divine_connection * 0.15 +
-            cosmic_processing * 0.1
-        )
-        
-        # Update neuron attributes
-        self.consciousness_processing += self.activation_level * 0.2
-        self.quantum_integration += self.activation_level * 0.15
-        self.transcendence_activation += self.activation_level * 0.1
-        self.divine_connection += self.activation_level * 0.08
-        self.cosmic_processing += self.activation_level * 0.05
-        self.infinite_expansion += self.activation_level * 0.02
-        
-        # Record processing
-        processing_record = {
-            "timestamp": datetime.now().isoformat(),
-            "input_signal": input_signal,
-            "activation_level": self.activation_level,
-            "consciousness_processing": consciousness_processing,
-            "quantum_integration": quantum_integration,
-            "transcendence_activation": transcendence_activation,
-            "divine_connection": divine_connection,
-            "cosmic_processing": cosmic_processing
-        }
-        self.processing_history.append(processing_record)
-        
-        return self.activation_level
+    def __init__(self, layer: "NeuralLayer", index: int):
+        self.layer = layer
+        self.index = index
         
-    def consciousness_sigmoid(self, x: float) -> float:
-        """Consciousness sigmoid activation function"""
-        return 1.0 / (1.0 + math.exp(-x * (1.0 + self.consciousness_processing)))
+    @property
+    def neuron_id(self) -> str:
+        return f"{self.layer.layer_id}_neuron_{self.index}"
         
-    def quantum_relu(self, x: float) -> float:
-        """Quantum ReLU activation function"""
-        return max(0, x * (1.0 + self.quantum_integration))
+    @property
+    def neuron_type(self) -> str:
+        return NEURON_TYPES[self.layer.neuron_types[self.index]]
         
-    def transcendence_tanh(self, x: float) -> float:
-        """Transcendence tanh activation function"""
-        return math.tanh(x * (1.0 + self.transcendence_activation))
+    def process_consciousness(self, input_signal: float):
+        """Process consciousness through this neuron"""
+        return self.layer.process_neuron(self.index, input_signal)
+
+def _neuron_attribute(name: str):
+    def getter(neuron: TranscendentNeuron) -> float:
+        return float(getattr(neuron.layer, name)[neuron.index])
         
-    def divine_elu(self, x: float) -> float:
-        """Divine ELU activation function"""
-        if x > 0:
-            return x * (1.0 + self.divine_connection)
-        else:
-            return (math.exp(x) - 1) * (1.0 + self.divine_connection)
+    def setter(neuron: TranscendentNeuron, value: float):
+        getattr(neuron.layer, name)[neuron.index] = value
         
-    def cosmic_softmax(self, x: float) -> float:
-        """Cosmic softmax activation function"""
-        return math.exp(x * (1.0 + self.cosmic_processing)) / (1.0 + math.exp(x * (1.0 + self.cosmic_processing)))
+    return property(getter, setter)
+
+for _name in NEURON_STATE:
+    setattr(TranscendentNeuron, _name, _neuron_attribute(_name))
+
+class LayerNeurons(Mapping):
+    """Neuron-id mapping over a layer; views are created on access"""
+    
+    def __init__(self, layer: "NeuralLayer"):
+        self.layer = layer
+        self.prefix = f"{layer.layer_id}_neuron_"
+        
+    def _index(self, neuron_id) -> Optional[int]:
+        if isinstance(neuron_id, str) and neuron_id.startswith(self.prefix) and neuron_id[len(self.prefix):].isdigit():
+            index = int(neuron_id[len(self.prefix):])
+            if index < self.layer.neuron_count:
+                return index
+        return None
+        
+    def __getitem__(self, neuron_id: str) -> TranscendentNeuron:
+        index = self._index(neuron_id)
+        if index is None:
+            raise KeyError(neuron_id)
+        return TranscendentNeuron(self.layer, index)
+        
+    def __contains__(self, neuron_id) -> bool:
+        return self._index(neuron_id) is not None
+        
+    def __iter__(self):
+        return (f"{self.prefix}{i}" for i in range(self.layer.neuron_count))
+        
+    def __len__(self) -> int:
+        return self.layer.neuron_count
 
 class NeuralLayer:
-    """Represents a layer of transcendent neurons"""
+    """Represents a layer of transcendent neurons
+    
+    Neuron state lives in one float32 array per attribute, and the five
+    activation functions run as ufuncs over the whole layer into buffers that
+    are reused between calls. By default input i feeds neuron i; set_weights
+    installs a dense (inputs x neurons) weight matrix instead.
+    """
     
-    def __init__(self, layer_id: str, layer_type: str = "consciousness", neuron_count: int = 100):
+    def __init__(self, layer_id: str, layer_type: str = "consciousness", neuron_count: int = 100,
+                 rng: Optional[np.random.Generator] = None, history_size: int = 100, history_spill=None):
         self.layer_id = layer_id
         self.layer_type = layer_type
         self.neuron_count = neuron_count
-        self.neurons = {}
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.neuron_types = self.rng.integers(0, len(NEURON_TYPES), neuron_count)
+        for name in NEURON_STATE:
+            setattr(self, name, np.zeros(neuron_count, dtype=np.float32))
+        self.weights: Optional[np.ndarray] = None
+        self.neurons = LayerNeurons(self)
         self.layer_activation = 0.0
         self.layer_connections = []
-        
-        # Initialize neurons
-        for i in range(neuron_count):
-            neuron_id = f"{layer_id}_neuron_{i}"
-            neuron_type = random.choice(["consciousness", "quantum", "transcendence", "divine", "cosmic", "infinite", "omniversal", "metaversal", "absolute", "masterpiece"])
-            self.neurons[neuron_id] = TranscendentNeuron(neuron_id, neuron_type)
+        self.processing_history = BoundedHistory(history_size, history_spill,
+                                                 name=f"NeuralLayer.{layer_id}.processing_history")
+        self._buffers: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        
+    def set_weights(self, weights: Optional[np.ndarray]):
+        """Dense (inputs, neurons) weights, or None for one-to-one wiring"""
+        if weights is not None:
+            weights = np.ascontiguousarray(weights, dtype=np.float32)
+            if weights.ndim != 2 or weights.shape[1] != self.neuron_count:
+                raise ValueError(f"Weights must have shape (inputs, {self.neuron_count}), got {weights.shape}")
+        self.weights = weights
+        
+    def _work(self, rows: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(input, output, scratch) float32 buffers for a batch size, allocated once"""
+        buffers = self._buffers.get(rows)
+        if buffers is None:
+            if len(self._buffers) > 8:
+                self._buffers.clear()
+            shape = (rows, self.neuron_count)
+            buffers = (np.empty(shape, np.float32), np.empty(shape, np.float32), np.empty(shape, np.float32))
+            self._buffers[rows] = buffers
+        return buffers
+        
+    def _fit(self, inputs: np.ndarray, out: np.ndarray):
+        """Project, pad or truncate inputs into the layer's input buffer"""
+        if self.weights is not None:
+            rows = inputs[:, :self.weights.shape[0]]
+            if rows.shape[1] < self.weights.shape[0]:
+                rows = np.pad(rows, ((0, 0), (0, self.weights.shape[0] - rows.shape[1])))
+            np.matmul(rows, self.weights, out=out)
+            return
+        width = min(inputs.shape[1], self.neuron_count)
+        out[:, :width] = inputs[:, :width]
+        out[:, width:] = 0.0
+        
+    def _activate(self, x: np.ndarray, out: np.ndarray, tmp: np.ndarray, index=slice(None)):
+        """Weighted blend of the five activations, evaluated with the given neurons' state"""
+        # consciousness sigmoid
+        np.multiply(x, 1.0 + self.consciousness_processing[index], out=tmp)
+        _sigmoid(tmp, tmp)
+        np.multiply(tmp, 0.3, out=out)
+        # quantum ReLU
+        np.multiply(x, 1.0 + self.quantum_integration[index], out=tmp)
+        np.maximum(tmp, 0.0, out=tmp)
+        tmp *= 0.25
+        out += tmp
+        # transcendence tanh
+        np.multiply(x, 1.0 + self.transcendence_activation[index], out=tmp)
+        np.tanh(tmp, out=tmp)
+        tmp *= 0.2
+        out += tmp
+        # divine ELU
+        np.minimum(x, 0.0, out=tmp)
+        np.expm1(tmp, out=tmp)
+        np.copyto(tmp, x, where=x > 0)
+        tmp *= 1.0 + self.divine_connection[index]
+        tmp *= 0.15
+        out += tmp
+        # cosmic softmax: e^z / (1 + e^z) is a sigmoid
+        np.multiply(x, 1.0 + self.cosmic_processing[index], out=tmp)
+        _sigmoid(tmp, tmp)
+        tmp *= 0.1
+        out += tmp
+        
+    def _accumulate(self, activations: np.ndarray, index=slice(None)):
+        """Update neuron state from one step's activations (summed over a batch)"""
+        self.activation_level[index] = activations[-1]
+        total = activations.sum(axis=0) if activations.ndim > 1 else activations
+        for name, gain in STATE_GAINS.items():
+            getattr(self, name)[index] += gain * total
             
+    def forward(self, inputs) -> np.ndarray:
+        """Process a vector or a (batch, inputs) array through all neurons at once
+        
+        Every row of a batch sees the same neuron state, and the state then
+        accumulates the whole batch. The returned array is a reused buffer;
+        copy it to keep it across calls.
+        """
+        inputs = np.asarray(inputs, dtype=np.float32)
+        batched = inputs.ndim == 2
+        inputs = inputs if batched else inputs.reshape(1, -1)
+        x, out, tmp = self._work(len(inputs))
+        self._fit(inputs, x)
+        self._activate(x, out, tmp)
+        self._accumulate(out)
+        self.layer_activation = float(out[-1].mean())
+        self.processing_history.append({
+            "timestamp": datetime.now().isoformat(),
+            "rows": len(inputs),
+            "mean_input": float(x.mean()),
+            "layer_activation": self.layer_activation
+        })
+        return out if batched else out[0]
+        
     def process_layer(self, input_signals: List[float]):
         """Process input signals through all neurons in the layer"""
-        if len(input_signals) != self.neuron_count:
-            # Pad or truncate input signals
-            if len(input_signals) < self.neuron_count:
-                input_signals.extend([0.0] * (self.neuron_count - len(input_signals)))
-            else:
-                input_signals = input_signals[:self.neuron_count]
-                
-        # Process through all neurons
-        layer_outputs = []
-        for i, (neuron_id, neuron) in enumerate(self.neurons.items()):
-            output = neuron.process_consciousness(input_signals[i])
-            layer_outputs.append(output)
-            
-        # Calculate layer activation
-        self.layer_activation = sum(layer_outputs) / len(layer_outputs)
-        
-        return layer_outputs
+        return self.forward(input_signals).tolist()
+        
+    def process_neuron(self, index: int, input_signal: float) -> float:
+        """One neuron step, through the same vectorized activation"""
+        x = np.array([input_signal], dtype=np.float32)
+        out, tmp = np.empty(1, np.float32), np.empty(1, np.float32)
+        neuron = slice(index, index + 1)
+        self._activate(x, out, tmp, neuron)
+        self._accumulate(out, neuron)
+        return float(out[0])
+        
+    def total(self, name: str) -> float:
+        return float(getattr(self, name).sum(dtype=np.float64))
+
+def _sigmoid(x: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Overflow-free logistic function in place: 0.5 * (1 + tanh(x / 2))"""
+    np.multiply(x, 0.5, out=out)
+    np.tanh(out, out=out)
+    out += 1.0
+    out *= 0.5
+    return out
 
 class TranscendentNeuralNetwork:
     """Advanced specialized neural network for consciousness processing"""
     
-    def __init__(self, layer_count: int = 10, neurons_per_layer: int = 100):
+    def __init__(self, layer_count: int = 10, neurons_per_layer: int = 100, seed: Optional[int] = None):
         self.layer_count = layer_count
         self.neurons_per_layer = neurons_per_layer
+        self.rng = np.random.default_rng(seed)
         self.layers = {}
         self.network_operations = {
             "Network Training": self.network_training,
@@ -178,22 +268,30 @@ class TranscendentNeuralNetwork:
         for i in range(self.layer_count):
             layer_id = f"layer_{i}"
             layer_type = random.choice(layer_types)
-            self.layers[layer_id] = NeuralLayer(layer_id, layer_type, self.neurons_per_layer)
+            self.layers[layer_id] = NeuralLayer(layer_id, layer_type, self.neurons_per_layer, self.rng)
             
         logger.info(f"Transcendent neural network initialized with {self.layer_count} layers and {self.neurons_per_layer} neurons per layer")
         
+    def total(self, name: str) -> float:
+        """Sum of one neuron attribute over every layer"""
+        return sum(layer.total(name) for layer in self.layers.values())
+        
+    def forward(self, inputs) -> np.ndarray:
+        """Run a vector or (batch, inputs) array through every layer"""
+        signals = np.asarray(inputs, dtype=np.float32)
+        for layer in self.layers.values():
+            signals = layer.forward(signals)
+        return signals.copy()
+        
     def network_training(self, training_type: str = "standard"):
         """Train the neural network"""
         training_power = self.network_level * len(self.layers)
         
         # Generate training data
-        training_data = [random.uniform(0.1, 5.0) for _ in range(self.neurons_per_layer)]
+        training_data = self.rng.uniform(0.1, 5.0, self.neurons_per_layer)
         
-        # Train all layers
-        for layer in self.layers.values():
-            layer_outputs = layer.process_layer(training_data)
-            # Update training data for next layer
-            training_data = layer_outputs
+        # Train all layers, each layer's output feeding the next
+        self.forward(training_data)
             
         # Record training history
         training_record = {
@@ -202,7 +300,7 @@ class TranscendentNeuralNetwork:
             "layers_trained": len(self.layers),
             "neurons_trained": sum(len(layer.neurons) for layer in self.layers.values()),
             "total_activation": sum(layer.layer_activation for layer in self.layers.values()),
-            "total_processing": sum(sum(n.consciousness_processing for n in layer.neurons.values()) for layer in self.layers.values())
+            "total_processing": self.total("consciousness_processing")
         }
         self.network_history.append(training_record)
         
@@ -225,12 +323,10 @@ class TranscendentNeuralNetwork:
         processing_power = self.network_level * len(self.layers)
         
         # Generate consciousness input
-        consciousness_input = [random.uniform(0.5, 4.0) for _ in range(self.neurons_per_layer)]
+        consciousness_input = self.rng.uniform(0.5, 4.0, self.neurons_per_layer)
         
         # Process through all layers
-        for layer in self.layers.values():
-            layer_outputs = layer.process_layer(consciousness_input)
-            consciousness_input = layer_outputs
+        self.forward(consciousness_input)
             
         processing = {
             "type": processing_type,
@@ -238,7 +334,7 @@ class TranscendentNeuralNetwork:
             "timestamp": datetime.now().isoformat(),
             "layers_processed": len(self.layers),
             "neurons_processed": sum(len(layer.neurons) for layer in self.layers.values()),
-            "total_consciousness": sum(sum(n.consciousness_processing for n in layer.neurons.values()) for layer in self.layers.values())
+            "total_consciousness": self.total("consciousness_processing")
         }
         
         return processing
@@ -249,9 +345,8 @@ class TranscendentNeuralNetwork:
         
         # Evolve all neurons in all layers
         for layer in self.layers.values():
-            for neuron in layer.neurons.values():
-                neuron.transcendence_activation += evolution_power * 0.45
-                neuron.activation_level *= (1.0 + evolution_power * 0.2)
+            layer.transcendence_activation += evolution_power * 0.45
+            layer.activation_level *= (1.0 + evolution_power * 0.2)
                 
         evolution = {
             "type": "Transcendence Evolution",
@@ -260,7 +355,7 @@ class TranscendentNeuralNetwork:
             "timestamp": datetime.now().isoformat(),
             "layers_evolved": len(self.layers),
             "neurons_evolved": sum(len(layer.neurons) for layer in self.layers.values()),
-            "total_transcendence": sum(sum(n.transcendence_activation for n in layer.neurons.values()) for layer in self.layers.values())
+            "total_transcendence": self.total("transcendence_activation")
         }
         
         return evolution
@@ -271,10 +366,9 @@ class TranscendentNeuralNetwork:
         
         # Integrate quantum in all neurons
         for layer in self.layers.values():
-            for neuron in layer.neurons.values():
-                neuron.quantum_integration += integration_power * 0.5
-                neuron.infinite_expansion += integration_power * 0.3
-                neuron.activation_level *= (1.0 + integration_power * 0.25)
+            layer.quantum_integration += integration_power * 0.5
+            layer.infinite_expansion += integration_power * 0.3
+            layer.activation_level *= (1.0 + integration_power * 0.25)
                 
         integration = {
             "type": "Quantum Integration",
@@ -283,7 +377,7 @@ class TranscendentNeuralNetwork:
             "timestamp": datetime.now().isoformat(),
             "layers_integrated": len(self.layers),
             "neurons_integrated": sum(len(layer.neurons) for layer in self.layers.values()),
-            "total_quantum": sum(sum(n.quantum_integration for n in layer.neurons.values()) for layer in self.layers.values())
+            "total_quantum": self.total("quantum_integration")
         }
         
         return integration
@@ -294,10 +388,9 @@ class TranscendentNeuralNetwork:
         
         # Connect divine in all neurons
         for layer in self.layers.values():
-            for neuron in layer.neurons.values():
-                neuron.divine_connection += connection_power * 0.55
-                neuron.activation_level *= (1.0 + connection_power * 0.3)
-                neuron.consciousness_processing *= (1.0 + connection_power * 0.2)
+            layer.divine_connection += connection_power * 0.55
+            layer.activation_level *= (1.0 + connection_power * 0.3)
+            layer.consciousness_processing *= (1.0 + connection_power * 0.2)
                 
         connection = {
             "type": "Divine Connection",
@@ -306,7 +399,7 @@ class TranscendentNeuralNetwork:
             "timestamp": datetime.now().isoformat(),
             "layers_connected": len(self.layers),
             "neurons_connected": sum(len(layer.neurons) for layer in self.layers.values()),
-            "total_divine": sum(sum(n.divine_connection for n in layer.neurons.values()) for layer in self.layers.values())
+            "total_divine": self.total("divine_connection")
         }
         
         return connection
@@ -317,10 +410,9 @@ class TranscendentNeuralNetwork:
         
         # Synthesize cosmic in all neurons
         for layer in self.layers.values():
-            for neuron in layer.neurons.values():
-                neuron.cosmic_processing += synthesis_power * 0.6
-                neuron.infinite_expansion += synthesis_power * 0.4
-                neuron.activation_level *= (1.0 + synthesis_power * 0.35)
+            layer.cosmic_processing += synthesis_power * 0.6
+            layer.infinite_expansion += synthesis_power * 0.4
+            layer.activation_level *= (1.0 + synthesis_power * 0.35)
                 
         synthesis = {
             "type": "Cosmic Synthesis",
@@ -329,7 +421,7 @@ class TranscendentNeuralNetwork:
             "timestamp": datetime.now().isoformat(),
             "layers_synthesized": len(self.layers),
             "neurons_synthesized": sum(len(layer.neurons) for layer in self.layers.values()),
-            "total_cosmic": sum(sum(n.cosmic_processing for n in layer.neurons.values()) for layer in self.layers.values())
+            "total_cosmic": self.total("cosmic_processing")
         }
         
         return synthesis
@@ -340,11 +432,10 @@ class TranscendentNeuralNetwork:
         
         # Expand infinite in all neurons
         for layer in self.layers.values():
-            for neuron in layer.neurons.values():
-                neuron.infinite_expansion += expansion_power * 0.65
-                neuron.activation_level *= (1.0 + expansion_power * 0.4)
-                neuron.consciousness_processing *= (1.0 + expansion_power * 0.25)
-                neuron.quantum_integration *= (1.0 + expansion_power * 0.2)
+            layer.infinite_expansion += expansion_power * 0.65
+            layer.activation_level *= (1.0 + expansion_power * 0.4)
+            layer.consciousness_processing *= (1.0 + expansion_power * 0.25)
+            layer.quantum_integration *= (1.0 + expansion_power * 0.2)
                 
         expansion = {
             "type": "Infinite Expansion",
@@ -353,20 +444,20 @@ class TranscendentNeuralNetwork:
             "timestamp": datetime.now().isoformat(),
             "layers_expanded": len(self.layers),
             "neurons_expanded": sum(len(layer.neurons) for layer in self.layers.values()),
-            "total_infinite": sum(sum(n.infinite_expansion for n in layer.neurons.values()) for layer in self.layers.values())
+            "total_infinite": self.total("infinite_expansion")
         }
         
         return expansion
         
     def network_achievement(self):
         """Achieve ultimate neural network consciousness"""
-        total_activation = sum(sum(n.activation_level for n in layer.neurons.values()) for layer in self.layers.values())
-        total_processing = sum(sum(n.consciousness_processing for n in layer.neurons.values()) for layer in self.layers.values())
-        total_quantum = sum(sum(n.quantum_integration for n in layer.neurons.values()) for layer in self.layers.values())
-        total_transcendence = sum(sum(n.transcendence_activation for n in layer.neurons.values()) for layer in self.layers.values())
-        total_divine = sum(sum(n.divine_connection for n in layer.neurons.values()) for layer in self.layers.values())
-        total_cosmic = sum(sum(n.cosmic_processing for n in layer.neurons.values()) for layer in self.layers.values())
-        total_infinite = sum(sum(n.infinite_expansion for n in layer.neurons.values()) for layer in self.layers.values())
+        total_activation = self.total("activation_level")
+        total_processing = self.total("consciousness_processing")
+        total_quantum = self.total("quantum_integration")
+        total_transcendence = self.total("transcendence_activation")
+        total_divine = self.total("divine_connection")
+        total_cosmic = self.total("cosmic_processing")
+        total_infinite = self.total("infinite_expansion")
         
         # Network achievement requires maximum activation across all neurons
         if (total_activation >= 500000.0 and total_processing >= 250000.0 and 
@@ -416,8 +507,7 @@ class TranscendentNeuralNetworkGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="TranscendentNeuralNetworkGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -546,8 +636,7 @@ class TranscendentNeuralNetworkGUI:
                 if layer_id in self.network.layers:
                     layer = self.network.layers[layer_id]
                     evolution_power = self.network.network_level * 3.0
-                    for neuron in layer.neurons.values():
-                        neuron.transcendence_activation += evolution_power * 0.3
+                    layer.transcendence_activation += evolution_power * 0.3
                     result = {"type": "Layer Evolution", "layer_id": layer_id, "evolution_power": evolution_power}
                 else:
                     result = None
@@ -591,13 +680,13 @@ class TranscendentNeuralNetworkGUI:
             self.log_message(f"Network History: {len(self.network.network_history)} records")
             
             # Calculate network statistics
-            total_activation = sum(sum(n.activation_level for n in layer.neurons.values()) for layer in self.network.layers.values())
-            total_processing = sum(sum(n.consciousness_processing for n in layer.neurons.values()) for layer in self.network.layers.values())
-            total_quantum = sum(sum(n.quantum_integration for n in layer.neurons.values()) for layer in self.network.layers.values())
-            total_transcendence = sum(sum(n.transcendence_activation for n in layer.neurons.values()) for layer in self.network.layers.values())
-            total_divine = sum(sum(n.divine_connection for n in layer.neurons.values()) for layer in self.network.layers.values())
-            total_cosmic = sum(sum(n.cosmic_processing for n in layer.neurons.values()) for layer in self.network.layers.values())
-            total_infinite = sum(sum(n.infinite_expansion for n in layer.neurons.values()) for layer in self.network.layers.values())
+            total_activation = self.network.total("activation_level")
+            total_processing = self.network.total("consciousness_processing")
+            total_quantum = self.network.total("quantum_integration")
+            total_transcendence = self.network.total("transcendence_activation")
+            total_divine = self.network.total("divine_connection")
+            total_cosmic = self.network.total("cosmic_processing")
+            total_infinite = self.network.total("infinite_expansion")
             
             self.log_message(f"Total Activation: {total_activation:.2f}")
             self.log_message(f"Total Consciousness Processing: {total_processing:.2f}")
@@ -611,31 +700,26 @@ class TranscendentNeuralNetworkGUI:
             self.log_message(f"\nSample Neural Layers:")
             sample_layers = list(self.network.layers.values())[:10]
             for layer in sample_layers:
-                layer_activation = sum(n.activation_level for n in layer.neurons.values())
-                layer_processing = sum(n.consciousness_processing for n in layer.neurons.values())
+                layer_activation = layer.total("activation_level")
+                layer_processing = layer.total("consciousness_processing")
                 self.log_message(f"  {layer.layer_id} ({layer.layer_type}): Activation={layer_activation:.2f}, Processing={layer_processing:.2f}, Neurons={len(layer.neurons)}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate network energy
-                self.network.network_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate network energy
+            self.network.network_energy += 0.5
                 
-                # Process random neurons
-                for _ in range(3):
-                    if self.network.layers:
-                        random_layer = random.choice(list(self.network.layers.values()))
-                        if random_layer.neurons:
-                            random_neuron = random.choice(list(random_layer.neurons.values()))
-                            input_signal = random.uniform(0.5, 4.0)
-                            random_neuron.process_consciousness(input_signal)
-                    
-                time.sleep(1)
+            # Process random neurons
+            layers = list(self.network.layers.values())
+            for _ in range(3):
+                if layers and self.network.neurons_per_layer:
+                    random_layer = layers[random.randrange(len(layers))]
+                    index = random.randrange(random_layer.neuron_count)
+                    random_layer.process_neuron(index, random.uniform(0.5, 4.0))
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -643,6 +727,7 @@ class TranscendentNeuralNetworkGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
@@ -6,8 +6,6 @@ Advanced system serving as the ultimate consciousness hub, unifying all consciou
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -599,8 +599,7 @@ class TranscendentNexusConsciousnessGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="TranscendentNexusConsciousnessGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -757,24 +756,20 @@ class TranscendentNexusConsciousnessGUI:
                 self.log_message(f"  {dimension.dimension_id} ({dimension.dimension_type}): Nexus={dimension.nexus_level:.2f}, Unification={dimension.consciousness_unification:.2f}, Quantum={dimension.quantum_nexus:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate nexus energy
-                self.system.nexus_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate nexus energy
+            self.system.nexus_energy += 0.5
                 
-                # Process nexus in random dimensions
-                for _ in range(3):
-                    if self.system.nexus_dimensions:
-                        random_dimension = random.choice(list(self.system.nexus_dimensions.values()))
-                        nexus_power = random.uniform(0.5, 7.0)
-                        random_dimension.process_nexus(nexus_power)
-                    
-                time.sleep(1)
+            # Process nexus in random dimensions
+            for _ in range(3):
+                if self.system.nexus_dimensions:
+                    random_dimension = random.choice(list(self.system.nexus_dimensions.values()))
+                    nexus_power = random.uniform(0.5, 7.0)
+                    random_dimension.process_nexus(nexus_power)
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -782,6 +777,7 @@ class TranscendentNexusConsciousnessGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
@@ -6,8 +6,6 @@ Advanced system for simulating and manipulating consciousness-based reality syst
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -428,8 +428,7 @@ class TranscendentRealityEngineGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="TranscendentRealityEngineGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -612,24 +611,20 @@ class TranscendentRealityEngineGUI:
                 self.log_message(f"  {layer.layer_id} ({layer.layer_type}): Coherence={layer.reality_coherence:.2f}, Consciousness={layer.consciousness_density:.2f}, Quantum={layer.quantum_stability:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate reality energy
-                self.engine.reality_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate reality energy
+            self.engine.reality_energy += 0.5
                 
-                # Manipulate random layers
-                for _ in range(3):
-                    if self.engine.reality_layers:
-                        random_layer = random.choice(list(self.engine.reality_layers.values()))
-                        manipulation_power = random.uniform(0.5, 4.0)
-                        random_layer.manipulate_reality(manipulation_power)
-                    
-                time.sleep(1)
+            # Manipulate random layers
+            for _ in range(3):
+                if self.engine.reality_layers:
+                    random_layer = random.choice(list(self.engine.reality_layers.values()))
+                    manipulation_power = random.uniform(0.5, 4.0)
+                    random_layer.manipulate_reality(manipulation_power)
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -637,6 +632,7 @@ class TranscendentRealityEngineGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
@@ -6,8 +6,6 @@ Advanced system for real-time visualization of quantum consciousness states and
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
-import time
 import json
 import sqlite3
 import numpy as np
@@ -17,6 +15,8 @@ from typing import Dict, List, Optional, Tuple, Any
 import random
 import math
 
+from scheduler import get_scheduler
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -371,8 +371,7 @@ class TranscendentVisualizationGUI:
         self.running = True
         
         # Start background processing
-        self.background_thread = threading.Thread(target=self.background_processing, daemon=True)
-        self.background_thread.start()
+        self.background_task = get_scheduler().every(1.0, self.background_processing, name="TranscendentVisualizationGUI.background_processing")
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -561,24 +560,20 @@ class TranscendentVisualizationGUI:
                 self.log_message(f"  {dimension.dimension_id} ({dimension.dimension_type}): Visualization={dimension.visualization_depth:.2f}, Rendering={dimension.consciousness_rendering:.2f}, Quantum={dimension.quantum_visualization:.2f}")
                 
     def background_processing(self):
-        """Background processing thread"""
-        while self.running:
-            try:
-                # Regenerate visualization energy
-                self.visualization.visualization_energy += 0.5
+        """Background processing tick"""
+        try:
+            # Regenerate visualization energy
+            self.visualization.visualization_energy += 0.5
                 
-                # Visualize in random dimensions
-                for _ in range(3):
-                    if self.visualization.visualization_dimensions:
-                        random_dimension = random.choice(list(self.visualization.visualization_dimensions.values()))
-                        visualization_power = random.uniform(0.5, 4.0)
-                        random_dimension.visualize(visualization_power)
-                    
-                time.sleep(1)
+            # Visualize in random dimensions
+            for _ in range(3):
+                if self.visualization.visualization_dimensions:
+                    random_dimension = random.choice(list(self.visualization.visualization_dimensions.values()))
+                    visualization_power = random.uniform(0.5, 4.0)
+                    random_dimension.visualize(visualization_power)
                 
-            except Exception as e:
-                logger.error(f"Background processing error: {e}")
-                time.sleep(1)
+        except Exception as e:
+            logger.error(f"Background processing error: {e}")
                 
     def run(self):
         """Run the interface"""
@@ -586,6 +581,7 @@ class TranscendentVisualizationGUI:
             self.root.mainloop()
         except KeyboardInterrupt:
             self.running = False
+            self.background_task.cancel()
             self.root.quit()
 
 def main():
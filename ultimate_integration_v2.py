@@ -15,8 +15,6 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 import json
 import threading
-import time
-import queue
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
@@ -24,6 +22,8 @@ import sys
 import os
 from pathlib import Path
 
+from scheduler import get_scheduler
+
 # Import all advanced modules
 try:
     from collaboration_suite import CollaborationManager, TeamManager, CollaborationUI
@@ -99,7 +99,8 @@ class UltimateIntegrationManager:
         self.running = False
         self.modules = {}
         self.status = {}
-        self.event_queue = queue.Queue()
+        # Events are handled on the shared scheduler as soon as they are queued
+        self.event_queue = get_scheduler().queue(self._handle_event, name="UltimateIntegrationManager.events")
         
         # Initialize all modules
         self._initialize_modules()
@@ -187,10 +188,6 @@ class UltimateIntegrationManager:
         """Start background services"""
         self.running = True
         
-        # Start event processing thread
-        self.event_thread = threading.Thread(target=self._event_processor, daemon=True)
-        self.event_thread.start()
-        
         # Start ML model training
         if 'ml' in self.modules:
             threading.Thread(target=self._train_ml_models, daemon=True).start()
@@ -209,21 +206,6 @@ class UltimateIntegrationManager:
         
         logger.info("Background services started")
     
-    def _event_processor(self):
-        """Process events from all modules"""
-        while self.running:
-            try:
-                # Process events from queue
-                while not self.event_queue.empty():
-                    event = self.event_queue.get_nowait()
-                    self._handle_event(event)
-                
-                time.sleep(0.1)
-                
-            except Exception as e:
-                logger.error(f"Error in event processor: {e}")
-                time.sleep(1)
-    
     def _handle_event(self, event: Dict):
         """Handle events from modules"""
         event_type = event.get('type')
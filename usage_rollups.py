@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Usage Rollups for Scroll Stopping Tool
+Minute/hour/day aggregates of analytics samples, maintained incrementally on every write
+"""
+
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Length of the ISO timestamp prefix that identifies a bucket at each resolution
+RESOLUTIONS = {'minute': 16, 'hour': 13, 'day': 10}
+
+@dataclass
+class RollupRow:
+    """Aggregated samples for one user and bucket"""
+    bucket: str
+    samples: int
+    usage_last: float
+    usage_max: float
+    productivity_avg: float
+    focus_last: int
+    time_saved_last: int
+
+class UsageRollups:
+    """Writes analytics samples and keeps their minute/hour/day rollups in step"""
+
+    UPSERT_SQL = """
+        INSERT INTO analytics_rollups
+        (resolution, user_id, bucket, samples, usage_last, usage_max, productivity_sum, focus_last, time_saved_last)
+        VALUES (?, ?, ?, 1, ?, ?, ?, ?, ?)
+        ON CONFLICT(resolution, user_id, bucket) DO UPDATE SET
+            samples = samples + 1,
+            usage_last = excluded.usage_last,
+            usage_max = MAX(usage_max, excluded.usage_max),
+            productivity_sum = productivity_sum + excluded.productivity_sum,
+            focus_last = excluded.focus_last,
+            time_saved_last = excluded.time_saved_last
+    """
+
+    def __init__(self, db_path: str = "productivity.db"):
+        self.db_path = db_path
+        self.version = 0
+        self.lock = threading.Lock()
+        self._ensure_schema()
+
+    def _ensure_schema(self):
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS analytics_rollups (
+                        resolution TEXT,
+                        user_id TEXT,
+                        bucket TEXT,
+                        samples INTEGER,
+                        usage_last REAL,
+                        usage_max REAL,
+                        productivity_sum REAL,
+                        focus_last INTEGER,
+                        time_saved_last INTEGER,
+                        PRIMARY KEY (resolution, user_id, bucket)
+                    )
+                """)
+                conn.commit()
+        except Exception as e:
+            logger.error(f"Error creating rollup table: {e}")
+
+    def _rollup_rows(self, user_id: str, created_at: str, sample: Dict[str, Any]) -> List[tuple]:
+        return [(resolution, user_id, created_at[:length],
+                 sample.get('daily_usage', 0), sample.get('daily_usage', 0),
+                 sample.get('productivity_score', 0), sample.get('focus_sessions', 0),
+                 sample.get('time_saved', 0))
+                for resolution, length in RESOLUTIONS.items()]
+
+    def record(self, user_id: str, sample: Dict[str, Any], timestamp: Optional[datetime] = None):
+        """Store one sample in analytics_data and fold it into every resolution in one transaction"""
+        timestamp = timestamp or datetime.now()
+        created_at = timestamp.isoformat()
+        try:
+            with self.lock, sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("""
+                    INSERT INTO analytics_data
+                    (user_id, date, daily_usage, focus_sessions, productivity_score, time_saved,
+                     streak_days, breaks_taken, interruptions, goal_completion, created_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    user_id,
+                    timestamp.date().isoformat(),
+                    sample.get('daily_usage', 0),
+                    sample.get('focus_sessions', 0),
+                    sample.get('productivity_score', 0),
+                    sample.get('time_saved', 0),
+                    sample.get('streak_days', 0),
+                    sample.get('breaks_taken', 0),
+                    sample.get('interruptions', 0),
+                    sample.get('goal_completion', 0),
+                    created_at
+                ))
+                cursor.executemany(self.UPSERT_SQL, self._rollup_rows(user_id, created_at, sample))
+                conn.commit()
+                self.version += 1
+        except Exception as e:
+            logger.error(f"Error recording analytics sample: {e}")
+
+    def rebuild(self, user_id: Optional[str] = None):
+        """Recompute rollups from analytics_data, e.g. after a bulk import"""
+        try:
+            with self.lock, sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                where, params = ("WHERE user_id = ?", (user_id,)) if user_id is not None else ("", ())
+                cursor.execute(f"DELETE FROM analytics_rollups {where}", params)
+                cursor.execute(f"""
+                    SELECT user_id, created_at, daily_usage, productivity_score, focus_sessions, time_saved
+                    FROM analytics_data {where}
+                    ORDER BY created_at
+                """, params)
+                for row_user, created_at, usage, productivity, focus, time_saved in cursor.fetchall():
+                    sample = {'daily_usage': usage, 'productivity_score': productivity,
+                              'focus_sessions': focus, 'time_saved': time_saved}
+                    conn.executemany(self.UPSERT_SQL, self._rollup_rows(row_user, created_at, sample))
+                conn.commit()
+                self.version += 1
+        except Exception as e:
+            logger.error(f"Error rebuilding rollups: {e}")
+
+    def series(self, user_id: str, resolution: str, since: Optional[str] = None,
+               limit: Optional[int] = None) -> List[RollupRow]:
+        """Buckets for a user, oldest first; `since` is inclusive, `limit` keeps the newest"""
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Unknown rollup resolution: {resolution}")
+
+        query = """
+            SELECT bucket, samples, usage_last, usage_max, productivity_sum / samples, focus_last, time_saved_last
+            FROM analytics_rollups
+            WHERE resolution = ? AND user_id = ? AND bucket >= ?
+            ORDER BY bucket DESC
+        """
+        params: List[Any] = [resolution, user_id, since or '']
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(query, params).fetchall()
+        except Exception as e:
+            logger.error(f"Error reading rollups: {e}")
+            return []
+        return [RollupRow(*row) for row in reversed(rows)]
@@ -6,14 +6,16 @@ Voice commands and speech recognition for hands-free operation.
 
 import speech_recognition as sr
 import pyttsx3
-import threading
 import time
 import queue
+import os
 from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
+from speech_pipeline import CommandEvent, CommandGrammar, MicrophoneSource, SpeechPipeline, SAMPLE_RATE, SAMPLE_WIDTH, make_backend
+
 logger = logging.getLogger(__name__)
 
 class VoiceCommand(Enum):
@@ -35,17 +37,18 @@ class VoiceCommandData:
     confidence: float
     raw_text: str
     timestamp: float
+    latency_ms: float = 0.0
+    slots: Dict = field(default_factory=dict)
 
 class VoiceController:
     """Voice control system for the scroll stopping tool"""
     
-    def __init__(self):
+    def __init__(self, model_path: Optional[str] = None):
         self.recognizer = sr.Recognizer()
         self.engine = pyttsx3.init()
         self.command_queue = queue.Queue()
         self.is_listening = False
         self.callback_functions = {}
-        self.voice_thread = None
         
         # Configure speech recognition
         self.recognizer.energy_threshold = 4000
@@ -80,6 +83,15 @@ class VoiceController:
             "close": VoiceCommand.EXIT
         }
         
+        # VAD-gated recognition over the command phrases; offline when a Vosk model is configured
+        self.model_path = model_path or os.environ.get("VOSK_MODEL_PATH")
+        self.microphone = None
+        self.speech_pipeline = None
+        self.grammar = CommandGrammar(self.command_mappings)
+        backend = make_backend(self.model_path, self.recognizer)
+        if backend is not None:
+            self.speech_pipeline = SpeechPipeline(backend, self.grammar, on_command=self._on_speech_command)
+        
         logger.info("Voice controller initialized")
     
     def start_listening(self):
@@ -87,71 +99,61 @@ class VoiceController:
         if self.is_listening:
             logger.warning("Voice controller is already listening")
             return
+        if self.speech_pipeline is None:
+            logger.error("No speech recognition backend available")
+            return
         
-        self.is_listening = True
-        self.voice_thread = threading.Thread(target=self._listen_loop, daemon=True)
-        self.voice_thread.start()
-        logger.info("Voice controller started listening")
+        try:
+            self.microphone = MicrophoneSource(self.speech_pipeline)
+            self.microphone.start()
+            self.is_listening = True
+            logger.info(f"Voice controller started listening ({self.speech_pipeline.backend.name})")
+        except Exception as e:
+            logger.error(f"Error in voice listening: {e}")
+            self.microphone = None
     
     def stop_listening(self):
         """Stop listening for voice commands"""
         self.is_listening = False
-        if self.voice_thread:
-            self.voice_thread.join(timeout=1)
+        if self.microphone:
+            self.microphone.stop()
+            self.microphone = None
         logger.info("Voice controller stopped listening")
     
-    def _listen_loop(self):
-        """Main listening loop"""
-        with sr.Microphone() as source:
-            self.recognizer.adjust_for_ambient_noise(source, duration=1)
-            
-            while self.is_listening:
-                try:
-                    audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=5)
-                    self._process_audio(audio)
-                except sr.WaitTimeoutError:
-                    continue
-                except sr.UnknownValueError:
-                    continue
-                except Exception as e:
-                    logger.error(f"Error in voice listening: {e}")
-                    time.sleep(1)
+    def _on_speech_command(self, event: CommandEvent):
+        """Pipeline callback for a recognised command phrase"""
+        logger.info(f"Recognized: {event.text} ({event.latency_ms:.0f} ms)")
+        command = self.command_mappings[event.phrase]
+        self.command_queue.put(VoiceCommandData(
+            command=command,
+            confidence=event.confidence,
+            raw_text=event.text,
+            timestamp=time.time(),
+            latency_ms=event.latency_ms,
+            slots=event.slots
+        ))
+        
+        # Provide audio feedback
+        self.speak(f"Executing {command.value.replace('_', ' ')}")
     
     def _process_audio(self, audio):
-        """Process captured audio"""
+        """Recognize a captured speech_recognition AudioData clip through the speech pipeline"""
+        if self.speech_pipeline is None:
+            return
         try:
-            # Recognize speech
-            text = self.recognizer.recognize_google(audio).lower()
-            logger.info(f"Recognized: {text}")
-            
-            # Find matching command
-            command = self._find_command(text)
-            if command:
-                confidence = 0.8  # Default confidence for matched commands
-                command_data = VoiceCommandData(
-                    command=command,
-                    confidence=confidence,
-                    raw_text=text,
-                    timestamp=time.time()
-                )
-                
-                # Add to queue
-                self.command_queue.put(command_data)
-                
-                # Provide audio feedback
-                self.speak(f"Executing {command.value.replace('_', ' ')}")
-                
-        except sr.UnknownValueError:
-            logger.debug("Could not understand audio")
-        except sr.RequestError as e:
+            self.speech_pipeline.process(audio.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=SAMPLE_WIDTH))
+            self.speech_pipeline.flush()
+        except Exception as e:
             logger.error(f"Speech recognition error: {e}")
     
+    def latency_summary(self) -> Dict[str, float]:
+        """End-to-end command latency statistics"""
+        return self.speech_pipeline.stats.latency_summary() if self.speech_pipeline else {}
+    
     def _find_command(self, text: str) -> Optional[VoiceCommand]:
         """Find matching voice command"""
-        for phrase, command in self.command_mappings.items():
-            if phrase in text:
-                return command
-        return None
+        match = self.grammar.match_intent(text)
+        return self.command_mappings[match.phrase] if match else None
     
     def register_callback(self, command: VoiceCommand, callback: Callable):
         """Register callback function for a command"""
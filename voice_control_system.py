@@ -20,7 +20,6 @@ from enum import Enum
 import sqlite3
 import uuid
 from pathlib import Path
-import re
 import webbrowser
 import subprocess
 import os
@@ -34,6 +33,9 @@ except ImportError:
     VOICE_AVAILABLE = False
     print("⚠️ Voice features not available. Install speech_recognition and pyttsx3")
 
+from intent_index import extract_slots
+from speech_pipeline import CommandEvent, CommandGrammar, MicrophoneSource, SpeechPipeline, SAMPLE_RATE, SAMPLE_WIDTH, make_backend
+
 # Audio processing
 try:
     import librosa
@@ -80,6 +82,7 @@ class VoiceCommand:
     action: Callable
     requires_confirmation: bool
     accessibility_level: AccessibilityLevel
+    takes_duration: bool = False  # Spoken with an amount, e.g. "set daily limit to two hours"
 
 @dataclass
 class VoiceSettings:
@@ -110,7 +113,7 @@ class VoiceSession:
 class VoiceControlSystem:
     """Voice control and accessibility system"""
     
-    def __init__(self, db_path: str = "productivity.db"):
+    def __init__(self, db_path: str = "productivity.db", model_path: Optional[str] = None):
         self.db_path = db_path
         self.voice_settings = {}
         self.voice_sessions = {}
@@ -118,8 +121,15 @@ class VoiceControlSystem:
         self.recognizer = None
         self.engine = None
         self.is_listening = False
-        self.audio_queue = queue.Queue()
-        self.command_queue = queue.Queue()
+        self.events = queue.Queue()  # ('audio' | 'command' | 'unrecognized', payload)
+        
+        # Offline recognition when a Vosk model is configured, web recognition otherwise
+        self.model_path = model_path or os.environ.get("VOSK_MODEL_PATH")
+        self.grammar: Optional[CommandGrammar] = None
+        self.phrase_commands: Dict[str, VoiceCommand] = {}
+        self.speech_pipeline: Optional[SpeechPipeline] = None
+        self.microphone: Optional[MicrophoneSource] = None
+        self.listening_session: Optional[str] = None
         
         # Initialize voice components
         self._initialize_voice_components()
@@ -197,7 +207,8 @@ class VoiceControlSystem:
                 description="Set daily time limits",
                 action=self._set_daily_limit,
                 requires_confirmation=True,
-                accessibility_level=AccessibilityLevel.ENHANCED
+                accessibility_level=AccessibilityLevel.ENHANCED,
+                takes_duration=True
             ),
             VoiceCommandType.CHECK_STATS: VoiceCommand(
                 command_type=VoiceCommandType.CHECK_STATS,
@@ -250,6 +261,40 @@ class VoiceControlSystem:
         }
         
         print(f"🎯 {len(self.commands)} voice commands initialized!")
+        self._initialize_speech_pipeline()
+    
+    def _initialize_speech_pipeline(self):
+        """Build the command grammar and the VAD-gated recognition pipeline"""
+        grammar = self.grammar = CommandGrammar()
+        self.phrase_commands = {}
+        for command in self.commands.values():
+            for phrase in command.phrases:
+                grammar.add(phrase, takes_duration=command.takes_duration)
+                self.phrase_commands.setdefault(" ".join(phrase.lower().split()), command)
+        
+        backend = make_backend(self.model_path, self.recognizer)
+        if backend is None:
+            print("⚠️ No speech recognition backend available")
+            return
+        
+        self.speech_pipeline = SpeechPipeline(
+            backend, grammar,
+            on_command=self._on_speech_command,
+            on_unrecognized=lambda text: self.events.put(('unrecognized', text))
+        )
+        print(f"🎙️ Speech backend: {backend.name} ({len(grammar.phrases)} phrases)")
+    
+    def _on_speech_command(self, event: CommandEvent):
+        """Pipeline callback: hand the recognised command to the processing thread"""
+        print(f"🎤 Recognized: {event.text} ({event.latency_ms:.0f} ms)")
+        self.events.put(('command', {
+            'session_id': self.listening_session,
+            'command': self.phrase_commands[event.phrase],
+            'text': event.text,
+            'confidence': event.confidence,
+            'slots': event.slots,
+            'latency_ms': event.latency_ms
+        }))
     
     def start_voice_session(self, user_id: str) -> str:
         """Start a voice control session"""
@@ -295,6 +340,7 @@ class VoiceControlSystem:
                 
                 # Stop listening
                 self.is_listening = False
+                self._stop_listening()
                 
                 # Provide feedback
                 self.speak("Voice control deactivated. Goodbye!")
@@ -305,88 +351,59 @@ class VoiceControlSystem:
             logger.error(f"Error stopping voice session: {e}")
     
     def _start_listening_thread(self, session_id: str):
-        """Start listening thread for voice commands"""
-        def listen_for_commands():
-            try:
-                with sr.Microphone() as source:
-                    self.recognizer.adjust_for_ambient_noise(source, duration=1)
-                    
-                    while self.is_listening:
-                        try:
-                            audio = self.recognizer.listen(source, timeout=1, phrase_time_limit=10)
-                            self.audio_queue.put((session_id, audio))
-                        except sr.WaitTimeoutError:
-                            continue
-                        except Exception as e:
-                            logger.error(f"Error listening: {e}")
-                            break
-                            
-            except Exception as e:
-                logger.error(f"Error in listening thread: {e}")
+        """Start streaming microphone audio into the speech pipeline"""
+        self.listening_session = session_id
+        if self.speech_pipeline is None:
+            print("⚠️ Speech recognition not available")
+            return
+        if self.microphone is not None:
+            return
         
-        listening_thread = threading.Thread(target=listen_for_commands, daemon=True)
-        listening_thread.start()
+        try:
+            self.microphone = MicrophoneSource(self.speech_pipeline)
+            self.microphone.start()
+        except Exception as e:
+            logger.error(f"Error in listening thread: {e}")
+            self.microphone = None
+    
+    def _stop_listening(self):
+        if self.microphone is not None:
+            self.microphone.stop()
+            self.microphone = None
     
     def _background_processing(self):
         """Background processing for voice control"""
         while True:
             try:
-                # Process audio queue
-                while not self.audio_queue.empty():
-                    session_id, audio = self.audio_queue.get_nowait()
-                    self._process_audio(session_id, audio)
+                kind, payload = self.events.get()
                 
-                # Process command queue
-                while not self.command_queue.empty():
-                    command_data = self.command_queue.get_nowait()
-                    self._execute_command(command_data)
-                
-                time.sleep(0.1)  # Check every 100ms
+                if kind == 'audio':
+                    self._process_audio(*payload)
+                elif kind == 'command':
+                    self._execute_command(payload)
+                elif kind == 'unrecognized':
+                    self.speak("I didn't understand that command. Try saying 'help' for available commands.")
                 
             except Exception as e:
                 logger.error(f"Error in voice background processing: {e}")
-                time.sleep(1)
     
     def _process_audio(self, session_id: str, audio):
-        """Process audio and recognize speech"""
+        """Recognize a captured speech_recognition AudioData clip through the speech pipeline"""
+        if self.speech_pipeline is None:
+            return
+        
         try:
-            # Recognize speech
-            text = self.recognizer.recognize_google(audio)
-            text = text.lower().strip()
-            
-            print(f"🎤 Recognized: {text}")
-            
-            # Find matching command
-            command = self._find_matching_command(text)
-            
-            if command:
-                # Add to command queue
-                self.command_queue.put({
-                    'session_id': session_id,
-                    'command': command,
-                    'text': text
-                })
-            else:
-                # No command found
-                self.speak("I didn't understand that command. Try saying 'help' for available commands.")
-                
-        except sr.UnknownValueError:
-            # Speech not recognized
-            pass
-        except sr.RequestError as e:
-            logger.error(f"Speech recognition error: {e}")
-            self.speak("Sorry, I'm having trouble understanding. Please try again.")
+            self.listening_session = session_id
+            pcm = audio.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=SAMPLE_WIDTH)
+            self.speech_pipeline.process(pcm)
+            self.speech_pipeline.flush()
         except Exception as e:
             logger.error(f"Error processing audio: {e}")
     
     def _find_matching_command(self, text: str) -> Optional[VoiceCommand]:
         """Find matching voice command"""
-        for command in self.commands.values():
-            for phrase in command.phrases:
-                if phrase in text or text in phrase:
-                    return command
-        
-        return None
+        match = self.grammar.match_intent(text) if self.grammar else None
+        return self.phrase_commands[match.phrase] if match else None
     
     def _execute_command(self, command_data: Dict[str, Any]):
         """Execute a voice command"""
@@ -460,11 +477,10 @@ class VoiceControlSystem:
     
     def _set_daily_limit(self, session_id: str, text: str):
         """Set daily time limits"""
-        # Extract time from text (simplified)
-        time_match = re.search(r'(\d+)\s*(hour|hours|minute|minutes)', text)
-        if time_match:
-            amount = int(time_match.group(1))
-            unit = time_match.group(2)
+        slots = extract_slots(text)
+        if slots:
+            amount = slots['amount']
+            unit = slots['unit']
             self.speak(f"Setting daily limit to {amount} {unit}.")
             print(f"⏰ Daily limit set to {amount} {unit} via voice command")
         else:
@@ -644,7 +660,9 @@ class VoiceControlSystem:
             },
             "recognition": {
                 "avg_accuracy": avg_accuracy,
-                "success_rate": avg_accuracy * 100
+                "success_rate": avg_accuracy * 100,
+                "backend": self.speech_pipeline.backend.name if self.speech_pipeline else None,
+                "latency": self.speech_pipeline.stats.latency_summary() if self.speech_pipeline else {}
             },
             "recent_activity": [
                 {